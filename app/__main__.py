@@ -1,11 +1,17 @@
 """Main entrypoint."""
 
+from datetime import timedelta
+
 import click
 
+from app.config import settings
 from app.logger import configure_logging, configure_warnings
 from app.sentry import init_sentry
 from app.utils.uvicorn import run_server
 
+# the modules used by the other commands are imported only by them, so that they aren't imported
+# by the parent process of the workers, and they don't affect the profile of the startup
+
 
 @click.group()
 def cli() -> None:
@@ -16,9 +22,91 @@ def cli() -> None:
 @click.option("--host", default="0.0.0.0", help="Address to listen on to run on")
 @click.option("--port", default=8000, help="Port to run on")
 @click.option("--reload", is_flag=True, default=False, help="Enable auto-reload.")
-def run(*, host: str, port: int, reload: bool) -> None:
+@click.option(
+    "--workers",
+    default=1,
+    type=click.IntRange(min=1),
+    show_default=True,
+    help="Number of worker processes, forked after loading the application.",
+)
+def run(*, host: str, port: int, reload: bool, workers: int) -> None:
     """Run the application."""
-    run_server("app.application:app", host=host, port=port, reload=reload)
+    if reload and workers > 1:
+        msg = "--reload cannot be used with multiple workers"
+        raise click.UsageError(msg)
+    run_server(
+        "app.application:app",
+        host=host,
+        port=port,
+        reload=reload,
+        workers=workers,
+        warmup="app.application:warmup",
+    )
+
+
+@cli.command()
+@click.option(
+    "--max-age",
+    default=settings.UPLOAD_REAPER_MAX_AGE_SECONDS,
+    show_default=True,
+    help="Minimum age in seconds of the uploads to abort.",
+)
+@click.option("--limit", type=int, default=None, help="Maximum number of assets to delete.")
+@click.option("--dry-run", is_flag=True, default=False, help="Only report the stale uploads.")
+def reap_uploads(*, max_age: float, limit: int | None, dry_run: bool) -> None:
+    """Abort the stale multipart uploads, and delete the related assets."""
+    from app.db.session import (  # ruff:ignore[import-outside-top-level]
+        configure_database_session_manager,
+    )
+    from app.upload_reaper import reap_stale_uploads  # ruff:ignore[import-outside-top-level]
+
+    database_session_manager = configure_database_session_manager()
+    try:
+        with database_session_manager.session() as db:
+            result = reap_stale_uploads(
+                db, max_age=timedelta(seconds=max_age), limit=limit, dry_run=dry_run
+            )
+    finally:
+        database_session_manager.close()
+    click.echo(result.model_dump_json(indent=2))
+
+
+@cli.command("backfill-embeddings")
+@click.option(
+    "--limit",
+    default=settings.EMBEDDING_BACKFILL_BATCH_SIZE,
+    show_default=True,
+    help="Maximum number of embeddings to compute.",
+)
+def backfill_embeddings_cmd(*, limit: int) -> None:
+    """Compute the missing embeddings of the entities with name and description."""
+    from app.db.session import (  # ruff:ignore[import-outside-top-level]
+        configure_database_session_manager,
+    )
+    from app.embedding_backfill import backfill_embeddings  # ruff:ignore[import-outside-top-level]
+
+    database_session_manager = configure_database_session_manager()
+    try:
+        with database_session_manager.session() as db:
+            count = backfill_embeddings(db, limit=limit)
+    finally:
+        database_session_manager.close()
+    click.echo(f"Computed {count} embeddings")
+
+
+@cli.command("profile-startup")
+@click.option(
+    "--top", default=20, show_default=True, help="Number of modules and packages to report."
+)
+def profile_startup_cmd(*, top: int) -> None:
+    """Report the slowest imports and lifespan phases of the application."""
+    from app.startup_profile import (  # ruff:ignore[import-outside-top-level]
+        format_startup_profile,
+        profile_startup,
+    )
+
+    profile = profile_startup("app.application")
+    click.echo(format_startup_profile(profile, top=top))
 
 
 configure_logging()
@@ -0,0 +1,70 @@
+"""Threadpool sizing and admission control, to reject the requests when overloaded.
+
+The sync routes and dependencies are executed in the anyio threadpool, and each of them may wait
+for a connection of the db pool. When too many requests are queued, it's better to reject the new
+requests immediately with 503, instead of letting them time out after waiting in the queues.
+"""
+
+import dataclasses
+import time
+from typing import NamedTuple
+
+import anyio.to_thread
+
+from app.config import settings
+from app.db.session import DatabaseSessionManager
+from app.logger import L
+
+
+class ThreadpoolStats(NamedTuple):
+    size: int
+    busy: int
+    waiting: int
+
+
+@dataclasses.dataclass
+class RequestCounters:
+    """Counters updated by the middleware in the event loop."""
+
+    in_flight: int = 0
+    rejected: int = 0
+    last_finished_at: float = dataclasses.field(default_factory=time.monotonic)
+
+    def idle_time(self) -> float:
+        """Return the seconds elapsed since the last request finished, or 0 if any in flight."""
+        if self.in_flight:
+            return 0.0
+        return time.monotonic() - self.last_finished_at
+
+
+request_counters = RequestCounters()
+
+
+def configure_threadpool(size: int) -> None:
+    """Set the number of worker threads, to be called in the event loop at startup."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    L.info("Threadpool size set to {} (default: {})", size, limiter.total_tokens)
+    limiter.total_tokens = size
+
+
+def get_threadpool_stats() -> ThreadpoolStats:
+    """Return the stats of the threadpool, to be called in the event loop."""
+    stats = anyio.to_thread.current_default_thread_limiter().statistics()
+    return ThreadpoolStats(
+        size=int(stats.total_tokens),
+        busy=stats.borrowed_tokens,
+        waiting=stats.tasks_waiting,
+    )
+
+
+def get_overload_reason(database_session_manager: DatabaseSessionManager | None) -> str | None:
+    """Return the reason why the service is overloaded, or None if it's not overloaded."""
+    if (waiting := get_threadpool_stats().waiting) > settings.ADMISSION_MAX_QUEUE_DEPTH:
+        return f"{waiting} tasks waiting for a worker thread"
+    if database_session_manager:
+        for name, stats in database_session_manager.pool_stats().items():
+            if stats.max_wait > settings.ADMISSION_MAX_POOL_WAIT:
+                return (
+                    f"{stats.waiting} checkouts waiting up to {stats.max_wait:.1f}s for {name} db"
+                )
+    return None
@@ -17,15 +17,38 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.requests import Request
 from starlette.responses import Response
 
+from app.admission_control import configure_threadpool
 from app.config import settings
 from app.db.session import configure_database_session_manager
 from app.dependencies.common import forbid_extra_query_params
+from app.embedding_backfill import start_embedding_backfill_thread
 from app.errors import ApiError, ApiErrorCode
 from app.gc_control import configure_gc, start_gc_thread
 from app.logger import L, timed
-from app.middleware import RequestContextMiddleware
+from app.middleware import (
+    AdmissionControlMiddleware,
+    MemoryTrackingMiddleware,
+    ProfilerMiddleware,
+    RequestContextMiddleware,
+)
 from app.routers import router
 from app.schemas.api import ErrorResponse
+from app.upload_reaper import start_upload_reaper_thread
+from app.utils.process import get_memory_usage, get_uptime
+
+# elapsed seconds of the startup phases, reported by the profile-startup command
+startup_timings: dict[str, float] = {}
+
+
+def warmup() -> None:
+    """Execute the expensive initialization, shared by the workers when forked after it."""
+    with timed("Eagerly configuring SQLAlchemy mappers", timings=startup_timings):
+        configure_mappers()
+    with timed(
+        "Forcing FastAPI to build the effective route contexts at startup",
+        timings=startup_timings,
+    ):
+        list(iter_route_contexts(app.router.routes))
 
 
 @asynccontextmanager
@@ -37,21 +60,47 @@ async def lifespan(_: FastAPI) -> AsyncGenerator[dict[str, Any]]:
         os.cpu_count(),
         settings.ENVIRONMENT,
     )
-    with timed("Eagerly configuring SQLAlchemy mappers"):
-        configure_mappers()
-    with timed("Forcing FastAPI to build the effective route contexts at startup"):
-        list(iter_route_contexts(app.router.routes))
-    database_session_manager = configure_database_session_manager()
+    # already done before forking the workers, if running multiple workers
+    warmup()
+    with timed("Configuring threadpool", timings=startup_timings):
+        configure_threadpool(settings.THREADPOOL_SIZE)
+    with timed("Configuring database session manager", timings=startup_timings):
+        database_session_manager = configure_database_session_manager()
     app.state.database_session_manager = database_session_manager
+    if settings.DB_POOL_PREWARM_SIZE:
+        with timed("Prewarming database pools", timings=startup_timings):
+            database_session_manager.prewarm(
+                min(settings.DB_POOL_PREWARM_SIZE, settings.DB_POOL_SIZE)
+            )
+            await database_session_manager.prewarm_async(
+                min(settings.DB_POOL_PREWARM_SIZE, settings.DB_ASYNC_POOL_SIZE)
+            )
     http_client = httpx2.Client()
     if settings.GC_CONTROL_ENABLED:
-        configure_gc()
-        stop_gc = start_gc_thread()
+        with timed("Starting gc control", timings=startup_timings):
+            configure_gc()
+            stop_gc = start_gc_thread()
     else:
         stop_gc = lambda: None
+    if settings.UPLOAD_REAPER_ENABLED:
+        with timed("Starting upload reaper", timings=startup_timings):
+            stop_upload_reaper = start_upload_reaper_thread(database_session_manager)
+    else:
+        stop_upload_reaper = lambda: None
+    if settings.EMBEDDING_BACKFILL_ENABLED:
+        with timed("Starting embedding backfill", timings=startup_timings):
+            stop_embedding_backfill = start_embedding_backfill_thread(database_session_manager)
+    else:
+        stop_embedding_backfill = lambda: None
     if settings.TRACEMALLOC_ENABLED:
-        with timed("Starting tracemalloc"):
+        with timed("Starting tracemalloc", timings=startup_timings):
             tracemalloc.start()
+    L.info(
+        "Application started in {:.2f}s [PID={}, memory: {}]",
+        get_uptime(),
+        os.getpid(),
+        get_memory_usage(),
+    )
     try:
         yield {
             "database_session_manager": database_session_manager,
@@ -62,6 +111,9 @@ async def lifespan(_: FastAPI) -> AsyncGenerator[dict[str, Any]]:
         L.info("Ignored {} in lifespan", err)
     finally:
         stop_gc()
+        stop_upload_reaper()
+        stop_embedding_backfill()
+        await database_session_manager.close_async()
         database_session_manager.close()
         http_client.close()
         L.info("Stopping application")
@@ -150,6 +202,11 @@ app = FastAPI(
     redirect_slashes=False,
     strict_content_type=False,
 )
+app.add_middleware(MemoryTrackingMiddleware)
+app.add_middleware(ProfilerMiddleware)
+# added before CORSMiddleware and RequestContextMiddleware, so that the rejected requests
+# have the CORS headers and are logged
+app.add_middleware(AdmissionControlMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
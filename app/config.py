@@ -63,7 +63,7 @@ class Settings(BaseSettings):
     # to override the presigned url hostname and port when running locally
     S3_PRESIGNED_URL_NETLOC: str | None = None
     S3_PRESIGNED_URL_EXPIRATION: int = 6 * 3600  # 6 hours
-    # upload_fileobj: data flows through the service
+    # upload: data flows through the service
     S3_MULTIPART_UPLOAD_THRESHOLD: int = 100 * MB
     S3_MULTIPART_UPLOAD_CHUNKSIZE: int = 10 * MB
     S3_MULTIPART_UPLOAD_MAX_CONCURRENCY: int = 10
@@ -80,7 +80,15 @@ class Settings(BaseSettings):
     S3_MULTIPART_UPLOAD_DEFAULT_PARTS: int = 100
     S3_MAX_WORKERS: int = 32
 
+    # abort the multipart uploads abandoned by the clients, and delete the related assets
+    UPLOAD_REAPER_ENABLED: bool = False
+    UPLOAD_REAPER_INTERVAL_SECONDS: float = 3600.0
+    UPLOAD_REAPER_MAX_AGE_SECONDS: float = 7 * 24 * 3600.0
+    UPLOAD_REAPER_BATCH_SIZE: int = 1000
+
     API_ASSET_POST_MAX_SIZE: int = 150 * MB
+    # store the files uploaded through the service only once per digest, storage and visibility
+    ASSET_DEDUPLICATION_ENABLED: bool = False
     PAGINATION_DEFAULT_PAGE_SIZE: int = 30
     PAGINATION_MAX_PAGE_SIZE: int = 1000
 
@@ -91,17 +99,84 @@ class Settings(BaseSettings):
     DB_PORT: int = 5432
     DB_NAME: str = "entitycore"
     DB_URI: str = ""
+    # used by the async routes, with the same parameters of DB_URI if not specified
+    DB_ASYNC_ENGINE: str = "postgresql+asyncpg"
+    DB_ASYNC_URI: str = ""
 
+    # each worker process opens up to (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections for the sync
+    # engine, and up to (DB_ASYNC_POOL_SIZE + DB_ASYNC_MAX_OVERFLOW) for the async engine, so
+    # the total multiplied by the number of workers must not exceed max_connections of the server
     DB_POOL_SIZE: int = 30
     DB_POOL_PRE_PING: bool = False
     DB_MAX_OVERFLOW: int = 10
+    DB_ASYNC_POOL_SIZE: int = 10
+    DB_ASYNC_MAX_OVERFLOW: int = 5
+    DB_POOL_RECYCLE: int = 3600  # seconds after which a connection is replaced, -1 to disable
+    DB_POOL_PREWARM_SIZE: int = 0  # connections opened at startup in each pool
+    DB_POOL_WAIT_LOG_THRESHOLD: float = 0.5  # log the checkouts waiting longer, in seconds
+    # parameters set on each new connection, the server defaults are used if not set
+    DB_STATEMENT_TIMEOUT: int = 0  # milliseconds, 0 to disable
+    DB_IDLE_IN_TRANSACTION_SESSION_TIMEOUT: int = 0  # milliseconds, 0 to disable
+    DB_JIT: bool = False  # the JIT compilation is slower than the execution of the OLTP queries
+    DB_WORK_MEM: str | None = None  # e.g. 16MB, used by the sorts and hashes of the facets
+    # statement timeout in milliseconds by route template, overriding DB_STATEMENT_TIMEOUT
+    DB_ROUTE_STATEMENT_TIMEOUTS: dict[str, int] = {}
+    # statements kept in the compiled cache of each engine
+    DB_QUERY_CACHE_SIZE: int = 500
+    # count the hits and misses of the compiled cache by route
+    DB_COMPILED_CACHE_STATS_ENABLED: bool = False
+    # statements kept prepared on each connection of the async engine, 0 to disable
+    DB_ASYNC_PREPARED_STATEMENT_CACHE_SIZE: int = 500
+    # worker threads used by the sync routes and dependencies, and by the other blocking calls,
+    # set by default to the max number of connections of the sync engine
+    THREADPOOL_SIZE: int = 40
+    # reject the requests with 503 and Retry-After when the service is overloaded
+    ADMISSION_CONTROL_ENABLED: bool = False
+    ADMISSION_MAX_QUEUE_DEPTH: int = 100  # tasks waiting for a worker thread
+    ADMISSION_MAX_POOL_WAIT: float = 5.0  # seconds waited by the oldest db connection checkout
+    ADMISSION_RETRY_AFTER: int = 1  # seconds
     TRACEMALLOC_ENABLED: bool = False
     TRACEMALLOC_TOP_N: int = 20
+    # record the memory traced during each request by route, requires TRACEMALLOC_ENABLED
+    TRACEMALLOC_PER_ROUTE_ENABLED: bool = False
+    CPU_PROFILER_INTERVAL_SECONDS: float = 0.01  # seconds between two samples
+    CPU_PROFILER_MAX_SECONDS: float = 300.0  # max duration of a profiling session
     GC_CONTROL_ENABLED: bool = True
     GC_GEN1_INTERVAL_SECONDS: float = 5.0
     GC_GEN2_INTERVAL_SECONDS: float = 600.0
+    # collect when the worker is idle: the collections are due after the intervals above,
+    # and they are executed when no request is in flight, or after GC_MAX_IDLE_WAIT_SECONDS
+    GC_ADAPTIVE_ENABLED: bool = False
+    GC_POLL_INTERVAL_SECONDS: float = 0.5
+    GC_IDLE_SECONDS: float = 0.2  # seconds without requests in flight to consider it idle
+    GC_MAX_IDLE_WAIT_SECONDS: float = 30.0
+    GC_MAX_GEN0_COUNT: int = 200_000  # collect gen1 early when exceeded, even if not idle
+    GC_MAX_RSS_MB: int | None = None  # collect gen2 early when exceeded, even if not idle
+    # min seconds between the gen2 collections triggered by GC_MAX_RSS_MB, doubled after each
+    # of them while the rss remains above, up to GC_GEN2_INTERVAL_SECONDS
+    GC_RSS_MIN_INTERVAL_SECONDS: float = 60.0
 
     OPENAI_API_KEY: SecretStr | None = None
+    EMBEDDING_CACHE_MAXSIZE: int = 10_000  # items kept in memory
+    EMBEDDING_BATCH_SIZE: int = 512  # max number of texts sent in a single request
+    # embeddings kept in the embedding_cache table, generated again when expired
+    EMBEDDING_DB_CACHE_TTL_SECONDS: float = 30 * 24 * 3600.0
+    EMBEDDING_DB_CACHE_PURGE_BATCH_SIZE: int = 100  # max number of expired rows deleted per write
+    # compute in background the embeddings of the entities with name and description
+    EMBEDDING_BACKFILL_ENABLED: bool = False
+    EMBEDDING_BACKFILL_INTERVAL_SECONDS: float = 60.0
+    EMBEDDING_BACKFILL_BATCH_SIZE: int = 100  # max number of embeddings computed per interval
+
+    # cache in memory the public part of the circuit hierarchy
+    CIRCUIT_HIERARCHY_CACHE_ENABLED: bool = True
+    CIRCUIT_HIERARCHY_CACHE_TTL: int = 300  # seconds
+
+    PROVENANCE_MAX_DEPTH: int = 10  # max depth that can be requested
+    PROVENANCE_MAX_NODES: int = 1000  # the returned graph is truncated above this size
+    # cache in memory the graphs of the most requested roots
+    PROVENANCE_CACHE_ENABLED: bool = False
+    PROVENANCE_CACHE_MAXSIZE: int = 1000  # items
+    PROVENANCE_CACHE_TTL: int = 60  # seconds
 
     VIRTUAL_LAB_API_URL: str = "https://staging.cell-a.openbraininstute.org/api/virtual-lab-manager"
 
@@ -122,6 +197,16 @@ class Settings(BaseSettings):
             )
         return dsn.unicode_string()
 
+    @field_validator("DB_ASYNC_URI", mode="before")
+    @classmethod
+    def build_db_async_uri(cls, v: str, info: ValidationInfo) -> str:
+        """Return the configured async db uri, or build it from DB_URI and DB_ASYNC_ENGINE."""
+        if v:
+            return PostgresDsn(v).unicode_string()
+        dsn = PostgresDsn(info.data["DB_URI"])
+        _, rest = dsn.unicode_string().split("://", 1)
+        return f"{info.data['DB_ASYNC_ENGINE']}://{rest}"
+
     @model_validator(mode="after")
     def validate_multipart_upload_size_consistency(self):
         if (
@@ -0,0 +1,177 @@
+"""On-demand statistical profiler, sampling the stacks of all the threads.
+
+The stacks are sampled by a background thread, started only while profiling, so there isn't any
+overhead when idle. When a route template is given, the threads are sampled only while at least
+one request matching the template is in flight, and the profiling ends after the given number of
+matching requests.
+
+The profile is wall-clock based: the threads waiting for I/O or locks are sampled as well.
+"""
+
+import contextlib
+import sys
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from http import HTTPStatus
+from types import FrameType
+from typing import Any
+
+import anyio
+from starlette.routing import compile_path
+
+from app.errors import ApiError, ApiErrorCode
+
+Stack = tuple[str, ...]  # thread name and frames, from the root to the leaf
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    # the semicolons are the separators of the frames in the collapsed format
+    return f"{code.co_qualname} ({code.co_filename}:{code.co_firstlineno})".replace(";", ":")
+
+
+def _get_stack(thread_name: str, frame: FrameType | None) -> Stack:
+    frames: list[str] = []
+    while frame is not None:
+        frames.append(_frame_name(frame))
+        frame = frame.f_back
+    return (thread_name, *reversed(frames))
+
+
+class ProfilingSession:
+    """Stacks sampled during a profiling session."""
+
+    def __init__(
+        self, *, interval: float, route: str | None = None, max_requests: int | None = None
+    ) -> None:
+        """Init the session.
+
+        Args:
+            interval: seconds between two samples.
+            route: route template, to sample only while the matching requests are in flight.
+            max_requests: number of matching requests after which the session is done.
+        """
+        self.interval = interval
+        self.route = route
+        self.max_requests = max_requests
+        self.route_regex = compile_path(route)[0] if route else None
+        self.stacks: Counter[Stack] = Counter()
+        self.samples = 0
+        self.started_requests = 0
+        self.finished_requests = 0
+        self.in_flight = 0
+        self.done = anyio.Event()
+
+    def is_sampling(self) -> bool:
+        """Return True if the threads should be sampled."""
+        return self.route_regex is None or self.in_flight > 0
+
+    def request_started(self, path: str) -> bool:
+        """Return True if the request should be profiled, to be called in the event loop."""
+        if (
+            self.route_regex is None
+            or not self.route_regex.match(path)
+            or (self.max_requests is not None and self.started_requests >= self.max_requests)
+        ):
+            return False
+        self.started_requests += 1
+        self.in_flight += 1
+        return True
+
+    def request_finished(self) -> None:
+        """Update the counters of a profiled request, to be called in the event loop."""
+        self.in_flight -= 1
+        self.finished_requests += 1
+        if self.finished_requests == self.max_requests:
+            self.done.set()
+
+    def sample(self, frames: dict[int, FrameType], exclude: set[int]) -> None:
+        """Add the stacks of the given frames, by thread id."""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in frames.items():
+            if thread_id not in exclude:
+                self.stacks[_get_stack(names.get(thread_id, str(thread_id)), frame)] += 1
+        self.samples += 1
+
+
+_current_session: ProfilingSession | None = None
+
+
+def get_current_session() -> ProfilingSession | None:
+    """Return the profiling session in progress, if any."""
+    return _current_session
+
+
+def _sampler(session: ProfilingSession, stop: threading.Event) -> None:
+    exclude = {threading.get_ident()}
+    while not stop.wait(timeout=session.interval):
+        if session.is_sampling():
+            session.sample(sys._current_frames(), exclude=exclude)  # ruff:ignore[private-member-access]
+
+
+@contextlib.contextmanager
+def profiling_session(
+    *, interval: float, route: str | None = None, max_requests: int | None = None
+) -> Iterator[ProfilingSession]:
+    """Sample the threads in a background thread until exiting the context.
+
+    Raises:
+        ApiError: if another profiling session is in progress.
+    """
+    global _current_session  # ruff:ignore[global-statement]
+    if _current_session is not None:
+        raise ApiError(
+            message="Another profiling session is in progress",
+            error_code=ApiErrorCode.PROFILING_IN_PROGRESS,
+            http_status_code=HTTPStatus.CONFLICT,
+        )
+    session = ProfilingSession(interval=interval, route=route, max_requests=max_requests)
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=_sampler, args=(session, stop), daemon=True, name="cpu-profiler"
+    )
+    _current_session = session
+    thread.start()
+    try:
+        yield session
+    finally:
+        _current_session = None
+        stop.set()
+        thread.join()
+
+
+def to_collapsed(session: ProfilingSession) -> str:
+    """Return the stacks in the collapsed format, used by flamegraph.pl and speedscope."""
+    return "".join(f"{';'.join(stack)} {count}\n" for stack, count in session.stacks.most_common())
+
+
+def to_speedscope(session: ProfilingSession) -> dict[str, Any]:
+    """Return the stacks in the speedscope format, with one profile per thread."""
+    frame_index: dict[str, int] = {}
+    profiles: dict[str, dict[str, Any]] = {}
+    for (thread_name, *frames), count in session.stacks.most_common():
+        profile = profiles.setdefault(
+            thread_name,
+            {
+                "type": "sampled",
+                "name": thread_name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": 0,
+                "samples": [],
+                "weights": [],
+            },
+        )
+        profile["samples"].append(
+            [frame_index.setdefault(name, len(frame_index)) for name in frames]
+        )
+        profile["weights"].append(count * session.interval)
+        profile["endValue"] += count * session.interval
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": [{"name": name} for name in frame_index]},
+        "profiles": list(profiles.values()),
+        "name": session.route or "all threads",
+        "exporter": "entitycore",
+    }
@@ -0,0 +1,105 @@
+"""Statistics of the SQLAlchemy compiled cache, by route template.
+
+Each statement executed with a cache miss is compiled again to SQL, so a low hit ratio on a route
+means that the queries built by the route don't produce stable cache keys.
+
+The statements are executed by the worker threads and by the background threads, so the counters
+are updated and read while holding a lock.
+"""
+
+import dataclasses
+import threading
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import Engine, event
+from sqlalchemy.engine.interfaces import CacheStats
+
+
+@dataclasses.dataclass
+class CacheCounters:
+    """Number of statements by outcome of the compiled cache lookup."""
+
+    hits: int = 0
+    misses: int = 0
+    uncached: int = 0  # statements without cache key, or with caching disabled
+
+    @property
+    def hit_ratio(self) -> float | None:
+        """Ratio of the hits over the cacheable statements, or None if there are none."""
+        if total := self.hits + self.misses:
+            return self.hits / total
+        return None
+
+    def add(self, other: "CacheCounters") -> None:
+        """Add the counters of other."""
+        self.hits += other.hits
+        self.misses += other.misses
+        self.uncached += other.uncached
+
+
+_request_counters: ContextVar[CacheCounters | None] = ContextVar(
+    "compiled_cache_counters", default=None
+)
+_lock = threading.Lock()
+total_counters = CacheCounters()
+route_counters: dict[str, CacheCounters] = {}
+
+
+def _after_cursor_execute(
+    _conn: Any,
+    _cursor: Any,
+    _statement: str,
+    _parameters: Any,
+    context: Any,
+    _executemany: bool,  # ruff:ignore[boolean-type-hint-positional-argument]
+) -> None:
+    if context is None or context.compiled is None:
+        return  # raw sql
+    counters = [total_counters]
+    if (request_counters := _request_counters.get()) is not None:
+        counters.append(request_counters)
+    with _lock:
+        for c in counters:
+            if context.cache_hit is CacheStats.CACHE_HIT:
+                c.hits += 1
+            elif context.cache_hit is CacheStats.CACHE_MISS:
+                c.misses += 1
+            else:
+                c.uncached += 1
+
+
+def listen(engine: Engine) -> None:
+    """Count the compiled cache lookups of the statements executed by the engine."""
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def start_request() -> CacheCounters:
+    """Count the lookups of the statements executed in the current context, until finished."""
+    counters = CacheCounters()
+    _request_counters.set(counters)
+    return counters
+
+
+def finish_request(route_template: str, counters: CacheCounters) -> None:
+    """Add the counters of a request to the counters of the route."""
+    _request_counters.set(None)
+    with _lock:
+        if counters.hits or counters.misses or counters.uncached:
+            route_counters.setdefault(route_template, CacheCounters()).add(counters)
+
+
+def snapshot() -> tuple[CacheCounters, dict[str, CacheCounters]]:
+    """Return a copy of the total counters and of the counters by route."""
+    with _lock:
+        return (
+            dataclasses.replace(total_counters),
+            {route: dataclasses.replace(c) for route, c in route_counters.items()},
+        )
+
+
+def reset() -> None:
+    """Forget the recorded lookups."""
+    with _lock:
+        total_counters.hits = total_counters.misses = total_counters.uncached = 0
+        route_counters.clear()
@@ -1,11 +1,15 @@
+import itertools
+import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from sqlalchemy import event
-from sqlalchemy.orm import Session
+import sqlalchemy as sa
+from sqlalchemy import Connection, event
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
 from sqlalchemy.orm.session import object_session
 
 from app.config import settings, storages
-from app.db.model import Asset
+from app.db.hierarchy_cache import public_hierarchy_cache
+from app.db.model import Asset, AssetBlob, Circuit, Derivation
 from app.db.types import AssetStatus, StorageType
 from app.logger import L
 from app.utils.s3 import (
@@ -16,6 +20,8 @@ from app.utils.s3 import (
 )
 
 ASSETS_TO_DELETE_KEY = "assets_to_delete_from_storage"
+BLOBS_TO_DELETE_KEY = "blobs_to_delete_from_storage"
+HIERARCHY_CHANGED_KEY = "circuit_hierarchy_changed"
 
 
 def _delete_asset_from_storage(asset: Asset, storage_client_factory: StorageClientFactory) -> None:
@@ -53,9 +59,47 @@ def _delete_asset_from_storage(asset: Asset, storage_client_factory: StorageClie
                 )
 
 
+def _delete_blob_from_storage(
+    storage_type: StorageType, s3_key: str, storage_client_factory: StorageClientFactory
+) -> None:
+    try:
+        delete_asset_storage_object(
+            storage_type=storage_type,
+            s3_key=s3_key,
+            storage_client_factory=storage_client_factory,
+        )
+    except Exception:  # ruff:ignore[blind-except]
+        L.exception(
+            "Failed to delete storage object for AssetBlob full_path={} storage_type={}",
+            s3_key,
+            storage_type,
+        )
+
+
+def release_asset_blob(session: Session, connection: Connection, blob_id: uuid.UUID) -> None:
+    """Decrement the reference count of the blob, and delete it when no longer referenced.
+
+    The blob is deleted from the database immediately, and from the storage after commit.
+    It must be called after the referencing asset has been deleted or updated.
+    """
+    blob = connection.execute(
+        sa.update(AssetBlob)
+        .where(AssetBlob.id == blob_id)
+        .values(ref_count=AssetBlob.ref_count - 1)
+        .returning(AssetBlob.ref_count, AssetBlob.storage_type, AssetBlob.full_path)
+    ).one()
+    if blob.ref_count <= 0:
+        connection.execute(sa.delete(AssetBlob).where(AssetBlob.id == blob_id))
+        session.info.setdefault(BLOBS_TO_DELETE_KEY, set()).add((blob.storage_type, blob.full_path))
+
+
 @event.listens_for(Asset, "before_delete")
 def collect_asset_for_storage_deletion(_mapper, _connection, target: Asset):
     """Collect Asset for S3 object cleanup after database deletion."""
+    if target.blob_id is not None:
+        # the content is in a shared blob, released after the deletion of the asset
+        return
+
     session = object_session(target)
 
     if session is not None:
@@ -64,6 +108,20 @@ def collect_asset_for_storage_deletion(_mapper, _connection, target: Asset):
         L.warning("Asset {} not attached to a session.", target.id)
 
 
+@event.listens_for(Asset, "after_delete")
+def release_deleted_asset_blob(_mapper, connection: Connection, target: Asset):
+    """Release the blob referenced by the deleted Asset, if deduplicated."""
+    if target.blob_id is None:
+        return
+
+    session = object_session(target)
+
+    if session is not None:
+        release_asset_blob(session, connection, target.blob_id)
+    else:
+        L.warning("Asset {} not attached to a session.", target.id)
+
+
 @event.listens_for(Session, "after_commit")
 def delete_assets_from_storage(session: Session):
     """Delete storage objects for assets removed in a committed transaction.
@@ -78,6 +136,7 @@ def delete_assets_from_storage(session: Session):
     TODO: Add a cleanup function on a schedule that would remove s3 orphans from time to time.
     """
     to_delete: set[Asset] = session.info.pop(ASSETS_TO_DELETE_KEY, set())
+    blobs: set[tuple[StorageType, str]] = session.info.pop(BLOBS_TO_DELETE_KEY, set())
     # Ignore the directory assets because there is nothing to delete from S3.
     # However, the files in a directory:
     # - are registered in the database and are going to be deleted automatically by
@@ -86,23 +145,28 @@ def delete_assets_from_storage(session: Session):
     #   directly using a simple a presigned url.
     #   See https://github.com/openbraininstitute/entitycore/issues/256.
     assets = [asset for asset in to_delete if not asset.is_directory]
-    if not assets:
+    if not assets and not blobs:
         return
 
     # Pre-instantiate one client per storage type so all threads share them.
     storage_types: set[StorageType] = {asset.storage_type for asset in assets}
+    storage_types.update(storage_type for storage_type, _ in blobs)
     clients = {st: get_s3_client(storages[st]) for st in storage_types}
 
     def storage_client_factory(storage):
         return clients[storage.type]
 
-    max_workers = min(settings.S3_MAX_WORKERS, len(assets))
+    max_workers = min(settings.S3_MAX_WORKERS, len(assets) + len(blobs))
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         for future in as_completed(
             [
                 executor.submit(_delete_asset_from_storage, asset, storage_client_factory)
                 for asset in assets
             ]
+            + [
+                executor.submit(_delete_blob_from_storage, *blob, storage_client_factory)
+                for blob in blobs
+            ]
         ):
             future.result()
 
@@ -111,3 +175,45 @@ def delete_assets_from_storage(session: Session):
 def cleanup_storage_deletes(session: Session):
     """Clear pending storage deletions after a transaction rollback."""
     session.info.pop(ASSETS_TO_DELETE_KEY, None)
+    session.info.pop(BLOBS_TO_DELETE_KEY, None)
+
+
+def _is_hierarchy_model(model_class: type) -> bool:
+    """Return True if writing the model may change the circuit hierarchy."""
+    return issubclass(model_class, (Circuit, Derivation)) or issubclass(Circuit, model_class)
+
+
+def _invalidate_hierarchy_cache(session: Session) -> None:
+    session.info[HIERARCHY_CHANGED_KEY] = True
+    public_hierarchy_cache.invalidate()
+
+
+@event.listens_for(Session, "after_flush")
+def invalidate_hierarchy_cache_on_flush(session: Session, _flush_context: UOWTransaction):
+    """Invalidate the circuit hierarchy cache when circuits or derivations are flushed."""
+    objects = itertools.chain(session.new, session.dirty, session.deleted)
+    if any(_is_hierarchy_model(type(obj)) for obj in objects):
+        _invalidate_hierarchy_cache(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def invalidate_hierarchy_cache_on_bulk_write(orm_execute_state: ORMExecuteState):
+    """Invalidate the circuit hierarchy cache on bulk writes, for example when publishing."""
+    if not (
+        orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete
+    ):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and _is_hierarchy_model(mapper.class_):
+        _invalidate_hierarchy_cache(orm_execute_state.session)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def invalidate_hierarchy_cache_after_transaction(session: Session):
+    """Invalidate again the circuit hierarchy cache at the end of the transaction that changed it.
+
+    It's needed because the rows loaded by other sessions before the commit can be cached again.
+    """
+    if session.info.pop(HIERARCHY_CHANGED_KEY, False):
+        public_hierarchy_cache.invalidate()
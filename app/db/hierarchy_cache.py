@@ -0,0 +1,64 @@
+"""In-memory cache of the public nodes of the circuit hierarchy.
+
+The cache is invalidated by `app.db.events` when circuits or derivations are written in the
+same process, and it expires after CIRCUIT_HIERARCHY_CACHE_TTL to pick up the changes made by
+other processes.
+"""
+
+import threading
+import uuid
+from typing import NamedTuple
+
+import cachetools
+
+from app.config import settings
+from app.db.types import DerivationType
+
+
+class HierarchyRow(NamedTuple):
+    id: uuid.UUID
+    name: str
+    parent_id: uuid.UUID | None
+    authorized_public: bool
+    authorized_project_id: uuid.UUID
+
+
+class PublicHierarchyCache:
+    """Public hierarchy rows by derivation type, discarded when the hierarchy changes."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Init the cache."""
+        self._cache = cachetools.TTLCache[DerivationType, tuple[HierarchyRow, ...]](
+            maxsize=maxsize, ttl=ttl
+        )
+        self._lock = threading.Lock()
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Current version, to be read before loading the rows to be cached."""
+        return self._version
+
+    def get(self, derivation_type: DerivationType) -> tuple[HierarchyRow, ...] | None:
+        """Return the cached rows, or None if not cached."""
+        with self._lock:
+            return self._cache.get(derivation_type)
+
+    def set(
+        self, derivation_type: DerivationType, rows: tuple[HierarchyRow, ...], version: int
+    ) -> None:
+        """Cache the rows, unless the hierarchy changed since they have been loaded."""
+        with self._lock:
+            if version == self._version:
+                self._cache[derivation_type] = rows
+
+    def invalidate(self) -> None:
+        """Discard all the cached rows, and the rows being loaded."""
+        with self._lock:
+            self._version += 1
+            self._cache.clear()
+
+
+public_hierarchy_cache = PublicHierarchyCache(
+    maxsize=len(DerivationType), ttl=settings.CIRCUIT_HIERARCHY_CACHE_TTL
+)
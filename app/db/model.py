@@ -25,6 +25,7 @@ from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
     MappedColumn,
+    column_property,
     declared_attr,
     foreign,
     mapped_column,
@@ -70,6 +71,7 @@ from app.db.types import (
     PublicationType,
     RepairPipelineType,
     Sex,
+    SimilarityMetric,
     SlicingDirectionType,
     StainingType,
     StorageType,
@@ -163,11 +165,26 @@ class Identifiable(TimestampMixin, Base):
         )
 
 
+def trigram_indexes(tablename: str, *columns: str) -> tuple[Index, ...]:
+    """Return the GIN trigram indexes used by the ILIKE filters, one per column."""
+    return tuple(
+        Index(
+            f"ix_{tablename}_{column}_trgm",
+            column,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+        for column in columns
+    )
+
+
 class NameDescriptionVectorMixin(Base):
     __abstract__ = True
     name: Mapped[str] = mapped_column(index=True)
     description: Mapped[str]
     description_vector: Mapped[str | None] = mapped_column(TSVECTOR)
+    # computed in background by app.embedding_backfill, and reset when name or description change
+    embedding: Mapped[Vector | None] = mapped_column(Vector(1536), deferred=True)
 
     @declared_attr.directive
     @classmethod
@@ -182,6 +199,7 @@ class NameDescriptionVectorMixin(Base):
                     cls.description_vector,
                     postgresql_using="gin",
                 ),
+                *trigram_indexes(cls.__tablename__, "name", "description"),
                 *super_table_args,
             )
         return super_table_args
@@ -204,12 +222,40 @@ class EmbeddingMixin(Base):
     __abstract__ = True
     embedding: Mapped[Vector] = mapped_column(Vector(1536), nullable=False, deferred=True)
 
+    @staticmethod
+    def embedding_indexes(tablename: str) -> tuple[Index, ...]:
+        """Return the HNSW indexes for approximate nearest neighbor search, one per metric."""
+        return tuple(
+            Index(
+                f"ix_{tablename}_embedding_{metric}",
+                "embedding",
+                postgresql_using="hnsw",
+                postgresql_ops={"embedding": f"vector_{metric}_ops"},
+            )
+            for metric in SimilarityMetric
+        )
+
+
+class EmbeddingCache(TimestampMixin, Base):
+    """Embeddings already generated, to avoid calling the provider again for the same text."""
+
+    __tablename__ = "embedding_cache"
+    model: Mapped[str] = mapped_column(primary_key=True)
+    # sha256 digest of the normalized text
+    text_digest: Mapped[bytes] = mapped_column(LargeBinary(32), primary_key=True)
+    embedding: Mapped[Vector] = mapped_column(Vector(EmbeddingMixin.SIZE))
+
 
 class Species(EmbeddingMixin, Identifiable):
     __tablename__ = GlobalType.species.value
     name: Mapped[str] = mapped_column(unique=True, index=True)
     taxonomy_id: Mapped[str] = mapped_column(unique=True, index=True)
 
+    __table_args__ = (
+        *EmbeddingMixin.embedding_indexes(GlobalType.species.value),
+        *trigram_indexes(GlobalType.species.value, "name"),
+    )
+
 
 class Strain(EmbeddingMixin, Identifiable):
     __tablename__ = GlobalType.strain.value
@@ -222,6 +268,7 @@ class Strain(EmbeddingMixin, Identifiable):
     __table_args__ = (
         # needed for the composite foreign key in SpeciesMixin
         UniqueConstraint("id", "species_id", name="uq_strain_id_species_id"),
+        *EmbeddingMixin.embedding_indexes(GlobalType.strain.value),
     )
 
 
@@ -303,6 +350,11 @@ class BrainRegion(EmbeddingMixin, Identifiable):
         ForeignKey("brain_region_hierarchy.id"), index=True
     )
 
+    __table_args__ = (
+        *EmbeddingMixin.embedding_indexes(GlobalType.brain_region.value),
+        *trigram_indexes(GlobalType.brain_region.value, "name"),
+    )
+
     species = relationship(
         "Species",
         secondary=BrainRegionHierarchy.__table__,
@@ -517,10 +569,14 @@ class AnnotationMixin:
 class MTypeClass(AnnotationMixin, LegacyMixin, Identifiable):
     __tablename__ = GlobalType.mtype_class.value
 
+    __table_args__ = trigram_indexes(GlobalType.mtype_class.value, "pref_label")
+
 
 class ETypeClass(AnnotationMixin, LegacyMixin, Identifiable):
     __tablename__ = GlobalType.etype_class.value
 
+    __table_args__ = trigram_indexes(GlobalType.etype_class.value, "pref_label")
+
 
 class MTypeClassification(Identifiable):
     __tablename__ = AssociationType.mtype_classification.value
@@ -1548,13 +1604,37 @@ class MEModelCalibrationResult(Entity):
     }
 
 
+class AssetBlob(TimestampMixin, Base):
+    """Object in the storage shared by the assets with the same content, when deduplicated."""
+
+    __tablename__ = "asset_blob"
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=create_uuid)
+    storage_type: Mapped[StorageType]
+    is_public: Mapped[bool]
+    sha256_digest: Mapped[bytes] = mapped_column(LargeBinary(32))
+    full_path: Mapped[str] = mapped_column(unique=True)  # full path on S3
+    size: Mapped[BIGINT]
+    # number of assets referencing the blob, the blob is deleted when it reaches 0
+    ref_count: Mapped[int]
+
+    __table_args__ = (
+        Index(
+            "uq_asset_blob_storage_type_is_public_sha256_digest",
+            "storage_type",
+            "is_public",
+            "sha256_digest",
+            unique=True,
+        ),
+    )
+
+
 class Asset(Identifiable):
     """Asset table."""
 
     __tablename__ = "asset"
     status: Mapped[AssetStatus]
     path: Mapped[str]  # relative path
-    full_path: Mapped[str]  # full path on S3
+    full_path: Mapped[str] = mapped_column()  # full path on S3
     is_directory: Mapped[bool]
     content_type: Mapped[ContentType] = mapped_column(
         sa.Enum(ContentType, values_callable=lambda x: [i.value for i in x])
@@ -1570,7 +1650,17 @@ class Asset(Identifiable):
     storage_type: Mapped[StorageType]
     upload_meta: Mapped[JSON_DICT | None]
     # parent_id should be set only for files that are children of a directory asset
-    parent_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("asset.id"), index=True)
+    parent_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("asset.id"))
+    # blob_id should be set only for deduplicated files, stored in the blob instead of full_path
+    blob_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("asset_blob.id"), index=True)
+    blob: Mapped[AssetBlob | None] = relationship()
+    # key of the object in the storage, shared with other assets if deduplicated
+    storage_path: Mapped[str] = column_property(
+        sa.case(
+            (blob_id.is_(None), full_path),
+            else_=sa.select(AssetBlob.full_path).where(AssetBlob.id == blob_id).scalar_subquery(),
+        )
+    )
 
     children: Mapped[list["Asset"]] = relationship(
         foreign_keys=[parent_id],
@@ -1582,6 +1672,14 @@ class Asset(Identifiable):
     __table_args__ = (
         Index("ix_asset_full_path", "full_path", unique=True),
         Index("uq_asset_entity_id_path", "path", "entity_id", unique=True),
+        # manifest of the files in a directory, used for listing without accessing the storage;
+        # text_pattern_ops allows the prefix filters on the path, regardless of the collation
+        Index(
+            "ix_asset_parent_id_path",
+            "parent_id",
+            "path",
+            postgresql_ops={"path": "text_pattern_ops"},
+        ),
     )
 
 
@@ -0,0 +1,77 @@
+"""Connection pools keeping track of the checkouts waiting for a connection."""
+
+import itertools
+import threading
+import time
+from typing import NamedTuple
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, PoolProxiedConnection, QueuePool
+
+from app.config import settings
+from app.logger import L
+
+
+class PoolStats(NamedTuple):
+    size: int
+    checked_out: int
+    overflow: int
+    waiting: int
+    max_wait: float  # seconds waited by the oldest checkout still waiting
+
+
+class _WaitTrackingMixin:
+    """Record the start time of the checkouts until they get a connection."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Init the pool."""
+        super().__init__(*args, **kwargs)
+        self._waiting: dict[int, float] = {}
+        self._waiting_lock = threading.Lock()
+        self._waiting_counter = itertools.count()
+
+    def connect(self) -> PoolProxiedConnection:
+        """Return a connection from the pool, waiting if none is available."""
+        key = next(self._waiting_counter)
+        start = time.monotonic()
+        with self._waiting_lock:
+            self._waiting[key] = start
+        try:
+            return super().connect()  # pyright: ignore[reportAttributeAccessIssue]
+        finally:
+            with self._waiting_lock:
+                del self._waiting[key]
+            if (waited := time.monotonic() - start) > settings.DB_POOL_WAIT_LOG_THRESHOLD:
+                L.warning(
+                    "DB pool checkout waited {:.1f}ms [{}]",
+                    waited * 1000,
+                    self.status(),  # pyright: ignore[reportAttributeAccessIssue]
+                )
+
+    def waiting_stats(self) -> tuple[int, float]:
+        """Return the number of waiting checkouts, and the max time waited in seconds."""
+        with self._waiting_lock:
+            oldest = min(self._waiting.values(), default=None)
+            waiting = len(self._waiting)
+        return waiting, time.monotonic() - oldest if oldest is not None else 0.0
+
+
+class InstrumentedQueuePool(_WaitTrackingMixin, QueuePool):
+    """QueuePool exposing the checkouts waiting for a connection."""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_WaitTrackingMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool exposing the checkouts waiting for a connection."""
+
+
+def get_pool_stats(pool: Pool) -> PoolStats | None:
+    """Return the stats of the pool, or None if the pool is not instrumented."""
+    if not isinstance(pool, _WaitTrackingMixin) or not isinstance(pool, QueuePool):
+        return None
+    waiting, max_wait = pool.waiting_stats()
+    return PoolStats(
+        size=pool.size(),
+        checked_out=pool.checkedout(),
+        overflow=max(pool.overflow(), 0),
+        waiting=waiting,
+        max_wait=max_wait,
+    )
@@ -1,28 +1,110 @@
 """Database session utils."""
 
-from collections.abc import Iterator
-from contextlib import contextmanager
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
+from typing import Any
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import Session
 
 from app.config import settings
+from app.db import compiled_cache
+from app.db.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    PoolStats,
+    get_pool_stats,
+)
 from app.logger import L
 
 
+def get_session_parameters() -> dict[str, str]:
+    """Return the parameters to be set on each new connection, according to the settings."""
+    params = {}
+    if settings.DB_STATEMENT_TIMEOUT:
+        params["statement_timeout"] = str(settings.DB_STATEMENT_TIMEOUT)
+    if settings.DB_IDLE_IN_TRANSACTION_SESSION_TIMEOUT:
+        params["idle_in_transaction_session_timeout"] = str(
+            settings.DB_IDLE_IN_TRANSACTION_SESSION_TIMEOUT
+        )
+    if not settings.DB_JIT:
+        params["jit"] = "off"
+    if settings.DB_WORK_MEM:
+        params["work_mem"] = settings.DB_WORK_MEM
+    return params
+
+
+def _listen_connect(engine: Engine, session_parameters: dict[str, str]) -> None:
+    """Set the session parameters on each new connection of the engine."""
+    if not session_parameters:
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_session_parameters(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in session_parameters.items():
+                quoted = value.replace("'", "''")
+                cursor.execute(f"SET {name} = '{quoted}'")
+        finally:
+            cursor.close()
+        # commit, or the parameters would be reset by the rollback when returned to the pool
+        dbapi_connection.commit()
+
+
 class DatabaseSessionManager:
     """DatabaseSessionManager."""
 
     def __init__(self) -> None:
         """Init the manager."""
         self._engine: Engine | None = None
+        self._async_engine: AsyncEngine | None = None
+        self._async_engine_params: tuple[str, dict] | None = None
+        self._session_parameters: dict[str, str] = {}
+        self._compiled_cache_stats = False
+
+    def initialize(
+        self,
+        url: str,
+        async_url: str | None = None,
+        session_parameters: dict[str, str] | None = None,
+        *,
+        compiled_cache_stats: bool = False,
+        async_connect_args: dict[str, Any] | None = None,
+        async_pool_size: int | None = None,
+        async_max_overflow: int | None = None,
+        **kwargs,
+    ) -> None:
+        """Initialize the database engine.
+
+        If async_url is specified, the async engine is created with the same kwargs on first use,
+        so that it's bound to the running event loop, and it's not created by the commands
+        that don't need it. The async_connect_args are passed only to the driver of the async
+        engine, and async_pool_size and async_max_overflow, if specified, replace pool_size and
+        max_overflow for the pool of the async engine.
 
-    def initialize(self, url: str, **kwargs) -> None:
-        """Initialize the database engine."""
+        The session_parameters are set with SET on each new connection of both the engines.
+        If compiled_cache_stats is True, the lookups of the compiled cache are counted.
+        """
         if self._engine:
             err = "DB engine already initialized"
             raise RuntimeError(err)
-        self._engine = create_engine(url, **kwargs)
+        self._session_parameters = session_parameters or {}
+        self._compiled_cache_stats = compiled_cache_stats
+        self._engine = create_engine(url, **{"poolclass": InstrumentedQueuePool, **kwargs})
+        _listen_connect(self._engine, self._session_parameters)
+        if compiled_cache_stats:
+            compiled_cache.listen(self._engine)
+        if async_url:
+            if async_connect_args:
+                kwargs = {**kwargs, "connect_args": async_connect_args}
+            if async_pool_size is not None:
+                kwargs = {**kwargs, "pool_size": async_pool_size}
+            if async_max_overflow is not None:
+                kwargs = {**kwargs, "max_overflow": async_max_overflow}
+            self._async_engine_params = (async_url, kwargs)
         L.info("DB engine has been initialized")
 
     def close(self) -> None:
@@ -32,8 +114,16 @@ class DatabaseSessionManager:
             raise RuntimeError(err)
         self._engine.dispose()
         self._engine = None
+        self._async_engine_params = None
         L.info("DB engine has been closed")
 
+    async def close_async(self) -> None:
+        """Shut down the async database engine, if it has been created."""
+        if self._async_engine:
+            await self._async_engine.dispose()
+            self._async_engine = None
+            L.info("DB async engine has been closed")
+
     @property
     def engine(self) -> Engine:
         """The database engine."""
@@ -42,6 +132,59 @@ class DatabaseSessionManager:
             raise RuntimeError(err)
         return self._engine
 
+    @property
+    def async_engine(self) -> AsyncEngine:
+        """The async database engine, created on first use."""
+        if not self._async_engine:
+            if not self._async_engine_params:
+                err = "DB async engine not initialized"
+                raise RuntimeError(err)
+            url, kwargs = self._async_engine_params
+            self._async_engine = create_async_engine(
+                url, **{"poolclass": InstrumentedAsyncAdaptedQueuePool, **kwargs}
+            )
+            _listen_connect(self._async_engine.sync_engine, self._session_parameters)
+            if self._compiled_cache_stats:
+                compiled_cache.listen(self._async_engine.sync_engine)
+            L.info("DB async engine has been initialized")
+        return self._async_engine
+
+    def prewarm(self, size: int) -> None:
+        """Open the given number of connections in the pool of the sync engine."""
+        with ExitStack() as stack:
+            for _ in range(size):
+                stack.enter_context(self.engine.connect())
+        L.info("DB pool prewarmed with {} connections", size)
+
+    async def prewarm_async(self, size: int) -> None:
+        """Open concurrently the given number of connections in the pool of the async engine."""
+        async with AsyncExitStack() as stack:
+            await asyncio.gather(
+                *(stack.enter_async_context(self.async_engine.connect()) for _ in range(size))
+            )
+        L.info("DB async pool prewarmed with {} connections", size)
+
+    def pool_stats(self) -> dict[str, PoolStats]:
+        """Return the stats of the pools of the sync and async engines, if created."""
+        engines = {"sync": self._engine, "async": self._async_engine}
+        return {
+            name: stats
+            for name, engine in engines.items()
+            if engine and (stats := get_pool_stats(engine.pool)) is not None
+        }
+
+    def compiled_cache_sizes(self) -> dict[str, int]:
+        """Return the number of statements in the compiled cache of the engines, if created."""
+        engines = {
+            "sync": self._engine,
+            "async": self._async_engine.sync_engine if self._async_engine else None,
+        }
+        return {
+            name: len(cache)
+            for name, engine in engines.items()
+            if engine and (cache := engine._compiled_cache) is not None  # ruff:ignore[private-member-access]
+        }
+
     @contextmanager
     def session(self) -> Iterator[Session]:
         """Yield a new database session."""
@@ -59,15 +202,51 @@ class DatabaseSessionManager:
             else:
                 session.commit()
 
+    @asynccontextmanager
+    async def async_session(self) -> AsyncIterator[AsyncSession]:
+        """Yield a new async database session."""
+        async with AsyncSession(
+            self.async_engine,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        ) as session:
+            try:
+                yield session
+            except Exception:
+                await session.rollback()
+                raise
+            else:
+                await session.commit()
+
+
+def get_async_connect_args() -> dict[str, Any]:
+    """Return the arguments passed to the driver of the async engine, according to the settings.
+
+    The sync driver (psycopg2) doesn't support the server-side prepared statements, while asyncpg
+    prepares every statement, and keeps the most recent ones prepared on each connection.
+    """
+    if settings.DB_ASYNC_URI.startswith("postgresql+asyncpg"):
+        return {"prepared_statement_cache_size": settings.DB_ASYNC_PREPARED_STATEMENT_CACHE_SIZE}
+    return {}
+
 
 def configure_database_session_manager(**kwargs) -> DatabaseSessionManager:
     database_session_manager = DatabaseSessionManager()
     database_session_manager.initialize(
         url=settings.DB_URI,
+        async_url=settings.DB_ASYNC_URI,
+        session_parameters=get_session_parameters(),
+        compiled_cache_stats=settings.DB_COMPILED_CACHE_STATS_ENABLED,
+        async_connect_args=get_async_connect_args(),
+        async_pool_size=settings.DB_ASYNC_POOL_SIZE,
+        async_max_overflow=settings.DB_ASYNC_MAX_OVERFLOW,
         **{
             "pool_size": settings.DB_POOL_SIZE,
             "pool_pre_ping": settings.DB_POOL_PRE_PING,
             "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
             **kwargs,
         },
     )
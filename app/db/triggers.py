@@ -36,6 +36,7 @@ from app.db.model import (
 )
 
 MAX_IDENTIFIER_LENGTH = 59
+TSVECTOR_WEIGHTS = "ABCD"
 
 
 def _check_name_length(s: str, min_len: int = 1, max_len: int = 63) -> str:
@@ -78,26 +79,91 @@ def _get_unauthorized_trigger_name(table: str, field_name: str) -> str:
     return _check_name_length(name)
 
 
-def description_vector_trigger(
-    model: type[DeclarativeBase], signature: str, target_field: str, fields: list[str]
-):
+def _check_description_vector_fields(
+    model: type[DeclarativeBase], target_field: str, fields: list[str]
+) -> None:
     if not fields:
         msg = "At least one field required"
         raise TypeError(msg)
+    if len(fields) > len(TSVECTOR_WEIGHTS):
+        msg = f"At most {len(TSVECTOR_WEIGHTS)} fields allowed"
+        raise TypeError(msg)
 
     for field in [target_field, *fields]:
         if not isinstance(getattr(model, field, None), InstrumentedAttribute):
             msg = f"{field!r} is not a column of {model.__name__}"
             raise TypeError(msg)
 
+
+def description_vector_function(
+    model: type[DeclarativeBase], signature: str, target_field: str, fields: list[str]
+) -> PGFunction:
+    """Return a PGFunction that computes the weighted text search vector of the fields.
+
+    The fields are given in decreasing order of relevance, and they are weighted from A to D,
+    so that `ts_rank_cd` ranks the matches in the first fields higher.
+    """
+    _check_description_vector_fields(model, target_field, fields)
+    weighted_vectors = " || ".join(
+        f"setweight(to_tsvector('pg_catalog.english', coalesce(NEW.{field}, '')), '{weight}')"
+        for field, weight in zip(fields, TSVECTOR_WEIGHTS, strict=False)
+    )
+    return PGFunction(
+        schema="public",
+        signature=f"{_check_name_length(signature)}()",
+        definition=f"""
+            RETURNS TRIGGER AS $$
+            BEGIN
+                NEW.{target_field} := {weighted_vectors};
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+        """,
+    )
+
+
+def description_vector_trigger(
+    model: type[DeclarativeBase], signature: str, target_field: str, fields: list[str]
+) -> PGTrigger:
+    _check_description_vector_fields(model, target_field, fields)
     return PGTrigger(
         schema="public",
         signature=_check_name_length(signature),
         on_entity=model.__tablename__,
         definition=f"""
-            BEFORE INSERT OR UPDATE ON {model.__tablename__}
-            FOR EACH ROW EXECUTE FUNCTION
-                tsvector_update_trigger({target_field}, 'pg_catalog.english', {", ".join(fields)})
+            BEFORE INSERT OR UPDATE OF {", ".join(fields)} ON {model.__tablename__}
+            FOR EACH ROW EXECUTE FUNCTION {signature}()
+        """,
+    )
+
+
+def reset_embedding_function() -> PGFunction:
+    """Return a PGFunction that resets the embedding when the name or the description change."""
+    return PGFunction(
+        schema="public",
+        signature="reset_embedding()",
+        definition="""
+            RETURNS TRIGGER AS $$
+            BEGIN
+                IF NEW.name IS DISTINCT FROM OLD.name
+                    OR NEW.description IS DISTINCT FROM OLD.description THEN
+                    NEW.embedding := NULL;
+                END IF;
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+        """,
+    )
+
+
+def reset_embedding_trigger(model: type[DeclarativeBase]) -> PGTrigger:
+    table = model.__tablename__
+    return PGTrigger(
+        schema="public",
+        signature=_check_name_length(f"{table}_reset_embedding"),
+        on_entity=table,
+        definition=f"""BEFORE UPDATE OF name, description ON {table}
+            FOR EACH ROW EXECUTE FUNCTION reset_embedding();
         """,
     )
 
@@ -255,21 +321,42 @@ protected_entity_relationships = [
     (TaskConfig, "task_config_generator_id"),
 ]
 
-entities = [
-    description_vector_trigger(
-        model=mapper.class_,
-        signature=f"{mapper.class_.__tablename__}_description_vector",
-        target_field="description_vector",
-        fields=["description", "name"],
-    )
+description_vector_models = [
+    mapper.class_
     for mapper in Base.registry.mappers
     if issubclass(mapper.class_, NameDescriptionVectorMixin)
     and "description_vector" in mapper.class_.__table__.c  # exclude children
 ]
 
+entities = []
+for model in description_vector_models:
+    entities += [
+        description_vector_function(
+            model=model,
+            signature=f"{model.__tablename__}_description_vector",
+            target_field="description_vector",
+            fields=["name", "description"],
+        ),
+        description_vector_trigger(
+            model=model,
+            signature=f"{model.__tablename__}_description_vector",
+            target_field="description_vector",
+            fields=["name", "description"],
+        ),
+    ]
+
+entities += [reset_embedding_function()]
+entities += [
+    reset_embedding_trigger(model=mapper.class_)
+    for mapper in Base.registry.mappers
+    if issubclass(mapper.class_, NameDescriptionVectorMixin)
+    and "embedding" in mapper.class_.__table__.c  # exclude children
+]
+
 entities += [
     PGExtension(schema="public", signature="vector"),
     PGExtension(schema="public", signature="uuid-ossp"),
+    PGExtension(schema="public", signature="pg_trgm"),
 ]
 
 for model, field_name in protected_entity_relationships:
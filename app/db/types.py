@@ -100,6 +100,13 @@ class StorageType(StrEnum):
     aws_s3_open = auto()
 
 
+class SimilarityMetric(StrEnum):
+    """Distance between embeddings, each metric has its own pgvector index."""
+
+    l2 = auto()
+    cosine = auto()
+
+
 class EntityLifecycleStatus(StrEnum):
     draft = auto()
     active = auto()
@@ -22,6 +22,7 @@ from app.db.model import (
     LocationMixin,
     MeasurableEntityMixin,
     MTypeClassification,
+    NameDescriptionVectorMixin,
     TaskResult,
 )
 from app.db.types import (
@@ -30,6 +31,7 @@ from app.db.types import (
     AssetLabel,
     CellMorphologyGenerationType,
     EntityType,
+    GlobalType,
     LabelRequirements,
     ResourceType,
 )
@@ -125,6 +127,24 @@ EntityTypeWithBrainRegion = StrEnum(
     sorted(entity_type_with_brain_region_enum_members),
 )
 
+SUGGEST_GLOBAL_TYPES = [
+    GlobalType.brain_region,
+    GlobalType.species,
+    GlobalType.mtype_class,
+    GlobalType.etype_class,
+]
+
+SUGGEST_ENTITY_TYPES = [
+    entity_type
+    for entity_type, cls in ENTITY_TYPE_TO_CLASS.items()
+    if issubclass(cls, NameDescriptionVectorMixin)
+]
+
+SuggestType = StrEnum(
+    "SuggestType",
+    sorted(str(member) for member in [*SUGGEST_ENTITY_TYPES, *SUGGEST_GLOBAL_TYPES]),
+)
+
 
 def _model_kwargs[T: DeclarativeBase](model_cls: type[T], data: dict) -> dict:
     """Build the kwars needed to create or update a database model."""
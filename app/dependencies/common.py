@@ -1,4 +1,6 @@
+import re
 import uuid
+from enum import StrEnum, auto
 from http import HTTPStatus
 from typing import Annotated, Protocol
 
@@ -6,16 +8,22 @@ import sqlalchemy as sa
 from fastapi import Depends, Query
 from fastapi.dependencies.models import Dependant
 from pydantic import BaseModel, Field, model_validator
+from sqlalchemy.dialects.postgresql import REGCONFIG
 from sqlalchemy.orm import DeclarativeBase, InstrumentedAttribute, Session
 from starlette.requests import Request
 
-from app.db.types import DerivationType
+from app.db.types import DerivationType, SimilarityMetric
 from app.errors import ApiError, ApiErrorCode
 from app.filters.brain_region import WithinBrainRegionDirection, filter_by_region
 from app.queries.expand import EntityExpand
 from app.queries.types import FacetQueryParamsMap
+from app.schemas.asset import DirectoryListRequest
 from app.schemas.types import Facet, Facets, PaginationRequest
 
+# same configuration used by the triggers computing the description vectors
+TEXT_SEARCH_CONFIG = "pg_catalog.english"
+HEADLINE_OPTIONS = "MaxFragments=2, MaxWords=20, MinWords=5"
+
 
 class BuildFacetQuery(Protocol):
     """Build a facet query with the given facet key."""
@@ -81,7 +89,8 @@ def _get_facets(
     for facet_type, fields in name_to_facet_query_params.items():
         groupby_fields = {"type": sa.literal(facet_type), **fields}
         groupby_columns = [groupby_fields[key].label(key) for key in groupby_keys]  # type: ignore[attr-defined]
-        groupby_ids = [sa.literal(i + 1) for i in range(len(groupby_columns))]
+        # rendered inline, since the bound parameters aren't positions with asyncpg
+        groupby_ids = [sa.literal_column(str(i + 1)) for i in range(len(groupby_columns))]
         facet_q = build_facet_query(facet_key=facet_type)
         # ensure that only the required columns are selected
         facet_q = (
@@ -124,14 +133,85 @@ class WithFacets(BaseModel):
         )
 
 
+class SearchSyntax(StrEnum):
+    """Syntax of the full-text search query."""
+
+    plain = auto()  # all the words must match
+    websearch = auto()  # quoted phrases, OR and -word, as in web search engines
+    prefix = auto()  # all the words must match, also as prefix of longer words
+
+
 class Search[T: DeclarativeBase](BaseModel):
+    """Handle the full-text search parameters.
+
+    `search` filters the results matching the text. The results are ordered by relevance,
+    instead of `order_by`, if `search_ranked` is true, and the snippets of the matching
+    descriptions are returned in `search_headlines` if `search_headline` is true.
+
+    `semantic_search` orders the results combining the full-text and the semantic similarity
+    to the text, without filtering them.
+    """
+
     search: str | None = None
+    search_syntax: SearchSyntax = SearchSyntax.plain
+    search_ranked: bool = False
+    search_headline: bool = False
+    semantic_search: str | None = None
 
-    def __call__(self, q: sa.Select[tuple[T]], vector_col: InstrumentedAttribute):
+    def get_tsquery(self) -> sa.ColumnElement | None:
+        """Return the text search query, or None if search isn't specified."""
         if not self.search:
+            return None
+        config = sa.cast(TEXT_SEARCH_CONFIG, REGCONFIG)
+        match self.search_syntax:
+            case SearchSyntax.plain:
+                return sa.func.plainto_tsquery(config, self.search)
+            case SearchSyntax.websearch:
+                return sa.func.websearch_to_tsquery(config, self.search)
+            case SearchSyntax.prefix:
+                # keep only the words, because the operators of to_tsquery would be invalid
+                words = re.findall(r"\w+", self.search)
+                return sa.func.to_tsquery(config, " & ".join(f"{word}:*" for word in words))
+
+    def get_rank(self, vector_col: InstrumentedAttribute) -> sa.ColumnElement[float] | None:
+        """Return the relevance of the results, or None if they shouldn't be ranked."""
+        if not self.search_ranked or (tsquery := self.get_tsquery()) is None:
+            return None
+        return sa.func.ts_rank_cd(vector_col, tsquery)
+
+    def get_headline(self, text_col: InstrumentedAttribute) -> sa.ColumnElement[str] | None:
+        """Return the snippets of the text matching the search, or None if not requested."""
+        if not self.search_headline or (tsquery := self.get_tsquery()) is None:
+            return None
+        config = sa.cast(TEXT_SEARCH_CONFIG, REGCONFIG)
+        return sa.func.ts_headline(config, text_col, tsquery, HEADLINE_OPTIONS)
+
+    def __call__(self, q: sa.Select[tuple[T]], vector_col: InstrumentedAttribute):
+        if (tsquery := self.get_tsquery()) is None:
             return q
 
-        return q.where(vector_col.match(self.search))
+        return q.where(vector_col.op("@@")(tsquery))
+
+
+class SemanticSearchQuery(BaseModel):
+    """Handle the parameters for ordering the results by similarity to the semantic_search text.
+
+    `semantic_search_ef_search` is the size of the candidate list of the HNSW index scans:
+    higher values improve the recall of the approximate search, at the cost of speed.
+    """
+
+    semantic_search: str | None = None
+    semantic_search_metric: SimilarityMetric = SimilarityMetric.l2
+    semantic_search_ef_search: Annotated[int | None, Field(ge=1, le=1000)] = None
+
+
+class NearestQuery(BaseModel):
+    """Handle the parameters for retrieving the k items nearest to the semantic_search text."""
+
+    semantic_search: str
+    semantic_search_metric: SimilarityMetric = SimilarityMetric.l2
+    semantic_search_ef_search: Annotated[int | None, Field(ge=1, le=1000)] = None
+    k: Annotated[int, Field(ge=1, le=100)] = 10
 
 
 class InBrainRegionQuery(BaseModel):
@@ -216,9 +296,12 @@ class DerivationQuery(BaseModel):
 
 
 PaginationQuery = Annotated[PaginationRequest, Depends(PaginationRequest)]
+DirectoryListQuery = Annotated[DirectoryListRequest, Depends(DirectoryListRequest)]
 FacetsDep = Annotated[WithFacets, Depends()]
 SearchDep = Annotated[Search, Depends()]
 InBrainRegionDep = Annotated[InBrainRegionQuery, Depends()]
+SemanticSearchDep = Annotated[SemanticSearchQuery, Depends()]
+NearestDep = Annotated[NearestQuery, Depends()]
 DerivationQueryDep = Annotated[DerivationQuery, Depends()]
 # `?expand=generated_from_derivations&expand=used_by_derivations` — available on every entity
 # read endpoint.
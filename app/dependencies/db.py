@@ -1,15 +1,32 @@
-from collections.abc import Iterator
+from collections.abc import AsyncGenerator, AsyncIterator, Iterator
+from contextlib import aclosing
 from typing import Annotated
 
+import sqlalchemy as sa
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from starlette.requests import Request
 
+from app.config import settings
 from app.repository.group import RepositoryGroup
 
 
+def get_route_statement_timeout_query(request: Request) -> sa.Select | None:
+    """Return the query setting the statement timeout of the route, if configured.
+
+    The timeout is set only for the current transaction, overriding DB_STATEMENT_TIMEOUT.
+    """
+    route = request.scope.get("route")
+    if not route or (timeout := settings.DB_ROUTE_STATEMENT_TIMEOUTS.get(route.path)) is None:
+        return None
+    return sa.select(sa.func.set_config("statement_timeout", str(timeout), sa.true()))
+
+
 def _get_session(request: Request) -> Iterator[Session]:
     with request.state.database_session_manager.session() as session:
+        if (query := get_route_statement_timeout_query(request)) is not None:
+            session.execute(query)
         yield session
 
 
@@ -18,6 +35,23 @@ def get_db(request: Request) -> Iterator[Session]:
     yield from _get_session(request)
 
 
+async def _get_async_session(request: Request) -> AsyncGenerator[AsyncSession]:
+    # the dependencies with yield are always closed by FastAPI
+    async with request.state.database_session_manager.async_session() as session:
+        if (query := get_route_statement_timeout_query(request)) is not None:
+            await session.execute(query)
+        yield session  # ruff:ignore[yield-in-context-manager-in-async-generator]
+
+
+async def get_async_db(request: Request) -> AsyncIterator[AsyncSession]:
+    """Yield an async database session, to be used as a dependency in async routes."""
+    # unlike yield from, async for doesn't close the inner generator if an exception is raised,
+    # and the session would be closed only when the generator is garbage collected
+    async with aclosing(_get_async_session(request)) as sessions:
+        async for session in sessions:
+            yield session  # ruff:ignore[yield-in-context-manager-in-async-generator]
+
+
 def _get_repo_group(db: "SessionDep") -> RepositoryGroup:
     """Return the repository group, to be used as a dependency."""
     return RepositoryGroup(db=db)
@@ -28,4 +62,5 @@ def _get_repo_group(db: "SessionDep") -> RepositoryGroup:
 # In this way, the commit of the db transaction and the associated events
 # are executed before the response is sent back to the client.
 SessionDep = Annotated[Session, Depends(get_db, scope="function")]
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_db, scope="function")]
 RepoGroupDep = Annotated[RepositoryGroup, Depends(_get_repo_group)]
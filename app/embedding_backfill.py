@@ -0,0 +1,116 @@
+"""Compute the missing embeddings of the entities with name and description.
+
+The embeddings are used by `semantic_search`, and they are reset by a trigger when the name
+or the description change, so that they are computed again.
+"""
+
+import threading
+from collections.abc import Callable
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.db.model import Base, NameDescriptionVectorMixin
+from app.db.session import DatabaseSessionManager
+from app.logger import L
+from app.utils.embedding import get_embedding_provider
+
+MAX_TEXT_LENGTH = 8000  # characters, well below the token limit of the embedding models
+
+
+def get_embedding_tables() -> list[sa.Table]:
+    """Return the tables with an embedding column computed from name and description."""
+    return [
+        Base.metadata.tables[mapper.class_.__tablename__]
+        for mapper in Base.registry.mappers
+        if issubclass(mapper.class_, NameDescriptionVectorMixin)
+        and "embedding" in mapper.class_.__table__.c  # exclude children
+    ]
+
+
+def get_embedding_text(name: str, description: str) -> str:
+    """Return the text used to compute the embedding of an entity, with collapsed whitespaces.
+
+    The case is preserved, as in the texts of the queries sent to the embedding provider.
+    """
+    return " ".join(f"{name}\n{description}".split())[:MAX_TEXT_LENGTH]
+
+
+def backfill_embeddings(db: Session, *, limit: int) -> int:
+    """Compute up to limit missing embeddings, and return the number of updated rows.
+
+    The rows are locked while the embeddings are computed, and the rows already locked by other
+    transactions are skipped. The embeddings aren't added to the embedding cache, because the
+    texts aren't expected to be requested again.
+    """
+    provider = get_embedding_provider()
+    count = 0
+    for table in get_embedding_tables():
+        if count >= limit:
+            break
+        query = (
+            sa.select(table.c.id, table.c.name, table.c.description)
+            .where(table.c.embedding.is_(None))
+            .limit(limit - count)
+            .with_for_update(skip_locked=True)
+        )
+        rows = db.execute(query).all()
+        if not rows:
+            continue
+        texts = [get_embedding_text(row.name, row.description) for row in rows]
+        embeddings = provider.embed_batch(texts)
+        db.execute(
+            sa.update(table)
+            .where(table.c.id == sa.bindparam("row_id"))
+            .values(embedding=sa.bindparam("row_embedding")),
+            [
+                {"row_id": row.id, "row_embedding": embedding}
+                for row, embedding in zip(rows, embeddings, strict=True)
+            ],
+        )
+        count += len(rows)
+    return count
+
+
+def _backfill_worker(
+    stop: threading.Event,
+    database_session_manager: DatabaseSessionManager,
+    interval: float,
+    batch_size: int,
+) -> None:
+    """Compute up to batch_size embeddings every interval seconds, to limit the request rate."""
+    while not stop.wait(timeout=interval):
+        try:
+            with database_session_manager.session() as db:
+                count = backfill_embeddings(db, limit=batch_size)
+        except Exception:  # ruff:ignore[blind-except]
+            L.exception("Failed to backfill embeddings")
+            continue
+        if count:
+            L.info("Computed {} embeddings", count)
+
+
+def start_embedding_backfill_thread(
+    database_session_manager: DatabaseSessionManager,
+) -> Callable[[], None]:
+    """Start a daemon thread for periodic backfilling. Returns a stop function."""
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=_backfill_worker,
+        args=(
+            stop,
+            database_session_manager,
+            settings.EMBEDDING_BACKFILL_INTERVAL_SECONDS,
+            settings.EMBEDDING_BACKFILL_BATCH_SIZE,
+        ),
+        daemon=True,
+        name="embedding-backfill",
+    )
+    thread.start()
+
+    def shutdown() -> None:
+        stop.set()
+        thread.join(timeout=5)
+
+    return shutdown
@@ -1,22 +1,87 @@
-"""Freeze startup objects, disable automatic GC, run gen1/gen2 on separate background intervals."""
+"""Freeze startup objects, disable automatic GC, run gen1/gen2 on separate background intervals.
 
+In adaptive mode, the collections are executed when no request is in flight, unless they have
+been waiting too long for an idle window, or the allocations or the memory usage are too high.
+"""
+
+import bisect
+import dataclasses
 import gc
 import threading
 import time
+from collections import Counter
 from collections.abc import Callable
+from typing import Any
 
+from app.admission_control import request_counters
 from app.config import settings
 from app.logger import L
+from app.utils.process import get_rss
+
+MB = 1024**2
+
+# upper bounds in seconds of the buckets of the pause histograms, the last bucket is unbounded
+PAUSE_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+
+@dataclasses.dataclass
+class PauseHistogram:
+    """Histogram of the GC pauses of a generation."""
+
+    counts: list[int] = dataclasses.field(default_factory=lambda: [0] * (len(PAUSE_BUCKETS) + 1))
+    total: float = 0.0
+    max: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Add a pause to the histogram."""
+        self.counts[bisect.bisect_left(PAUSE_BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+@dataclasses.dataclass
+class GCStats:
+    """Pauses of all the collections, and reasons of the collections triggered by the worker."""
+
+    pauses: dict[int, PauseHistogram] = dataclasses.field(
+        default_factory=lambda: {generation: PauseHistogram() for generation in range(3)}
+    )
+    triggers: Counter[str] = dataclasses.field(default_factory=Counter)
+    started_at: float | None = None
+
+
+gc_stats = GCStats()
+
+
+def _gc_callback(phase: str, info: dict[str, Any]) -> None:
+    """Record the duration of the collections, executed with the GIL held."""
+    if phase == "start":
+        gc_stats.started_at = time.perf_counter()
+    elif phase == "stop" and gc_stats.started_at is not None:
+        gc_stats.pauses[info["generation"]].observe(time.perf_counter() - gc_stats.started_at)
+        gc_stats.started_at = None
 
 
 def configure_gc() -> None:
-    """Freeze existing objects and disable automatic GC."""
+    """Freeze existing objects, disable automatic GC, and record the pauses of the collections."""
     gc.collect(2)
     gc.freeze()
     gc.disable()
+    if _gc_callback not in gc.callbacks:
+        gc.callbacks.append(_gc_callback)
     L.info("GC configured: frozen={} objects, automatic collection disabled", gc.get_freeze_count())
 
 
+def freeze_before_fork() -> None:
+    """Freeze existing objects, so that the forked workers can share them copy-on-write.
+
+    The frozen objects are ignored by the collections in the workers, that would otherwise write
+    to the object headers and copy the memory pages of the parent.
+    """
+    gc.freeze()
+    L.info("GC frozen {} objects before forking", gc.get_freeze_count())
+
+
 def _collect(generation: int, level: str = "debug") -> None:
     """Run gc.collect for the given generation and log results with timing."""
     t0 = time.monotonic()
@@ -44,15 +109,121 @@ def _gc_worker(stop: threading.Event, gen1_interval: float, gen2_interval: float
             last_gen2 = now
 
 
+@dataclasses.dataclass(frozen=True)
+class AdaptivePolicy:
+    """Parameters of the adaptive mode, see the GC settings."""
+
+    gen1_interval: float
+    gen2_interval: float
+    poll_interval: float
+    idle_seconds: float
+    max_idle_wait: float
+    max_gen0_count: int
+    max_rss: int | None  # bytes
+    rss_min_interval: float
+
+    @classmethod
+    def from_settings(cls) -> "AdaptivePolicy":
+        """Return the policy configured in the settings."""
+        return cls(
+            gen1_interval=settings.GC_GEN1_INTERVAL_SECONDS,
+            gen2_interval=settings.GC_GEN2_INTERVAL_SECONDS,
+            poll_interval=settings.GC_POLL_INTERVAL_SECONDS,
+            idle_seconds=settings.GC_IDLE_SECONDS,
+            max_idle_wait=settings.GC_MAX_IDLE_WAIT_SECONDS,
+            max_gen0_count=settings.GC_MAX_GEN0_COUNT,
+            max_rss=settings.GC_MAX_RSS_MB * MB if settings.GC_MAX_RSS_MB else None,
+            rss_min_interval=settings.GC_RSS_MIN_INTERVAL_SECONDS,
+        )
+
+
+def _choose_collection(
+    policy: AdaptivePolicy,
+    *,
+    since_gen1: float,
+    since_gen2: float,
+    idle: bool,
+    gen0_count: int,
+    rss: int | None,
+    rss_interval: float,
+) -> tuple[int, str] | None:
+    """Return the generation to be collected and the reason, or None if not needed.
+
+    Args:
+        policy: adaptive policy.
+        since_gen1: seconds elapsed since the last collection of gen1 or gen2.
+        since_gen2: seconds elapsed since the last collection of gen2.
+        idle: True if no request has been in flight for a while.
+        gen0_count: number of allocations minus deallocations since the last collection.
+        rss: bytes resident in memory, or None if not checked.
+        rss_interval: min seconds elapsed since the last collection of gen2 to collect it again
+            because of the rss.
+    """
+    if (
+        policy.max_rss is not None
+        and rss is not None
+        and rss > policy.max_rss
+        and since_gen2 >= rss_interval
+    ):
+        return 2, "rss"
+    if gen0_count > policy.max_gen0_count:
+        return 1, "count"
+    for generation, elapsed, interval in [
+        (2, since_gen2, policy.gen2_interval),
+        (1, since_gen1, policy.gen1_interval),
+    ]:
+        if idle and elapsed >= interval:
+            return generation, "idle"
+        if elapsed >= interval + policy.max_idle_wait:
+            return generation, "overdue"
+    return None
+
+
+def _adaptive_gc_worker(stop: threading.Event, policy: AdaptivePolicy) -> None:
+    """Check every poll_interval seconds if a collection is needed, and execute it."""
+    last_gen1 = last_gen2 = time.monotonic()
+    rss_interval = policy.rss_min_interval
+    while not stop.wait(timeout=policy.poll_interval):
+        now = time.monotonic()
+        rss = get_rss() if policy.max_rss is not None else None
+        choice = _choose_collection(
+            policy,
+            since_gen1=now - last_gen1,
+            since_gen2=now - last_gen2,
+            idle=request_counters.idle_time() >= policy.idle_seconds,
+            gen0_count=gc.get_count()[0],
+            rss=rss,
+            rss_interval=rss_interval,
+        )
+        if rss is not None and policy.max_rss is not None and rss <= policy.max_rss:
+            rss_interval = policy.rss_min_interval
+        if choice is None:
+            continue
+        generation, reason = choice
+        gc_stats.triggers[reason] += 1
+        if reason == "rss":
+            # the memory may not be released to the OS after the collection, so the next ones
+            # are delayed more and more while the rss remains above max_rss
+            rss_interval = max(min(rss_interval * 2, policy.gen2_interval), policy.rss_min_interval)
+        if generation == 1:
+            _collect(1, level="debug")
+            last_gen1 = time.monotonic()
+        else:
+            _collect(2, level="info")
+            last_gen1 = last_gen2 = time.monotonic()
+
+
 def start_gc_thread() -> Callable[[], None]:
-    """Start a daemon thread for periodic GC. Returns a stop function."""
+    """Start a daemon thread for periodic or adaptive GC. Returns a stop function."""
     stop = threading.Event()
-    thread = threading.Thread(
-        target=_gc_worker,
-        args=(stop, settings.GC_GEN1_INTERVAL_SECONDS, settings.GC_GEN2_INTERVAL_SECONDS),
-        daemon=True,
-        name="gc-worker",
-    )
+    if settings.GC_ADAPTIVE_ENABLED:
+        target, args = _adaptive_gc_worker, (stop, AdaptivePolicy.from_settings())
+    else:
+        target, args = (
+            _gc_worker,
+            (stop, settings.GC_GEN1_INTERVAL_SECONDS, settings.GC_GEN2_INTERVAL_SECONDS),
+        )
+    thread = threading.Thread(target=target, args=args, daemon=True, name="gc-worker")
     thread.start()
 
     def shutdown() -> None:
@@ -135,8 +135,16 @@ def configure_warnings():
 
 
 @contextmanager
-def timed(msg: str, level: str = "INFO") -> Generator[None]:
-    """Context manager to log the execution of a block of code."""
+def timed(
+    msg: str, level: str = "INFO", timings: dict[str, float] | None = None
+) -> Generator[None]:
+    """Context manager to log the execution of a block of code.
+
+    Args:
+        msg: message to be logged.
+        level: log level.
+        timings: optional dict where the elapsed time in seconds is stored, using msg as key.
+    """
     start = time.perf_counter()
     status = "unknown"
     L.log(level, "{}...", msg)
@@ -149,4 +157,6 @@ def timed(msg: str, level: str = "INFO") -> Generator[None]:
         status = "done"
     finally:
         elapsed = time.perf_counter() - start
+        if timings is not None:
+            timings[msg] = elapsed
         L.log(level, "{}... {} in {:.1f}ms", msg, status, elapsed * 1000)
@@ -1,19 +1,33 @@
-"""Request context middleware."""
+"""Request context, admission control, profiler and memory tracking middlewares."""
 
 import time
+import tracemalloc
 from collections.abc import Awaitable, Callable
+from http import HTTPStatus
 
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from app.admission_control import get_overload_reason, get_threadpool_stats, request_counters
+from app.config import settings
 from app.context import RequestContext, request_context_provider
+from app.cpu_profiler import get_current_session
+from app.db import compiled_cache
+from app.errors import ApiErrorCode
 from app.logger import L
+from app.route_memory import route_memory_tracker
+from app.schemas.api import ErrorResponse
 from app.schemas.types import HeaderKey
 from app.utils.uuid import create_uuid
 
 RequestResponseEndpoint = Callable[[Request], Awaitable[Response]]
 
+# paths never rejected by the admission control, relative to the root path
+ADMISSION_EXEMPT_PATHS = {"/", "/health", "/version"}
+ADMISSION_EXEMPT_PREFIX = "/admin/debug/"
+
 
 class RequestContextMiddleware(BaseHTTPMiddleware):
     """Middleware to initialize request context and log access."""
@@ -28,6 +42,9 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
         request_id = str(create_uuid())
         ctx = RequestContext(request_id=request_id)
         request_context_provider.set(ctx)
+        cache_counters = (
+            compiled_cache.start_request() if settings.DB_COMPILED_CACHE_STATS_ENABLED else None
+        )
 
         try:
             response = await call_next(request)
@@ -52,6 +69,8 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
         response_size = response.headers.get(HeaderKey.content_length)
         route = request.scope.get("route")
         route_template = route.path if route else None
+        if cache_counters is not None:
+            compiled_cache.finish_request(f"{request.method} {route_template}", cache_counters)
 
         L.info(
             "request_completed",
@@ -62,9 +81,116 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
             status_class=response.status_code // 100,
             process_time_ms=round(process_time * 1000),
             response_size=int(response_size) if response_size else None,
+            threadpool_waiting=get_threadpool_stats().waiting,
             client=request.client.host if request.client else "",
             forwarded_for=request.headers.get(HeaderKey.forwarded_for, ""),
             user_agent=request.headers.get(HeaderKey.user_agent, ""),
         )
 
         return response
+
+
+class AdmissionControlMiddleware:
+    """Middleware to count the requests in flight, and reject them when overloaded.
+
+    It's a pure ASGI middleware, so that it doesn't add another task and another copy of the
+    body of each request, and so that the requests are counted until the response is sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Init the middleware."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Return 503 if the service is overloaded, or process the request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        path = scope["path"].removeprefix(scope.get("root_path", ""))
+        if (
+            settings.ADMISSION_CONTROL_ENABLED
+            and path not in ADMISSION_EXEMPT_PATHS
+            and not path.startswith(ADMISSION_EXEMPT_PREFIX)
+            and (
+                reason := get_overload_reason(
+                    getattr(scope["app"].state, "database_session_manager", None)
+                )
+            )
+        ):
+            request_counters.rejected += 1
+            L.warning("Request rejected, service overloaded: {}", reason)
+            err_content = ErrorResponse(
+                message="Service overloaded, retry later",
+                error_code=ApiErrorCode.SERVICE_OVERLOADED,
+                details=reason,
+            )
+            response = Response(
+                media_type="application/json",
+                status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+                content=err_content.model_dump_json(),
+                headers={HeaderKey.retry_after: str(settings.ADMISSION_RETRY_AFTER)},
+            )
+            await response(scope, receive, send)
+            return
+        request_counters.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_counters.in_flight -= 1
+            request_counters.last_finished_at = time.monotonic()
+
+
+class ProfilerMiddleware:
+    """Middleware to track the requests profiled by the CPU profiler.
+
+    It's a pure ASGI middleware, so that it doesn't add any significant overhead when idle.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Init the middleware."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process the request, and update the profiling session if the request is profiled."""
+        session = get_current_session()
+        if (
+            session is None
+            or scope["type"] != "http"
+            or not session.request_started(scope["path"].removeprefix(scope.get("root_path", "")))
+        ):
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            session.request_finished()
+
+
+class MemoryTrackingMiddleware:
+    """Middleware to record the memory traced during the requests, by route template.
+
+    It's a pure ASGI middleware, so that the memory allocated while sending the body of the
+    streaming responses is included.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Init the middleware."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process the request, recording the memory if enabled and tracemalloc is tracing."""
+        if (
+            not settings.TRACEMALLOC_PER_ROUTE_ENABLED
+            or scope["type"] != "http"
+            or not tracemalloc.is_tracing()
+        ):
+            await self.app(scope, receive, send)
+            return
+        start = route_memory_tracker.request_started()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            route = scope.get("route")
+            route_memory_tracker.request_finished(
+                f"{scope['method']} {route.path if route else '<unmatched>'}", start
+            )
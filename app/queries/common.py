@@ -1,9 +1,13 @@
 import uuid
-from collections.abc import Iterable, Set as AbstractSet
+from collections.abc import Iterable, Sequence, Set as AbstractSet
 from http import HTTPStatus
+from typing import Any, NamedTuple
 
+import anyio.to_thread
 import sqlalchemy as sa
 from pydantic import BaseModel
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import operators
 
@@ -12,12 +16,14 @@ from app.db.auth import (
     constrain_to_writable_entities,
 )
 from app.db.model import Activity, Identifiable
+from app.db.types import SimilarityMetric
 from app.db.utils import (
     get_authorized_project_id_declaring_class,
     load_db_model_from_pydantic,
     update_model,
 )
 from app.dependencies.common import (
+    TEXT_SEARCH_CONFIG,
     InBrainRegionQuery,
     PaginationQuery,
     Search,
@@ -52,7 +58,17 @@ from app.schemas.activity import ActivityCreate, ActivityUpdate
 from app.schemas.auth import UserContext, UserContextWithProjectId
 from app.schemas.base import Schema
 from app.schemas.routers import DeleteResponse
-from app.schemas.types import ListResponse, PaginationResponse
+from app.schemas.types import (
+    Facets,
+    ListResponse,
+    NearestNeighbor,
+    NearestNeighborsResponse,
+    PaginationResponse,
+)
+from app.utils.embedding import generate_embedding
+
+# constant of the reciprocal rank fusion, reducing the weight of the top ranks
+RRF_K = 60
 
 
 def router_read_one[T: Schema, I: Identifiable](
@@ -79,6 +95,27 @@ def router_read_one[T: Schema, I: Identifiable](
     Returns:
         the model data as a Pydantic model.
     """
+    row = _read_one_row(
+        id_=id_,
+        db=db,
+        db_model_class=db_model_class,
+        user_context=user_context,
+        apply_operations=apply_operations,
+        expand=expand,
+    )
+    return response_schema_class.model_validate(row)
+
+
+def _read_one_row[I: Identifiable](
+    *,
+    id_: uuid.UUID,
+    db: Session,
+    db_model_class: type[I],
+    user_context: UserContext | None,
+    apply_operations: ApplyOperations[I] | None,
+    expand: AbstractSet[str] | None = None,
+) -> I:
+    """Return the model to be validated by router_read_one."""
     query = sa.select(db_model_class).where(db_model_class.id == id_)
     if user_context and (
         id_model_class := get_authorized_project_id_declaring_class(db_model_class)
@@ -92,8 +129,7 @@ def router_read_one[T: Schema, I: Identifiable](
         query = apply_operations(query)
     query = apply_derivation_expand(query, db_model_class, expand)
     with ensure_result(error_message=f"{db_model_class.__name__} not found"):
-        row = db.execute(query).unique().scalar_one()
-    return response_schema_class.model_validate(row)
+        return db.execute(query).unique().scalar_one()
 
 
 def router_create_activity_one[T: Schema, I: Activity](
@@ -285,6 +321,80 @@ def _with_subquery[I: Identifiable](
     )
 
 
+def _get_embedding_distance(
+    db_model_class: type[Identifiable], embedding: list[float], metric: SimilarityMetric
+) -> sa.ColumnElement[float]:
+    """Return the distance to the given embedding, matching one of the indexes of the model."""
+    column = db_model_class.embedding  # type: ignore[attr-defined]
+    match metric:
+        case SimilarityMetric.l2:
+            return column.l2_distance(embedding)
+        case SimilarityMetric.cosine:
+            return column.cosine_distance(embedding)
+
+
+def _get_hybrid_search_score(
+    db_model_class: type[Identifiable], text: str, embedding: list[float]
+) -> sa.ColumnElement[float]:
+    """Return the reciprocal rank fusion of the full-text and the semantic rankings.
+
+    Each ranking contributes 1 / (RRF_K + rank) for the rows that it contains: respectively,
+    the rows matching the full-text query, and the rows having an embedding.
+    """
+    description_vector = db_model_class.description_vector  # type: ignore[attr-defined]
+    embedding_column = db_model_class.embedding  # type: ignore[attr-defined]
+    tsquery = sa.func.plainto_tsquery(sa.cast(TEXT_SEARCH_CONFIG, REGCONFIG), text)
+    distance = _get_embedding_distance(db_model_class, embedding, SimilarityMetric.l2)
+    text_rank = sa.func.rank().over(order_by=sa.func.ts_rank_cd(description_vector, tsquery).desc())
+    vector_rank = sa.func.rank().over(order_by=distance)
+    return sa.case(
+        (description_vector.op("@@")(tsquery), 1.0 / (RRF_K + text_rank)), else_=0.0
+    ) + sa.case((embedding_column.is_not(None), 1.0 / (RRF_K + vector_rank)), else_=0.0)
+
+
+def _get_search_score(
+    db: Session, db_model_class: type[Identifiable], with_search: Search | None
+) -> sa.ColumnElement[float] | None:
+    """Return the score used to order the results of the search, if any."""
+    description_vector = getattr(db_model_class, "description_vector", None)
+    if not with_search or not description_vector:
+        return None
+    if with_search.semantic_search:
+        return _get_hybrid_search_score(
+            db_model_class,
+            text=with_search.semantic_search,
+            embedding=generate_embedding(with_search.semantic_search, db=db),
+        )
+    return with_search.get_rank(description_vector)
+
+
+def _get_search_headlines(
+    db: Session,
+    db_model_class: type[Identifiable],
+    with_search: Search | None,
+    ids: Sequence[uuid.UUID],
+) -> dict[uuid.UUID, str] | None:
+    """Return the snippets of the descriptions matching the search, if requested."""
+    if not ids or not with_search or not hasattr(db_model_class, "description_vector"):
+        return None
+    headline = with_search.get_headline(db_model_class.description)  # type: ignore[attr-defined]
+    if headline is None:
+        return None
+    query = sa.select(db_model_class.id, headline.label("headline")).where(
+        db_model_class.id.in_(ids)
+    )
+    return {row.id: row.headline for row in db.execute(query)}
+
+
+def _set_ef_search(db: Session, ef_search: int | None) -> None:
+    """Set the size of the candidate list of the HNSW index scans, until the end of transaction.
+
+    Higher values improve the recall of the approximate search, at the cost of speed.
+    """
+    if ef_search is not None:
+        db.execute(sa.select(sa.func.set_config("hnsw.ef_search", str(ef_search), sa.true())))
+
+
 def _retrieve_rows[I: Identifiable](
     *,
     db: Session,
@@ -294,10 +404,16 @@ def _retrieve_rows[I: Identifiable](
     pagination_request: PaginationQuery,
     filter_model: CustomFilter[I],
     embedding: list[float] | None = None,
+    similarity_metric: SimilarityMetric = SimilarityMetric.l2,
+    score: sa.ColumnElement[float] | None = None,
     expand: AbstractSet[str] | None = None,
+    projection: Sequence[sa.ColumnElement] | None = None,
     filter_query: sa.Select[tuple[I]],
-) -> Iterable[I]:
-    """Execute the data query and return matching rows, or an empty list if page_size is 0."""
+) -> Iterable[I] | Iterable[sa.Row]:
+    """Execute the data query and return matching rows, or an empty list if page_size is 0.
+
+    If projection is given, only the selected columns are returned, without loading the models.
+    """
     if pagination_request.page_size <= 0:
         return []
 
@@ -316,11 +432,21 @@ def _retrieve_rows[I: Identifiable](
         # Remove existing ordering clauses
         data_query._order_by_clauses = ()  # ruff:ignore[private-member-access]
 
-        # Order by L2 distance first, then by ID to guarantee uniqueness
+        # Order by distance first, then by ID to guarantee uniqueness
         data_query = data_query.order_by(
-            db_model_class.embedding.l2_distance(embedding),  # type: ignore[attr-defined]
+            _get_embedding_distance(db_model_class, embedding, similarity_metric),
             *ensure_stable_sorting,
         )
+    elif score is not None:
+        data_query._order_by_clauses = ()  # ruff:ignore[private-member-access]
+        data_query = data_query.order_by(score.desc(), *ensure_stable_sorting)
+
+    if projection:
+        rows = db.execute(
+            data_query.with_only_columns(*projection, maintain_column_froms=True)
+        ).all()
+        # the rows duplicated by the joins are discarded, as done by unique() with the models
+        return {row.id: row for row in rows}.values()
 
     if apply_data_query_operations:
         data_query = _with_subquery(data_query=data_query, db_model_class=db_model_class)
@@ -332,6 +458,13 @@ def _retrieve_rows[I: Identifiable](
     return db.execute(data_query).scalars().unique()
 
 
+class _RowsPage(NamedTuple):
+    rows: list[Any]
+    pagination: PaginationResponse
+    facets: Facets | None
+    search_headlines: dict[uuid.UUID, str] | None
+
+
 def router_read_many[T: Schema, I: Identifiable](  # ruff:ignore[too-many-arguments]
     *,
     db: Session,
@@ -349,8 +482,11 @@ def router_read_many[T: Schema, I: Identifiable](  # ruff:ignore[too-many-argume
     filter_model: CustomFilter[I],
     join_specs: JoinSpecMap | None = None,
     embedding: list[float] | None = None,
+    similarity_metric: SimilarityMetric = SimilarityMetric.l2,
+    ef_search: int | None = None,
     check_authorized_project: bool = True,
     expand: AbstractSet[str] | None = None,
+    projection: Sequence[sa.ColumnElement] | None = None,
 ) -> ListResponse[T]:
     """Read multiple models from the database.
 
@@ -358,7 +494,8 @@ def router_read_many[T: Schema, I: Identifiable](  # ruff:ignore[too-many-argume
         db: database session.
         db_model_class: database model class.
         authorized_project_id: project id for filtering the resources.
-        with_search: search query (str).
+        with_search: search query (str), and optional semantic_search text for ordering the
+            results of the models with name and description by hybrid search.
         with_in_brain_region: enable family queries based on BrainRegion
         facets: facet query (bool).
         aliases: Aliases mapping for the filter query, or None.
@@ -372,12 +509,64 @@ def router_read_many[T: Schema, I: Identifiable](  # ruff:ignore[too-many-argume
             - the nested filters attributes, to choose which joins should be applied for filtering.
             - the keys in `name_to_facet_query_params`, for retrieving the facets.
         embedding: optional list of floats representing an embedding vector for semantic search.
+        similarity_metric: distance used to order the results when embedding is given.
+        ef_search: optional size of the candidate list of the HNSW index scans.
         check_authorized_project: Whether to constrain or not to authorized entities
         expand: optional set of derivation directions to eager-load (entity models only).
+        projection: optional columns to be selected instead of the models, including the id,
+            for building the response schemas from the rows. If given, apply_data_query_operations
+            and expand are ignored. See app.queries.projection.
 
     Returns:
         the list of model data, pagination, and facets as a Pydantic model.
     """
+    page = _read_many_rows(
+        db=db,
+        db_model_class=db_model_class,
+        authorized_project_id=authorized_project_id,
+        with_search=with_search,
+        with_in_brain_region=with_in_brain_region,
+        facets=facets,
+        aliases=aliases,
+        apply_filter_query_operations=apply_filter_query_operations,
+        apply_data_query_operations=apply_data_query_operations,
+        pagination_request=pagination_request,
+        name_to_facet_query_params=name_to_facet_query_params,
+        filter_model=filter_model,
+        join_specs=join_specs,
+        embedding=embedding,
+        similarity_metric=similarity_metric,
+        ef_search=ef_search,
+        check_authorized_project=check_authorized_project,
+        expand=expand,
+        projection=projection,
+    )
+    return _validate_rows_page(page, response_schema_class)
+
+
+def _read_many_rows[I: Identifiable](  # ruff:ignore[too-many-arguments]
+    *,
+    db: Session,
+    db_model_class: type[I],
+    authorized_project_id: uuid.UUID | None,
+    with_search: Search[I] | None,
+    with_in_brain_region: InBrainRegionQuery | None,
+    facets: WithFacets | None,
+    aliases: Aliases | None,
+    apply_filter_query_operations: ApplyOperations[I] | None,
+    apply_data_query_operations: ApplyOperations[I] | None,
+    pagination_request: PaginationQuery,
+    name_to_facet_query_params: FacetQueryParamsMap | None,
+    filter_model: CustomFilter[I],
+    join_specs: JoinSpecMap | None = None,
+    embedding: list[float] | None = None,
+    similarity_metric: SimilarityMetric = SimilarityMetric.l2,
+    ef_search: int | None = None,
+    check_authorized_project: bool = True,
+    expand: AbstractSet[str] | None = None,
+    projection: Sequence[sa.ColumnElement] | None = None,
+) -> _RowsPage:
+    """Return the rows and the metadata to be validated by router_read_many."""
     filter_query = sa.select(db_model_class)
 
     if check_authorized_project and (
@@ -408,16 +597,26 @@ def router_read_many[T: Schema, I: Identifiable](  # ruff:ignore[too-many-argume
 
     filter_query = _apply_filters(base_query)
 
-    data = _retrieve_rows(
-        db=db,
-        db_model_class=db_model_class,
-        aliases=aliases,
-        apply_data_query_operations=apply_data_query_operations,
-        pagination_request=pagination_request,
-        filter_model=filter_model,
-        embedding=embedding,
-        expand=expand,
-        filter_query=filter_query,
+    if embedding is not None:
+        _set_ef_search(db, ef_search)
+
+    score = _get_search_score(db, db_model_class, with_search)
+
+    data = list(
+        _retrieve_rows(
+            db=db,
+            db_model_class=db_model_class,
+            aliases=aliases,
+            apply_data_query_operations=apply_data_query_operations,
+            pagination_request=pagination_request,
+            filter_model=filter_model,
+            embedding=embedding,
+            similarity_metric=similarity_metric,
+            score=score,
+            expand=expand,
+            projection=projection,
+            filter_query=filter_query,
+        )
     )
 
     total_items = db.execute(
@@ -434,14 +633,140 @@ def router_read_many[T: Schema, I: Identifiable](  # ruff:ignore[too-many-argume
             name_to_facet_query_params=name_to_facet_query_params,
             count_distinct_field=db_model_class.id,
         )
-    return ListResponse[T](
-        data=[response_schema_class.model_validate(row) for row in data],
+    return _RowsPage(
+        rows=data,
         pagination=PaginationResponse(
             page=pagination_request.page,
             page_size=pagination_request.page_size,
             total_items=total_items,
         ),
         facets=facets_result,
+        search_headlines=_get_search_headlines(
+            db, db_model_class, with_search, [row.id for row in data]
+        ),
+    )
+
+
+def _validate_rows_page[T: Schema](
+    page: _RowsPage, response_schema_class: SupportsModelValidate[T]
+) -> ListResponse[T]:
+    """Build the response of router_read_many from the rows, without executing any query."""
+    return ListResponse[T](
+        data=[
+            # validating the mappings of the rows is faster than accessing their attributes
+            response_schema_class.model_validate(
+                row._mapping if isinstance(row, sa.Row) else row  # ruff:ignore[private-member-access]
+            )
+            for row in page.rows
+        ],
+        pagination=page.pagination,
+        facets=page.facets,
+        search_headlines=page.search_headlines,
+    )
+
+
+async def async_router_read_one[T: Schema](
+    *,
+    db: AsyncSession,
+    response_schema_class: SupportsModelValidate[T],
+    **kwargs: Any,
+) -> T:
+    """Read a model from the database in async routes.
+
+    The queries of router_read_one are executed by the async session without blocking the event
+    loop, while the response is validated in a worker thread, since it may take some time for
+    large models. For this reason, apply_operations must eager-load all the relationships needed
+    by the response schema, because lazy loads can't be executed by the worker thread.
+
+    Args:
+        db: async database session.
+        response_schema_class: Pydantic schema class for the returned data.
+        **kwargs: the other parameters of router_read_one.
+
+    Returns:
+        the model data as a Pydantic model.
+    """
+    row = await db.run_sync(lambda session: _read_one_row(db=session, **kwargs))
+    return await anyio.to_thread.run_sync(response_schema_class.model_validate, row)
+
+
+async def async_router_read_many[T: Schema](
+    *,
+    db: AsyncSession,
+    response_schema_class: SupportsModelValidate[T],
+    **kwargs: Any,
+) -> ListResponse[T]:
+    """Read multiple models from the database in async routes.
+
+    See async_router_read_one, the same constraints apply to apply_data_query_operations.
+
+    Args:
+        db: async database session.
+        response_schema_class: Pydantic schema class for the returned data.
+        **kwargs: the other parameters of router_read_many.
+
+    Returns:
+        the list of model data, pagination, and facets as a Pydantic model.
+    """
+    page = await db.run_sync(lambda session: _read_many_rows(db=session, **kwargs))
+    return await anyio.to_thread.run_sync(_validate_rows_page, page, response_schema_class)
+
+
+def router_read_nearest[T: Schema, I: Identifiable](
+    *,
+    db: Session,
+    db_model_class: type[I],
+    aliases: Aliases | None,
+    apply_data_query_operations: ApplyOperations[I] | None,
+    response_schema_class: SupportsModelValidate[T],
+    filter_model: CustomFilter[I],
+    join_specs: JoinSpecMap | None,
+    embedding: list[float],
+    similarity_metric: SimilarityMetric,
+    ef_search: int | None,
+    limit: int,
+) -> NearestNeighborsResponse[T]:
+    """Read the models nearest to the given embedding, with their distances.
+
+    The ids are selected ordering only by distance, so that the query can be served by the
+    approximate HNSW index of the metric. The models are loaded with a second query.
+
+    Args:
+        db: database session.
+        db_model_class: database model class, with an embedding column.
+        aliases: Aliases mapping for the filter query, or None.
+        apply_data_query_operations: optional callable to transform the data query.
+        response_schema_class: Pydantic schema class for the returned items.
+        filter_model: instance of CustomFilter for filtering data. The sorting is ignored.
+        join_specs: mapping of filter names to JoinSpec.
+        embedding: embedding vector to compare with.
+        similarity_metric: distance used to compare the embeddings.
+        ef_search: optional size of the candidate list of the HNSW index scans.
+        limit: maximum number of models to return.
+
+    Returns:
+        the list of models with their distances, nearest first.
+    """
+    distance = _get_embedding_distance(db_model_class, embedding, similarity_metric)
+    id_query: sa.Select = sa.select(db_model_class.id, distance.label("distance"))
+    if join_specs:
+        id_query = filter_from_db(id_query, filter_model, join_specs)
+    id_query = filter_model.filter(id_query, aliases=aliases).order_by(distance).limit(limit)
+
+    _set_ef_search(db, ef_search)
+    distances: dict[uuid.UUID, float] = {row.id: row.distance for row in db.execute(id_query)}
+    if not distances:
+        return NearestNeighborsResponse[T](data=[])
+
+    data_query = sa.select(db_model_class).where(db_model_class.id.in_(distances))
+    if apply_data_query_operations:
+        data_query = apply_data_query_operations(data_query)
+    rows = {row.id: row for row in db.execute(data_query).scalars().unique()}
+    return NearestNeighborsResponse[T](
+        data=[
+            NearestNeighbor[T](distance=value, item=response_schema_class.model_validate(rows[id_]))
+            for id_, value in distances.items()
+        ]
     )
 
 
@@ -0,0 +1,243 @@
+"""Column projections for building the read schemas without loading the ORM models.
+
+Selecting only the columns needed by the response schema avoids loading the ORM models, so
+the polymorphic loading of the subclasses, the identity map and the instrumented attributes
+are skipped, and the schemas are validated directly from the row mappings.
+
+The relationships required by the schema are selected with correlated subqueries, building
+the nested objects with json_build_object, and the collections with json_agg.
+"""
+
+import functools
+import json
+import types
+import typing
+from collections.abc import Iterator, Mapping
+
+import sqlalchemy as sa
+from pydantic import AliasChoices, BaseModel
+from pydantic.fields import FieldInfo
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+from sqlalchemy.orm import Mapper, RelationshipProperty, with_polymorphic
+from sqlalchemy.sql import util as sql_util, visitors
+
+from app.db.model import Identifiable
+
+type _Fields = Mapping[str, FieldInfo]
+
+
+def _iter_schema_classes(annotation: object) -> Iterator[type[BaseModel]]:
+    """Yield the schemas found in the annotation, unwrapping optional, lists and unions."""
+    if isinstance(annotation, typing.TypeAliasType):
+        yield from _iter_schema_classes(annotation.__value__)
+    elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
+    else:
+        for arg in typing.get_args(annotation):
+            yield from _iter_schema_classes(arg)
+
+
+def _is_list(annotation: object) -> bool:
+    """Return True if the annotation is a list, or an optional list."""
+    if typing.get_origin(annotation) is list:
+        return True
+    if typing.get_origin(annotation) in {typing.Union, types.UnionType}:
+        return any(_is_list(arg) for arg in typing.get_args(annotation))
+    return False
+
+
+def _get_fields(schema_classes: list[type[BaseModel]]) -> dict[str, FieldInfo]:
+    """Return the fields of all the given schemas, keeping the first definition of each name."""
+    result: dict[str, FieldInfo] = {}
+    for schema_class in schema_classes:
+        for name, field in schema_class.model_fields.items():
+            result.setdefault(name, field)
+    return result
+
+
+def _corresponding(selectable: sa.FromClause | None, column: sa.ColumnElement) -> sa.ColumnElement:
+    """Return the column adapted to the aliased selectable, or the same column if not aliased."""
+    if selectable is None:
+        return column
+    if not isinstance(column, sa.Column):
+        # expression of a column property, adapting the columns that it contains
+        return sql_util.ClauseAdapter(selectable).traverse(column)
+    if (result := selectable.corresponding_column(column)) is None:  # pyright: ignore[reportArgumentType]
+        msg = f"Column {column} not found in {selectable}"
+        raise ValueError(msg)
+    return result
+
+
+def _to_json(column: sa.ColumnElement) -> sa.ColumnElement:
+    """Return the column converted to a JSON value that can be validated by pydantic."""
+    if isinstance(column.type, sa.Interval):
+        return sa.extract("epoch", column)
+    if isinstance(column.type, sa.LargeBinary):
+        return sa.func.encode(column, "hex")
+    if isinstance(column.type, sa.Enum) and (enum_class := column.type.enum_class):
+        # the enums stored by name are converted to the values expected by the schemas
+        # as JSON literals escaped in ASCII, since the values may contain any character
+        mapping = {
+            e.name: sa.cast(sa.literal(json.dumps(e.value)), JSON)
+            for e in enum_class
+            if e.name != e.value
+        }
+        if mapping and column.type.enums == list(enum_class.__members__):
+            # compared as text, since asyncpg doesn't coerce the VARCHAR parameters to the enum
+            return sa.case(mapping, value=sa.cast(column, sa.String), else_=sa.func.to_json(column))
+    return column
+
+
+def _build_object(
+    mapper: Mapper, selectable: sa.FromClause, fields: _Fields, *, strict: bool
+) -> sa.ColumnElement:
+    """Return the JSON object containing the given fields of the mapped selectable.
+
+    If strict is False, the fields that are not mapped are silently ignored.
+    """
+    pairs: list[sa.ColumnElement] = []
+    for name, field in fields.items():
+        value = _build_value(mapper, selectable, name, field, strict=strict)
+        if value is not None:
+            pairs += [sa.literal(name), _to_json(value)]
+    return sa.func.json_build_object(*pairs)
+
+
+def _build_polymorphic_object(
+    mapper: Mapper, selectable: sa.FromClause, fields: _Fields
+) -> sa.ColumnElement:
+    """Return the JSON object of the mapped selectable, including the columns of the subclasses.
+
+    Each object contains only the fields mapped in its own class, so that it can be validated
+    by the schema matching the class, as done when validating the ORM models.
+    """
+    # the base mapper is used as fallback, since its identity may be missing in the enum
+    mappers = [m for m in mapper.self_and_descendants if m is not mapper]
+    if not mappers or mapper.polymorphic_on is None:
+        return _build_object(mapper, selectable, fields, strict=True)
+    discriminator = _corresponding(selectable, mapper.polymorphic_on)
+    return sa.case(
+        *(
+            (
+                discriminator == m.polymorphic_identity,
+                _build_object(m, selectable, fields, strict=False),
+            )
+            for m in mappers
+        ),
+        else_=_build_object(mapper, selectable, fields, strict=False),
+    )
+
+
+def _adapt_join(
+    clause: sa.ColumnElement,
+    *,
+    parent: sa.FromClause | None,
+    target: sa.FromClause,
+    secondary: sa.FromClause | None,
+    target_tables: set[sa.FromClause],
+) -> sa.ColumnElement:
+    """Return the join condition using the aliases of the parent, target and secondary tables.
+
+    The remote columns, as annotated by SQLAlchemy in the join condition, belong to the target
+    or to the secondary table, and the other columns belong to the parent.
+    """
+
+    def replace(element: visitors.ExternallyTraversible, **_kw) -> sa.ColumnElement | None:
+        if not isinstance(element, sa.Column):
+            return None
+        if secondary is not None and secondary.corresponding_column(element) is not None:
+            return secondary.corresponding_column(element)
+        is_remote = element._annotations.get("remote")  # ruff:ignore[private-member-access]
+        if is_remote or (is_remote is None and element.table in target_tables):
+            return _corresponding(target, element)
+        return _corresponding(parent, element)
+
+    return visitors.replacement_traverse(clause, {}, replace)
+
+
+def _build_relationship(
+    prop: RelationshipProperty, parent: sa.FromClause | None, field: FieldInfo
+) -> sa.ColumnElement:
+    """Return the correlated subquery selecting the related object, or the list of objects."""
+    schema_classes = list(_iter_schema_classes(field.annotation))
+    if not schema_classes:
+        msg = f"Relationship {prop} not validated by a schema"
+        raise ValueError(msg)
+    target_mapper = prop.mapper
+    target = sa.inspect(
+        with_polymorphic(target_mapper.class_, "*", aliased=True, flat=True)
+    ).selectable
+    secondary = prop.secondary.alias() if prop.secondary is not None else None
+    adapt = functools.partial(
+        _adapt_join,
+        parent=parent,
+        target=target,
+        secondary=secondary,
+        target_tables=set(target_mapper.tables),
+    )
+    obj = _build_polymorphic_object(target_mapper, target, _get_fields(schema_classes))
+    if prop.uselist:
+        order_by = [
+            _corresponding(target, column)
+            for column in (prop.order_by or target_mapper.primary_key)
+        ]
+        value = sa.func.coalesce(
+            sa.func.json_agg(aggregate_order_by(obj, *order_by)),
+            sa.literal_column("'[]'::json"),
+        )
+    else:
+        value = obj
+    query = sa.select(value).select_from(target).where(adapt(prop.primaryjoin))
+    if secondary is not None and prop.secondaryjoin is not None:
+        query = query.select_from(secondary).where(adapt(prop.secondaryjoin))
+    return query.scalar_subquery()
+
+
+def _build_value(
+    mapper: Mapper,
+    selectable: sa.FromClause | None,
+    name: str,
+    field: FieldInfo,
+    *,
+    strict: bool,
+) -> sa.ColumnElement | None:
+    """Return the expression selecting the field, or None if the field can be omitted.
+
+    The fields validated with AliasChoices are selected from the first attribute found among
+    the choices, since the schema would read it from the model in the same way.
+    """
+    alias = field.validation_alias
+    choices = alias.choices if isinstance(alias, AliasChoices) else []
+    for attr_name in [*choices, name]:
+        if isinstance(attr_name, str) and attr_name in mapper.column_attrs:
+            return _corresponding(selectable, mapper.column_attrs[attr_name].columns[0])
+    if name in mapper.relationships:
+        prop = mapper.relationships[name]
+        if prop.uselist != _is_list(field.annotation):
+            msg = f"Relationship {prop} not matching the annotation {field.annotation}"
+            raise ValueError(msg)
+        return _build_relationship(prop, selectable, field)
+    if strict and field.is_required():
+        msg = f"Field {name!r} not mapped to columns or relationships of {mapper.class_.__name__}"
+        raise ValueError(msg)
+    return None
+
+
+@functools.cache
+def get_schema_columns(
+    db_model_class: type[Identifiable], schema_class: type[BaseModel]
+) -> tuple[sa.ColumnElement, ...]:
+    """Return the columns of the model needed to build the given schema.
+
+    The fields mapped to relationships are selected as JSON objects, or lists of JSON objects
+    ordered as defined in the relationship, or by primary key. The fields not mapped to columns
+    or relationships are omitted when they have a default value, and ValueError is raised
+    if they are required.
+    """
+    mapper = sa.inspect(db_model_class)
+    result = []
+    for name, field in schema_class.model_fields.items():
+        value = _build_value(mapper, None, name, field, strict=True)
+        if value is not None:
+            result.append(value.label(name))
+    return tuple(result)
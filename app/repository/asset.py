@@ -1,13 +1,17 @@
 """Asset repository module."""
 
 import uuid
+from collections.abc import Sequence
+from datetime import datetime
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from app.db.model import Asset, Entity
-from app.db.types import AssetStatus, EntityType
+from app.db.model import Asset, AssetBlob, Entity
+from app.db.types import AssetStatus, EntityType, StorageType
 from app.repository.base import BaseRepository
-from app.schemas.asset import AssetCreate
+from app.schemas.asset import AssetCreate, DirectoryListRequest
+from app.utils.pattern import convert_to_ilike_pattern
 
 
 class AssetRepository(BaseRepository):
@@ -73,3 +77,108 @@ class AssetRepository(BaseRepository):
         self.db.delete(asset)
         self.db.flush()
         return asset
+
+    def has_directory_children(self, parent_id: uuid.UUID) -> bool:
+        """Return True if the directory has child assets registered in the database."""
+        query = sa.select(sa.exists().where(Asset.parent_id == parent_id))
+        return self.db.execute(query).scalar_one()
+
+    def list_directory_children(
+        self,
+        parent_id: uuid.UUID,
+        parent_path: str,
+        list_request: DirectoryListRequest,
+    ) -> tuple[Sequence[sa.Row], int]:
+        """Return the files in a directory, and the total number of files matching the filters.
+
+        Each row contains the `name` relative to the directory, `size` and `last_modified`.
+        """
+        name = sa.func.substr(Asset.path, len(parent_path) + 2)
+        query = sa.select(
+            name.label("name"),
+            Asset.size.label("size"),
+            Asset.update_date.label("last_modified"),
+        ).where(Asset.parent_id == parent_id)
+        if list_request.prefix:
+            # filter on the path, not on the name, so that the index on (parent_id, path) is used
+            query = query.where(
+                Asset.path.startswith(f"{parent_path}/{list_request.prefix}", autoescape=True)
+            )
+        if list_request.glob:
+            query = query.where(name.like(convert_to_ilike_pattern(list_request.glob)))
+        data_query = query.order_by(Asset.path)
+        if list_request.page_size:
+            data_query = data_query.offset(list_request.offset).limit(list_request.page_size)
+        rows = self.db.execute(data_query).all()
+        if not list_request.page_size:
+            return rows, len(rows)
+        total_items = self.db.execute(query.with_only_columns(sa.func.count())).scalar_one()
+        return rows, total_items
+
+    def get_stale_uploads(self, *, created_before: datetime, limit: int | None) -> Sequence[Asset]:
+        """Return and lock the top level assets still uploading since before the given date.
+
+        They can be files with a multipart upload, or directories with files uploaded with
+        multipart uploads. The assets locked by other transactions are skipped.
+        """
+        query = (
+            sa.select(Asset)
+            .where(
+                Asset.status == AssetStatus.UPLOADING,
+                Asset.parent_id.is_(None),
+                Asset.creation_date < created_before,
+                sa.or_(Asset.is_directory, Asset.upload_meta.is_not(None)),
+            )
+            .order_by(Asset.creation_date)
+            .limit(limit)
+            .with_for_update(of=Asset, skip_locked=True)
+        )
+        return self.db.execute(query).scalars().all()
+
+    def bulk_create_assets(self, assets: Sequence[dict]) -> None:
+        """Create many assets with a single bulk insert.
+
+        Each item must contain the column values of an asset, the ids are generated if missing.
+        """
+        if assets:
+            self.db.execute(sa.insert(Asset), assets)
+
+    def acquire_blob(
+        self,
+        *,
+        blob_id: uuid.UUID,
+        storage_type: StorageType,
+        is_public: bool,
+        sha256_digest: bytes,
+        size: int,
+        full_path: str,
+    ) -> sa.Row:
+        """Increment the reference count of the blob with the given digest, or create it.
+
+        The blob is created with the given id and full_path only if it doesn't exist yet.
+
+        Returns a row with the `id` and `full_path` of the blob, and `created` set to True
+        if the blob has been created, so the content must be stored in its full_path.
+        """
+        query = (
+            pg_insert(AssetBlob)
+            .values(
+                id=blob_id,
+                storage_type=storage_type,
+                is_public=is_public,
+                sha256_digest=sha256_digest,
+                size=size,
+                full_path=full_path,
+                ref_count=1,
+            )
+            .on_conflict_do_update(
+                index_elements=["storage_type", "is_public", "sha256_digest"],
+                set_={"ref_count": AssetBlob.ref_count + 1},
+            )
+            .returning(
+                AssetBlob.id,
+                AssetBlob.full_path,
+                (AssetBlob.id == blob_id).label("created"),
+            )
+        )
+        return self.db.execute(query).one()
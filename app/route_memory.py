@@ -0,0 +1,67 @@
+"""Memory traced by tracemalloc during the requests, aggregated by route template.
+
+The traced memory is global to the process, so the values are exact only when a single request
+is in flight. With concurrent requests, the peak of each request is the peak of all the requests
+overlapping with it, and the retained bytes include the allocations of the other requests.
+"""
+
+import dataclasses
+import tracemalloc
+from collections import defaultdict
+
+
+@dataclasses.dataclass
+class RouteMemoryStats:
+    """Memory traced by the requests of a route, in bytes."""
+
+    count: int = 0
+    peak_total: int = 0
+    peak_max: int = 0
+    retained_total: int = 0
+    retained_max: int = 0
+
+    def add(self, peak: int, retained: int) -> None:
+        """Add the memory traced by a request."""
+        if not self.count:
+            self.peak_max, self.retained_max = peak, retained
+        self.count += 1
+        self.peak_total += peak
+        self.peak_max = max(self.peak_max, peak)
+        self.retained_total += retained
+        self.retained_max = max(self.retained_max, retained)
+
+
+class RouteMemoryTracker:
+    """Record the peak and the retained memory of the requests, to be called in the event loop."""
+
+    def __init__(self) -> None:
+        """Init the tracker."""
+        self.routes: defaultdict[str, RouteMemoryStats] = defaultdict(RouteMemoryStats)
+        self.in_flight = 0
+
+    def request_started(self) -> int:
+        """Return the traced memory at the start of the request."""
+        if not self.in_flight:
+            # the peak is shared by all the requests in flight, so it's reset only when idle
+            tracemalloc.reset_peak()
+        self.in_flight += 1
+        return tracemalloc.get_traced_memory()[0]
+
+    def request_finished(self, route_template: str, start: int) -> None:
+        """Record the memory traced since the start of the request."""
+        self.in_flight -= 1
+        current, peak = tracemalloc.get_traced_memory()
+        self.routes[route_template].add(peak=peak - start, retained=current - start)
+
+    def top(self, key: str, limit: int) -> list[tuple[str, RouteMemoryStats]]:
+        """Return the routes with the highest values of the given attribute of the stats."""
+        return sorted(self.routes.items(), key=lambda item: getattr(item[1], key), reverse=True)[
+            :limit
+        ]
+
+    def reset(self) -> None:
+        """Forget the recorded requests."""
+        self.routes = defaultdict(RouteMemoryStats)
+
+
+route_memory_tracker = RouteMemoryTracker()
@@ -73,6 +73,7 @@ from app.routers import (
     species,
     strain,
     subject,
+    suggest,
     task_activity,
     task_config,
     task_result,
@@ -164,6 +165,7 @@ authenticated_routers = [
     species.router,
     strain.router,
     subject.router,
+    suggest.router,
     task_activity.router,
     task_config.router,
     validation.router,
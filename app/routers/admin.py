@@ -7,7 +7,7 @@ from starlette.responses import RedirectResponse
 from app.config import storages
 from app.db.types import AssetLabel, StorageType
 from app.dependencies.auth import AdminContextDep
-from app.dependencies.common import PaginationQuery
+from app.dependencies.common import DirectoryListQuery, PaginationQuery
 from app.dependencies.db import RepoGroupDep, SessionDep
 from app.dependencies.s3 import StorageClientFactoryDep
 from app.dependencies.virtual_lab_api import AdminVirtualLabClientDep
@@ -20,6 +20,7 @@ from app.schemas.asset import (
     MultipartDirectoryUploadRequest,
     MultipartDirectoryUploadResponse,
     MultipartUploadInitiateRequest,
+    Sha256Digest,
 )
 from app.schemas.publish import ChangeProjectVisibilityResponse
 from app.schemas.types import ListResponse
@@ -86,10 +87,12 @@ def upload_entity_asset(
     file: UploadFile,
     label: Annotated[AssetLabel, Form()],
     meta: Annotated[dict | None, Form()] = None,
+    sha256_digest: Annotated[Sha256Digest | None, Form()] = None,
 ) -> AssetRead:
     """Upload an asset to be associated with the specified entity.
 
-    To be used only for small files.
+    To be used only for small files. If sha256_digest is provided, the asset is created only
+    when it matches the digest of the uploaded file.
     """
     return admin_service.upload_entity_asset(
         repos=repos,
@@ -100,6 +103,7 @@ def upload_entity_asset(
         file=file,
         label=label,
         meta=meta,
+        sha256_digest=sha256_digest,
         virtual_lab_client=virtual_lab_client,
     )
 
@@ -196,6 +200,7 @@ def list_directory(
     entity_route: EntityRoute,
     entity_id: uuid.UUID,
     asset_id: uuid.UUID,
+    list_request: DirectoryListQuery,
 ) -> DetailedFileList:
     """Return the list of files in a directory asset."""
     return admin_service.list_directory(
@@ -204,6 +209,7 @@ def list_directory(
         entity_type=entity_route_to_type(entity_route),
         entity_id=entity_id,
         asset_id=asset_id,
+        list_request=list_request,
     )
 
 
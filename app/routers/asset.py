@@ -9,12 +9,13 @@ from starlette.responses import RedirectResponse
 from app.config import storages
 from app.db.types import AssetLabel, StorageType
 from app.dependencies.auth import UserContextDep
-from app.dependencies.common import PaginationQuery
+from app.dependencies.common import DirectoryListQuery, PaginationQuery
 from app.dependencies.db import RepoGroupDep
 from app.dependencies.s3 import StorageClientFactoryDep
 from app.filters.asset import AssetFilterDep
 from app.schemas.asset import (
     AssetAndPresignedURLS,
+    AssetCopyRequest,
     AssetRead,
     AssetReadWithUploadMeta,
     AssetRegister,
@@ -23,6 +24,7 @@ from app.schemas.asset import (
     MultipartDirectoryUploadRequest,
     MultipartDirectoryUploadResponse,
     MultipartUploadInitiateRequest,
+    Sha256Digest,
 )
 from app.schemas.types import ListResponse
 from app.service import asset as asset_service
@@ -96,10 +98,12 @@ def upload_entity_asset(
     file: UploadFile,
     label: Annotated[AssetLabel, Form()],
     meta: Annotated[dict | None, Form()] = None,
+    sha256_digest: Annotated[Sha256Digest | None, Form()] = None,
 ) -> AssetRead:
     """Upload an asset to be associated with the specified entity.
 
-    To be used only for small files.
+    To be used only for small files. If sha256_digest is provided, the asset is created only
+    when it matches the digest of the uploaded file.
     """
     return asset_service.upload_entity_asset(
         repos=repos,
@@ -110,6 +114,7 @@ def upload_entity_asset(
         file=file,
         label=label,
         meta=meta,
+        sha256_digest=sha256_digest,
     )
 
 
@@ -137,6 +142,31 @@ def register_entity_asset(
     )
 
 
+@router.post("/{entity_route}/{entity_id}/assets/copy", status_code=status.HTTP_201_CREATED)
+def entity_asset_copy(
+    *,
+    repos: RepoGroupDep,
+    user_context: UserContextDep,
+    storage_client_factory: StorageClientFactoryDep,
+    entity_route: EntityRoute,
+    entity_id: uuid.UUID,
+    json_model: AssetCopyRequest,
+) -> AssetRead:
+    """Copy a file or directory asset from another entity to the specified entity.
+
+    The source entity must be readable, and the destination entity must be writable.
+    The content is copied directly in the storage, and it's not transferred through the client.
+    """
+    return asset_service.copy_entity_asset(
+        repos,
+        user_context=user_context,
+        entity_type=entity_route_to_type(entity_route),
+        entity_id=entity_id,
+        storage_client_factory=storage_client_factory,
+        json_model=json_model,
+    )
+
+
 @router.get("/{entity_route}/{entity_id}/assets/{asset_id}/download")
 def download_entity_asset(
     repos: RepoGroupDep,
@@ -233,8 +263,15 @@ def entity_asset_directory_list(
     entity_route: EntityRoute,
     entity_id: uuid.UUID,
     asset_id: uuid.UUID,
+    list_request: DirectoryListQuery,
 ) -> DetailedFileList:
-    """Return the list of files in a directory asset."""
+    """Return the list of files in a directory asset.
+
+    The files can be filtered by `prefix` and `glob`, relative to the directory.
+
+    If `page_size` is specified, the files are paginated and sorted by path,
+    and the pagination details are returned. Otherwise, all the files are returned.
+    """
     files = asset_service.list_directory(
         repos=repos,
         user_context=user_context,
@@ -242,6 +279,7 @@ def entity_asset_directory_list(
         entity_id=entity_id,
         storage_client_factory=storage_client_factory,
         asset_id=asset_id,
+        list_request=list_request,
     )
     return files
 
@@ -1,12 +1,24 @@
+import gc
 import tracemalloc
 from datetime import UTC, datetime
+from enum import StrEnum, auto
+from typing import Annotated
 
-from fastapi import APIRouter
+import anyio
+from fastapi import APIRouter, Query
 from pydantic import BaseModel
 from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
 
+from app.admission_control import get_threadpool_stats, request_counters
 from app.config import settings
+from app.cpu_profiler import profiling_session, to_collapsed, to_speedscope
+from app.db import compiled_cache
 from app.dependencies.auth import AdminContextDep
+from app.errors import ApiError, ApiErrorCode
+from app.gc_control import PAUSE_BUCKETS, gc_stats
+from app.route_memory import RouteMemoryStats, route_memory_tracker
+from app.utils.process import get_rss
 
 router = APIRouter(
     prefix="/admin/debug",
@@ -120,6 +132,62 @@ def get_memory_snapshot(
     )
 
 
+class _RouteMemory(BaseModel):
+    route: str
+    count: int
+    peak_avg_kb: float
+    peak_max_kb: float
+    retained_avg_kb: float
+    retained_max_kb: float
+
+
+class _RouteMemoryResponse(BaseModel):
+    enabled: bool
+    in_flight: int
+    top_by_peak: list[_RouteMemory]
+    top_by_retained: list[_RouteMemory]
+
+
+def _to_route_memory(items: list[tuple[str, RouteMemoryStats]]) -> list[_RouteMemory]:
+    return [
+        _RouteMemory(
+            route=route,
+            count=stats.count,
+            peak_avg_kb=round(stats.peak_total / stats.count / 1024, 2),
+            peak_max_kb=round(stats.peak_max / 1024, 2),
+            retained_avg_kb=round(stats.retained_total / stats.count / 1024, 2),
+            retained_max_kb=round(stats.retained_max / 1024, 2),
+        )
+        for route, stats in items
+    ]
+
+
+@router.get("/memory/routes")
+async def get_route_memory(_user_context: AdminContextDep) -> _RouteMemoryResponse:
+    """Return the routes with the highest peak and retained memory traced during the requests.
+
+    Requires TRACEMALLOC_ENABLED=true and TRACEMALLOC_PER_ROUTE_ENABLED=true.
+    The values are exact only when a single request is in flight, since the traced memory is
+    global to the process. The route is async, since the stats are updated in the event loop.
+    """
+    if not settings.TRACEMALLOC_PER_ROUTE_ENABLED or not tracemalloc.is_tracing():
+        return _RouteMemoryResponse(enabled=False, in_flight=0, top_by_peak=[], top_by_retained=[])
+    limit = settings.TRACEMALLOC_TOP_N
+    return _RouteMemoryResponse(
+        enabled=True,
+        in_flight=route_memory_tracker.in_flight,
+        top_by_peak=_to_route_memory(route_memory_tracker.top("peak_max", limit)),
+        top_by_retained=_to_route_memory(route_memory_tracker.top("retained_total", limit)),
+    )
+
+
+@router.post("/memory/routes/reset")
+async def reset_route_memory(_user_context: AdminContextDep) -> _RouteMemoryResponse:
+    """Forget the memory traced by the previous requests, for example after the warm-up."""
+    route_memory_tracker.reset()
+    return await get_route_memory(_user_context)
+
+
 @router.post("/memory/reset")
 def reset_memory_baseline(
     request: Request, _user_context: AdminContextDep
@@ -144,3 +212,192 @@ def reset_memory_baseline(
         top=_to_allocations(snapshot.statistics("lineno")),
         top_diff=[],
     )
+
+
+class _ThreadpoolLoad(BaseModel):
+    size: int
+    busy: int
+    waiting: int
+
+
+class _PoolLoad(BaseModel):
+    size: int
+    checked_out: int
+    overflow: int
+    waiting: int
+    max_wait: float
+
+
+class _LoadResponse(BaseModel):
+    admission_control_enabled: bool
+    in_flight: int
+    rejected: int
+    threadpool: _ThreadpoolLoad
+    db_pools: dict[str, _PoolLoad]
+
+
+@router.get("/load")
+async def get_load(request: Request, _user_context: AdminContextDep) -> _LoadResponse:
+    """Return the requests in flight, the threadpool queue and the db pools usage.
+
+    The route is async, since the threadpool stats are available only in the event loop.
+    """
+    return _LoadResponse(
+        admission_control_enabled=settings.ADMISSION_CONTROL_ENABLED,
+        in_flight=request_counters.in_flight,
+        rejected=request_counters.rejected,
+        threadpool=_ThreadpoolLoad(**get_threadpool_stats()._asdict()),
+        db_pools={
+            name: _PoolLoad(**stats._asdict())
+            for name, stats in request.app.state.database_session_manager.pool_stats().items()
+        },
+    )
+
+
+class _GCPauses(BaseModel):
+    count: int
+    total: float
+    max: float
+    histogram: dict[str, int]  # by upper bound in seconds of the bucket
+
+
+class _GCResponse(BaseModel):
+    control_enabled: bool
+    adaptive_enabled: bool
+    counts: list[int]
+    frozen: int
+    rss: int | None
+    idle_time: float
+    pauses: dict[int, _GCPauses]
+    triggers: dict[str, int]
+
+
+@router.get("/gc")
+def get_gc(_user_context: AdminContextDep) -> _GCResponse:
+    """Return the GC pause histograms by generation, and the reasons of the adaptive collections.
+
+    The pauses are recorded only when GC_CONTROL_ENABLED=true at startup.
+    """
+    labels = [str(bound) for bound in PAUSE_BUCKETS] + ["+Inf"]
+    return _GCResponse(
+        control_enabled=settings.GC_CONTROL_ENABLED,
+        adaptive_enabled=settings.GC_ADAPTIVE_ENABLED,
+        counts=list(gc.get_count()),
+        frozen=gc.get_freeze_count(),
+        rss=get_rss(),
+        idle_time=request_counters.idle_time(),
+        pauses={
+            generation: _GCPauses(
+                count=sum(histogram.counts),
+                total=histogram.total,
+                max=histogram.max,
+                histogram=dict(zip(labels, histogram.counts, strict=True)),
+            )
+            for generation, histogram in gc_stats.pauses.items()
+        },
+        triggers=dict(gc_stats.triggers),
+    )
+
+
+class CPUProfileFormat(StrEnum):
+    collapsed = auto()
+    speedscope = auto()
+
+
+@router.get("/cpu")
+async def get_cpu_profile(
+    _user_context: AdminContextDep,
+    *,
+    seconds: Annotated[
+        float,
+        Query(
+            gt=0,
+            le=settings.CPU_PROFILER_MAX_SECONDS,
+            description="Max duration of the profiling, in seconds.",
+        ),
+    ] = 10.0,
+    route: Annotated[
+        str | None,
+        Query(
+            description=(
+                "Route template, e.g. /cell-morphology/{id_}, to sample the threads only while the "
+                "matching requests are in flight."
+            )
+        ),
+    ] = None,
+    requests: Annotated[
+        int | None,
+        Query(ge=1, description="Stop after the given number of requests matching the route."),
+    ] = None,
+    output_format: Annotated[CPUProfileFormat, Query(alias="format")] = CPUProfileFormat.collapsed,
+) -> Response:
+    """Sample the stacks of all the threads, and return the CPU profile.
+
+    The profiling lasts the given seconds, or until the given number of requests matching the
+    route template are completed. The result can be visualized with speedscope or flamegraph.pl.
+    """
+    if requests is not None and route is None:
+        raise ApiError(
+            message="The parameter requests can be used only with route",
+            error_code=ApiErrorCode.INVALID_REQUEST,
+        )
+    with profiling_session(
+        interval=settings.CPU_PROFILER_INTERVAL_SECONDS, route=route, max_requests=requests
+    ) as session:
+        with anyio.move_on_after(seconds):
+            await session.done.wait()
+    if output_format == CPUProfileFormat.speedscope:
+        return JSONResponse(to_speedscope(session))
+    return PlainTextResponse(to_collapsed(session))
+
+
+class _CacheCounters(BaseModel):
+    hits: int
+    misses: int
+    uncached: int
+    hit_ratio: float | None
+
+
+class _CompiledCacheResponse(BaseModel):
+    enabled: bool
+    cache_size: int
+    cache_usage: dict[str, int]
+    total: _CacheCounters
+    routes: dict[str, _CacheCounters]  # sorted by descending misses
+
+
+def _to_cache_counters(counters: compiled_cache.CacheCounters) -> _CacheCounters:
+    return _CacheCounters(
+        hits=counters.hits,
+        misses=counters.misses,
+        uncached=counters.uncached,
+        hit_ratio=counters.hit_ratio,
+    )
+
+
+@router.get("/compiled-cache")
+async def get_compiled_cache(
+    request: Request, _user_context: AdminContextDep
+) -> _CompiledCacheResponse:
+    """Return the hits and misses of the SQLAlchemy compiled cache, by route.
+
+    The lookups are counted only when DB_COMPILED_CACHE_STATS_ENABLED=true at startup.
+    """
+    total_counters, route_counters = compiled_cache.snapshot()
+    routes = sorted(route_counters.items(), key=lambda item: item[1].misses, reverse=True)
+    return _CompiledCacheResponse(
+        enabled=settings.DB_COMPILED_CACHE_STATS_ENABLED,
+        cache_size=settings.DB_QUERY_CACHE_SIZE,
+        cache_usage=request.app.state.database_session_manager.compiled_cache_sizes(),
+        total=_to_cache_counters(total_counters),
+        routes={route: _to_cache_counters(counters) for route, counters in routes},
+    )
+
+
+@router.post("/compiled-cache/reset")
+async def reset_compiled_cache_stats(
+    request: Request, _user_context: AdminContextDep
+) -> _CompiledCacheResponse:
+    """Forget the hits and misses counted so far, for example after the warm-up."""
+    compiled_cache.reset()
+    return await get_compiled_cache(request, _user_context)
@@ -5,12 +5,15 @@ from uuid import UUID
 
 from fastapi import APIRouter, Query
 
+from app.config import settings
+from app.db.types import DerivationType, EntityType
 from app.db.utils import EntityTypeWithBrainRegion
 from app.dependencies.auth import UserContextDep
 from app.dependencies.common import InBrainRegionDep
 from app.dependencies.db import SessionDep
 from app.schemas.entity import EntityCountRead, EntityRead
-from app.service import entity as entity_service
+from app.schemas.provenance import ProvenanceDirection, ProvenanceEdgeType, ProvenanceGraph
+from app.service import entity as entity_service, provenance as provenance_service
 
 router = APIRouter(
     prefix="/entity",
@@ -46,3 +49,41 @@ def read_one(
     db: SessionDep,
 ) -> EntityRead:
     return entity_service.read_one(id_, db, user_context)
+
+
+@router.get("/{id_}/provenance")
+def read_provenance(
+    id_: UUID,
+    user_context: UserContextDep,
+    db: SessionDep,
+    direction: ProvenanceDirection = ProvenanceDirection.downstream,
+    max_depth: Annotated[int, Query(ge=1, le=settings.PROVENANCE_MAX_DEPTH)] = 3,
+    edge_types: Annotated[
+        list[ProvenanceEdgeType] | None,
+        Query(description="Relationships to traverse, all of them if not specified"),
+    ] = None,
+    derivation_types: Annotated[
+        list[DerivationType] | None,
+        Query(description="Derivation types to traverse, all of them if not specified"),
+    ] = None,
+    entity_types: Annotated[
+        list[EntityType] | None,
+        Query(description="Entity types of the returned nodes, all of them if not specified"),
+    ] = None,
+) -> ProvenanceGraph:
+    """Return the provenance graph of the entities derived from, or used by, the given entity.
+
+    The graph is traversed up to max_depth, through derivations and through activities
+    using and generating entities, and only the readable entities and activities are followed.
+    The entity_types filter doesn't prune the traversal, it only selects the returned nodes.
+    """
+    return provenance_service.read_graph(
+        db=db,
+        user_context=user_context,
+        entity_id=id_,
+        direction=direction,
+        max_depth=max_depth,
+        edge_types=edge_types,
+        derivation_types=derivation_types,
+        entity_types=entity_types,
+    )
@@ -4,5 +4,10 @@ from app.routers.common import create_user_router, register_default_admin_routes
 from app.types import GlobalRoute
 
 ROUTE = GlobalRoute.species
-router = create_user_router(route=ROUTE, service=service)
+# Note: /nearest should be added before /{id_}
+router = create_user_router(
+    route=ROUTE,
+    service=service,
+    before_routes=[lambda router: router.get("/nearest")(service.read_nearest)],
+)
 register_default_admin_routes(router=admin_router, service=service, route=ROUTE)
@@ -0,0 +1,41 @@
+"""Suggest router."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+
+from app.db.utils import SuggestType
+from app.dependencies.auth import UserContextDep
+from app.dependencies.db import SessionDep
+from app.schemas.suggest import SuggestResponse
+from app.service import suggest as suggest_service
+
+router = APIRouter(
+    prefix="/suggest",
+    tags=["suggest"],
+)
+
+
+@router.get("")
+def suggest(
+    user_context: UserContextDep,
+    db: SessionDep,
+    q: Annotated[str, Query(min_length=1, max_length=200, description="Text to complete")],
+    types: Annotated[
+        list[SuggestType] | None,
+        Query(description="Entity and global resource types, all of them if not specified"),
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+) -> SuggestResponse:
+    """Suggest the entities and global resources with names matching the given text.
+
+    Intended for autocompletion: the names starting with the text are returned first,
+    and only the id, the type, and the name of each match are returned.
+    """
+    return suggest_service.suggest(
+        db=db,
+        user_context=user_context,
+        text=q,
+        types=types,
+        limit=limit,
+    )
@@ -5,6 +5,7 @@ from typing import Annotated, Literal
 
 from pydantic import (
     AfterValidator,
+    AliasChoices,
     BeforeValidator,
     Field,
     field_validator,
@@ -23,6 +24,7 @@ from app.db.types import (
     StorageType,
 )
 from app.schemas.base import Schema
+from app.schemas.types import PaginationResponse
 
 
 def validate_relative_path(path: Path) -> Path:
@@ -107,6 +109,8 @@ class AssetRead(AssetBase, SizeAndDigestMixin):
 
     id: uuid.UUID
     status: AssetStatus
+    # the object in the storage, that is the shared blob if the asset is deduplicated
+    full_path: RelativePathStr = Field(validation_alias=AliasChoices("storage_path", "full_path"))
 
 
 class ToUploadPart(Schema):
@@ -266,6 +270,75 @@ class DetailedFile(Schema):
 
 class DetailedFileList(Schema):
     files: dict[Path, DetailedFile]
+    pagination: PaginationResponse | None = None
+
+
+class DirectoryListRequest(Schema):
+    """Query parameters for listing the files in a directory asset."""
+
+    prefix: Annotated[
+        str | None,
+        Field(
+            description=(
+                "Only list the files whose path, relative to the directory, "
+                "starts with the given prefix."
+            )
+        ),
+    ] = None
+    glob: Annotated[
+        str | None,
+        Field(
+            description=(
+                "Only list the files whose path, relative to the directory, matches the pattern. "
+                "'*' matches zero or more characters, including '/', "
+                "and '?' matches exactly one character."
+            )
+        ),
+    ] = None
+    page: Annotated[int, Field(ge=1)] = 1
+    page_size: Annotated[
+        int | None,
+        Field(
+            ge=1,
+            le=settings.PAGINATION_MAX_PAGE_SIZE,
+            description="Number of files per page. If not specified, all the files are returned.",
+        ),
+    ] = None
+
+    @property
+    def offset(self) -> int:
+        return (self.page - 1) * (self.page_size or 0)
+
+
+class AssetCopyRequest(Schema):
+    """Request schema for copying an asset from another entity."""
+
+    source_entity_type: EntityType
+    source_entity_id: uuid.UUID
+    source_asset_id: uuid.UUID
+    path: Annotated[
+        PathComponentStr | None,
+        Field(
+            description=(
+                "Name of the copied file or directory. "
+                "If not provided, the name of the source asset is used."
+            ),
+        ),
+    ] = None
+    label: Annotated[
+        AssetLabel | None,
+        Field(description="Label of the copied asset. If not provided, the source label is used."),
+    ] = None
+
+
+class ReapUploadsResult(Schema):
+    """Result of the deletion of the assets left uploading by the clients."""
+
+    dry_run: bool
+    asset_count: int = 0
+    upload_count: int = 0
+    file_count: int = 0
+    total_size: int = 0
 
 
 class AssetAndPresignedURLS(Schema):
@@ -18,3 +18,4 @@ class HierarchyNode(Schema):
 class HierarchyTree(Schema):
     derivation_type: DerivationType
     data: list[HierarchyNode]
+    truncated_ids: list[uuid.UUID] = []  # ruff:ignore[mutable-class-default]
@@ -0,0 +1,44 @@
+"""Provenance graph schemas."""
+
+from enum import StrEnum, auto
+from uuid import UUID
+
+from app.db.types import ActivityType, DerivationType, EntityType
+from app.schemas.base import Schema
+
+
+class ProvenanceDirection(StrEnum):
+    """Direction of the traversal, from the root entity."""
+
+    upstream = auto()  # towards the entities used to derive or generate the root
+    downstream = auto()  # towards the entities derived or generated from the root
+
+
+class ProvenanceEdgeType(StrEnum):
+    """Relationships traversed between two entities."""
+
+    derivation = auto()  # Derivation from used_id to generated_id
+    activity = auto()  # Usage by an activity, and Generation by the same activity
+
+
+class ProvenanceNode(Schema):
+    id: UUID
+    type: EntityType
+    depth: int
+
+
+class ProvenanceEdge(Schema):
+    used_id: UUID
+    generated_id: UUID
+    edge_type: ProvenanceEdgeType
+    derivation_type: DerivationType | None = None
+    activity_id: UUID | None = None
+    activity_type: ActivityType | None = None
+
+
+class ProvenanceGraph(Schema):
+    root_id: UUID
+    direction: ProvenanceDirection
+    nodes: list[ProvenanceNode]
+    edges: list[ProvenanceEdge]
+    truncated: bool = False
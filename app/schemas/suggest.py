@@ -0,0 +1,16 @@
+"""Suggest schemas."""
+
+from uuid import UUID
+
+from app.db.utils import SuggestType
+from app.schemas.base import Schema
+
+
+class SuggestionRead(Schema):
+    id: UUID
+    type: SuggestType
+    name: str
+
+
+class SuggestResponse(Schema):
+    data: list[SuggestionRead]
@@ -16,6 +16,7 @@ class HeaderKey(StrEnum):
     process_time = "X-Process-Time"
     user_agent = "User-Agent"
     content_length = "Content-Length"
+    retry_after = "Retry-After"
 
 
 class PaginationRequest(Schema):
@@ -50,6 +51,17 @@ class ListResponse[M: Schema](Schema):
     data: list[M]
     pagination: PaginationResponse
     facets: Facets | None = None
+    # snippets of the descriptions matching the full-text search, by id
+    search_headlines: dict[uuid.UUID, str] | None = None
+
+
+class NearestNeighbor[M: Schema](Schema):
+    distance: float
+    item: M
+
+
+class NearestNeighborsResponse[M: Schema](Schema):
+    data: list[NearestNeighbor[M]]
 
 
 type Select[M: DeclarativeBase] = sa.Select[tuple[M]]
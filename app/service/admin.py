@@ -1,7 +1,7 @@
 import uuid
 from typing import cast
 
-from fastapi import HTTPException, UploadFile
+from fastapi import UploadFile
 from starlette.responses import RedirectResponse
 
 from app.config import storages
@@ -21,6 +21,7 @@ from app.schemas.asset import (
     AssetReadWithUploadMeta,
     AssetRegister,
     DetailedFileList,
+    DirectoryListRequest,
     MultipartDirectoryUploadRequest,
     MultipartDirectoryUploadResponse,
     MultipartUploadInitiateRequest,
@@ -37,15 +38,12 @@ from app.service.asset import (
     multipart_upload_complete_unverified,
     multipart_upload_initiate_unverified,
     register_entity_asset_unverified,
+    upload_file_to_asset,
     validate_uploadfile_for_small_entity_post,
 )
 from app.types import EntityRoute, ResourceRoute
-from app.utils.files import calculate_sha256_digest
 from app.utils.routers import entity_route_to_type, route_to_type
-from app.utils.s3 import (
-    StorageClientFactory,
-    upload_to_s3,
-)
+from app.utils.s3 import StorageClientFactory
 
 
 def _get_entity_and_vlab(
@@ -85,13 +83,24 @@ def get_entity_asset(
     asset_id: uuid.UUID,
 ) -> AssetRead:
     """Return an asset associated with a specific entity."""
+    asset = _get_entity_db_asset(
+        repos, entity_type=entity_type, entity_id=entity_id, asset_id=asset_id
+    )
+    return AssetRead.model_validate(asset)
+
+
+def _get_entity_db_asset(
+    repos: RepositoryGroup,
+    entity_type: EntityType,
+    entity_id: uuid.UUID,
+    asset_id: uuid.UUID,
+) -> Asset:
     with ensure_result(f"Asset {asset_id} not found", error_code=ApiErrorCode.ASSET_NOT_FOUND):
-        asset = repos.asset.get_entity_asset(
+        return repos.asset.get_entity_asset(
             entity_type=entity_type,
             entity_id=entity_id,
             asset_id=asset_id,
         )
-    return AssetRead.model_validate(asset)
 
 
 def get_entity_assets(
@@ -153,7 +162,7 @@ def download_entity_asset(
     - If `asset_path` is provided for a non-directory asset, the request will
       fail with HTTP 409.
     """
-    asset = get_entity_asset(
+    asset = _get_entity_db_asset(
         repos,
         entity_type=entity_route_to_type(entity_route),
         entity_id=entity_id,
@@ -176,12 +185,12 @@ def upload_entity_asset(
     file: UploadFile,
     label: AssetLabel,
     meta: dict | None = None,
+    sha256_digest: str | None = None,
 ) -> AssetRead:
     """Upload an asset through admin flow."""
     storage = storages[StorageType.aws_s3_internal]
     s3_client = storage_client_factory(storage)
     content_type = validate_uploadfile_for_small_entity_post(file)
-    sha256_digest = calculate_sha256_digest(file)
     entity, virtual_lab_id = _get_entity_and_vlab(repos, virtual_lab_client, entity_type, entity_id)
     asset_db = create_entity_asset_unverified(
         repos,
@@ -189,7 +198,7 @@ def upload_entity_asset(
         filename=cast("str", file.filename),
         content_type=content_type,
         size=file.size or 0,
-        sha256_digest=sha256_digest,
+        sha256_digest=None,
         meta=meta,
         label=label,
         is_directory=False,
@@ -197,13 +206,13 @@ def upload_entity_asset(
         user_profile=user_context.profile,
         virtual_lab_id=virtual_lab_id,
     )
-    if not upload_to_s3(
-        s3_client,
-        file_obj=file.file,
-        bucket_name=storage.bucket,
-        s3_key=asset_db.full_path,
-    ):
-        raise HTTPException(status_code=500, detail="Failed to upload object")
+    upload_file_to_asset(
+        repos,
+        asset=asset_db,
+        s3_client=s3_client,
+        file=file,
+        expected_sha256_digest=sha256_digest,
+    )
     return AssetRead.model_validate(asset_db)
 
 
@@ -255,9 +264,15 @@ def list_directory(
     entity_type: EntityType,
     entity_id: uuid.UUID,
     asset_id: uuid.UUID,
+    list_request: DirectoryListRequest | None = None,
 ) -> DetailedFileList:
     asset = get_entity_asset(repos, entity_type=entity_type, entity_id=entity_id, asset_id=asset_id)
-    return list_directory_unverified(asset=asset, storage_client_factory=storage_client_factory)
+    return list_directory_unverified(
+        repos,
+        asset=asset,
+        storage_client_factory=storage_client_factory,
+        list_request=list_request,
+    )
 
 
 def directory_multipart_upload_initiate(
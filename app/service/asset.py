@@ -4,6 +4,7 @@ from http import HTTPStatus
 from pathlib import Path
 from typing import cast
 
+import sqlalchemy as sa
 from fastapi import HTTPException, UploadFile
 from pydantic.networks import AnyUrl
 from starlette.responses import RedirectResponse
@@ -21,11 +22,14 @@ from app.queries.common import get_or_create_user, router_read_many
 from app.queries.utils import is_user_authorized_for_deletion
 from app.repository.group import RepositoryGroup
 from app.schemas.asset import (
+    AssetCopyRequest,
     AssetCreate,
     AssetRead,
     AssetReadWithUploadMeta,
     AssetRegister,
+    DetailedFile,
     DetailedFileList,
+    DirectoryListRequest,
     DirectoryUploadRequest,
     MultipartDirectoryFileRequest,
     MultipartDirectoryUploadRequest,
@@ -36,29 +40,36 @@ from app.schemas.asset import (
     validate_relative_path,
 )
 from app.schemas.auth import UserContext, UserProfile
-from app.schemas.types import ListResponse
+from app.schemas.types import ListResponse, PaginationResponse
 from app.service import entity as entity_service
 from app.service.asset_helpers import (
     build_asset_read_with_upload_meta,
     complete_asset_s3,
     complete_empty_asset_s3,
+    deduplicate_asset,
     generate_upload_presigned_urls,
     initiate_multipart_upload,
 )
 from app.types import EntityRoute
-from app.utils.files import calculate_sha256_digest, get_content_type
+from app.utils.files import get_content_type
+from app.utils.pattern import convert_to_regex_pattern
 from app.utils.routers import entity_route_to_type
 from app.utils.s3 import (
     StorageClientFactory,
+    build_s3_blob_path,
     build_s3_path,
     check_object,
+    copy_file,
+    delete_from_s3,
     generate_presigned_url,
+    is_public_s3_path,
     list_directory_with_details,
     upload_to_s3,
     validate_filename,
     validate_filesize,
     validate_multipart_filesize,
 )
+from app.utils.uuid import create_uuid
 from app.utils.virtual_lab import resolve_virtual_lab_id
 
 
@@ -111,6 +122,24 @@ def get_entity_asset(
     asset_id: uuid.UUID,
 ) -> AssetRead:
     """Return an asset associated with a specific entity."""
+    asset = get_readable_entity_db_asset(
+        repos,
+        user_context=user_context,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        asset_id=asset_id,
+    )
+    return AssetRead.model_validate(asset)
+
+
+def get_readable_entity_db_asset(
+    repos: RepositoryGroup,
+    user_context: UserContext,
+    entity_type: EntityType,
+    entity_id: uuid.UUID,
+    asset_id: uuid.UUID,
+) -> Asset:
+    """Return an asset associated with a specific readable entity."""
     _ = entity_service.get_readable_entity(
         repos,
         user_context=user_context,
@@ -118,10 +147,9 @@ def get_entity_asset(
         entity_id=entity_id,
     )
     with ensure_result(f"Asset {asset_id} not found", error_code=ApiErrorCode.ASSET_NOT_FOUND):
-        asset = repos.asset.get_entity_asset(
+        return repos.asset.get_entity_asset(
             entity_type=entity_type, entity_id=entity_id, asset_id=asset_id
         )
-    return AssetRead.model_validate(asset)
 
 
 def get_writable_entity_db_asset(
@@ -338,34 +366,80 @@ def upload_entity_asset(
     file: UploadFile,
     label: AssetLabel,
     meta: dict | None = None,
+    sha256_digest: str | None = None,
 ) -> AssetRead:
-    """Upload a small file asset for standard project-authorized users."""
+    """Upload a small file asset for standard project-authorized users.
+
+    The sha256 digest and the size of the asset are calculated while uploading the file.
+    If sha256_digest is provided, the upload is aborted when the calculated digest doesn't match.
+    """
     storage = storages[StorageType.aws_s3_internal]
     s3_client = storage_client_factory(storage)
     content_type = validate_uploadfile_for_small_entity_post(file)
-    sha256_digest = calculate_sha256_digest(file)
-    asset_read = create_entity_asset(
-        repos=repos,
+    entity = entity_service.get_writable_entity_by_context(
+        repos,
         user_context=user_context,
         entity_type=entity_type,
         entity_id=entity_id,
+    )
+    virtual_lab_id = resolve_virtual_lab_id(user_context, entity.authorized_project_id)
+    asset_db = create_entity_asset_unverified(
+        repos,
+        entity=entity,
         filename=cast("str", file.filename),
         content_type=content_type,
         size=file.size or 0,
-        sha256_digest=sha256_digest,
+        sha256_digest=None,
         meta=meta,
         label=label,
         is_directory=False,
         storage_type=storage.type,
+        user_profile=user_context.profile,
+        virtual_lab_id=virtual_lab_id,
+    )
+    upload_file_to_asset(
+        repos,
+        asset=asset_db,
+        s3_client=s3_client,
+        file=file,
+        expected_sha256_digest=sha256_digest,
     )
-    if not upload_to_s3(
+    return AssetRead.model_validate(asset_db)
+
+
+def upload_file_to_asset(
+    repos: RepositoryGroup,
+    *,
+    asset: Asset,
+    s3_client: S3Client,
+    file: UploadFile,
+    expected_sha256_digest: str | None = None,
+) -> None:
+    """Upload the file to the storage of the asset, and save the calculated size and digest."""
+    storage = storages[asset.storage_type]
+    blob_id = None
+    s3_key = asset.full_path
+    if settings.ASSET_DEDUPLICATION_ENABLED:
+        # the digest is known only after uploading, so the file is uploaded to a new blob,
+        # that is deleted if a blob with the same content already exists
+        blob_id = create_uuid()
+        s3_key = build_s3_blob_path(blob_id=blob_id, is_public=is_public_s3_path(asset.full_path))
+    upload_result = upload_to_s3(
         s3_client,
         file_obj=file.file,
         bucket_name=storage.bucket,
-        s3_key=asset_read.full_path,
-    ):
+        s3_key=s3_key,
+        expected_sha256_digest=expected_sha256_digest,
+    )
+    if not upload_result:
         raise HTTPException(status_code=500, detail="Failed to upload object")
-    return asset_read
+    asset.size = upload_result["size"]
+    asset.sha256_digest = bytes.fromhex(upload_result["sha256_digest"])
+    if blob_id:
+        deduplicate_asset(
+            repos, asset=asset, s3_client=s3_client, blob_id=blob_id, blob_path=s3_key
+        )
+    repos.db.flush()
 
 
 def delete_entity_asset(
@@ -650,26 +724,75 @@ def multipart_upload_initiate(
     )
 
 
+def _filter_storage_files(
+    files: dict[str, dict], list_request: DirectoryListRequest
+) -> tuple[list[dict], int]:
+    """Filter and paginate the files listed from the storage, consistently with the database."""
+    regex = convert_to_regex_pattern(list_request.glob) if list_request.glob else None
+    selected = [
+        file
+        for name, file in sorted(files.items())
+        if (not list_request.prefix or name.startswith(list_request.prefix))
+        and (not regex or regex.fullmatch(name))
+    ]
+    if not list_request.page_size:
+        return selected, len(selected)
+    offset = list_request.offset
+    return selected[offset : offset + list_request.page_size], len(selected)
+
+
 def list_directory_unverified(
+    repos: RepositoryGroup,
     *,
     asset: AssetRead,
     storage_client_factory: StorageClientFactory,
+    list_request: DirectoryListRequest | None = None,
 ) -> DetailedFileList:
-    """Return the list of files in a directory asset, without checking authorization."""
+    """Return the list of files in a directory asset, without checking authorization.
+
+    When the directory has been uploaded with multipart upload and completed, the files are
+    listed from the child assets registered in the database, without accessing the storage.
+
+    Otherwise, for example for directories registered or uploaded with presigned urls,
+    the files aren't tracked in the database and they are listed from the storage.
+    """
     if not asset.is_directory:
         raise ApiError(
             message="Asset is not a directory, cannot be listed",
             error_code=ApiErrorCode.ASSET_NOT_A_DIRECTORY,
             http_status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
         )
-    storage = storages[asset.storage_type]
-    s3_client = storage_client_factory(storage)
-    ret = list_directory_with_details(
-        s3_client,
-        bucket_name=storage.bucket,
-        prefix=asset.full_path,
+    list_request = list_request or DirectoryListRequest()
+    if asset.status == AssetStatus.CREATED and repos.asset.has_directory_children(asset.id):
+        rows, total_items = repos.asset.list_directory_children(
+            parent_id=asset.id,
+            parent_path=asset.path,
+            list_request=list_request,
+        )
+        files = [DetailedFile.model_validate(row) for row in rows]
+    else:
+        storage = storages[asset.storage_type]
+        s3_client = storage_client_factory(storage)
+        ret = list_directory_with_details(
+            s3_client,
+            bucket_name=storage.bucket,
+            prefix=asset.full_path,
+        )
+        selected, total_items = _filter_storage_files(ret, list_request)
+        files = [DetailedFile.model_validate(file) for file in selected]
+    pagination = (
+        PaginationResponse(
+            page=list_request.page,
+            page_size=list_request.page_size,
+            total_items=total_items,
+        )
+        if list_request.page_size
+        else None
+    )
+    return DetailedFileList(
+        files={Path(file.name): file for file in files},
+        pagination=pagination,
     )
-    return DetailedFileList.model_validate({"files": ret})
 
 
 def list_directory(
@@ -679,6 +802,7 @@ def list_directory(
     entity_id: uuid.UUID,
     asset_id: uuid.UUID,
     storage_client_factory: StorageClientFactory,
+    list_request: DirectoryListRequest | None = None,
 ) -> DetailedFileList:
     asset = get_entity_asset(
         repos,
@@ -687,7 +811,12 @@ def list_directory(
         entity_id=entity_id,
         asset_id=asset_id,
     )
-    return list_directory_unverified(asset=asset, storage_client_factory=storage_client_factory)
+    return list_directory_unverified(
+        repos,
+        asset=asset,
+        storage_client_factory=storage_client_factory,
+        list_request=list_request,
+    )
 
 
 def _entity_asset_multipart_upload_initiate(
@@ -796,7 +925,7 @@ def download_entity_asset(
     - If `asset_path` is provided for a non-directory asset, the request will
       fail with HTTP 409.
     """
-    asset = get_entity_asset(
+    asset = get_readable_entity_db_asset(
         repos,
         user_context=user_context,
         entity_type=entity_route_to_type(entity_route),
@@ -812,7 +941,7 @@ def download_entity_asset(
 
 def create_asset_download_redirect(
     *,
-    asset: AssetRead,
+    asset: Asset,
     storage_client_factory: StorageClientFactory,
     asset_path: str | None = None,
 ) -> RedirectResponse:
@@ -840,7 +969,7 @@ def create_asset_download_redirect(
                 error_code=ApiErrorCode.ASSET_NOT_A_DIRECTORY,
                 http_status_code=HTTPStatus.CONFLICT,
             )
-        full_path = str(asset.full_path)
+        full_path = asset.storage_path
 
     storage = storages[asset.storage_type]
     s3_client = storage_client_factory(storage)
@@ -1008,6 +1137,7 @@ def directory_multipart_upload_complete_unverified(
                 future.result()
         for child in pending_children:
             child.status = AssetStatus.CREATED
+            child.update_date = sa.func.statement_timestamp()
     asset_db.status = AssetStatus.CREATED
     repos.db.flush()
     return AssetRead.model_validate(asset_db)
@@ -1031,3 +1161,183 @@ def entity_asset_directory_multipart_upload_complete(
         asset_id=asset_id,
     )
     return directory_multipart_upload_complete_unverified(repos, asset_db, storage_client_factory)
+
+
+def _copy_storage_objects(
+    s3_client: S3Client,
+    *,
+    src_bucket_name: str,
+    dst_bucket_name: str,
+    keys: list[tuple[str, str]],
+) -> None:
+    """Copy the objects server-side in parallel, deleting the copies if any of them fails.
+
+    Args:
+        s3_client: S3 client instance, with read access to the source and write access to the
+            destination.
+        src_bucket_name: name of the source bucket.
+        dst_bucket_name: name of the destination bucket.
+        keys: list of tuples (source key, destination key).
+    """
+    if not keys:
+        return
+    max_workers = min(settings.S3_MAX_WORKERS, len(keys))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                copy_file,
+                s3_client,
+                src_bucket_name=src_bucket_name,
+                dst_bucket_name=dst_bucket_name,
+                src_key=src_key,
+                dst_key=dst_key,
+            )
+            for src_key, dst_key in keys
+        ]
+        results = [future.result() for future in futures]
+        if all(results):
+            return
+        # the assets are not created, so the copied objects would be orphaned
+        for (_, dst_key), copied in zip(keys, results, strict=True):
+            if copied:
+                executor.submit(delete_from_s3, s3_client, dst_bucket_name, dst_key)
+    raise HTTPException(status_code=500, detail="Failed to copy object")
+
+
+def copy_entity_asset_unverified(
+    repos: RepositoryGroup,
+    *,
+    source_asset: Asset,
+    entity: Entity,
+    virtual_lab_id: uuid.UUID,
+    user_profile: UserProfile,
+    storage_client_factory: StorageClientFactory,
+    json_model: AssetCopyRequest,
+) -> AssetRead:
+    """Copy an asset to the given entity, without checking authorization.
+
+    The content is copied server-side to the internal storage, and the assets of the files in
+    a directory are created with a single bulk insert.
+    """
+    if source_asset.status != AssetStatus.CREATED:
+        raise ApiError(
+            message="Only assets with status created can be copied.",
+            error_code=ApiErrorCode.ASSET_UPLOAD_INCOMPLETE,
+            http_status_code=HTTPStatus.CONFLICT,
+        )
+    src_storage = storages[source_asset.storage_type]
+    dst_storage = storages[StorageType.aws_s3_internal]
+    asset_db = create_entity_asset_unverified(
+        repos,
+        entity=entity,
+        filename=json_model.path or source_asset.path,
+        content_type=source_asset.content_type,
+        size=source_asset.size,
+        sha256_digest=source_asset.sha256_digest.hex() if source_asset.sha256_digest else None,
+        meta=source_asset.meta,
+        label=json_model.label or source_asset.label,
+        is_directory=source_asset.is_directory,
+        storage_type=dst_storage.type,
+        user_profile=user_profile,
+        virtual_lab_id=virtual_lab_id,
+    )
+    if not source_asset.is_directory:
+        source_blob = source_asset.blob
+        if (
+            settings.ASSET_DEDUPLICATION_ENABLED
+            and source_blob
+            and source_blob.storage_type == dst_storage.type
+            and source_blob.is_public == is_public_s3_path(asset_db.full_path)
+        ):
+            # the content is already deduplicated, so it's enough to reference the same blob
+            asset_db.blob_id = repos.asset.acquire_blob(
+                blob_id=source_blob.id,
+                storage_type=source_blob.storage_type,
+                is_public=source_blob.is_public,
+                sha256_digest=source_blob.sha256_digest,
+                size=source_blob.size,
+                full_path=source_blob.full_path,
+            ).id
+            repos.db.flush()
+            repos.db.expire(asset_db, ["storage_path"])
+            keys = []
+        else:
+            keys = [(source_asset.storage_path, asset_db.full_path)]
+    elif children := [c for c in source_asset.children if c.status == AssetStatus.CREATED]:
+        # directory uploaded with multipart upload, the files are registered in the db
+        children_values = []
+        keys = []
+        for child in children:
+            name = Path(child.path).relative_to(source_asset.path)
+            full_path = f"{asset_db.full_path}/{name}"
+            children_values.append(
+                {
+                    "status": AssetStatus.CREATED,
+                    "entity_id": entity.id,
+                    "parent_id": asset_db.id,
+                    "path": str(Path(asset_db.path, name)),
+                    "full_path": full_path,
+                    "is_directory": False,
+                    "content_type": child.content_type,
+                    "size": child.size,
+                    "sha256_digest": child.sha256_digest,
+                    "meta": child.meta,
+                    "label": child.label,
+                    "storage_type": dst_storage.type,
+                    "created_by_id": asset_db.created_by_id,
+                    "updated_by_id": asset_db.updated_by_id,
+                }
+            )
+            keys.append((child.full_path, full_path))
+        repos.asset.bulk_create_assets(children_values)
+    else:
+        files = list_directory_with_details(
+            storage_client_factory(src_storage),
+            bucket_name=src_storage.bucket,
+            prefix=source_asset.full_path,
+        )
+        keys = [
+            (f"{source_asset.full_path}/{name}", f"{asset_db.full_path}/{name}") for name in files
+        ]
+    _copy_storage_objects(
+        storage_client_factory(dst_storage),
+        src_bucket_name=src_storage.bucket,
+        dst_bucket_name=dst_storage.bucket,
+        keys=keys,
+    )
+    return AssetRead.model_validate(asset_db)
+
+
+def copy_entity_asset(
+    repos: RepositoryGroup,
+    *,
+    user_context: UserContext,
+    entity_type: EntityType,
+    entity_id: uuid.UUID,
+    storage_client_factory: StorageClientFactory,
+    json_model: AssetCopyRequest,
+) -> AssetRead:
+    """Copy an asset from a readable entity to a writable entity."""
+    source_asset = get_readable_entity_db_asset(
+        repos,
+        user_context=user_context,
+        entity_type=json_model.source_entity_type,
+        entity_id=json_model.source_entity_id,
+        asset_id=json_model.source_asset_id,
+    )
+    entity = entity_service.get_writable_entity_by_context(
+        repos,
+        user_context=user_context,
+        entity_type=entity_type,
+        entity_id=entity_id,
+    )
+    virtual_lab_id = resolve_virtual_lab_id(user_context, entity.authorized_project_id)
+    return copy_entity_asset_unverified(
+        repos,
+        source_asset=source_asset,
+        entity=entity,
+        virtual_lab_id=virtual_lab_id,
+        user_profile=user_context.profile,
+        storage_client_factory=storage_client_factory,
+        json_model=json_model,
+    )
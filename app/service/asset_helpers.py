@@ -1,4 +1,6 @@
+import uuid
 from http import HTTPStatus
+from typing import cast
 
 from types_boto3_s3 import S3Client
 
@@ -6,6 +8,7 @@ from app.config import StorageUnion, storages
 from app.db.model import Asset
 from app.db.types import AssetStatus, ContentType
 from app.errors import ApiError, ApiErrorCode
+from app.repository.group import RepositoryGroup
 from app.schemas.asset import (
     AssetRead,
     AssetReadWithUploadMeta,
@@ -15,7 +18,9 @@ from app.schemas.asset import (
 )
 from app.utils.s3 import (
     check_object,
+    delete_from_s3,
     generate_presigned_url,
+    is_public_s3_path,
     multipart_compute_upload_plan,
     multipart_upload_complete,
     multipart_upload_create_part_presigned_url,
@@ -207,3 +212,39 @@ def complete_empty_asset_s3(
             error_code=ApiErrorCode.ASSET_UPLOAD_INCONSISTENT_SIZE,
             http_status_code=HTTPStatus.CONFLICT,
         )
+
+
+def deduplicate_asset(
+    repos: RepositoryGroup,
+    *,
+    asset: Asset,
+    s3_client: S3Client,
+    blob_id: uuid.UUID,
+    blob_path: str,
+) -> None:
+    """Reference the blob shared by the same content from an uploaded file asset.
+
+    The file must have been uploaded to the path of a new blob with the given id, as returned by
+    `build_s3_blob_path`. If a blob with the same digest already exists in the same storage and
+    visibility scope, the uploaded object is deleted and the asset references the existing blob,
+    otherwise the new blob is created and the uploaded object is kept, without copying it.
+
+    The digest must have been calculated by the service while uploading the file: a digest
+    provided by the client cannot be trusted, because it would give access to the content of
+    an existing blob without uploading it.
+    """
+    storage = storages[asset.storage_type]
+    blob = repos.asset.acquire_blob(
+        blob_id=blob_id,
+        storage_type=asset.storage_type,
+        is_public=is_public_s3_path(asset.full_path),
+        sha256_digest=cast("bytes", asset.sha256_digest),
+        size=asset.size,
+        full_path=blob_path,
+    )
+    if not blob.created:
+        # in case of failure, the uploaded object is orphaned but the asset is still valid
+        delete_from_s3(s3_client, bucket_name=storage.bucket, s3_key=blob_path)
+    asset.blob_id = blob.id
+    repos.db.flush()
+    repos.db.expire(asset, ["storage_path"])
@@ -6,15 +6,15 @@ from sqlalchemy.orm import joinedload, raiseload
 import app.queries.common
 from app.db.model import BrainRegion, BrainRegionHierarchy, Species, Strain
 from app.dependencies.auth import AdminContextDep
-from app.dependencies.common import PaginationQuery
+from app.dependencies.common import NearestDep, PaginationQuery, SemanticSearchDep
 from app.dependencies.db import SessionDep
 from app.errors import ensure_result
 from app.filters.brain_region import BrainRegionFilterDep
-from app.queries.alias_registry import build_aliases
+from app.queries.alias_registry import Aliases, build_aliases
 from app.queries.types import JoinSpec, JoinSpecMap
 from app.schemas.brain_region import BrainRegionAdminUpdate, BrainRegionCreate, BrainRegionRead
 from app.schemas.routers import DeleteResponse
-from app.schemas.types import ListResponse
+from app.schemas.types import ListResponse, NearestNeighborsResponse
 from app.utils.embedding import generate_embedding
 
 
@@ -26,13 +26,7 @@ def _load(select: sa.Select):
     )
 
 
-def read_many(
-    *,
-    db: SessionDep,
-    pagination_request: PaginationQuery,
-    brain_region_filter: BrainRegionFilterDep,
-    semantic_search: str | None = None,
-) -> ListResponse[BrainRegionRead]:
+def _get_query_params() -> tuple[Aliases, JoinSpecMap]:
     db_model_class = BrainRegion
     aliases = build_aliases(
         (BrainRegionHierarchy, "species"),
@@ -52,10 +46,20 @@ def read_many(
             ).join(Strain, brh_strain_alias.strain_id == Strain.id)
         ),
     }
+    return aliases, join_specs
+
 
+def read_many(
+    *,
+    db: SessionDep,
+    pagination_request: PaginationQuery,
+    brain_region_filter: BrainRegionFilterDep,
+    semantic_search: SemanticSearchDep,
+) -> ListResponse[BrainRegionRead]:
+    aliases, join_specs = _get_query_params()
     return app.queries.common.router_read_many(
         db=db,
-        db_model_class=db_model_class,
+        db_model_class=BrainRegion,
         authorized_project_id=None,
         with_search=None,
         with_in_brain_region=None,
@@ -68,7 +72,35 @@ def read_many(
         name_to_facet_query_params=None,
         filter_model=brain_region_filter,
         join_specs=join_specs,
-        embedding=None if semantic_search is None else generate_embedding(semantic_search),
+        embedding=(
+            None
+            if semantic_search.semantic_search is None
+            else generate_embedding(semantic_search.semantic_search, db=db)
+        ),
+        similarity_metric=semantic_search.semantic_search_metric,
+        ef_search=semantic_search.semantic_search_ef_search,
+    )
+
+
+def read_nearest(
+    *,
+    db: SessionDep,
+    brain_region_filter: BrainRegionFilterDep,
+    nearest: NearestDep,
+) -> NearestNeighborsResponse[BrainRegionRead]:
+    aliases, join_specs = _get_query_params()
+    return app.queries.common.router_read_nearest(
+        db=db,
+        db_model_class=BrainRegion,
+        aliases=aliases,
+        apply_data_query_operations=_load,
+        response_schema_class=BrainRegionRead,
+        filter_model=brain_region_filter,
+        join_specs=join_specs,
+        embedding=generate_embedding(nearest.semantic_search, db=db),
+        similarity_metric=nearest.semantic_search_metric,
+        ef_search=nearest.semantic_search_ef_search,
+        limit=nearest.k,
     )
 
 
@@ -92,7 +124,7 @@ def create_one(
     json_model: BrainRegionCreate,
     user_context: AdminContextDep,
 ) -> BrainRegionRead:
-    embedding = generate_embedding(json_model.name)
+    embedding = generate_embedding(json_model.name, db=db)
 
     return app.queries.common.router_create_one(
         db=db,
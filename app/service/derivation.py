@@ -30,6 +30,7 @@ from app.queries.common import (
 )
 from app.queries.entity import get_accessible_entity, get_writable_entity
 from app.queries.factory import query_params_factory
+from app.queries.projection import get_schema_columns
 from app.queries.utils import is_user_authorized_for_deletion
 from app.schemas.derivation import (
     DerivationAdminUpdate,
@@ -242,6 +243,7 @@ def _read_many_from_entity(
     """Return a list of basic entities used to generate the specified entity.
 
     Only the used entities that are accessible by the user are returned.
+    The entities are built from the selected columns, without loading the polymorphic models.
     """
     used_db_model_class = Entity
     generated_alias = aliased(Entity, flat=True, name="generated_alias")
@@ -285,6 +287,7 @@ def _read_many_from_entity(
         filter_model=entity_filter,
         join_specs=join_specs,
         check_authorized_project=check_authorized_project,
+        projection=get_schema_columns(used_db_model_class, BasicEntityRead),
     )
 
 
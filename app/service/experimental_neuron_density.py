@@ -20,17 +20,18 @@ from app.dependencies.common import (
     PaginationQuery,
     SearchDep,
 )
-from app.dependencies.db import SessionDep
+from app.dependencies.db import AsyncSessionDep, SessionDep
 from app.filters.density import ExperimentalNeuronDensityFilterDep
 from app.queries.common import (
+    async_router_read_many,
+    async_router_read_one,
     router_create_one,
-    router_read_many,
-    router_read_one,
     router_update_one,
     router_user_delete_one,
 )
 from app.queries.expand import EntityExpand
 from app.queries.factory import query_params_factory
+from app.queries.projection import get_schema_columns
 from app.schemas.density import (
     ExperimentalNeuronDensityAdminUpdate,
     ExperimentalNeuronDensityCreate,
@@ -59,10 +60,10 @@ def _load(query: sa.Select):
     )
 
 
-def _read_many(
+async def _read_many(
     *,
     user_context: UserContextDep,
-    db: SessionDep,
+    db: AsyncSessionDep,
     pagination_request: PaginationQuery,
     filter_model: ExperimentalNeuronDensityFilterDep,
     with_search: SearchDep,
@@ -86,7 +87,7 @@ def _read_many(
         facet_keys=facet_keys,
         filter_keys=filter_keys,
     )
-    return router_read_many(
+    return await async_router_read_many(
         db=db,
         filter_model=filter_model,
         db_model_class=ExperimentalNeuronDensity,
@@ -103,12 +104,16 @@ def _read_many(
         join_specs=join_specs,
         check_authorized_project=check_authorized_project,
         expand=expand,
+        # the derivations to expand can be loaded only with the models
+        projection=None
+        if expand
+        else get_schema_columns(ExperimentalNeuronDensity, ExperimentalNeuronDensityRead),
     )
 
 
-def read_many(
+async def read_many(
     user_context: UserContextDep,
-    db: SessionDep,
+    db: AsyncSessionDep,
     pagination_request: PaginationQuery,
     filter_model: ExperimentalNeuronDensityFilterDep,
     with_search: SearchDep,
@@ -116,7 +121,7 @@ def read_many(
     in_brain_region: InBrainRegionDep,
     expand: ExpandDep = None,
 ) -> ListResponse[ExperimentalNeuronDensityRead]:
-    return _read_many(
+    return await _read_many(
         user_context=user_context,
         db=db,
         pagination_request=pagination_request,
@@ -129,9 +134,9 @@ def read_many(
     )
 
 
-def admin_read_many(
+async def admin_read_many(
     user_context: AdminContextDep,
-    db: SessionDep,
+    db: AsyncSessionDep,
     pagination_request: PaginationQuery,
     filter_model: ExperimentalNeuronDensityFilterDep,
     with_search: SearchDep,
@@ -139,7 +144,7 @@ def admin_read_many(
     in_brain_region: InBrainRegionDep,
     expand: ExpandDep = None,
 ) -> ListResponse[ExperimentalNeuronDensityRead]:
-    return _read_many(
+    return await _read_many(
         user_context=user_context,
         db=db,
         pagination_request=pagination_request,
@@ -152,13 +157,13 @@ def admin_read_many(
     )
 
 
-def read_one(
+async def read_one(
     user_context: UserContextDep,
-    db: SessionDep,
+    db: AsyncSessionDep,
     id_: uuid.UUID,
     expand: ExpandDep = None,
 ) -> ExperimentalNeuronDensityRead:
-    return router_read_one(
+    return await async_router_read_one(
         db=db,
         id_=id_,
         db_model_class=ExperimentalNeuronDensity,
@@ -169,12 +174,12 @@ def read_one(
     )
 
 
-def admin_read_one(
-    db: SessionDep,
+async def admin_read_one(
+    db: AsyncSessionDep,
     id_: uuid.UUID,
     expand: ExpandDep = None,
 ) -> ExperimentalNeuronDensityRead:
-    return router_read_one(
+    return await async_router_read_one(
         db=db,
         id_=id_,
         db_model_class=ExperimentalNeuronDensity,
@@ -1,25 +1,49 @@
 import uuid
 from collections import Counter
+from http import HTTPStatus
+from typing import Annotated
 
 import sqlalchemy as sa
-from fastapi import HTTPException
+from fastapi import HTTPException, Query
 from sqlalchemy.orm import Session, aliased
 
-from app.db.auth import constrain_to_readable_entities_by_project
+from app.config import settings
+from app.db.auth import constrain_to_readable_entities_by_project, is_private, is_public
+from app.db.hierarchy_cache import HierarchyRow, public_hierarchy_cache
 from app.db.model import Circuit, Derivation, Entity
 from app.db.types import DerivationType
 from app.dependencies.auth import UserContextDep
 from app.dependencies.db import SessionDep
+from app.errors import ApiError, ApiErrorCode
 from app.logger import L
 from app.schemas.hierarchy import HierarchyNode, HierarchyTree
 
 
-def _load_nodes(
+def _get_row_sort_key(row: HierarchyRow) -> tuple[bool, str, uuid.UUID]:
+    """Return the key sorting the roots before the children, and each group by name and id.
+
+    The rows are sorted in Python and not only by the query, because the database collation
+    may differ from the Python ordering, and the public and private rows are sorted together.
+    """
+    return row.parent_id is not None, row.name, row.id
+
+
+def _load_rows(
     db: Session,
     project_id: uuid.UUID | None,
     entity_class: type[Entity],
     derivation_type: DerivationType,
-) -> dict[uuid.UUID, HierarchyNode]:
+    *,
+    public: bool,
+) -> list[HierarchyRow]:
+    """Return the public nodes, or the nodes in the project linked to private circuits.
+
+    In the public mode, the nodes are public and linked only to public parents.
+    In the private mode, the nodes are private or linked to a private parent, so the public
+    nodes returned as roots in the public mode can be returned again as children.
+
+    The roots are returned before the children, and each group is sorted by name and id.
+    """
     root = aliased(entity_class, flat=True, name="root")
     root_parent = aliased(entity_class, flat=True, name="root_parent")
     parent = aliased(entity_class, flat=True, name="parent")
@@ -47,6 +71,7 @@ def _load_nodes(
             root.authorized_project_id,
         )
         .where(~sa.exists(matching_derivation_for_root))
+        .where(is_public(root) if public else is_private(root))
         .order_by(*order_by)
     )
     query_roots = constrain_to_readable_entities_by_project(
@@ -64,6 +89,11 @@ def _load_nodes(
         .join(parent, parent.id == Derivation.used_id)
         .join(child, child.id == Derivation.generated_id)
         .where(Derivation.derivation_type == derivation_type)
+        .where(
+            sa.and_(is_public(parent), is_public(child))
+            if public
+            else sa.or_(is_private(parent), is_private(child))
+        )
         .order_by(*order_by)
     )
     query_children = constrain_to_readable_entities_by_project(
@@ -73,8 +103,47 @@ def _load_nodes(
         query=query_children, project_id=project_id, db_model_class=child
     )
     query = query_roots.union_all(query_children)
+    rows = [HierarchyRow._make(row) for row in db.execute(query).all()]
+    return sorted(rows, key=_get_row_sort_key)
+
+
+def _load_public_rows(
+    db: Session, entity_class: type[Entity], derivation_type: DerivationType
+) -> tuple[HierarchyRow, ...]:
+    """Return the public nodes, using the cache if enabled.
+
+    The public nodes are the same for every project, so they can be cached and the nodes
+    linked to private circuits in a project can be merged on top of them.
+    """
+    if not settings.CIRCUIT_HIERARCHY_CACHE_ENABLED or entity_class is not Circuit:
+        return tuple(_load_rows(db, None, entity_class, derivation_type, public=True))
+    if (rows := public_hierarchy_cache.get(derivation_type)) is not None:
+        return rows
+    version = public_hierarchy_cache.version
+    rows = tuple(_load_rows(db, None, entity_class, derivation_type, public=True))
+    public_hierarchy_cache.set(derivation_type, rows, version=version)
+    return rows
+
 
-    rows = db.execute(query).all()
+def _load_nodes(
+    db: Session,
+    project_id: uuid.UUID | None,
+    entity_class: type[Entity],
+    derivation_type: DerivationType,
+) -> dict[uuid.UUID, HierarchyNode]:
+    public_rows = _load_public_rows(db, entity_class, derivation_type)
+    rows = list(public_rows)
+    if project_id is not None:
+        private_rows = _load_rows(db, project_id, entity_class, derivation_type, public=False)
+        # the public roots with a private parent readable in the project are not roots anymore
+        reparented_ids = {row.id for row in private_rows if row.authorized_public}
+        rows = sorted(
+            [
+                *(row for row in public_rows if row.parent_id or row.id not in reparented_ids),
+                *private_rows,
+            ],
+            key=_get_row_sort_key,
+        )
     all_nodes = {
         row.id: HierarchyNode(
             id=row.id,
@@ -93,10 +162,33 @@ def _load_nodes(
     return all_nodes
 
 
+def _truncate(nodes: list[HierarchyNode], max_depth: int) -> list[uuid.UUID]:
+    """Remove the children of the nodes deeper than max_depth, and return the ids of their parents.
+
+    The nodes in the given list are at depth 0.
+    """
+    truncated_ids: list[uuid.UUID] = []
+    level = nodes
+    for _ in range(max_depth):
+        level = [child for node in level for child in node.children]
+    for node in level:
+        if node.children:
+            truncated_ids.append(node.id)
+            node.children = []
+    return truncated_ids
+
+
 def read_circuit_hierarchy(
     user_context: UserContextDep,
     db: SessionDep,
     derivation_type: DerivationType,
+    root_id: Annotated[
+        uuid.UUID | None, Query(description="Return only the subtree of the given circuit")
+    ] = None,
+    max_depth: Annotated[
+        int | None,
+        Query(ge=0, description="Max depth of the returned nodes, where the roots are at 0"),
+    ] = None,
 ) -> HierarchyTree:
     """Return a hierarchy tree of circuits based on derivations.
 
@@ -111,6 +203,9 @@ def read_circuit_hierarchy(
     - A public circuit can have any combination of public and private circuits as children.
     - A private circuit can have only private circuits with the same project_id as children.
 
+    The subtrees can be loaded lazily with root_id and max_depth: the nodes whose children
+    have been removed because of max_depth are listed in truncated_ids.
+
     See also https://github.com/openbraininstitute/entitycore/issues/292#issuecomment-3174884561
     """
     all_nodes = _load_nodes(
@@ -126,7 +221,17 @@ def read_circuit_hierarchy(
         else:
             parent = all_nodes[node.parent_id]
             parent.children.append(node)
+    if root_id is not None:
+        if root_id not in all_nodes:
+            raise ApiError(
+                message=f"Circuit {root_id} not found or forbidden",
+                error_code=ApiErrorCode.ENTITY_NOT_FOUND,
+                http_status_code=HTTPStatus.NOT_FOUND,
+            )
+        root_nodes = [all_nodes[root_id]]
+    truncated_ids = _truncate(root_nodes, max_depth) if max_depth is not None else []
     return HierarchyTree(
         derivation_type=derivation_type,
         data=root_nodes,
+        truncated_ids=truncated_ids,
     )
@@ -0,0 +1,185 @@
+"""Traversal of the provenance graph of the entities."""
+
+import functools
+import threading
+import uuid
+
+import cachetools
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.db.auth import is_public_or_in_projects
+from app.db.model import Activity, Derivation, Entity, Generation, Usage
+from app.db.types import DerivationType, EntityType
+from app.queries.entity import get_accessible_entity
+from app.schemas.auth import UserContext
+from app.schemas.provenance import (
+    ProvenanceDirection,
+    ProvenanceEdge,
+    ProvenanceEdgeType,
+    ProvenanceGraph,
+    ProvenanceNode,
+)
+
+_cache = cachetools.TTLCache[tuple, ProvenanceGraph](
+    maxsize=settings.PROVENANCE_CACHE_MAXSIZE, ttl=settings.PROVENANCE_CACHE_TTL
+)
+_cache_lock = threading.Lock()
+
+
+def _get_edges(
+    project_ids: list[uuid.UUID],
+    edge_types: list[ProvenanceEdgeType],
+    derivation_types: list[DerivationType] | None,
+) -> sa.CTE:
+    """Return the edges from the used to the generated entities, through readable activities."""
+    queries = []
+    if ProvenanceEdgeType.derivation in edge_types:
+        query = sa.select(
+            Derivation.used_id.label("used_id"),
+            Derivation.generated_id.label("generated_id"),
+            sa.literal(str(ProvenanceEdgeType.derivation), sa.String).label("edge_type"),
+            sa.cast(Derivation.derivation_type, sa.String).label("derivation_type"),
+            sa.cast(sa.null(), sa.Uuid).label("activity_id"),
+            sa.cast(sa.null(), sa.String).label("activity_type"),
+        )
+        if derivation_types:
+            query = query.where(Derivation.derivation_type.in_(derivation_types))
+        queries.append(query)
+    if ProvenanceEdgeType.activity in edge_types:
+        query = (
+            sa.select(
+                Usage.usage_entity_id.label("used_id"),
+                Generation.generation_entity_id.label("generated_id"),
+                sa.literal(str(ProvenanceEdgeType.activity), sa.String).label("edge_type"),
+                sa.cast(sa.null(), sa.String).label("derivation_type"),
+                Activity.id.label("activity_id"),
+                sa.cast(Activity.type, sa.String).label("activity_type"),
+            )
+            .join(Activity, Activity.id == Usage.usage_activity_id)
+            .join(Generation, Generation.generation_activity_id == Activity.id)
+            .where(is_public_or_in_projects(Activity, project_ids))
+        )
+        queries.append(query)
+    return sa.union_all(*queries).cte("edges")
+
+
+def _traverse(
+    db: Session,
+    *,
+    root_id: uuid.UUID,
+    project_ids: list[uuid.UUID],
+    direction: ProvenanceDirection,
+    max_depth: int,
+    edge_types: list[ProvenanceEdgeType],
+    derivation_types: list[DerivationType] | None,
+    entity_types: list[EntityType] | None,
+) -> ProvenanceGraph:
+    """Return the graph of the readable entities reachable from the root.
+
+    The traversal is executed in a single recursive query, and it doesn't go through
+    the entities and activities that aren't readable. The rows are deduplicated by entity
+    and depth, so the cycles are harmless and the query is bounded by max_depth.
+    """
+    edges = _get_edges(project_ids, edge_types, derivation_types)
+    if direction == ProvenanceDirection.downstream:
+        source, target = edges.c.used_id, edges.c.generated_id
+    else:
+        source, target = edges.c.generated_id, edges.c.used_id
+    walk = sa.select(
+        sa.literal(root_id, sa.Uuid).label("id"),
+        sa.literal(0).label("depth"),
+    ).cte("walk", recursive=True)
+    walk = walk.union(
+        sa.select(target, (walk.c.depth + 1).label("depth"))
+        .select_from(walk)
+        .join(edges, source == walk.c.id)
+        .join(Entity, Entity.id == target)
+        .where(walk.c.depth < max_depth, is_public_or_in_projects(Entity, project_ids))
+    )
+    reached = (
+        sa.select(walk.c.id, sa.func.min(walk.c.depth).label("depth"))
+        .group_by(walk.c.id)
+        .subquery("reached")
+    )
+    query = (
+        sa.select(Entity.id, Entity.type, reached.c.depth)
+        .join(reached, reached.c.id == Entity.id)
+        .order_by(reached.c.depth, Entity.id)
+        .limit(settings.PROVENANCE_MAX_NODES + 1)
+    )
+    if entity_types:
+        query = query.where(sa.or_(Entity.id == root_id, Entity.type.in_(entity_types)))
+    nodes = [ProvenanceNode.model_validate(row) for row in db.execute(query).all()]
+    truncated = len(nodes) > settings.PROVENANCE_MAX_NODES
+    nodes = nodes[: settings.PROVENANCE_MAX_NODES]
+
+    node_ids = [node.id for node in nodes]
+    query = (
+        sa.select(edges)
+        .where(edges.c.used_id.in_(node_ids), edges.c.generated_id.in_(node_ids))
+        .order_by(edges.c.used_id, edges.c.generated_id, edges.c.edge_type)
+    )
+    return ProvenanceGraph(
+        root_id=root_id,
+        direction=direction,
+        nodes=nodes,
+        edges=[ProvenanceEdge.model_validate(row) for row in db.execute(query).mappings()],
+        truncated=truncated,
+    )
+
+
+def read_graph(
+    *,
+    db: Session,
+    user_context: UserContext,
+    entity_id: uuid.UUID,
+    direction: ProvenanceDirection,
+    max_depth: int,
+    edge_types: list[ProvenanceEdgeType] | None,
+    derivation_types: list[DerivationType] | None,
+    entity_types: list[EntityType] | None,
+) -> ProvenanceGraph:
+    """Return the provenance graph of the readable entities reachable from the given entity.
+
+    The nodes are returned with their minimum depth from the root, and the edges are
+    all the selected relationships between the returned nodes.
+    """
+    # ensure that the root is readable, also when the graph is cached
+    _ = get_accessible_entity(db, Entity, entity_id, user_context=user_context)
+
+    project_ids = sorted(user_context.authorized_project_ids)
+    edge_types = sorted(edge_types or ProvenanceEdgeType)
+    derivation_types = sorted(derivation_types) if derivation_types else None
+    entity_types = sorted(entity_types) if entity_types else None
+    traverse = functools.partial(
+        _traverse,
+        db,
+        root_id=entity_id,
+        project_ids=project_ids,
+        direction=direction,
+        max_depth=max_depth,
+        edge_types=edge_types,
+        derivation_types=derivation_types,
+        entity_types=entity_types,
+    )
+    if not settings.PROVENANCE_CACHE_ENABLED:
+        return traverse()
+
+    key = (
+        entity_id,
+        tuple(project_ids),
+        direction,
+        max_depth,
+        tuple(edge_types),
+        tuple(derivation_types or ()),
+        tuple(entity_types or ()),
+    )
+    with _cache_lock:
+        if (graph := _cache.get(key)) is not None:
+            return graph
+    graph = traverse()
+    with _cache_lock:
+        _cache[key] = graph
+    return graph
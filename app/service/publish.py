@@ -6,17 +6,22 @@ from sqlalchemy.orm import Session
 from types_boto3_s3 import S3Client
 
 from app.config import StorageUnion
+from app.db.events import release_asset_blob
 from app.db.model import Asset, Entity
 from app.db.types import AssetStatus, StorageType
 from app.db.utils import PUBLISHABLE_BASE_CLASSES, PublishableBaseModel
 from app.logger import L
-from app.schemas.publish import ChangeProjectVisibilityResponse, MoveAssetsResult
+from app.repository.asset import AssetRepository
+from app.schemas.publish import ChangeProjectVisibilityResponse, MoveAssetsResult, MoveFileResult
 from app.utils.s3 import (
+    build_s3_blob_path,
     convert_s3_path_visibility,
+    copy_file,
     get_s3_path_prefix,
     move_directory,
     move_file,
 )
+from app.utils.uuid import create_uuid
 
 BATCH_SIZE = 500
 
@@ -49,6 +54,52 @@ def _set_base_class_visibility(
     return result.rowcount  # type: ignore[attr-defined]
 
 
+def _move_asset_blob(
+    db: Session,
+    *,
+    s3_client: S3Client,
+    asset: Asset,
+    bucket_name: str,
+    dry_run: bool,
+    public: bool,
+) -> tuple[MoveFileResult, uuid.UUID | None]:
+    """Reference the blob with the same content in the new visibility scope, copying if needed.
+
+    The previous blob is not released here, because it's still referenced by the asset.
+
+    Returns the result of the operation, and the id of the new blob, or None if not changed.
+    """
+    old_blob = asset.blob
+    assert old_blob is not None  # ruff:ignore[assert]
+    if dry_run:
+        return MoveFileResult(size=asset.size, error=None), None
+    blob_id = create_uuid()
+    with db.begin_nested() as savepoint:
+        blob = AssetRepository(db).acquire_blob(
+            blob_id=blob_id,
+            storage_type=old_blob.storage_type,
+            is_public=public,
+            sha256_digest=old_blob.sha256_digest,
+            size=old_blob.size,
+            full_path=build_s3_blob_path(blob_id=blob_id, is_public=public),
+        )
+        if blob.created and not copy_file(
+            s3_client,
+            src_bucket_name=bucket_name,
+            dst_bucket_name=bucket_name,
+            src_key=old_blob.full_path,
+            dst_key=blob.full_path,
+        ):
+            savepoint.rollback()
+            msg = (
+                f"Failed to copy blob from s3://{bucket_name}/{old_blob.full_path} "
+                f"to s3://{bucket_name}/{blob.full_path}"
+            )
+            L.warning(msg)
+            return MoveFileResult(size=asset.size, error=msg), None
+    return MoveFileResult(size=asset.size, error=None), blob.id
+
+
 def _set_assets_visibility(
     db: Session,
     *,
@@ -87,11 +138,25 @@ def _set_assets_visibility(
     move_result = MoveAssetsResult()
     for batch in batched(private_assets, BATCH_SIZE):
         path_mapping: dict[uuid.UUID, str] = {}
+        # deduplicated assets, mapped to the new blob and the previous blob to be released
+        blob_mapping: dict[uuid.UUID, tuple[uuid.UUID, uuid.UUID]] = {}
         L.info("Processing batch of {} assets [dry_run={}]", len(batch), dry_run)
         for asset in batch:
             src_key = asset.full_path
             dst_key = convert_s3_path_visibility(asset.full_path, public=public)
-            if asset.is_directory:
+            if asset.blob_id:
+                move_file_result, new_blob_id = _move_asset_blob(
+                    db,
+                    s3_client=s3_client,
+                    asset=asset,
+                    bucket_name=bucket_name,
+                    dry_run=dry_run,
+                    public=public,
+                )
+                move_result.update_from_file_result(move_file_result)
+                if new_blob_id:
+                    blob_mapping[asset.id] = (new_blob_id, asset.blob_id)
+            elif asset.is_directory:
                 move_result.update_from_directory_result(
                     move_directory(
                         s3_client,
@@ -116,14 +181,19 @@ def _set_assets_visibility(
                 )
             path_mapping[asset.id] = dst_key
             db.expunge(asset)  # free memory from session's identity map
-        db.execute(
-            sa.update(Asset)
-            .where(Asset.id.in_(path_mapping))
-            .values(
-                full_path=sa.case(path_mapping, value=Asset.id),
-                update_date=Asset.update_date,  # preserve update_date
+        values = {
+            "full_path": sa.case(path_mapping, value=Asset.id),
+            "update_date": Asset.update_date,  # preserve update_date
+        }
+        if blob_mapping:
+            values["blob_id"] = sa.case(
+                {asset_id: new_id for asset_id, (new_id, _) in blob_mapping.items()},
+                value=Asset.id,
+                else_=Asset.blob_id,
             )
-        )
+        db.execute(sa.update(Asset).where(Asset.id.in_(path_mapping)).values(values))
+        for _, old_blob_id in blob_mapping.values():
+            release_asset_blob(db, db.connection(), old_blob_id)
     return move_result
 
 
@@ -6,13 +6,13 @@ from sqlalchemy.orm import joinedload, raiseload
 import app.queries.common
 from app.db.model import Strain
 from app.dependencies.auth import AdminContextDep
-from app.dependencies.common import PaginationQuery
+from app.dependencies.common import NearestDep, PaginationQuery, SemanticSearchDep
 from app.dependencies.db import SessionDep
 from app.filters.species import StrainFilterDep
 from app.queries.factory import query_params_factory
 from app.schemas.routers import DeleteResponse
 from app.schemas.species import StrainAdminUpdate, StrainCreate, StrainRead
-from app.schemas.types import ListResponse
+from app.schemas.types import ListResponse, NearestNeighborsResponse
 from app.utils.embedding import generate_embedding
 
 
@@ -29,13 +29,12 @@ def read_many(
     db: SessionDep,
     pagination_request: PaginationQuery,
     strain_filter: StrainFilterDep,
-    semantic_search: str | None = None,
+    semantic_search: SemanticSearchDep,
 ) -> ListResponse[StrainRead]:
-
     embedding = None
 
-    if semantic_search is not None:
-        embedding = generate_embedding(semantic_search)
+    if semantic_search.semantic_search is not None:
+        embedding = generate_embedding(semantic_search.semantic_search, db=db)
 
     facet_keys = filter_keys = [
         "created_by",
@@ -62,6 +61,34 @@ def read_many(
         filter_model=strain_filter,
         join_specs=join_specs,
         embedding=embedding,
+        similarity_metric=semantic_search.semantic_search_metric,
+        ef_search=semantic_search.semantic_search_ef_search,
+    )
+
+
+def read_nearest(
+    *,
+    db: SessionDep,
+    strain_filter: StrainFilterDep,
+    nearest: NearestDep,
+) -> NearestNeighborsResponse[StrainRead]:
+    _, join_specs, aliases = query_params_factory(
+        db_model_class=Strain,
+        facet_keys=[],
+        filter_keys=["created_by", "updated_by"],
+    )
+    return app.queries.common.router_read_nearest(
+        db=db,
+        db_model_class=Strain,
+        aliases=aliases,
+        apply_data_query_operations=_load,
+        response_schema_class=StrainRead,
+        filter_model=strain_filter,
+        join_specs=join_specs,
+        embedding=generate_embedding(nearest.semantic_search, db=db),
+        similarity_metric=nearest.semantic_search_metric,
+        ef_search=nearest.semantic_search_ef_search,
+        limit=nearest.k,
     )
 
 
@@ -90,7 +117,7 @@ def admin_read_one(
 def create_one(
     json_model: StrainCreate, db: SessionDep, user_context: AdminContextDep
 ) -> StrainRead:
-    embedding = generate_embedding(json_model.name)
+    embedding = generate_embedding(json_model.name, db=db)
 
     return app.queries.common.router_create_one(
         db=db,
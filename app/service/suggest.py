@@ -0,0 +1,111 @@
+"""Typeahead suggestions of the names of entities and global resources."""
+
+import uuid
+from collections import defaultdict
+
+import sqlalchemy as sa
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from app.db.auth import constrain_to_readable_entities_by_project
+from app.db.model import BrainRegion, Entity, ETypeClass, MTypeClass, Species
+from app.db.types import EntityType, GlobalType
+from app.db.utils import ENTITY_TYPE_TO_CLASS, SUGGEST_ENTITY_TYPES, SuggestType
+from app.schemas.auth import UserContext
+from app.schemas.suggest import SuggestionRead, SuggestResponse
+from app.utils.pattern import escape_like_pattern
+
+# shorter texts match only at the beginning of the names, because the trigram indexes
+# cannot be used to find shorter substrings in any position
+MIN_CONTAINS_LENGTH = 3
+
+GLOBAL_NAME_COLUMNS: dict[
+    GlobalType, tuple[InstrumentedAttribute[uuid.UUID], InstrumentedAttribute[str]]
+] = {
+    GlobalType.brain_region: (BrainRegion.id, BrainRegion.name),
+    GlobalType.species: (Species.id, Species.name),
+    GlobalType.mtype_class: (MTypeClass.id, MTypeClass.pref_label),
+    GlobalType.etype_class: (ETypeClass.id, ETypeClass.pref_label),
+}
+
+
+def _get_entity_types_by_table() -> dict[sa.Table, list[EntityType]]:
+    """Return the entity types grouped by the table where the name is stored."""
+    result: dict[sa.Table, list[EntityType]] = defaultdict(list)
+    for entity_type in SUGGEST_ENTITY_TYPES:
+        column = ENTITY_TYPE_TO_CLASS[entity_type].__mapper__.columns["name"]
+        result[column.table].append(entity_type)  # pyright: ignore[reportArgumentType]
+    return dict(result)
+
+
+ENTITY_TYPES_BY_TABLE = _get_entity_types_by_table()
+
+
+def _select_matching(
+    query: sa.Select,
+    name: sa.ColumnElement[str] | InstrumentedAttribute[str],
+    text: str,
+    limit: int,
+) -> sa.Select:
+    """Filter and sort the names matching the text, returning the columns used for sorting."""
+    prefix = f"{escape_like_pattern(text)}%"
+    pattern = f"%{prefix}" if len(text) >= MIN_CONTAINS_LENGTH else prefix
+    is_prefix = name.ilike(prefix, escape="\\")
+    return (
+        query.add_columns(
+            is_prefix.label("is_prefix"),
+            sa.func.length(name).label("length"),
+        )
+        .where(name.ilike(pattern, escape="\\"))
+        .order_by(is_prefix.desc(), sa.func.length(name), name)
+        .limit(limit)
+    )
+
+
+def suggest(
+    *,
+    db: Session,
+    user_context: UserContext,
+    text: str,
+    types: list[SuggestType] | None,
+    limit: int,
+) -> SuggestResponse:
+    """Return the top entities and global resources with names matching the text.
+
+    The names starting with the text are returned first, then the shortest names.
+    Only the entities readable in the project of the user context are considered.
+    """
+    selected = {str(t) for t in types} if types else {str(t) for t in SuggestType}
+    queries = []
+    for table, entity_types in ENTITY_TYPES_BY_TABLE.items():
+        if not (table_types := [t for t in entity_types if t in selected]):
+            continue
+        query = (
+            sa.select(
+                Entity.id,
+                sa.cast(Entity.type, sa.String).label("type"),
+                table.c.name.label("name"),
+            )
+            .join(table, table.c.id == Entity.id)
+            .where(Entity.type.in_(table_types))
+        )
+        query = constrain_to_readable_entities_by_project(
+            query=query, project_id=user_context.project_id
+        )
+        queries.append(_select_matching(query, table.c.name, text, limit))
+    for global_type, (id_column, name_column) in GLOBAL_NAME_COLUMNS.items():
+        if global_type not in selected:
+            continue
+        query = sa.select(
+            id_column.label("id"),
+            sa.literal(str(global_type), sa.String).label("type"),
+            name_column.label("name"),
+        )
+        queries.append(_select_matching(query, name_column, text, limit))
+    union = sa.union_all(*queries).subquery()
+    query = (
+        sa.select(union.c.id, union.c.type, union.c.name)
+        .order_by(union.c.is_prefix.desc(), union.c.length, union.c.name, union.c.id)
+        .limit(limit)
+    )
+    rows = db.execute(query).all()
+    return SuggestResponse(data=[SuggestionRead.model_validate(row) for row in rows])
@@ -0,0 +1,126 @@
+"""Profile the startup of the application, to find the slowest imports and lifespan phases.
+
+The import times are measured with ``python -X importtime`` in a new interpreter, so that all the
+modules are imported from scratch, while the lifespan phases are measured in the current process,
+where some modules may have been imported already, using the timings collected by
+``app.logger.timed``.
+"""
+
+import asyncio
+import importlib
+import operator
+import subprocess  # ruff:ignore[suspicious-subprocess-import]
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import NamedTuple
+
+
+class ImportTime(NamedTuple):
+    module: str
+    self_time: float  # seconds, excluding the nested imports
+    cumulative_time: float  # seconds, including the nested imports
+
+
+class StartupProfile(NamedTuple):
+    import_times: list[ImportTime]
+    import_time: float  # seconds to import the application in a new interpreter
+    lifespan_timings: dict[str, float]  # seconds of each startup phase
+    lifespan_time: float  # seconds to execute the startup and the shutdown
+
+
+def parse_import_times(lines: Iterable[str]) -> list[ImportTime]:
+    """Parse the output of ``python -X importtime``, ignoring the header and any other line."""
+    result = []
+    for line in lines:
+        _, sep, rest = line.partition("import time:")
+        fields = rest.split("|")
+        if not sep or len(fields) != len(ImportTime._fields) or not fields[0].strip().isdigit():
+            continue
+        result.append(
+            ImportTime(
+                module=fields[2].strip(),
+                self_time=int(fields[0]) / 1e6,
+                cumulative_time=int(fields[1]) / 1e6,
+            )
+        )
+    return result
+
+
+def profile_imports(module: str) -> list[ImportTime]:
+    """Import the module in a new interpreter, and return the import time of each module."""
+    process = subprocess.run(  # ruff:ignore[subprocess-without-shell-equals-true]
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_import_times(process.stderr.splitlines())
+
+
+def get_import_time(import_times: Iterable[ImportTime], module: str) -> float:
+    """Return the cumulative import time of the module and of its parent packages."""
+    parts = module.split(".")
+    names = {".".join(parts[:i]) for i in range(1, len(parts) + 1)}
+    return sum(item.cumulative_time for item in import_times if item.module in names)
+
+
+def group_by_package(import_times: Iterable[ImportTime], depth: int = 2) -> dict[str, float]:
+    """Return the self time of the modules grouped by package, sorted by descending time.
+
+    Args:
+        import_times: import times of the modules.
+        depth: number of components of the module names used to group them,
+            for example ``app.routers`` with depth=2.
+    """
+    totals: dict[str, float] = defaultdict(float)
+    for item in import_times:
+        totals[".".join(item.module.split(".")[:depth])] += item.self_time
+    return dict(sorted(totals.items(), key=operator.itemgetter(1), reverse=True))
+
+
+def profile_startup(module: str = "app.application") -> StartupProfile:
+    """Profile the imports, then import the application and execute its lifespan.
+
+    Args:
+        module: module containing the FastAPI ``app`` and the ``startup_timings`` collected
+            during the lifespan.
+    """
+    import_times = profile_imports(module)
+    application = importlib.import_module(module)
+
+    async def run_lifespan() -> None:
+        async with application.app.router.lifespan_context(application.app):
+            pass
+
+    start = time.perf_counter()
+    asyncio.run(run_lifespan())
+    lifespan_time = time.perf_counter() - start
+    return StartupProfile(
+        import_times=import_times,
+        import_time=get_import_time(import_times, module),
+        lifespan_timings=dict(application.startup_timings),
+        lifespan_time=lifespan_time,
+    )
+
+
+def format_startup_profile(profile: StartupProfile, top: int = 20) -> str:
+    """Return the report of the slowest modules, packages and lifespan phases."""
+    slowest = sorted(profile.import_times, key=lambda x: x.cumulative_time, reverse=True)[:top]
+    lines = [
+        f"Import: {profile.import_time:.2f}s, lifespan: {profile.lifespan_time:.2f}s",
+        "",
+        f"Slowest {top} modules by cumulative time (with nested imports):",
+    ]
+    lines.extend(
+        f"{item.cumulative_time:9.3f}s {item.self_time:9.3f}s  {item.module}" for item in slowest
+    )
+    lines += ["", f"Slowest {top} packages by self time:"]
+    lines.extend(
+        f"{elapsed:9.3f}s  {package}"
+        for package, elapsed in list(group_by_package(profile.import_times).items())[:top]
+    )
+    lines += ["", "Lifespan phases:"]
+    lines.extend(f"{elapsed:9.3f}s  {msg}" for msg, elapsed in profile.lifespan_timings.items())
+    return "\n".join(lines)
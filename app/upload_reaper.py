@@ -0,0 +1,93 @@
+"""Abort the multipart uploads abandoned by the clients, in a background thread or on demand."""
+
+import threading
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.db.session import DatabaseSessionManager
+from app.db.types import AssetStatus
+from app.logger import L
+from app.repository.asset import AssetRepository
+from app.schemas.asset import ReapUploadsResult
+
+
+def reap_stale_uploads(
+    db: Session, *, max_age: timedelta, limit: int | None, dry_run: bool
+) -> ReapUploadsResult:
+    """Delete the assets left uploading for longer than max_age.
+
+    The pending multipart uploads, and the files already uploaded in the directories,
+    are removed from the storage in parallel by `app.db.events` after commit.
+
+    Returns the number of deleted assets, aborted uploads and deleted files,
+    and the total declared size of the files.
+    """
+    created_before = datetime.now(UTC) - max_age
+    result = ReapUploadsResult(dry_run=dry_run)
+    assets = AssetRepository(db).get_stale_uploads(created_before=created_before, limit=limit)
+    for asset in assets:
+        result.asset_count += 1
+        for file in asset.children if asset.is_directory else [asset]:
+            if file.status == AssetStatus.UPLOADING:
+                result.upload_count += 1
+            else:
+                result.file_count += 1
+            result.total_size += file.size
+        if not dry_run:
+            db.delete(asset)
+    db.flush()
+    return result
+
+
+def _reaper_worker(
+    stop: threading.Event,
+    database_session_manager: DatabaseSessionManager,
+    interval: float,
+    max_age: timedelta,
+) -> None:
+    """Reap the stale uploads every interval seconds."""
+    while not stop.wait(timeout=interval):
+        try:
+            with database_session_manager.session() as db:
+                result = reap_stale_uploads(
+                    db, max_age=max_age, limit=settings.UPLOAD_REAPER_BATCH_SIZE, dry_run=False
+                )
+        except Exception:  # ruff:ignore[blind-except]
+            L.exception("Failed to reap stale uploads")
+            continue
+        if result.asset_count:
+            L.info(
+                "Reaped {} stale assets: {} uploads aborted, {} files deleted, {} bytes",
+                result.asset_count,
+                result.upload_count,
+                result.file_count,
+                result.total_size,
+            )
+
+
+def start_upload_reaper_thread(
+    database_session_manager: DatabaseSessionManager,
+) -> Callable[[], None]:
+    """Start a daemon thread for periodic reaping. Returns a stop function."""
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=_reaper_worker,
+        args=(
+            stop,
+            database_session_manager,
+            settings.UPLOAD_REAPER_INTERVAL_SECONDS,
+            timedelta(seconds=settings.UPLOAD_REAPER_MAX_AGE_SECONDS),
+        ),
+        daemon=True,
+        name="upload-reaper",
+    )
+    thread.start()
+
+    def shutdown() -> None:
+        stop.set()
+        thread.join(timeout=5)
+
+    return shutdown
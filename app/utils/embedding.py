@@ -1,15 +1,34 @@
 """Utility functions for generating embeddings using OpenAI API."""
 
+import functools
 import hashlib
 import itertools
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
-import openai
-from openai import APIConnectionError, APIStatusError
+import cachetools
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
 
 from app.config import settings
-from app.db.model import EmbeddingMixin
+from app.db.model import EmbeddingCache, EmbeddingMixin
 from app.errors import ApiError, ApiErrorCode
 
+if TYPE_CHECKING:
+    # imported only when needed, because the import of openai takes a significant part of startup
+    import openai
+
+DEFAULT_MODEL = "text-embedding-3-small"
+
+_cache: cachetools.LRUCache[tuple[str, str], tuple[float, ...]] = cachetools.LRUCache(
+    maxsize=settings.EMBEDDING_CACHE_MAXSIZE
+)
+_cache_lock = threading.Lock()
+
 
 def pseudo_random_embedding(text: str) -> list[float]:
     h = hashlib.sha256(text.encode()).digest()
@@ -21,18 +40,84 @@ def pseudo_random_embedding(text: str) -> list[float]:
     ]
 
 
-def generate_embedding(text: str, model: str = "text-embedding-3-small") -> list[float]:
-    """Generate an embedding for the given text using OpenAI API.
+def normalize_text(text: str) -> str:
+    """Return the text with collapsed whitespaces, preserving the case.
 
-    Args:
-        text: The text to generate an embedding for
-        model: The OpenAI embedding model to use (default: text-embedding-3-small)
+    The normalized text is used only as key of the caches, not to compute the embeddings.
+    """
+    return " ".join(text.split())
 
-    Returns:
-        A list of floats representing the embedding vector
+
+class EmbeddingProvider(ABC):
+    """Generate the embeddings of texts with a given model."""
+
+    def __init__(self, model: str) -> None:
+        """Init the provider."""
+        self.model = model
+
+    @abstractmethod
+    def embed_batch(self, texts: Sequence[str]) -> list[list[float]]:
+        """Return the embeddings of the texts, in the same order."""
+
+
+class OpenAIEmbeddingProvider(EmbeddingProvider):
+    """Provider using OpenAI API."""
+
+    def __init__(self, model: str, client: "openai.OpenAI") -> None:
+        """Init the provider."""
+        super().__init__(model)
+        self._client = client
+
+    def embed_batch(self, texts: Sequence[str]) -> list[list[float]]:
+        """Return the embeddings of the texts, sending up to EMBEDDING_BATCH_SIZE per request."""
+        from openai import (  # ruff:ignore[import-outside-top-level]
+            APIConnectionError,
+            APIStatusError,
+        )
+
+        result: list[list[float]] = []
+        try:
+            for batch in itertools.batched(texts, settings.EMBEDDING_BATCH_SIZE):
+                response = self._client.embeddings.create(model=self.model, input=list(batch))
+                result.extend(item.embedding for item in response.data)
+        except (APIConnectionError, APIStatusError) as e:
+            raise ApiError(
+                message="OpenAI API error",
+                error_code=ApiErrorCode.OPENAI_API_ERROR,
+                http_status_code=500,
+                details=str(e),
+            ) from e
+        return result
+
+
+class PseudoRandomEmbeddingProvider(EmbeddingProvider):
+    """Deterministic provider not requiring any network access, to be used for testing."""
+
+    def embed_batch(self, texts: Sequence[str]) -> list[list[float]]:  # ruff:ignore[no-self-use]
+        """Return the embeddings of the texts, in the same order."""
+        return [pseudo_random_embedding(text) for text in texts]
+
+
+@functools.cache
+def _get_openai_client(api_key: str) -> "openai.OpenAI":
+    """Return a client shared by all the models, to reuse the pooled connections."""
+    import openai  # ruff:ignore[import-outside-top-level]
+
+    return openai.OpenAI(api_key=api_key)
+
+
+@functools.cache
+def _create_embedding_provider(model: str, api_key: str) -> EmbeddingProvider:
+    if api_key == "random":
+        return PseudoRandomEmbeddingProvider(model)
+    return OpenAIEmbeddingProvider(model, client=_get_openai_client(api_key))
+
+
+def get_embedding_provider(model: str = DEFAULT_MODEL) -> EmbeddingProvider:
+    """Return the provider for the given model.
 
     Raises:
-        ApiError: If OpenAI API key is not configured or API call fails
+        ApiError: If OpenAI API key is not configured
     """
     if settings.OPENAI_API_KEY is None:
         raise ApiError(
@@ -40,24 +125,127 @@ def generate_embedding(text: str, model: str = "text-embedding-3-small") -> list
             error_code=ApiErrorCode.OPENAI_API_KEY_MISSING,
             http_status_code=500,
         )
+    return _create_embedding_provider(model, settings.OPENAI_API_KEY.get_secret_value())
 
-    openai_api_key = settings.OPENAI_API_KEY.get_secret_value()
 
-    if openai_api_key == "random":
-        return pseudo_random_embedding(text)
+def _get_text_digest(text: str) -> bytes:
+    return hashlib.sha256(text.encode()).digest()
 
-    try:
-        # Generate embedding using OpenAI API
-        client = openai.OpenAI(api_key=openai_api_key)
-        response = client.embeddings.create(model=model, input=text)
 
-        # Return the generated embedding
-        return response.data[0].embedding
+def _get_db_cache_expiration() -> datetime:
+    """Return the creation date before which the embeddings in the database are expired."""
+    return datetime.now(UTC) - timedelta(seconds=settings.EMBEDDING_DB_CACHE_TTL_SECONDS)
 
-    except (APIConnectionError, APIStatusError) as e:
-        raise ApiError(
-            message="OpenAI API error",
-            error_code=ApiErrorCode.OPENAI_API_ERROR,
-            http_status_code=500,
-            details=str(e),
-        ) from e
+
+def _read_db_cache(db: Session, model: str, keys: Sequence[str]) -> dict[str, list[float]]:
+    digests = {_get_text_digest(key): key for key in keys}
+    rows = db.execute(
+        sa.select(EmbeddingCache.text_digest, EmbeddingCache.embedding).where(
+            EmbeddingCache.model == model,
+            EmbeddingCache.text_digest.in_(digests),
+            EmbeddingCache.creation_date >= _get_db_cache_expiration(),
+        )
+    ).all()
+    return {digests[row.text_digest]: [float(v) for v in row.embedding] for row in rows}
+
+
+def _write_db_cache(db: Session, model: str, embeddings: dict[str, list[float]]) -> None:
+    """Store the embeddings by key, replacing the expired ones, and purge some expired rows.
+
+    The expired rows are purged in batches of at most EMBEDDING_DB_CACHE_PURGE_BATCH_SIZE at each
+    write, since the cache grows only when writing. The rows locked by other writers are skipped.
+    """
+    expiration = _get_db_cache_expiration()
+    insert = pg_insert(EmbeddingCache).values(
+        [
+            {"model": model, "text_digest": _get_text_digest(key), "embedding": embedding}
+            for key, embedding in embeddings.items()
+        ]
+    )
+    db.execute(
+        insert.on_conflict_do_update(
+            index_elements=[EmbeddingCache.model, EmbeddingCache.text_digest],
+            set_={
+                "embedding": insert.excluded.embedding,
+                "creation_date": sa.func.statement_timestamp(),
+                "update_date": sa.func.statement_timestamp(),
+            },
+            where=EmbeddingCache.creation_date < expiration,
+        )
+    )
+    expired = (
+        sa.select(EmbeddingCache.model, EmbeddingCache.text_digest)
+        .where(EmbeddingCache.creation_date < expiration)
+        .limit(settings.EMBEDDING_DB_CACHE_PURGE_BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )
+    db.execute(
+        sa.delete(EmbeddingCache).where(
+            sa.tuple_(EmbeddingCache.model, EmbeddingCache.text_digest).in_(expired)
+        )
+    )
+
+
+def generate_embeddings(
+    texts: Sequence[str], model: str = DEFAULT_MODEL, db: Session | None = None
+) -> list[list[float]]:
+    """Generate the embeddings for the given texts, in the same order.
+
+    The embeddings are looked up by normalized text in the in-process cache, then in the
+    database cache if a session is given. Only the missing embeddings are requested to the
+    provider in batches, and stored in both caches. The texts sent to the provider aren't
+    normalized: the first text of each key is sent as given. The normalization preserves the
+    case, so the texts differing only by case get their own embeddings.
+
+    Args:
+        texts: The texts to generate the embeddings for
+        model: The embedding model to use (default: text-embedding-3-small)
+        db: Optional database session used to read and write the persistent cache
+
+    Returns:
+        A list of embedding vectors
+
+    Raises ApiError if OpenAI API key is not configured or API call fails.
+    """
+    provider = get_embedding_provider(model)
+    keys = [normalize_text(text) for text in texts]
+    found: dict[str, list[float]] = {}
+    with _cache_lock:
+        for key in keys:
+            if (embedding := _cache.get((model, key))) is not None:
+                found[key] = list(embedding)
+    missing: dict[str, str] = {}  # text to be embedded by key
+    for key, text in zip(keys, texts, strict=True):
+        if key not in found:
+            missing.setdefault(key, text)
+    if missing and db is not None:
+        found |= _read_db_cache(db, model, list(missing))
+        missing = {key: text for key, text in missing.items() if key not in found}
+    if missing:
+        embeddings = provider.embed_batch(list(missing.values()))
+        generated = dict(zip(missing, embeddings, strict=True))
+        if db is not None:
+            _write_db_cache(db, model, generated)
+        found |= generated
+    with _cache_lock:
+        for key in keys:
+            _cache[model, key] = tuple(found[key])
+    return [found[key] for key in keys]
+
+
+def generate_embedding(
+    text: str, model: str = DEFAULT_MODEL, db: Session | None = None
+) -> list[float]:
+    """Generate an embedding for the given text, using the cache if possible.
+
+    Args:
+        text: The text to generate an embedding for
+        model: The embedding model to use (default: text-embedding-3-small)
+        db: Optional database session used to read and write the persistent cache
+
+    Returns:
+        A list of floats representing the embedding vector
+
+    Raises ApiError if OpenAI API key is not configured or API call fails.
+    """
+    return generate_embeddings([text], model=model, db=db)[0]
@@ -1,4 +1,3 @@
-import hashlib
 import mimetypes
 
 from fastapi import UploadFile
@@ -35,12 +34,3 @@ def get_content_type(
         )
     str_content_type = original_content_type or guessed_content_type
     return ContentType(str_content_type)
-
-
-def calculate_sha256_digest(file: UploadFile) -> str:
-    """Calculate the sha256 digest of the given file."""
-    try:
-        return hashlib.file_digest(file.file, "sha256").hexdigest()  # type: ignore[arg-type]
-    finally:
-        # Reset the file pointer to the beginning
-        file.file.seek(0)
@@ -1,3 +1,16 @@
+import re
+
+
+def escape_like_pattern(value: str) -> str:
+    r"""Escape the SQL LIKE metacharacters (%, _, \\), to match the value literally.
+
+    Examples:
+        >>> escape_like_pattern("data_file")
+        "data\\_file"
+    """
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 def convert_to_ilike_pattern(value: str) -> str:
     r"""Convert user input to SQL ILIKE pattern with wildcard support.
 
@@ -25,6 +38,28 @@ def convert_to_ilike_pattern(value: str) -> str:
         >>> convert_to_ilike_pattern("100% complete")
         "100\\% complete"
     """
-    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-    pattern = escaped.replace("*", "%").replace("?", "_")
+    pattern = escape_like_pattern(value).replace("*", "%").replace("?", "_")
     return pattern
+
+
+def convert_to_regex_pattern(value: str) -> re.Pattern[str]:
+    """Convert user input to a compiled regex with the same wildcards of `convert_to_ilike_pattern`.
+
+    The returned pattern is case-sensitive and it should be used with `fullmatch`.
+
+    Args:
+        value: String with optional wildcards
+
+    Returns:
+        Compiled regular expression
+
+    Examples:
+        >>> convert_to_regex_pattern("*.swc").fullmatch("morph/cell.swc") is not None
+        True
+        >>> convert_to_regex_pattern("file?.txt").fullmatch("file10.txt") is not None
+        False
+    """
+    pattern = "".join(
+        ".*" if char == "*" else "." if char == "?" else re.escape(char) for char in value
+    )
+    return re.compile(pattern, flags=re.DOTALL)
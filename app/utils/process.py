@@ -0,0 +1,65 @@
+"""Process utils, to report the startup time and the memory usage of the workers."""
+
+import os
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+MB = 1024**2
+
+_started_at = time.monotonic()
+
+
+def _reset_started_at() -> None:
+    global _started_at  # ruff:ignore[global-statement]
+    _started_at = time.monotonic()
+
+
+# the forked workers start counting from the fork, not from the start of the parent
+os.register_at_fork(after_in_child=_reset_started_at)
+
+
+class MemoryUsage(NamedTuple):
+    rss: int  # bytes resident in memory, including the pages shared with other processes
+    pss: int  # bytes of rss, with the shared pages divided by the number of processes sharing them
+    private: int  # bytes of rss not shared with other processes
+
+    def __str__(self) -> str:
+        """Return the memory usage in MB."""
+        return (
+            f"rss={self.rss / MB:.1f}MB pss={self.pss / MB:.1f}MB private={self.private / MB:.1f}MB"
+        )
+
+
+def get_uptime() -> float:
+    """Return the seconds elapsed since the start of the process, or since the fork."""
+    return time.monotonic() - _started_at
+
+
+def get_memory_usage(path: Path = Path("/proc/self/smaps_rollup")) -> MemoryUsage | None:
+    """Return the memory usage of the current process, or None if not available (non Linux)."""
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return None
+    values: dict[str, int] = {}
+    for line in lines:
+        key, sep, value = line.partition(":")
+        if sep and value.strip().endswith("kB"):
+            values[key] = int(value.split()[0]) * 1024
+    return MemoryUsage(
+        rss=values.get("Rss", 0),
+        pss=values.get("Pss", 0),
+        private=values.get("Private_Clean", 0) + values.get("Private_Dirty", 0),
+    )
+
+
+def get_rss(path: Path = Path("/proc/self/statm")) -> int | None:
+    """Return the bytes resident in memory, or None if not available (non Linux).
+
+    It's cheaper than get_memory_usage, so it can be called frequently.
+    """
+    try:
+        return int(path.read_text(encoding="utf-8").split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError):
+        return None
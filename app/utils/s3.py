@@ -1,7 +1,11 @@
+import hashlib
 import math
 import os
 import threading
 import uuid
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from http import HTTPStatus
 from pathlib import Path
 from typing import IO, Protocol, TypedDict
 from urllib.parse import urlparse, urlunparse
@@ -21,6 +25,7 @@ from types_boto3_s3.type_defs import (
 
 from app.config import StorageUnion, settings, storages
 from app.db.types import EntityType, StorageType
+from app.errors import ApiError, ApiErrorCode
 from app.logger import L
 from app.schemas.asset import validate_path_component
 from app.schemas.publish import MoveDirectoryResult, MoveFileResult
@@ -37,6 +42,11 @@ class CheckObjectResult(TypedDict):
     size: int | None
 
 
+class UploadResult(TypedDict):
+    size: int
+    sha256_digest: str
+
+
 class StorageClientFactory(Protocol):
     def __call__(self, storage: StorageUnion) -> S3Client: ...
 
@@ -67,6 +77,21 @@ def build_s3_path(
     return f"{prefix}{vlab_id}/{proj_id}/assets/{entity_type.name}/{entity_id}/{filename}"
 
 
+def build_s3_blob_path(*, blob_id: uuid.UUID, is_public: bool) -> str:
+    """Return the key used to store a deduplicated file on S3, shared by multiple assets.
+
+    The key doesn't depend on the digest, so that the file can be uploaded directly to the blob
+    while the digest is calculated.
+    """
+    prefix = get_s3_path_prefix(public=is_public)
+    return f"{prefix}blobs/{blob_id}"
+
+
+def is_public_s3_path(s3_path: str) -> bool:
+    """Return True if the S3 path is public, False if private."""
+    return s3_path.startswith(PUBLIC_ASSET_PREFIX)
+
+
 def convert_s3_path_visibility(s3_path: str, *, public: bool) -> str:
     """Convert a private S3 path to a public one, or vice versa.
 
@@ -140,36 +165,240 @@ def get_s3_client(storage: StorageUnion) -> S3Client:
     return clients[storage.type]
 
 
+def _upload_part(
+    s3_client: S3Client,
+    *,
+    bucket_name: str,
+    s3_key: str,
+    upload_id: str,
+    part_number: int,
+    body: bytes,
+) -> dict:
+    response = s3_client.upload_part(
+        Bucket=bucket_name,
+        Key=s3_key,
+        UploadId=upload_id,
+        PartNumber=part_number,
+        Body=body,
+    )
+    return {"ETag": response["ETag"], "PartNumber": part_number}
+
+
+def _upload_single_part(
+    s3_client: S3Client,
+    *,
+    bucket_name: str,
+    s3_key: str,
+    body: bytes,
+    sha256: "hashlib._Hash",
+    expected_sha256_digest: str | None,
+) -> int | None:
+    """Upload the body with a single request, and return its size, or None on digest mismatch."""
+    sha256.update(body)
+    if expected_sha256_digest and sha256.hexdigest() != expected_sha256_digest:
+        return None
+    s3_client.put_object(Bucket=bucket_name, Key=s3_key, Body=body)
+    return len(body)
+
+
+def _iter_chunks(head: bytes, file_obj: IO[bytes], chunk_size: int) -> Iterator[bytes]:
+    """Yield the chunks of the file, starting with the chunks of the head already read."""
+    offset = 0
+    while len(head) - offset >= chunk_size:
+        yield head[offset : offset + chunk_size]
+        offset += chunk_size
+    rest = head[offset:]
+    del head
+    chunk = rest + file_obj.read(chunk_size - len(rest))
+    while chunk:
+        yield chunk
+        chunk = file_obj.read(chunk_size)
+
+
+def _upload_parts(
+    s3_client: S3Client,
+    *,
+    chunks: Iterator[bytes],
+    bucket_name: str,
+    s3_key: str,
+    upload_id: str,
+    sha256: "hashlib._Hash",
+) -> tuple[int, list[dict]]:
+    """Upload the parts of a multipart upload in parallel, and return the size and the parts.
+
+    The file isn't read anymore after the first failed part, and the pending parts are cancelled.
+    """
+    max_concurrency = settings.S3_MULTIPART_UPLOAD_MAX_CONCURRENCY
+    # limit the number of chunks waiting to be uploaded, to bound the memory usage
+    semaphore = threading.BoundedSemaphore(max_concurrency)
+    failed = threading.Event()
+    size = 0
+    futures: list[Future[dict]] = []
+
+    def on_done(future: Future[dict]) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            failed.set()
+        semaphore.release()
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        for chunk in chunks:
+            semaphore.acquire()
+            if failed.is_set():
+                executor.shutdown(cancel_futures=True)
+                break
+            sha256.update(chunk)
+            size += len(chunk)
+            future = executor.submit(
+                _upload_part,
+                s3_client,
+                bucket_name=bucket_name,
+                s3_key=s3_key,
+                upload_id=upload_id,
+                part_number=len(futures) + 1,
+                body=chunk,
+            )
+            future.add_done_callback(on_done)
+            futures.append(future)
+    for future in futures:
+        if not future.cancelled() and (exc := future.exception()) is not None:
+            raise exc
+    return size, [future.result() for future in futures]
+
+
+def _upload_multipart(
+    s3_client: S3Client,
+    *,
+    chunks: Iterator[bytes],
+    bucket_name: str,
+    s3_key: str,
+    sha256: "hashlib._Hash",
+    expected_sha256_digest: str | None,
+) -> int | None:
+    """Upload the file with a multipart upload, and return its size, or None on digest mismatch.
+
+    The multipart upload is aborted in case of digest mismatch or errors.
+    """
+    upload_id = s3_client.create_multipart_upload(Bucket=bucket_name, Key=s3_key)["UploadId"]
+    try:
+        size, parts = _upload_parts(
+            s3_client,
+            chunks=chunks,
+            bucket_name=bucket_name,
+            s3_key=s3_key,
+            upload_id=upload_id,
+            sha256=sha256,
+        )
+        if expected_sha256_digest and sha256.hexdigest() != expected_sha256_digest:
+            _abort_multipart_upload(s3_client, bucket_name, s3_key, upload_id)
+            return None
+        multipart_upload_complete(
+            s3_client, s3_key=s3_key, upload_id=upload_id, bucket=bucket_name, parts=parts
+        )
+    except Exception:
+        _abort_multipart_upload(s3_client, bucket_name, s3_key, upload_id)
+        raise
+    return size
+
+
+def _upload_file(
+    s3_client: S3Client,
+    *,
+    file_obj: IO[bytes],
+    bucket_name: str,
+    s3_key: str,
+    sha256: "hashlib._Hash",
+    expected_sha256_digest: str | None,
+) -> int | None:
+    """Upload the file with a single or a multipart upload, depending on its size."""
+    threshold = settings.S3_MULTIPART_UPLOAD_THRESHOLD
+    head = file_obj.read(threshold)
+    if len(head) < threshold:
+        return _upload_single_part(
+            s3_client,
+            bucket_name=bucket_name,
+            s3_key=s3_key,
+            body=head,
+            sha256=sha256,
+            expected_sha256_digest=expected_sha256_digest,
+        )
+    chunk_size = max(
+        settings.S3_MULTIPART_UPLOAD_CHUNKSIZE, settings.S3_MULTIPART_UPLOAD_MIN_PART_SIZE
+    )
+    chunks = _iter_chunks(head, file_obj, chunk_size)
+    # the head is released by the generator after yielding its chunks
+    del head
+    return _upload_multipart(
+        s3_client,
+        chunks=chunks,
+        bucket_name=bucket_name,
+        s3_key=s3_key,
+        sha256=sha256,
+        expected_sha256_digest=expected_sha256_digest,
+    )
+
+
 def upload_to_s3(
     s3_client: S3Client,
-    file_obj: IO,
+    file_obj: IO[bytes],
     bucket_name: str,
     s3_key: str,
-) -> bool:
-    """Upload an object to an S3 bucket.
+    expected_sha256_digest: str | None = None,
+) -> UploadResult | None:
+    """Upload an object to an S3 bucket, calculating the sha256 digest while uploading.
+
+    The file is read only once: each chunk is added to the digest and sent to S3.
+    Files smaller than S3_MULTIPART_UPLOAD_THRESHOLD are uploaded with a single request, while
+    bigger files are uploaded with a multipart upload, keeping at most
+    S3_MULTIPART_UPLOAD_MAX_CONCURRENCY parts in memory at the same time, besides the beginning
+    of the file read to choose between them.
 
     Args:
         s3_client: S3 client instance.
         file_obj: file-like object.
         bucket_name: name of the S3 bucket.
         s3_key: S3 object key (destination path in the bucket).
+        expected_sha256_digest: if provided, the object is not stored and the multipart upload
+            is aborted when the calculated digest doesn't match.
+
+    Returns:
+        The size and the sha256 digest of the uploaded object, or None in case of failure.
+
+    Raises:
+        ApiError: if the calculated digest doesn't match the expected digest.
     """
+    if expected_sha256_digest:
+        expected_sha256_digest = expected_sha256_digest.lower()
+    sha256 = hashlib.sha256()
     try:
-        s3_client.upload_fileobj(
-            file_obj,
-            Bucket=bucket_name,
-            Key=s3_key,
-            Config=TransferConfig(
-                multipart_threshold=settings.S3_MULTIPART_UPLOAD_THRESHOLD,
-                multipart_chunksize=settings.S3_MULTIPART_UPLOAD_CHUNKSIZE,
-                max_concurrency=settings.S3_MULTIPART_UPLOAD_MAX_CONCURRENCY,
-            ),
+        size = _upload_file(
+            s3_client,
+            file_obj=file_obj,
+            bucket_name=bucket_name,
+            s3_key=s3_key,
+            sha256=sha256,
+            expected_sha256_digest=expected_sha256_digest,
         )
     except Exception:  # ruff:ignore[blind-except]
         L.exception("Error while uploading file to s3://{}/{}", bucket_name, s3_key)
-        return False
+        return None
+    if size is None:
+        L.warning("Digest mismatch, file not uploaded to s3://{}/{}", bucket_name, s3_key)
+        raise ApiError(
+            message="The sha256 digest of the uploaded file doesn't match the expected digest",
+            error_code=ApiErrorCode.ASSET_INVALID_DIGEST,
+            http_status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+        )
     L.info("File uploaded successfully to s3://{}/{}", bucket_name, s3_key)
-    return True
+    return {"size": size, "sha256_digest": sha256.hexdigest()}
+
+
+def _abort_multipart_upload(
+    s3_client: S3Client, bucket_name: str, s3_key: str, upload_id: str
+) -> None:
+    try:
+        s3_client.abort_multipart_upload(Bucket=bucket_name, Key=s3_key, UploadId=upload_id)
+    except Exception:  # ruff:ignore[blind-except]
+        L.exception("Error while aborting the upload to s3://{}/{}", bucket_name, s3_key)
 
 
 def delete_from_s3(s3_client: S3Client, bucket_name: str, s3_key: str) -> bool:
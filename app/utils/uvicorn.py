@@ -1,7 +1,18 @@
+import contextlib
+import gc
+import os
+import signal
+import socket
+import time
+from types import FrameType
+
 import uvicorn
+from uvicorn.importer import import_from_string
 from uvicorn.supervisors import ChangeReload
 
-from app.logger import configure_logging, configure_warnings
+from app.gc_control import freeze_before_fork
+from app.logger import L, configure_logging, configure_warnings
+from app.utils.process import get_memory_usage
 
 
 class CustomUvicornConfig(uvicorn.Config):
@@ -14,7 +25,104 @@ class CustomUvicornConfig(uvicorn.Config):
         configure_warnings()
 
 
-def run_server(app: str, *, host: str, port: int, reload: bool = False) -> None:
+class PreforkSupervisor:
+    """Run the workers forked from the parent process after the warmup.
+
+    Unlike the multiprocess supervisor of uvicorn, that spawns new interpreters, the workers share
+    the modules imported by the parent, and the objects created by the warmup, copy-on-write.
+    The workers exiting unexpectedly are replaced by new workers forked from the parent, unless
+    they exit during the startup, since the new workers would probably fail in the same way.
+    """
+
+    min_worker_lifetime = 10.0  # seconds
+
+    def __init__(self, config: uvicorn.Config, *, workers: int, warmup: str | None) -> None:
+        """Init the supervisor."""
+        self.config = config
+        self.workers = workers
+        self.warmup = warmup
+        self.pids: dict[int, float] = {}  # start time of each worker
+        self.should_exit = False
+
+    def _handle_exit(self, sig: int, _frame: FrameType | None) -> None:
+        L.info("Received signal {}, stopping {} workers", signal.Signals(sig).name, len(self.pids))
+        self.should_exit = True
+        for pid in list(self.pids):
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+
+    def _fork_worker(self, sock: socket.socket) -> None:
+        if pid := os.fork():
+            self.pids[pid] = time.monotonic()
+            return
+        # in the worker: restore the default handlers, replaced by uvicorn when serving
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        gc.enable()
+        exit_code = 0
+        try:
+            uvicorn.Server(self.config).run(sockets=[sock])
+        except BaseException:  # ruff:ignore[blind-except]
+            L.exception("Worker failed [PID={}]", os.getpid())
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def run(self) -> None:
+        """Execute the warmup, fork the workers, and wait until all of them have exited."""
+        start = time.perf_counter()
+        # avoid collections while the objects to be frozen are created
+        gc.disable()
+        self.config.load()
+        if self.warmup:
+            import_from_string(self.warmup)()
+        freeze_before_fork()
+        L.info(
+            "Warmup completed in {:.2f}s [PID={}, memory: {}]",
+            time.perf_counter() - start,
+            os.getpid(),
+            get_memory_usage(),
+        )
+        sock = self.config.bind_socket()
+        signal.signal(signal.SIGINT, self._handle_exit)
+        signal.signal(signal.SIGTERM, self._handle_exit)
+        for _ in range(self.workers):
+            self._fork_worker(sock)
+        L.info("Started {} workers {}", self.workers, sorted(self.pids))
+        while self.pids:
+            pid, status = os.wait()
+            lifetime = time.monotonic() - self.pids.pop(pid)
+            if self.should_exit:
+                continue
+            if lifetime < self.min_worker_lifetime:
+                L.error("Worker {} exited with status {} during startup", pid, status)
+                self._handle_exit(signal.SIGTERM, None)
+            else:
+                L.warning("Worker {} exited with status {}, forking a new worker", pid, status)
+                self._fork_worker(sock)
+        sock.close()
+        L.info("All workers stopped")
+
+
+def run_server(
+    app: str,
+    *,
+    host: str,
+    port: int,
+    reload: bool = False,
+    workers: int = 1,
+    warmup: str | None = None,
+) -> None:
+    """Run the server, forking the given number of workers after the warmup if workers > 1.
+
+    Args:
+        app: import string of the app.
+        host: address to listen on.
+        port: port to listen on.
+        reload: enable auto-reload, only with a single worker.
+        workers: number of worker processes.
+        warmup: import string of the function called before forking the workers.
+    """
     config = CustomUvicornConfig(
         app,
         host=host,
@@ -23,9 +131,11 @@ def run_server(app: str, *, host: str, port: int, reload: bool = False) -> None:
         proxy_headers=True,
         log_config=None,
     )
-    server = uvicorn.Server(config)
     if reload:
+        server = uvicorn.Server(config)
         sock = config.bind_socket()
         ChangeReload(config, target=server.run, sockets=[sock]).run()
+    elif workers > 1:
+        PreforkSupervisor(config, workers=workers, warmup=warmup).run()
     else:
-        server.run()
+        uvicorn.Server(config).run()
@@ -0,0 +1,141 @@
+"""Compare the concurrent lists of experimental neuron densities with the sync and async engines.
+
+The sync mode executes each request in a worker thread, limited as the threadpool used by FastAPI
+for the sync routes, while the async mode executes all the requests in the event loop.
+
+The densities already in the database are read, so the script doesn't write anything.
+"""
+
+import asyncio
+import statistics
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+import anyio.to_thread
+import click
+from anyio import CapacityLimiter
+
+from app.config import settings
+from app.db.model import ExperimentalNeuronDensity
+from app.db.session import DatabaseSessionManager, configure_database_session_manager
+from app.filters.density import ExperimentalNeuronDensityFilter
+from app.queries.common import async_router_read_many, router_read_many
+from app.schemas.density import ExperimentalNeuronDensityRead
+from app.schemas.types import PaginationRequest
+from app.service import experimental_neuron_density as service
+
+
+def _params(page_size: int, project_id: uuid.UUID | None) -> dict:
+    return {
+        "db_model_class": ExperimentalNeuronDensity,
+        "authorized_project_id": project_id,
+        "with_search": None,
+        "with_in_brain_region": None,
+        "facets": None,
+        "aliases": None,
+        "apply_filter_query_operations": None,
+        "apply_data_query_operations": service._load,  # ruff:ignore[private-member-access]
+        "pagination_request": PaginationRequest(page=1, page_size=page_size),
+        "response_schema_class": ExperimentalNeuronDensityRead,
+        "name_to_facet_query_params": None,
+        "filter_model": ExperimentalNeuronDensityFilter(),
+    }
+
+
+async def run(
+    read_one_page: Callable[[], Awaitable[int]], requests: int, concurrency: int
+) -> tuple[list[float], float, int]:
+    """Execute the requests with the given concurrency.
+
+    Returns:
+        the latencies in ms, the total time in s, and the number of items of the last page.
+    """
+    latencies: list[float] = []
+    items = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request() -> None:
+        nonlocal items
+        async with semaphore:
+            start = time.perf_counter()
+            items = await read_one_page()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(requests):
+            tg.create_task(request())
+    return latencies, time.perf_counter() - start, items
+
+
+async def benchmark(
+    manager: DatabaseSessionManager,
+    *,
+    requests: int,
+    concurrency: int,
+    threads: int,
+    page_size: int,
+    project_id: uuid.UUID | None,
+) -> None:
+    """Print the throughput and the latencies of the sync and async modes."""
+    params = _params(page_size, project_id)
+    limiter = CapacityLimiter(threads)
+
+    def read_sync() -> int:
+        with manager.session() as db:
+            return len(router_read_many(db=db, **params).data)
+
+    async def read_in_thread() -> int:
+        return await anyio.to_thread.run_sync(read_sync, limiter=limiter)
+
+    async def read_async() -> int:
+        async with manager.async_session() as db:
+            return len((await async_router_read_many(db=db, **params)).data)
+
+    for mode, read_one_page in [("sync", read_in_thread), ("async", read_async)]:
+        # warm up the pool and the compiled cache
+        await run(read_one_page, requests=concurrency, concurrency=concurrency)
+        latencies, elapsed, items = await run(read_one_page, requests, concurrency)
+        quantiles = statistics.quantiles(latencies, n=20)
+        click.echo(
+            f"{mode:<6} items={items:<5} requests/s={requests / elapsed:.1f} "
+            f"p50={statistics.median(latencies):.2f} ms p95={quantiles[18]:.2f} ms"
+        )
+
+
+@click.command()
+@click.option("--requests", default=500, show_default=True, help="Number of requests per mode.")
+@click.option("--concurrency", default=100, show_default=True, help="In-flight requests.")
+@click.option(
+    "--threads", default=40, show_default=True, help="Worker threads used in the sync mode."
+)
+@click.option("--page-size", default=settings.PAGINATION_DEFAULT_PAGE_SIZE, show_default=True)
+@click.option("--project-id", type=click.UUID, default=None, help="Read also the project data.")
+def main(
+    requests: int, concurrency: int, threads: int, page_size: int, project_id: uuid.UUID | None
+) -> None:
+    """Print the throughput of the list of densities, using the sync or async engine."""
+    manager = configure_database_session_manager()
+
+    async def execute() -> None:
+        try:
+            await benchmark(
+                manager,
+                requests=requests,
+                concurrency=concurrency,
+                threads=threads,
+                page_size=page_size,
+                project_id=project_id,
+            )
+        finally:
+            await manager.close_async()
+
+    try:
+        asyncio.run(execute())
+    finally:
+        manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Compare the ILIKE filters on name and description with and without the trigram indexes.
+
+The rows are generated in a temporary table having the same indexes of the entity tables,
+so the script can be run against any database where the pg_trgm extension is installed.
+"""
+
+import statistics
+import time
+
+import click
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+
+from app.config import settings
+from app.db.model import trigram_indexes
+from app.utils.pattern import convert_to_ilike_pattern
+
+TABLE_NAME = "benchmark_ilike_search"
+
+
+def create_table(conn: Connection, rows: int) -> sa.Table:
+    """Create and populate the temporary table, returning it."""
+    table = sa.Table(
+        TABLE_NAME,
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("name", sa.String, nullable=False),
+        sa.Column("description", sa.String, nullable=False),
+        *trigram_indexes(TABLE_NAME, "name", "description"),
+        prefixes=["TEMPORARY"],
+    )
+    table.create(conn)
+    conn.execute(
+        sa.text(
+            f"INSERT INTO {TABLE_NAME} (id, name, description) "  # ruff:ignore[hardcoded-sql-expression]
+            "SELECT i, 'entity ' || md5(i::text), "
+            "'generated description ' || md5((i * 7)::text) || ' ' || md5((i * 11)::text) "
+            "FROM generate_series(1, :rows) AS i"
+        ),
+        {"rows": rows},
+    )
+    conn.execute(sa.text(f"ANALYZE {TABLE_NAME}"))
+    return table
+
+
+def run_query(conn: Connection, sql: str, repeat: int) -> tuple[str, int, float]:
+    """Return the scan node used by the plan, the number of rows, and the median time in ms."""
+    plan = conn.execute(sa.text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar_one()
+    node = plan[0]["Plan"]
+    while node.get("Plans") and node["Node Type"] not in {"Seq Scan", "Bitmap Heap Scan"}:
+        node = node["Plans"][0]
+    timings = []
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = len(conn.execute(sa.text(sql)).all())
+        timings.append((time.perf_counter() - start) * 1000)
+    return node["Node Type"], count, statistics.median(timings)
+
+
+@click.command()
+@click.option("--rows", default=200_000, show_default=True, help="Number of generated rows.")
+@click.option("--repeat", default=10, show_default=True, help="Executions of each query.")
+@click.option("--db-uri", default=settings.DB_URI, show_default=False, help="Database URI.")
+def main(rows: int, repeat: int, db_uri: str) -> None:
+    """Print the plan and the median time of the ILIKE filters, with and without indexes."""
+    engine = sa.create_engine(db_uri)
+    with engine.connect() as conn:
+        table = create_table(conn, rows)
+        # substring of the description of a single row, as searched by ilike_search
+        term = conn.execute(
+            sa.select(sa.func.substr(table.c.description, 30, 8)).where(table.c.id == rows // 2)
+        ).scalar_one()
+        # the names matching a short hexadecimal substring are about 1 every 4096 rows
+        queries = {
+            "name__ilike": sa.select(table.c.id).where(table.c.name.ilike("%ntity 1a2%")),
+            "ilike_search": sa.select(table.c.id).where(
+                sa.or_(
+                    *(
+                        column.ilike(convert_to_ilike_pattern(f"*{term}*"), escape="\\")
+                        for column in (table.c.name, table.c.description)
+                    )
+                )
+            ),
+        }
+        for scans_enabled in [False, True]:
+            conn.execute(sa.text(f"SET enable_bitmapscan = {scans_enabled}"))
+            conn.execute(sa.text(f"SET enable_indexscan = {scans_enabled}"))
+            for filter_name, query in queries.items():
+                sql = str(query.compile(engine, compile_kwargs={"literal_binds": True}))
+                node_type, count, elapsed = run_query(conn, sql, repeat)
+                click.echo(
+                    f"{filter_name:<14} {node_type:<18} rows={count:<6} median={elapsed:.2f} ms"
+                )
+        conn.rollback()
+
+
+if __name__ == "__main__":
+    main()
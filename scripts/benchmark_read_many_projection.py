@@ -0,0 +1,223 @@
+"""Compare the list of experimental neuron densities loading the models or the projected columns.
+
+The rows are created in a transaction that is rolled back at the end, so the script can be run
+against any database with the current schema, without leaving any data behind.
+"""
+
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+import click
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.db.model import (
+    Asset,
+    BrainRegion,
+    BrainRegionHierarchy,
+    Contribution,
+    EmbeddingMixin,
+    ETypeClass,
+    ETypeClassification,
+    ExperimentalNeuronDensity,
+    License,
+    Measurement,
+    MTypeClass,
+    MTypeClassification,
+    Organization,
+    Person,
+    PlatformUser,
+    Role,
+    Species,
+    Subject,
+)
+from app.db.types import AssetLabel, AssetStatus, ContentType, StorageType
+from app.filters.density import ExperimentalNeuronDensityFilter
+from app.queries.common import router_read_many
+from app.queries.projection import get_schema_columns
+from app.schemas.density import ExperimentalNeuronDensityRead
+from app.schemas.types import PaginationRequest
+from app.service import experimental_neuron_density as service
+
+PROJECT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+
+def create_rows(db: Session, rows: int) -> None:
+    """Create the densities with their measurements, contributions, annotations and assets."""
+    user = PlatformUser(id=uuid.uuid4(), pref_label="benchmark user")
+    db.add(user)
+    db.flush()
+    common = {"created_by_id": user.id, "updated_by_id": user.id}
+    embedding = EmbeddingMixin.SIZE * [0.1]
+    species = Species(
+        name="benchmark species", taxonomy_id="benchmark", embedding=embedding, **common
+    )
+    db.add(species)
+    db.flush()
+    hierarchy = BrainRegionHierarchy(name="benchmark", species_id=species.id, **common)
+    license_ = License(name="benchmark", description="benchmark", label="benchmark", **common)
+    role = Role(name="benchmark role", role_id="benchmark role", **common)
+    agents = [
+        Person(given_name="given", family_name="family", pref_label="benchmark person", **common),
+        Organization(pref_label="benchmark org", alternative_name="benchmark", **common),
+    ]
+    mtypes = [MTypeClass(pref_label=f"m{i}", definition="d", **common) for i in range(3)]
+    etypes = [ETypeClass(pref_label=f"e{i}", definition="d", **common) for i in range(3)]
+    db.add_all([hierarchy, license_, role, *agents, *mtypes, *etypes])
+    db.flush()
+    region = BrainRegion(
+        annotation_value=1,
+        acronym="benchmark",
+        name="benchmark region",
+        color_hex_triplet="FF0000",
+        hierarchy_id=hierarchy.id,
+        embedding=embedding,
+        **common,
+    )
+    subject = Subject(
+        name="benchmark subject",
+        description="benchmark",
+        species_id=species.id,
+        age_value=timedelta(days=14),
+        age_period="postnatal",
+        sex="female",
+        authorized_project_id=PROJECT_ID,
+        authorized_public=True,
+        **common,
+    )
+    db.add_all([region, subject])
+    db.flush()
+    authorized = {"authorized_project_id": PROJECT_ID, "authorized_public": True}
+    densities = [
+        ExperimentalNeuronDensity(
+            name=f"density {i}",
+            description="benchmark density",
+            brain_region_id=region.id,
+            subject_id=subject.id,
+            license_id=license_.id,
+            **authorized,
+            **common,
+        )
+        for i in range(rows)
+    ]
+    db.add_all(densities)
+    db.flush()
+    for i, density in enumerate(densities):
+        db.add_all(
+            [
+                *(
+                    Measurement(name=name, unit="linear__um", value=i, entity_id=density.id)
+                    for name in ["mean", "standard_deviation"]
+                ),
+                *(
+                    Contribution(entity_id=density.id, agent_id=agent.id, role_id=role.id, **common)
+                    for agent in agents
+                ),
+                *(
+                    MTypeClassification(
+                        entity_id=density.id, mtype_class_id=m.id, **authorized, **common
+                    )
+                    for m in mtypes[: i % 3 + 1]
+                ),
+                ETypeClassification(
+                    entity_id=density.id, etype_class_id=etypes[i % 3].id, **authorized, **common
+                ),
+                Asset(
+                    path="density.swc",
+                    full_path=f"benchmark/{density.id}/density.swc",
+                    status=AssetStatus.CREATED,
+                    is_directory=False,
+                    content_type=ContentType.swc,
+                    size=0,
+                    meta={},
+                    label=AssetLabel.morphology,
+                    storage_type=StorageType.aws_s3_internal,
+                    entity_id=density.id,
+                    **common,
+                ),
+            ]
+        )
+    db.flush()
+
+
+def normalize(value: object) -> object:
+    """Return the value with the lists of objects sorted by id, since their order is undefined."""
+    if isinstance(value, dict):
+        return {k: normalize(v) for k, v in value.items()}
+    if isinstance(value, list):
+        items = [normalize(v) for v in value]
+        if all(isinstance(v, dict) and "id" in v for v in items):
+            items.sort(key=lambda v: str(v["id"]))  # pyright: ignore[reportIndexIssue]
+        return items
+    return value
+
+
+def read_many(db: Session, page_size: int, *, projection: bool) -> list[dict]:
+    """Return the densities as dicts, loading the models or the projected columns."""
+    result = router_read_many(
+        db=db,
+        db_model_class=ExperimentalNeuronDensity,
+        authorized_project_id=PROJECT_ID,
+        with_search=None,
+        with_in_brain_region=None,
+        facets=None,
+        aliases=None,
+        apply_filter_query_operations=None,
+        apply_data_query_operations=service._load,  # ruff:ignore[private-member-access]
+        pagination_request=PaginationRequest(page=1, page_size=page_size),
+        response_schema_class=ExperimentalNeuronDensityRead,
+        name_to_facet_query_params=None,
+        filter_model=ExperimentalNeuronDensityFilter(),
+        projection=get_schema_columns(ExperimentalNeuronDensity, ExperimentalNeuronDensityRead)
+        if projection
+        else None,
+    )
+    return [item.model_dump() for item in result.data]
+
+
+def run(db: Session, page_size: int, repeat: int, *, projection: bool) -> list[float]:
+    """Return the times in ms of the requests, starting every request with an empty session."""
+    timings = []
+    for _ in range(repeat):
+        db.expunge_all()
+        start = time.perf_counter()
+        read_many(db, page_size, projection=projection)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+@click.command()
+@click.option("--rows", default=1000, show_default=True, help="Number of generated densities.")
+@click.option(
+    "--page-size",
+    default=settings.PAGINATION_MAX_PAGE_SIZE,
+    show_default=True,
+    help="Number of densities per page.",
+)
+@click.option("--repeat", default=10, show_default=True, help="Executions of each mode.")
+@click.option("--db-uri", default=settings.DB_URI, show_default=False, help="Database URI.")
+def main(rows: int, page_size: int, repeat: int, db_uri: str) -> None:
+    """Print the median time of the list of densities, loading the models or the columns."""
+    engine = sa.create_engine(db_uri)
+    with engine.connect() as conn, Session(conn, expire_on_commit=False) as db:
+        create_rows(db, rows)
+        if normalize(read_many(db, page_size, projection=False)) != normalize(
+            read_many(db, page_size, projection=True)
+        ):
+            msg = "The results of the two modes are different"
+            raise click.ClickException(msg)
+        for projection in [False, True]:
+            timings = run(db, page_size, repeat, projection=projection)
+            mode = "projection" if projection else "models"
+            click.echo(
+                f"{mode:<10} items={min(rows, page_size):<6} "
+                f"median={statistics.median(timings):.2f} ms min={min(timings):.2f} ms"
+            )
+        db.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Load-testing benchmarks of the hot endpoints, executed against a synthetic dataset."""
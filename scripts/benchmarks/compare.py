@@ -0,0 +1,88 @@
+"""Compare the results of the benchmark scenarios saved by two executions, e.g. on two commits.
+
+The latencies are considered regressed when they increase more than the given threshold, since
+they vary between executions, while any additional statement executed by a request is reported.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import click
+
+from scripts.benchmarks.scenarios import RESULTS_VERSION
+
+METRICS = ["p50_ms", "p95_ms", "queries"]
+
+
+class Comparison(NamedTuple):
+    scenario: str
+    metric: str
+    base: float
+    new: float
+
+    @property
+    def change(self) -> float | None:
+        """Relative change of the new value, or None if the base value is 0."""
+        return (self.new - self.base) / self.base if self.base else None
+
+    def is_regression(self, threshold: float) -> bool:
+        """Return True if the new value is worse than the base value, considering the threshold."""
+        if self.metric == "queries":
+            return self.new > self.base
+        return self.change is not None and self.change > threshold
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    """Load the results saved by scripts.benchmarks.scenarios.
+
+    Raises:
+        click.ClickException: if the results have been saved in a different format.
+    """
+    results = json.loads(path.read_text(encoding="utf-8"))
+    if results.get("version") != RESULTS_VERSION:
+        msg = f"Unsupported version of the results in {path}"
+        raise click.ClickException(msg)
+    return results
+
+
+def compare(base: dict[str, Any], new: dict[str, Any]) -> list[Comparison]:
+    """Return the comparisons of the metrics of the scenarios present in both the results."""
+    return [
+        Comparison(scenario=name, metric=metric, base=base_result[metric], new=new_result[metric])
+        for name, base_result in base["scenarios"].items()
+        if (new_result := new["scenarios"].get(name))
+        for metric in METRICS
+    ]
+
+
+@click.command()
+@click.argument("base", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument("new", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--threshold",
+    default=0.2,
+    show_default=True,
+    help="Relative increase of the latencies considered a regression.",
+)
+def main(base: Path, new: Path, threshold: float) -> None:
+    """Print the changes of the metrics from BASE to NEW, and fail if any regressed."""
+    base_results = load_results(base)
+    new_results = load_results(new)
+    click.echo(f"base: {base_results['app_version']}, new: {new_results['app_version']}")
+    regressions = 0
+    for c in compare(base_results, new_results):
+        change = f"{c.change:+.1%}" if c.change is not None else "n/a"
+        is_regression = c.is_regression(threshold)
+        regressions += is_regression
+        click.echo(
+            f"{c.scenario:<32} {c.metric:<8} {c.base:10.2f} {c.new:10.2f} {change:>8}"
+            f"{'  REGRESSION' if is_regression else ''}"
+        )
+    if regressions:
+        msg = f"{regressions} metrics regressed"
+        raise click.ClickException(msg)
+
+
+if __name__ == "__main__":
+    main()
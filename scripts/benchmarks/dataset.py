@@ -0,0 +1,514 @@
+"""Deterministic generator of the synthetic dataset used by the benchmark scenarios.
+
+The same seed and sizes produce the same ids, names and dates, so that the results of the scenarios
+can be compared across commits. The rows are inserted in batches with the ORM bulk inserts, and
+the dataset is meant to be loaded in an empty database, migrated with ``alembic upgrade head``.
+
+The assets are only inserted in the database, since the scenarios don't read their content.
+"""
+
+import random
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import click
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.db.model import (
+    Asset,
+    Base,
+    BrainRegion,
+    BrainRegionHierarchy,
+    CellMorphology,
+    Contribution,
+    Derivation,
+    EmbeddingMixin,
+    EModel,
+    Entity,
+    ETypeClass,
+    ETypeClassification,
+    ExperimentalBoutonDensity,
+    ExperimentalNeuronDensity,
+    License,
+    Measurement,
+    MTypeClass,
+    MTypeClassification,
+    Organization,
+    Person,
+    PlaceholderCellMorphologyProtocol,
+    PlatformUser,
+    Role,
+    Species,
+    Strain,
+    Subject,
+)
+from app.db.types import (
+    AgePeriod,
+    AssetLabel,
+    AssetStatus,
+    CellMorphologyGenerationType,
+    ContentType,
+    DerivationType,
+    EntityType,
+    MeasurementStatistic,
+    MeasurementUnit,
+    Sex,
+    StorageType,
+)
+
+PROJECT_ID = uuid.UUID("00000000-0000-4000-8000-000000000001")
+VIRTUAL_LAB_ID = uuid.UUID("00000000-0000-4000-8000-000000000002")
+USER_ID = uuid.UUID("00000000-0000-4000-8000-000000000003")
+HIERARCHY_NAME = "benchmark"
+BASE_DATE = datetime(2025, 1, 1, tzinfo=UTC)
+BATCH_SIZE = 10_000
+# the remaining entities are private to one of the projects
+PUBLIC_RATIO = 0.8
+OTHER_PROJECTS = 4
+# fraction of the entities generated for each type, in order of creation
+ENTITY_SHARES = {
+    EntityType.subject: 0.01,
+    EntityType.cell_morphology: 0.4,
+    EntityType.experimental_neuron_density: 0.15,
+    EntityType.experimental_bouton_density: 0.14,
+    EntityType.emodel: 0.3,
+}
+# words used in the names and descriptions, to be matched by the search scenarios
+WORDS = [
+    "pyramidal",
+    "basket",
+    "martinotti",
+    "chandelier",
+    "stellate",
+    "granule",
+    "purkinje",
+    "bitufted",
+    "cortical",
+    "hippocampal",
+    "thalamic",
+    "cerebellar",
+]
+
+Row = dict[str, Any]
+
+
+class DatasetGenerator:
+    """Insert the rows of the synthetic dataset, using a random generator with a fixed seed."""
+
+    def __init__(self, db: Session, *, seed: int, project_id: uuid.UUID) -> None:
+        """Init the generator.
+
+        Args:
+            db: session used to insert the rows, not committed.
+            seed: seed of the random generator.
+            project_id: project of the private entities readable by the scenarios.
+        """
+        self.db = db
+        self.rng = random.Random(seed)  # ruff:ignore[suspicious-non-cryptographic-random-usage]
+        self.project_ids = [project_id, *(self.uuid() for _ in range(OTHER_PROJECTS))]
+        self.common = {"created_by_id": USER_ID, "updated_by_id": USER_ID}
+        self.created = 0
+        self.counts: dict[str, int] = {}
+
+    def uuid(self) -> uuid.UUID:
+        """Return a random UUID, determined by the seed."""
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def date(self) -> datetime:
+        """Return the creation date of the next row, one second after the previous one."""
+        self.created += 1
+        return BASE_DATE + timedelta(seconds=self.created)
+
+    def words(self, count: int) -> str:
+        return " ".join(self.rng.choices(WORDS, k=count))
+
+    def insert(self, model: type[Base], rows: list[Row]) -> None:
+        """Insert the rows with a single bulk insert, and count them by table."""
+        if rows:
+            self.db.execute(sa.insert(model), rows)
+            name = model.__tablename__
+            self.counts[name] = self.counts.get(name, 0) + len(rows)
+
+    def identifiable(self) -> Row:
+        date = self.date()
+        return {"id": self.uuid(), "creation_date": date, "update_date": date, **self.common}
+
+    def entity(self, name: str, *, is_public: bool | None = None) -> Row:
+        if is_public is None:
+            is_public = self.rng.random() < PUBLIC_RATIO
+        return {
+            **self.identifiable(),
+            "name": f"{self.words(1)} {name}",
+            "description": f"synthetic {name}, {self.words(8)}",
+            "authorized_public": is_public,
+            "authorized_project_id": self.project_ids[0]
+            if is_public
+            else self.rng.choice(self.project_ids),
+        }
+
+    def create_globals(self, regions: int) -> None:
+        """Create the rows shared by the entities, and keep their ids."""
+        self.db.add(PlatformUser(id=USER_ID, pref_label="benchmark user"))
+        self.db.flush()
+        embedding = EmbeddingMixin.SIZE * [0.1]
+        self.species_ids = [self.uuid() for _ in range(3)]
+        self.insert(
+            Species,
+            [
+                {
+                    "id": species_id,
+                    "name": f"benchmark species {i}",
+                    "taxonomy_id": f"benchmark:{i}",
+                    "embedding": embedding,
+                    **self.common,
+                }
+                for i, species_id in enumerate(self.species_ids)
+            ],
+        )
+        self.insert(
+            Strain,
+            [
+                {
+                    "id": self.uuid(),
+                    "name": f"benchmark strain {i}",
+                    "taxonomy_id": f"benchmark:strain:{i}",
+                    "species_id": species_id,
+                    "embedding": embedding,
+                    **self.common,
+                }
+                for i, species_id in enumerate(self.species_ids)
+            ],
+        )
+        hierarchy_id = self.uuid()
+        self.insert(
+            BrainRegionHierarchy,
+            [
+                {
+                    "id": hierarchy_id,
+                    "name": HIERARCHY_NAME,
+                    "species_id": self.species_ids[0],
+                    **self.common,
+                }
+            ],
+        )
+        # random recursive tree, where the parent of each region is one of the previous regions
+        self.region_ids = [self.uuid() for _ in range(regions)]
+        self.insert(
+            BrainRegion,
+            [
+                {
+                    "id": region_id,
+                    "annotation_value": i + 1,
+                    "name": f"{self.words(1)} region {i}",
+                    "acronym": f"BR{i}",
+                    "color_hex_triplet": "FF0000",
+                    "parent_structure_id": self.region_ids[self.rng.randrange(i)] if i else None,
+                    "hierarchy_id": hierarchy_id,
+                    "embedding": embedding,
+                    **self.common,
+                }
+                for i, region_id in enumerate(self.region_ids)
+            ],
+        )
+        self.license_ids = [self.uuid() for _ in range(3)]
+        self.insert(
+            License,
+            [
+                {
+                    "id": license_id,
+                    "name": f"benchmark license {i}",
+                    "description": "benchmark",
+                    "label": f"BENCH-{i}",
+                    **self.common,
+                }
+                for i, license_id in enumerate(self.license_ids)
+            ],
+        )
+        self.role_ids = [self.uuid() for _ in range(3)]
+        self.insert(
+            Role,
+            [
+                {
+                    "id": role_id,
+                    "name": f"benchmark role {i}",
+                    "role_id": f"role:{i}",
+                    **self.common,
+                }
+                for i, role_id in enumerate(self.role_ids)
+            ],
+        )
+        persons = [
+            {
+                "id": self.uuid(),
+                "pref_label": f"{self.words(1)} person {i}",
+                "given_name": "given",
+                "family_name": f"family {i}",
+                **self.common,
+            }
+            for i in range(40)
+        ]
+        organizations = [
+            {
+                "id": self.uuid(),
+                "pref_label": f"{self.words(1)} organization {i}",
+                "alternative_name": f"org {i}",
+                **self.common,
+            }
+            for i in range(10)
+        ]
+        self.insert(Person, persons)
+        self.insert(Organization, organizations)
+        self.agent_ids = [row["id"] for row in persons + organizations]
+        self.mtype_ids = [self.uuid() for _ in range(30)]
+        self.etype_ids = [self.uuid() for _ in range(15)]
+        for model, ids, prefix in [
+            (MTypeClass, self.mtype_ids, "L"),
+            (ETypeClass, self.etype_ids, "e"),
+        ]:
+            self.insert(
+                model,
+                [
+                    {
+                        "id": id_,
+                        "pref_label": f"{prefix}{i}_{self.words(1)}",
+                        "definition": "benchmark",
+                        **self.common,
+                    }
+                    for i, id_ in enumerate(ids)
+                ],
+            )
+        protocol = {
+            **self.entity("protocol", is_public=True),
+            "type": EntityType.cell_morphology_protocol,
+            "generation_type": CellMorphologyGenerationType.placeholder,
+        }
+        self.protocol_id = protocol["id"]
+        self.insert(PlaceholderCellMorphologyProtocol, [protocol])
+
+    def create_entities(
+        self, model: type[Entity], count: int, create_row: Callable[[int], Row]
+    ) -> Iterator[list[Row]]:
+        """Insert the entities in batches, yielding each batch to insert the related rows."""
+        # the discriminator isn't set by the bulk inserts
+        entity_type = EntityType(model.__tablename__)
+        for start in range(0, count, BATCH_SIZE):
+            rows = [
+                {**create_row(i), "type": entity_type}
+                for i in range(start, min(start + BATCH_SIZE, count))
+            ]
+            self.insert(model, rows)
+            yield rows
+
+    def create_related(self, rows: list[Row], *, mtypes: bool, etypes: bool) -> None:
+        """Create the contributions and the classifications of the entities."""
+        contributions = []
+        mtype_classifications = []
+        etype_classifications = []
+        for row in rows:
+            authorized = {
+                "authorized_public": row["authorized_public"],
+                "authorized_project_id": row["authorized_project_id"],
+            }
+            contributions += [
+                {
+                    **self.identifiable(),
+                    "entity_id": row["id"],
+                    "agent_id": agent_id,
+                    "role_id": self.rng.choice(self.role_ids),
+                }
+                for agent_id in self.rng.sample(self.agent_ids, k=self.rng.randint(1, 2))
+            ]
+            if mtypes:
+                mtype_classifications.append(
+                    {
+                        **self.identifiable(),
+                        **authorized,
+                        "entity_id": row["id"],
+                        "mtype_class_id": self.rng.choice(self.mtype_ids),
+                    }
+                )
+            if etypes:
+                etype_classifications.append(
+                    {
+                        **self.identifiable(),
+                        **authorized,
+                        "entity_id": row["id"],
+                        "etype_class_id": self.rng.choice(self.etype_ids),
+                    }
+                )
+        self.insert(Contribution, contributions)
+        self.insert(MTypeClassification, mtype_classifications)
+        self.insert(ETypeClassification, etype_classifications)
+
+    def create_measurements(self, rows: list[Row], unit: MeasurementUnit) -> None:
+        self.insert(
+            Measurement,
+            [
+                {
+                    "entity_id": row["id"],
+                    "name": name,
+                    "unit": unit,
+                    "value": self.rng.uniform(0.1, 10),
+                }
+                for row in rows
+                for name in [MeasurementStatistic.mean, MeasurementStatistic.standard_deviation]
+            ],
+        )
+
+    def create_assets(
+        self, rows: list[Row], entity_type: EntityType, label: AssetLabel, content_type: ContentType
+    ) -> None:
+        extension = content_type.split("/")[-1]
+        self.insert(
+            Asset,
+            [
+                {
+                    **self.identifiable(),
+                    "entity_id": row["id"],
+                    "path": f"{label}.{extension}",
+                    "full_path": f"private/{row['authorized_project_id']}/{entity_type}/"
+                    f"{row['id']}/{label}.{extension}",
+                    "status": AssetStatus.CREATED,
+                    "is_directory": False,
+                    "content_type": content_type,
+                    "size": self.rng.randint(1_000, 10_000_000),
+                    "meta": {},
+                    "label": label,
+                    "storage_type": StorageType.aws_s3_internal,
+                }
+                for row in rows
+            ],
+        )
+
+    def scientific_artifact(self, name: str) -> Row:
+        return {
+            **self.entity(name),
+            "subject_id": self.rng.choice(self.subject_ids),
+            "brain_region_id": self.rng.choice(self.region_ids),
+            "license_id": self.rng.choice(self.license_ids),
+        }
+
+    def generate(self, entities: int, regions: int) -> dict[str, int]:
+        """Create the dataset, returning the number of rows by table."""
+        sizes = {
+            entity_type: max(1, int(entities * share))
+            for entity_type, share in ENTITY_SHARES.items()
+        }
+        self.create_globals(regions)
+
+        self.subject_ids = []
+        for rows in self.create_entities(
+            Subject,
+            sizes[EntityType.subject],
+            lambda i: {
+                **self.entity(f"subject {i}", is_public=True),
+                "species_id": self.rng.choice(self.species_ids),
+                "sex": self.rng.choice(list(Sex)),
+                "age_value": timedelta(days=self.rng.randint(1, 100)),
+                "age_period": AgePeriod.postnatal,
+            },
+        ):
+            self.subject_ids += [row["id"] for row in rows]
+
+        # the private entities can reference only the public entities or those in the same project,
+        # so the subjects are public, and the emodels use only the public morphologies
+        public_morphology_ids = []
+        for rows in self.create_entities(
+            CellMorphology,
+            sizes[EntityType.cell_morphology],
+            lambda i: {
+                **self.scientific_artifact(f"cell morphology {i}"),
+                "cell_morphology_protocol_id": self.protocol_id,
+            },
+        ):
+            public_morphology_ids += [row["id"] for row in rows if row["authorized_public"]]
+            self.create_related(rows, mtypes=True, etypes=False)
+            self.create_assets(
+                rows, EntityType.cell_morphology, AssetLabel.morphology, ContentType.swc
+            )
+
+        for model, entity_type, unit, etypes in [
+            (
+                ExperimentalNeuronDensity,
+                EntityType.experimental_neuron_density,
+                MeasurementUnit.volume_density__1_mm3,
+                True,
+            ),
+            (
+                ExperimentalBoutonDensity,
+                EntityType.experimental_bouton_density,
+                MeasurementUnit.linear_density__1_um,
+                False,
+            ),
+        ]:
+            for rows in self.create_entities(
+                model,
+                sizes[entity_type],
+                lambda i, entity_type=entity_type: self.scientific_artifact(
+                    f"{entity_type.replace('_', ' ')} {i}"
+                ),
+            ):
+                self.create_related(rows, mtypes=True, etypes=etypes)
+                self.create_measurements(rows, unit)
+
+        for rows in self.create_entities(
+            EModel,
+            sizes[EntityType.emodel],
+            lambda i: {
+                **self.entity(f"emodel {i}"),
+                "species_id": self.rng.choice(self.species_ids),
+                "brain_region_id": self.rng.choice(self.region_ids),
+                "exemplar_morphology_id": self.rng.choice(public_morphology_ids),
+                "score": self.rng.random(),
+                "seed": i,
+            },
+        ):
+            self.create_related(rows, mtypes=True, etypes=True)
+            self.create_assets(rows, EntityType.emodel, AssetLabel.neuron_hoc, ContentType.hoc)
+            self.insert(
+                Derivation,
+                [
+                    {
+                        **self.identifiable(),
+                        "used_id": row["exemplar_morphology_id"],
+                        "generated_id": row["id"],
+                        "derivation_type": DerivationType.unspecified,
+                    }
+                    for row in rows
+                ],
+            )
+        return self.counts
+
+
+@click.command()
+@click.option(
+    "--entities", default=1_000_000, show_default=True, help="Number of generated entities."
+)
+@click.option("--regions", default=1000, show_default=True, help="Number of brain regions.")
+@click.option("--seed", default=0, show_default=True, help="Seed of the random generator.")
+@click.option("--project-id", type=click.UUID, default=PROJECT_ID, show_default=True)
+@click.option("--db-uri", default=settings.DB_URI, show_default=False, help="Database URI.")
+def main(entities: int, regions: int, seed: int, project_id: uuid.UUID, db_uri: str) -> None:
+    """Fill an empty database with the synthetic dataset, and print the number of rows."""
+    engine = sa.create_engine(db_uri)
+    start = time.perf_counter()
+    with Session(engine) as db:
+        if db.scalar(sa.select(sa.func.count()).select_from(Entity)):
+            msg = "The database already contains some entities"
+            raise click.ClickException(msg)
+        counts = DatasetGenerator(db, seed=seed, project_id=project_id).generate(entities, regions)
+        db.commit()
+    with engine.connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT").execute(sa.text("ANALYZE"))
+    for table, count in counts.items():
+        click.echo(f"{table:<32} {count:>10}")
+    click.echo(f"Generated in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""Execute the benchmark scenarios against the synthetic dataset, and save the results as JSON.
+
+The application is executed in the current process with TestClient, so that the latencies include
+the lifespan state, the middlewares, the authentication and the serialization, but not the network.
+The requests of each scenario are executed sequentially after a few warm-up requests, and the SQL
+statements executed by each request are counted with an engine event.
+
+KeyCloak is replaced by a mock transport returning a member of the project of the dataset, and S3
+is mocked with moto, since the scenarios only generate the presigned urls.
+"""
+
+import json
+import statistics
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import click
+import httpx2
+import sqlalchemy as sa
+from fastapi.testclient import TestClient
+from moto import mock_aws
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import Session
+
+from app.application import app
+from app.config import settings
+from app.db.model import (
+    Asset,
+    BrainRegion,
+    BrainRegionHierarchy,
+    CellMorphology,
+    EModel,
+    MTypeClass,
+)
+from scripts.benchmarks.dataset import HIERARCHY_NAME, PROJECT_ID, USER_ID, VIRTUAL_LAB_ID, WORDS
+
+RESULTS_VERSION = 1
+
+
+class Scenario(NamedTuple):
+    name: str
+    path: str  # formatted with the ids returned by get_path_params
+    status_code: int = 200
+    new_token: bool = False  # use a new token in each request, to miss the auth cache
+
+
+class ScenarioResult(NamedTuple):
+    status_code: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    queries: float  # median number of statements per request
+
+
+SCENARIOS = [
+    Scenario("cell_morphology_list", "/cell-morphology"),
+    Scenario("cell_morphology_list_facets", "/cell-morphology?with_facets=true"),
+    Scenario(
+        "cell_morphology_filter",
+        "/cell-morphology?mtype__pref_label={mtype}&order_by=-creation_date&page_size=100",
+    ),
+    Scenario("cell_morphology_search", "/cell-morphology?search={word}"),
+    Scenario("cell_morphology_ilike_search", "/cell-morphology?ilike_search={word}"),
+    Scenario(
+        "cell_morphology_within_region",
+        "/cell-morphology?within_brain_region_brain_region_id={brain_region_id}"
+        "&within_brain_region_direction=descendants",
+    ),
+    Scenario("cell_morphology_read", "/cell-morphology/{cell_morphology_id}"),
+    Scenario("cell_morphology_assets", "/cell-morphology/{cell_morphology_id}/assets"),
+    Scenario(
+        "cell_morphology_asset_download",
+        "/cell-morphology/{cell_morphology_id}/assets/{asset_id}/download",
+        status_code=307,
+    ),
+    Scenario("neuron_density_list_facets", "/experimental-neuron-density?with_facets=true"),
+    Scenario("bouton_density_list", "/experimental-bouton-density"),
+    Scenario("emodel_list", "/emodel"),
+    Scenario("emodel_read", "/emodel/{emodel_id}"),
+    Scenario("emodel_derived_from", "/emodel/{emodel_id}/derived-from?derivation_type=unspecified"),
+    Scenario("contribution_list", "/contribution?entity__id={cell_morphology_id}"),
+    Scenario("brain_region_list", "/brain-region?hierarchy_id={hierarchy_id}&page_size=100"),
+    Scenario("auth_cache_miss", "/mtype?page_size=1", new_token=True),
+]
+
+
+def get_path_params(db: Session) -> dict[str, Any]:
+    """Return the ids of the dataset used in the paths of the scenarios."""
+    morphology = db.execute(
+        sa.select(CellMorphology.id, Asset.id)
+        .join(Asset, Asset.entity_id == CellMorphology.id)
+        .where(CellMorphology.authorized_public)
+        .order_by(CellMorphology.creation_date)
+        .limit(1)
+    ).first()
+    hierarchy_id = db.scalar(
+        sa.select(BrainRegionHierarchy.id).where(BrainRegionHierarchy.name == HIERARCHY_NAME)
+    )
+    brain_region_id = db.scalar(
+        sa.select(BrainRegion.id).where(
+            BrainRegion.hierarchy_id == hierarchy_id, BrainRegion.parent_structure_id.is_(None)
+        )
+    )
+    emodel_id = db.scalar(
+        sa.select(EModel.id).where(EModel.authorized_public).order_by(EModel.creation_date).limit(1)
+    )
+    mtype = db.scalar(sa.select(MTypeClass.pref_label).order_by(MTypeClass.pref_label).limit(1))
+    if not morphology or not brain_region_id or not emodel_id or not mtype:
+        msg = "The synthetic dataset is missing, generate it with scripts.benchmarks.dataset"
+        raise click.ClickException(msg)
+    return {
+        "cell_morphology_id": morphology[0],
+        "asset_id": morphology[1],
+        "hierarchy_id": hierarchy_id,
+        "brain_region_id": brain_region_id,
+        "emodel_id": emodel_id,
+        "mtype": mtype,
+        "word": WORDS[0],
+    }
+
+
+def _keycloak_userinfo(_request: httpx2.Request) -> httpx2.Response:
+    """Return the userinfo of a member of the project of the dataset."""
+    return httpx2.Response(
+        200,
+        json={
+            "sub": str(USER_ID),
+            "preferred_username": "benchmark",
+            "name": "Benchmark User",
+            "groups": [
+                f"/vlab/{VIRTUAL_LAB_ID}/member",
+                f"/proj/{VIRTUAL_LAB_ID}/{PROJECT_ID}/member",
+            ],
+        },
+    )
+
+
+def get_headers(token: str) -> dict[str, str]:
+    """Return the headers of the requests of the member of the project of the dataset."""
+    return {
+        "Authorization": f"Bearer {token}",
+        "virtual-lab-id": str(VIRTUAL_LAB_ID),
+        "project-id": str(PROJECT_ID),
+    }
+
+
+@contextmanager
+def count_queries() -> Iterator[list[int]]:
+    """Count the statements executed by all the engines, in the first item of the yielded list."""
+    counter = [0]
+
+    def before_cursor_execute(*_) -> None:
+        counter[0] += 1
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+def summarize(status_code: int, latencies: list[float], queries: list[int]) -> ScenarioResult:
+    """Return the statistics of the latencies in ms, and of the statements of the requests."""
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return ScenarioResult(
+        status_code=status_code,
+        mean_ms=statistics.fmean(latencies),
+        p50_ms=statistics.median(latencies),
+        p95_ms=percentiles[94],
+        p99_ms=percentiles[98],
+        queries=statistics.median(queries),
+    )
+
+
+def run_scenario(
+    client: TestClient,
+    scenario: Scenario,
+    path_params: dict[str, Any],
+    *,
+    requests: int,
+    warmup: int,
+) -> ScenarioResult:
+    """Execute the requests of the scenario, and return the statistics.
+
+    Raises:
+        click.ClickException: if any response has an unexpected status code.
+    """
+    path = scenario.path.format(**path_params)
+    latencies: list[float] = []
+    queries: list[int] = []
+    with count_queries() as counter:
+        for i in range(warmup + requests):
+            token = f"benchmark-{scenario.name}-{i}" if scenario.new_token else "benchmark"
+            counter[0] = 0
+            start = time.perf_counter()
+            response = client.get(path, headers=get_headers(token), follow_redirects=False)
+            elapsed = (time.perf_counter() - start) * 1000
+            if response.status_code != scenario.status_code:
+                msg = f"{scenario.name}: unexpected response {response.status_code} {response.text}"
+                raise click.ClickException(msg)
+            if i >= warmup:
+                latencies.append(elapsed)
+                queries.append(counter[0])
+    return summarize(scenario.status_code, latencies, queries)
+
+
+@click.command()
+@click.option("--requests", default=100, show_default=True, help="Requests per scenario.")
+@click.option("--warmup", default=5, show_default=True, help="Warm-up requests per scenario.")
+@click.option(
+    "--scenario",
+    "names",
+    multiple=True,
+    type=click.Choice([s.name for s in SCENARIOS]),
+    help="Scenarios to execute, all if not specified.",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    required=True,
+    help="JSON file where the results are saved.",
+)
+def main(requests: int, warmup: int, names: tuple[str, ...], output: Path) -> None:
+    """Execute the scenarios against the synthetic dataset, and print the results."""
+    scenarios = [s for s in SCENARIOS if not names or s.name in names]
+    results: dict[str, ScenarioResult] = {}
+    with (
+        mock_aws(),
+        TestClient(app) as client,
+        httpx2.Client(transport=httpx2.MockTransport(_keycloak_userinfo)) as http_client,
+    ):
+        client.app_state["http_client"] = http_client
+        with app.state.database_session_manager.session() as db:
+            path_params = get_path_params(db)
+        for scenario in scenarios:
+            result = run_scenario(client, scenario, path_params, requests=requests, warmup=warmup)
+            results[scenario.name] = result
+            click.echo(
+                f"{scenario.name:<32} p50={result.p50_ms:8.2f} ms p95={result.p95_ms:8.2f} ms "
+                f"p99={result.p99_ms:8.2f} ms queries={result.queries:g}"
+            )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            {
+                "version": RESULTS_VERSION,
+                "app_version": settings.APP_VERSION,
+                "commit_sha": settings.COMMIT_SHA,
+                "created_at": datetime.now(UTC).isoformat(),
+                "requests": requests,
+                "scenarios": {name: result._asdict() for name, result in results.items()},
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    click.echo(f"Results saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 # Automatically generated, do not edit!
 set -euo pipefail
 SCRIPT_VERSION="1"
-SCRIPT_DB_VERSION="8953d8ad7437"
+SCRIPT_DB_VERSION="1d62cc747fdf"
 echo "DB dump (version $SCRIPT_VERSION for db version $SCRIPT_DB_VERSION)"
 
 
@@ -95,6 +95,8 @@ SET TRANSACTION READ ONLY;
 \copy (SELECT t0.* FROM annotation_body AS t0  WHERE TRUE) TO '$DATA_DIR/annotation_body.csv' WITH CSV HEADER;
 \echo Dumping table asset
 \copy (SELECT t0.* FROM asset AS t0 JOIN entity AS t1 ON t1.id=t0.entity_id WHERE t1.authorized_public IS NOT false) TO '$DATA_DIR/asset.csv' WITH CSV HEADER;
+\echo Dumping table asset_blob
+\copy (SELECT t0.* FROM asset_blob AS t0 WHERE t0.is_public IS true) TO '$DATA_DIR/asset_blob.csv' WITH CSV HEADER;
 \echo Dumping table brain_atlas
 \copy (SELECT t0.* FROM brain_atlas AS t0 JOIN entity AS t1 ON t1.id=t0.id WHERE t1.authorized_public IS NOT false) TO '$DATA_DIR/brain_atlas.csv' WITH CSV HEADER;
 \echo Dumping table brain_atlas_region
@@ -133,6 +135,8 @@ SET TRANSACTION READ ONLY;
 \copy (SELECT t0.* FROM em_cell_mesh__skeletonization_campaign AS t0 JOIN entity AS t1 ON t1.id=t0.em_cell_mesh_id JOIN entity AS t2 ON t2.id=t0.skeletonization_campaign_id WHERE t1.authorized_public IS NOT false AND t2.authorized_public IS NOT false) TO '$DATA_DIR/em_cell_mesh__skeletonization_campaign.csv' WITH CSV HEADER;
 \echo Dumping table em_dense_reconstruction_dataset
 \copy (SELECT t0.* FROM em_dense_reconstruction_dataset AS t0 JOIN entity AS t1 ON t1.id=t0.id WHERE t1.authorized_public IS NOT false) TO '$DATA_DIR/em_dense_reconstruction_dataset.csv' WITH CSV HEADER;
+\echo Dumping table embedding_cache
+\copy (SELECT t0.* FROM embedding_cache AS t0 WHERE false) TO '$DATA_DIR/embedding_cache.csv' WITH CSV HEADER;
 \echo Dumping table emodel
 \copy (SELECT t0.* FROM emodel AS t0 JOIN entity AS t1 ON t1.id=t0.id JOIN entity AS t2 ON t2.id=t0.exemplar_morphology_id WHERE t1.authorized_public IS NOT false AND t2.authorized_public IS NOT false) TO '$DATA_DIR/emodel.csv' WITH CSV HEADER;
 \echo Dumping table entity
@@ -269,7 +273,7 @@ install -m 755 /dev/stdin "$WORK_DIR/load.sh" <<'EOF_LOAD_SCRIPT'
 # Automatically generated, do not edit!
 set -euo pipefail
 SCRIPT_VERSION="1"
-SCRIPT_DB_VERSION="8953d8ad7437"
+SCRIPT_DB_VERSION="1d62cc747fdf"
 echo "DB load (version $SCRIPT_VERSION for db version $SCRIPT_DB_VERSION)"
 
 
@@ -162,6 +162,9 @@ def get_manual_queries() -> dict[str, str]:
     """Return the mapping used to generate the manual queries for each table."""
     return {
         "alembic_version": """SELECT * FROM alembic_version""",
+        "asset_blob": """SELECT t0.* FROM asset_blob AS t0 WHERE t0.is_public IS true""",
+        # the cache may reveal the searched texts, and it can be rebuilt if needed
+        "embedding_cache": """SELECT t0.* FROM embedding_cache AS t0 WHERE false""",
         "measurement_item": """
             SELECT t0.* FROM measurement_item AS t0
             JOIN measurement_kind AS mk ON mk.id=t0.measurement_kind_id
@@ -13,6 +13,7 @@ from fastapi.testclient import TestClient
 from moto import mock_aws
 from pydantic import BaseModel
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from starlette.requests import Request
 from types_boto3_s3 import S3Client
@@ -20,6 +21,7 @@ from types_boto3_s3 import S3Client
 import app.dependencies.db as db_module
 from app.application import app
 from app.config import storages
+from app.db.hierarchy_cache import public_hierarchy_cache
 from app.db.model import (
     Agent,
     AnalysisNotebookEnvironment,
@@ -360,7 +362,11 @@ def _override_check_user_info(
 def _override_embedding_generation(monkeypatch):
     """Mock the embedding generation to avoid making actual OpenAI API calls during tests."""
 
-    def mock_generate_embedding(text: str, model: str = "text-embedding-3-small") -> list[float]:  # ruff:ignore[unused-function-argument]
+    def mock_generate_embedding(
+        text: str,  # ruff:ignore[unused-function-argument]
+        model: str = "text-embedding-3-small",  # ruff:ignore[unused-function-argument]
+        db=None,  # ruff:ignore[unused-function-argument]
+    ) -> list[float]:
         """Return a fixed-size embedding vector filled with 0.1 values."""
         return [0.1] * EmbeddingMixin.SIZE
 
@@ -368,6 +374,7 @@ def _override_embedding_generation(monkeypatch):
     monkeypatch.setattr("app.service.species.generate_embedding", mock_generate_embedding)
     monkeypatch.setattr("app.service.strain.generate_embedding", mock_generate_embedding)
     monkeypatch.setattr("app.service.brain_region.generate_embedding", mock_generate_embedding)
+    monkeypatch.setattr("app.queries.common.generate_embedding", mock_generate_embedding)
 
 
 @pytest.fixture(scope="session")
@@ -496,21 +503,41 @@ def db(session_client, monkeypatch) -> Iterator[Session]:
             join_transaction_mode="create_savepoint",
         )
 
-        def _patched_get_session(request: Request):  # ruff:ignore[unused-function-argument]
+        def _patched_get_session(request: Request):
             # expire before each request so objects inserted by test setup are reloaded
             # fresh from DB, preventing stale cached relationships (e.g. selectin) from
             # being seen by the request handler
             session.expire_all()
             with session.begin_nested():
+                if (query := db_module.get_route_statement_timeout_query(request)) is not None:
+                    session.execute(query)
                 yield session
 
+        async def _patched_get_async_session(request: Request):
+            # the async session proxies the same session, so the queries are executed
+            # synchronously on the connection of the test transaction.
+            # The generator is always closed by FastAPI, so the savepoint is released.
+            session.expire_all()
+            async_session = AsyncSession(sync_session_class=lambda **_: session)
+            with session.begin_nested():
+                if (query := db_module.get_route_statement_timeout_query(request)) is not None:
+                    session.execute(query)
+                yield async_session  # ruff:ignore[yield-in-context-manager-in-async-generator]
+
         monkeypatch.setattr(db_module, "_get_session", _patched_get_session)
+        monkeypatch.setattr(db_module, "_get_async_session", _patched_get_async_session)
 
         yield session
         session.close()
         transaction.rollback()
 
 
+@pytest.fixture(autouse=True)
+def _clear_hierarchy_cache():
+    """Discard the public hierarchy cached by previous tests, since their data is rolled back."""
+    public_hierarchy_cache.invalidate()
+
+
 @pytest.fixture
 def user_id(db):
     uid = UUID(USER_SUB_ID_1)
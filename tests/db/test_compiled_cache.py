@@ -0,0 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import column, create_engine, event, literal, select, text
+from sqlalchemy.engine.interfaces import CacheStats
+
+from app.config import settings
+from app.db import compiled_cache as test_module
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(settings.DB_URI, pool_size=1, max_overflow=0)
+    test_module.listen(engine)
+    test_module.reset()
+    yield engine
+    event.remove(engine, "after_cursor_execute", test_module._after_cursor_execute)
+    test_module.reset()
+    engine.dispose()
+
+
+def test_cache_counters():
+    counters = test_module.CacheCounters()
+    assert counters.hit_ratio is None
+
+    counters.add(test_module.CacheCounters(hits=3, misses=1, uncached=2))
+    assert counters == test_module.CacheCounters(hits=3, misses=1, uncached=2)
+    assert counters.hit_ratio == pytest.approx(0.75)
+
+
+def test_listen(engine):
+    with engine.connect() as conn:
+        counters = test_module.start_request()
+        for value in range(3):
+            # the same statement with different parameters
+            conn.execute(
+                select(column("x"))
+                .select_from(text("(SELECT 1 AS x) AS t"))
+                .where(column("x") == literal(value))
+            )
+        test_module.finish_request("GET /test", counters)
+        conn.execute(text("SELECT 1"))
+        conn.exec_driver_sql("SELECT 1")
+
+    assert counters == test_module.CacheCounters(hits=2, misses=1, uncached=0)
+    assert test_module.route_counters == {"GET /test": counters}
+    assert test_module.total_counters == test_module.CacheCounters(hits=2, misses=2, uncached=0)
+
+    test_module.finish_request("GET /other", test_module.start_request())
+    assert list(test_module.route_counters) == ["GET /test"]
+
+    test_module.reset()
+    assert test_module.route_counters == {}
+    assert test_module.total_counters == test_module.CacheCounters()
+
+
+def test_counters_updated_by_threads():
+    test_module.reset()
+    context = SimpleNamespace(compiled=object(), cache_hit=CacheStats.CACHE_HIT)
+    executemany = False
+
+    def execute(n_statements):
+        counters = test_module.start_request()
+        for _ in range(n_statements):
+            test_module._after_cursor_execute(None, None, "", None, context, executemany)
+        test_module.finish_request("GET /test", counters)
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(execute, [10_000] * 8))
+        total, routes = test_module.snapshot()
+    finally:
+        test_module.reset()
+
+    assert total == test_module.CacheCounters(hits=80_000)
+    assert routes == {"GET /test": total}
+    # the snapshot is a copy
+    assert test_module.total_counters == test_module.CacheCounters()
@@ -1,13 +1,15 @@
 from unittest.mock import Mock, patch
 
 import pytest
+import sqlalchemy as sa
 from loguru import logger
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.session import object_session
 
 from app.db import events as test_module
-from app.db.model import Asset
-from app.db.types import AssetStatus, StorageType
+from app.db.hierarchy_cache import public_hierarchy_cache
+from app.db.model import Asset, Circuit, Derivation
+from app.db.types import AssetStatus, DerivationType, StorageType
 
 from tests.utils import add_db
 
@@ -375,3 +377,35 @@ def test_loguru_logging_on_multipart_abort_error(user_id, morphology_id, capture
     assert "Failed to abort multipart upload" in log_msg
     assert str(asset.id) in log_msg
     assert "abort failed" in log_msg
+
+
+def test_hierarchy_cache_invalidated_on_derivation_write(real_db, root_circuit, circuit, user_id):
+    version = public_hierarchy_cache.version
+    real_db.add(
+        Derivation(
+            used_id=root_circuit.id,
+            generated_id=circuit.id,
+            derivation_type=DerivationType.circuit_extraction,
+            created_by_id=user_id,
+            updated_by_id=user_id,
+        )
+    )
+    real_db.flush()
+    assert public_hierarchy_cache.version == version + 1
+    assert real_db.info[test_module.HIERARCHY_CHANGED_KEY] is True
+
+    real_db.commit()
+    assert public_hierarchy_cache.version == version + 2
+    assert test_module.HIERARCHY_CHANGED_KEY not in real_db.info
+
+
+def test_hierarchy_cache_invalidated_on_bulk_update(real_db, circuit):
+    version = public_hierarchy_cache.version
+    real_db.execute(sa.update(Circuit).where(Circuit.id == circuit.id).values(name="renamed"))
+    assert public_hierarchy_cache.version == version + 1
+
+    real_db.execute(sa.update(Asset).where(Asset.entity_id == circuit.id).values(meta={}))
+    assert public_hierarchy_cache.version == version + 1
+
+    real_db.rollback()
+    assert public_hierarchy_cache.version == version + 2
@@ -0,0 +1,60 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import sqlalchemy as sa
+
+from app.db import pool as test_module
+from app.db.session import configure_database_session_manager
+
+
+def test_get_pool_stats():
+    manager = configure_database_session_manager(pool_size=1, max_overflow=0)
+    pool = manager.engine.pool
+    assert isinstance(pool, test_module.InstrumentedQueuePool)
+    try:
+        assert test_module.get_pool_stats(pool) == test_module.PoolStats(
+            size=1, checked_out=0, overflow=0, waiting=0, max_wait=0.0
+        )
+        with manager.engine.connect() as conn:
+            conn.execute(sa.text("SELECT 1"))
+            thread = threading.Thread(target=lambda: manager.engine.connect().close())
+            thread.start()
+            time.sleep(0.2)
+            stats = test_module.get_pool_stats(pool)
+            assert stats is not None
+            assert stats.checked_out == 1
+            assert stats.waiting == 1
+            assert stats.max_wait >= 0.1
+        thread.join()
+        stats = test_module.get_pool_stats(pool)
+        assert stats is not None
+        assert stats.waiting == 0
+        assert manager.pool_stats() == {"sync": stats}
+    finally:
+        manager.close()
+
+
+def test_get_pool_stats_not_instrumented():
+    assert test_module.get_pool_stats(sa.pool.NullPool(lambda: None)) is None
+
+
+def test_slow_checkout_logged(monkeypatch):
+    mock_logger = MagicMock()
+    monkeypatch.setattr(test_module, "L", mock_logger)
+    manager = configure_database_session_manager(pool_size=1, max_overflow=0)
+    try:
+        with manager.engine.connect():
+            pass
+        mock_logger.warning.assert_not_called()
+
+        monkeypatch.setattr(test_module.settings, "DB_POOL_WAIT_LOG_THRESHOLD", 0.05)
+        with manager.engine.connect():
+            thread = threading.Thread(target=lambda: manager.engine.connect().close())
+            thread.start()
+            time.sleep(0.2)
+        thread.join()
+        mock_logger.warning.assert_called_once()
+        assert mock_logger.warning.call_args.args[1] >= 100
+    finally:
+        manager.close()
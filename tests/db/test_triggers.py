@@ -76,7 +76,7 @@ def test_description_vector_trigger():
         model=model,
         signature=f"{model.__tablename__}_description_vector",
         target_field="description_vector",
-        fields=["description", "name"],
+        fields=["name", "description"],
     )
     assert isinstance(result, PGTrigger)
 
@@ -97,6 +97,27 @@ def test_description_vector_trigger():
         )
 
 
+def test_description_vector_function():
+    model = Subject
+    result = test_module.description_vector_function(
+        model=model,
+        signature=f"{model.__tablename__}_description_vector",
+        target_field="description_vector",
+        fields=["name", "description"],
+    )
+    assert isinstance(result, PGFunction)
+    assert "coalesce(NEW.name, '')), 'A')" in result.definition
+    assert "coalesce(NEW.description, '')), 'B')" in result.definition
+
+    with pytest.raises(TypeError, match="At most 4 fields allowed"):
+        test_module.description_vector_function(
+            model=model,
+            signature=f"{model.__tablename__}_description_vector",
+            target_field="description_vector",
+            fields=["name", "description", "name", "description", "name"],
+        )
+
+
 def test_unauthorized_private_reference_function():
     result = test_module.unauthorized_private_reference_function(Circuit, "atlas_id")
     assert isinstance(result, PGFunction)
@@ -0,0 +1,30 @@
+import asyncio
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.config import settings
+from app.db.model import MTypeClass
+from app.dependencies import common as test_module
+
+
+def test_get_facets_with_asyncpg():
+    # the positions in GROUP BY must not be bound parameters, since asyncpg sends them typed
+    async def execute():
+        engine = create_async_engine(settings.DB_ASYNC_URI)
+        try:
+            async with AsyncSession(engine) as session:
+                return await session.run_sync(
+                    lambda db: test_module._get_facets(
+                        db,
+                        build_facet_query=lambda **_: sa.select(MTypeClass.id).where(sa.false()),
+                        name_to_facet_query_params={
+                            "mtype": {"id": MTypeClass.id, "label": MTypeClass.pref_label}
+                        },
+                        count_distinct_field=MTypeClass.id,
+                    )
+                )
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(execute()) == {"mtype": []}
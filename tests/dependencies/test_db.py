@@ -0,0 +1,86 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+import sqlalchemy as sa
+
+from app.config import settings
+from app.db.session import configure_database_session_manager
+from app.dependencies import db as test_module
+
+# the functions patched by the db fixture
+_get_session = test_module._get_session
+_get_async_session = test_module._get_async_session
+
+
+@pytest.mark.parametrize(
+    "route",
+    [
+        # sync route
+        "/etype",
+        # async route
+        "/experimental-neuron-density",
+    ],
+)
+def test_route_statement_timeout(monkeypatch, db, client, route):
+    monkeypatch.setattr(settings, "DB_ROUTE_STATEMENT_TIMEOUTS", {route: 1234})
+
+    assert client.get(route).status_code == 200
+
+    # the timeout is local to the test transaction, shared with the request
+    assert db.execute(sa.text("SHOW statement_timeout")).scalar_one() == "1234ms"
+
+
+def test_route_statement_timeout_not_configured(db, client):
+    default = db.execute(sa.text("SHOW statement_timeout")).scalar_one()
+
+    assert client.get("/etype").status_code == 200
+
+    assert db.execute(sa.text("SHOW statement_timeout")).scalar_one() == default
+
+
+def test_get_sessions_with_statement_timeout(monkeypatch):
+    monkeypatch.setattr(settings, "DB_ROUTE_STATEMENT_TIMEOUTS", {"/route": 1234})
+    manager = configure_database_session_manager()
+    request = MagicMock(scope={"route": MagicMock(path="/route")})
+    request.state.database_session_manager = manager
+    query = sa.text("SHOW statement_timeout")
+
+    async def execute_async():
+        try:
+            async for session in _get_async_session(request):
+                return (await session.execute(query)).scalar_one()
+        finally:
+            await manager.close_async()
+
+    try:
+        for session in _get_session(request):
+            assert session.execute(query).scalar_one() == "1234ms"
+        assert asyncio.run(execute_async()) == "1234ms"
+    finally:
+        manager.close()
+
+
+def test_get_async_db_closed_on_error(monkeypatch):
+    monkeypatch.setattr(test_module, "_get_async_session", _get_async_session)
+    manager = configure_database_session_manager()
+    request = MagicMock(scope={})
+    request.state.database_session_manager = manager
+    err = "route error"
+
+    async def execute_async():
+        try:
+            sessions = test_module.get_async_db(request)
+            session = await anext(sessions)
+            await session.execute(sa.text("SELECT 1"))
+            with pytest.raises(RuntimeError, match=err):
+                await sessions.athrow(RuntimeError(err))
+            return manager.async_engine.pool.checkedout()
+        finally:
+            await manager.close_async()
+
+    try:
+        # the connection is returned to the pool as soon as the exception is raised
+        assert asyncio.run(execute_async()) == 0
+    finally:
+        manager.close()
@@ -1,3 +1,4 @@
+import hashlib
 import io
 from http import HTTPStatus
 from unittest.mock import ANY, patch
@@ -8,7 +9,7 @@ import pytest
 from moto import mock_aws
 
 from app.config import settings, storages
-from app.db.model import Asset, Entity
+from app.db.model import Asset, AssetBlob, Entity
 from app.db.types import AssetLabel, ContentType, EntityType, StorageType
 from app.dependencies import auth
 from app.errors import ApiErrorCode
@@ -484,7 +485,7 @@ def test_upload_entity_asset_invalid_content_type(client, entity):
 
 def test_upload_entity_asset_s3_failure(client, entity):
     """Test upload when S3 upload fails."""
-    with patch("app.service.asset.upload_to_s3", return_value=False):
+    with patch("app.service.asset.upload_to_s3", return_value=None):
         response = _upload_entity_asset(
             client,
             entity_type=entity.type,
@@ -497,6 +498,32 @@ def test_upload_entity_asset_s3_failure(client, entity):
     assert response.json()["details"] == "Failed to upload object"
 
 
+def test_upload_entity_asset_sha256_digest(client, entity, s3, s3_internal_bucket):
+    url = f"{route(entity.type)}/{entity.id}/assets"
+    full_path = _get_expected_full_path(entity, path="morph.asc")
+    other_digest = hashlib.sha256(b"other").hexdigest()
+    with FILE_EXAMPLE_PATH.open("rb") as f:
+        response = client.post(
+            url,
+            files={"file": ("morph.asc", f, "application/asc")},
+            data={"label": "morphology", "sha256_digest": other_digest},
+        )
+    assert response.status_code == 422
+    error = ErrorResponse.model_validate(response.json())
+    assert error.error_code == ApiErrorCode.ASSET_INVALID_DIGEST
+    assert "Contents" not in s3.list_objects_v2(Bucket=s3_internal_bucket, Prefix=full_path)
+    assert assert_request(client.get, url=url).json()["data"] == []
+
+    with FILE_EXAMPLE_PATH.open("rb") as f:
+        response = client.post(
+            url,
+            files={"file": ("morph.asc", f, "application/asc")},
+            data={"label": "morphology", "sha256_digest": FILE_EXAMPLE_DIGEST.upper()},
+        )
+    assert response.status_code == 201, response.text
+    assert response.json()["sha256_digest"] == FILE_EXAMPLE_DIGEST
+
+
 def test_upload_entity_asset_virtual_lab_id_not_found(client, entity, monkeypatch):
     """User has project context but no virtual-lab mapping in Keycloak groups."""
 
@@ -584,7 +611,7 @@ def test_upload_entity_asset_admin_non_authorized(clients, entity):
 
 @pytest.mark.usefixtures("mock_virtual_lab_project_mapping")
 def test_upload_entity_asset_admin_s3_failure(client_admin, entity):
-    with patch("app.service.admin.upload_to_s3", return_value=False):
+    with patch("app.service.asset.upload_to_s3", return_value=None):
         response = _upload_entity_asset_admin(
             client_admin,
             entity_type=entity.type,
@@ -597,6 +624,19 @@ def test_upload_entity_asset_admin_s3_failure(client_admin, entity):
     assert response.json()["details"] == "Failed to upload object"
 
 
+@pytest.mark.usefixtures("mock_virtual_lab_project_mapping")
+def test_upload_entity_asset_admin_sha256_digest(client_admin, entity):
+    with FILE_EXAMPLE_PATH.open("rb") as f:
+        response = client_admin.post(
+            f"/admin{route(entity.type)}/{entity.id}/assets",
+            files={"file": ("morph.asc", f, "application/asc")},
+            data={"label": "morphology", "sha256_digest": hashlib.sha256(b"other").hexdigest()},
+        )
+    assert response.status_code == 422
+    error = ErrorResponse.model_validate(response.json())
+    assert error.error_code == ApiErrorCode.ASSET_INVALID_DIGEST
+
+
 def test_upload_entity_asset_admin_virtual_lab_api_failure(
     client_admin, entity, httpx2_mock, virtual_lab_api_url
 ):
@@ -1363,6 +1403,292 @@ def test_list_entity_asset_directory(
         assert data["files"] == fake_files
 
 
+@pytest.fixture
+def asset_directory_with_children(db, asset_directory, root_circuit, user_id) -> Asset:
+    for path, size in [
+        ("morphology/cell2.swc", 200),
+        ("morphology/cell1.swc", 100),
+        ("metadata/info.json", 300),
+        ("morphology_100%/cell_3.swc", 400),
+    ]:
+        add_db(
+            db,
+            Asset(
+                path=f"{asset_directory.path}/{path}",
+                full_path=f"{asset_directory.full_path}/{path}",
+                status="created",
+                is_directory=False,
+                content_type="application/octet-stream",
+                size=size,
+                sha256_digest=None,
+                meta={},
+                entity_id=root_circuit.id,
+                parent_id=asset_directory.id,
+                created_by_id=user_id,
+                updated_by_id=user_id,
+                label="directory_child",
+                storage_type=StorageType.aws_s3_internal,
+            ),
+        )
+    return asset_directory
+
+
+def test_list_entity_asset_directory_from_db(clients, root_circuit, asset_directory_with_children):
+    asset_id = asset_directory_with_children.id
+    url = f"{route(root_circuit.type)}/{root_circuit.id}/assets/{asset_id}/list"
+
+    with patch("app.service.asset.list_directory_with_details") as mock_list_directory:
+        data = assert_request(clients.user_2.get, url=url).json()
+        assert list(data["files"]) == [
+            "metadata/info.json",
+            "morphology/cell1.swc",
+            "morphology/cell2.swc",
+            "morphology_100%/cell_3.swc",
+        ]
+        assert data["files"]["morphology/cell1.swc"] == {
+            "name": "morphology/cell1.swc",
+            "size": 100,
+            "last_modified": ANY,
+        }
+        assert data["pagination"] is None
+
+        data = assert_request(clients.user_2.get, url=url, params={"prefix": "morphology/"}).json()
+        assert list(data["files"]) == ["morphology/cell1.swc", "morphology/cell2.swc"]
+
+        data = assert_request(clients.user_2.get, url=url, params={"prefix": "morphology_1"}).json()
+        assert list(data["files"]) == ["morphology_100%/cell_3.swc"]
+
+        data = assert_request(clients.user_2.get, url=url, params={"glob": "*/cell?.swc"}).json()
+        assert list(data["files"]) == ["morphology/cell1.swc", "morphology/cell2.swc"]
+
+        data = assert_request(clients.user_2.get, url=url, params={"glob": "*100%*_3*"}).json()
+        assert list(data["files"]) == ["morphology_100%/cell_3.swc"]
+
+        data = assert_request(
+            clients.user_2.get, url=url, params={"page": 2, "page_size": 3}
+        ).json()
+        assert list(data["files"]) == ["morphology_100%/cell_3.swc"]
+        assert data["pagination"] == {"page": 2, "page_size": 3, "total_items": 4}
+
+        data = assert_request(
+            clients.user_2.get,
+            url=url,
+            params={"prefix": "morphology", "glob": "*.swc", "page": 1, "page_size": 2},
+        ).json()
+        assert list(data["files"]) == ["morphology/cell1.swc", "morphology/cell2.swc"]
+        assert data["pagination"] == {"page": 1, "page_size": 2, "total_items": 3}
+
+        mock_list_directory.assert_not_called()
+
+
+def test_list_entity_asset_directory_from_storage_with_filters(
+    client, root_circuit, asset_directory
+):
+    url = f"{route(root_circuit.type)}/{root_circuit.id}/assets/{asset_directory.id}/list"
+    fake_files = {
+        name: {"name": name, "size": 1, "last_modified": "2024-01-01T00:00:00Z"}
+        for name in ["b/2.swc", "a/1.swc", "a/2.json", "b/1.swc"]
+    }
+
+    with patch("app.service.asset.list_directory_with_details", return_value=fake_files):
+        data = assert_request(client.get, url=url, params={"prefix": "a/"}).json()
+        assert list(data["files"]) == ["a/1.swc", "a/2.json"]
+
+        data = assert_request(client.get, url=url, params={"glob": "*.swc"}).json()
+        assert list(data["files"]) == ["a/1.swc", "b/1.swc", "b/2.swc"]
+
+        data = assert_request(
+            client.get, url=url, params={"glob": "*.swc", "page": 2, "page_size": 2}
+        ).json()
+        assert list(data["files"]) == ["b/2.swc"]
+        assert data["pagination"] == {"page": 2, "page_size": 2, "total_items": 3}
+
+
+def _copy_entity_asset(client, entity, source_entity, source_asset_id, expected_status=201, **kw):
+    return assert_request(
+        client.post,
+        url=f"{route(entity.type)}/{entity.id}/assets/copy",
+        json={
+            "source_entity_type": source_entity.type,
+            "source_entity_id": str(source_entity.id),
+            "source_asset_id": str(source_asset_id),
+        }
+        | kw,
+        expected_status_code=expected_status,
+    ).json()
+
+
+def test_copy_entity_asset(
+    client, s3, entity, asset, subject_id, brain_region_id, cell_morphology_protocol_id
+):
+    target_id = create_cell_morphology_id(
+        client,
+        subject_id=subject_id,
+        brain_region_id=brain_region_id,
+        cell_morphology_protocol_id=cell_morphology_protocol_id,
+        authorized_public=False,
+    )
+    target = Entity(id=target_id, type=entity.type)
+
+    data = _copy_entity_asset(client, target, entity, asset.id)
+    assert data == asset.model_dump(mode="json") | {
+        "id": ANY,
+        "full_path": _get_expected_full_path(target, path="morph.asc"),
+    }
+    assert data["id"] != str(asset.id)
+    assert s3_key_exists(s3, key=data["full_path"])
+
+    data = _copy_entity_asset(client, target, entity, asset.id, path="copy.asc")
+    assert data["path"] == "copy.asc"
+    assert data["full_path"] == _get_expected_full_path(target, path="copy.asc")
+    assert s3_key_exists(s3, key=data["full_path"])
+
+    data = _copy_entity_asset(client, target, entity, asset.id, expected_status=409)
+    assert data["error_code"] == ApiErrorCode.ASSET_DUPLICATED
+
+    data = _copy_entity_asset(client, target, entity, MISSING_ID, expected_status=404)
+    assert data["error_code"] == ApiErrorCode.ASSET_NOT_FOUND
+
+
+def test_copy_entity_asset_directory(
+    client, db, s3, s3_internal_bucket, circuit, root_circuit, asset_directory_with_children
+):
+    children = db.query(Asset).filter(Asset.parent_id == asset_directory_with_children.id).all()
+    assert len(children) == 4
+    for child in children:
+        s3.put_object(Bucket=s3_internal_bucket, Key=child.full_path, Body=b"x" * child.size)
+
+    data = _copy_entity_asset(client, circuit, root_circuit, asset_directory_with_children.id)
+    assert data["is_directory"] is True
+    assert data["full_path"] == _get_expected_full_path(circuit, path="my-directory")
+    for child in children:
+        name = child.path.removeprefix("my-directory/")
+        assert s3_key_exists(s3, key=f"{data['full_path']}/{name}")
+
+    with patch("app.service.asset.list_directory_with_details") as mock_list_directory:
+        listed = assert_request(
+            client.get, url=f"{route(circuit.type)}/{circuit.id}/assets/{data['id']}/list"
+        ).json()
+        mock_list_directory.assert_not_called()
+    assert {name: file["size"] for name, file in listed["files"].items()} == {
+        "metadata/info.json": 300,
+        "morphology/cell1.swc": 100,
+        "morphology/cell2.swc": 200,
+        "morphology_100%/cell_3.swc": 400,
+    }
+
+
+def test_copy_entity_asset_directory_from_storage(
+    client, s3, s3_internal_bucket, circuit, root_circuit, asset_directory
+):
+    for name in ["a/1.swc", "b.json"]:
+        s3.put_object(
+            Bucket=s3_internal_bucket, Key=f"{asset_directory.full_path}/{name}", Body=b"x"
+        )
+
+    data = _copy_entity_asset(
+        client, circuit, root_circuit, asset_directory.id, path="copied-directory"
+    )
+    assert data["path"] == "copied-directory"
+    for name in ["a/1.swc", "b.json"]:
+        assert s3_key_exists(s3, key=f"{data['full_path']}/{name}")
+
+
+def test_copy_entity_asset_failures(client, db, entity, asset, uploading_asset):
+    data = _copy_entity_asset(client, entity, entity, uploading_asset.id, expected_status=409)
+    assert data["error_code"] == ApiErrorCode.ASSET_UPLOAD_INCOMPLETE
+
+    with patch("app.service.asset.copy_file", return_value=False):
+        data = _copy_entity_asset(
+            client, entity, entity, asset.id, path="copy.asc", expected_status=500
+        )
+    assert data["details"] == "Failed to copy object"
+    assert db.query(Asset).filter(Asset.path == "copy.asc").count() == 0
+
+
+def test_upload_entity_asset_deduplicated(
+    monkeypatch, client, db, s3, entity, subject_id, brain_region_id, cell_morphology_protocol_id
+):
+    monkeypatch.setattr(settings, "ASSET_DEDUPLICATION_ENABLED", True)
+    other_id = create_cell_morphology_id(
+        client,
+        subject_id=subject_id,
+        brain_region_id=brain_region_id,
+        cell_morphology_protocol_id=cell_morphology_protocol_id,
+        authorized_public=False,
+    )
+    other = Entity(id=other_id, type=entity.type)
+
+    assets = [
+        AssetRead.model_validate(
+            _upload_entity_asset(
+                client,
+                entity_type=e.type,
+                entity_id=e.id,
+                label="morphology",
+                file_upload_name="morph.asc",
+                content_type="application/asc",
+                expected_status=201,
+            ).json()
+        )
+        for e in [entity, other]
+    ]
+    assert all(a.sha256_digest == FILE_EXAMPLE_DIGEST for a in assets)
+
+    db_assets = [db.get(Asset, a.id) for a in assets]
+    blob_id = db_assets[0].blob_id
+    assert blob_id is not None
+    assert db_assets[1].blob_id == blob_id
+    blob = db.get(AssetBlob, blob_id)
+    assert blob.ref_count == 2
+    assert blob.size == FILE_EXAMPLE_SIZE
+    blob_path = blob.full_path
+    assert s3_key_exists(s3, key=blob_path)
+    assert not any(s3_key_exists(s3, key=a.full_path) for a in db_assets)
+    # the second upload has been deleted, and the first one is the blob without copying it
+    bucket = storages[StorageType.aws_s3_internal].bucket
+    blobs_prefix = blob_path.rsplit("/", 1)[0]
+    assert s3.list_objects_v2(Bucket=bucket, Prefix=blobs_prefix)["KeyCount"] == 1
+
+    # full_path is the path of the blob, so the content can be read from it
+    assert all(a.full_path == blob_path for a in assets)
+    data = assert_request(
+        client.get, url=f"{route(entity.type)}/{entity.id}/assets/{assets[0].id}"
+    ).json()
+    assert data["full_path"] == blob_path
+    assert s3.get_object(Bucket=bucket, Key=data["full_path"])["Body"].read() == (
+        FILE_EXAMPLE_PATH.read_bytes()
+    )
+
+    response = assert_request(
+        client.get,
+        url=f"{route(entity.type)}/{entity.id}/assets/{assets[0].id}/download",
+        expected_status_code=307,
+        follow_redirects=False,
+    )
+    assert response.next_request.url.path.endswith(blob_path)
+
+    # copying the asset references the same blob
+    data = _copy_entity_asset(client, other, entity, assets[0].id, path="copy.asc")
+    copied = db.get(Asset, data["id"])
+    assert copied.blob_id == blob_id
+    assert data["full_path"] == blob_path
+    assert not s3_key_exists(s3, key=copied.full_path)
+    db.refresh(blob)
+    assert blob.ref_count == 3
+
+    assert_request(client.delete, url=f"{route(other.type)}/{other.id}/assets/{data['id']}")
+    assert_request(client.delete, url=f"{route(entity.type)}/{entity.id}/assets/{assets[0].id}")
+    db.refresh(blob)
+    assert blob.ref_count == 1
+    assert s3_key_exists(s3, key=blob_path)
+
+    assert_request(client.delete, url=f"{route(other.type)}/{other.id}/assets/{assets[1].id}")
+    db.expire_all()
+    assert db.get(AssetBlob, blob_id) is None
+    assert not s3_key_exists(s3, key=blob_path)
+
+
 def test_list_entity_asset_directory_failures(client, entity, asset):
     entity_type = route(entity.type)
     # non-directory asset
@@ -0,0 +1,151 @@
+import threading
+import time
+import tracemalloc
+
+from sqlalchemy import event
+
+from app.config import settings
+from app.cpu_profiler import get_current_session
+from app.db import compiled_cache
+
+
+def test_load(client_admin, client):
+    response = client_admin.get("/admin/debug/load")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["admission_control_enabled"] is False
+    assert data["in_flight"] == 1
+    assert data["threadpool"]["size"] == 40
+    assert set(data["db_pools"]) >= {"sync"}
+    assert data["db_pools"]["sync"]["waiting"] == 0
+
+    response = client.get("/admin/debug/load")
+    assert response.status_code == 403
+
+
+def test_gc(client_admin, client):
+    response = client_admin.get("/admin/debug/gc")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["control_enabled"] is True
+    assert data["adaptive_enabled"] is False
+    assert len(data["counts"]) == 3
+    assert data["frozen"] > 0
+    assert data["idle_time"] == 0
+    assert set(data["pauses"]) == {"0", "1", "2"}
+    histogram = data["pauses"]["2"]["histogram"]
+    assert list(histogram) == ["0.001", "0.005", "0.01", "0.05", "0.1", "0.5", "1.0", "+Inf"]
+
+    response = client.get("/admin/debug/gc")
+    assert response.status_code == 403
+
+
+def test_cpu_profile(client_admin, client):
+    response = client_admin.get("/admin/debug/cpu", params={"seconds": 0.1})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "MainThread;" in response.text
+
+    response = client_admin.get("/admin/debug/cpu", params={"seconds": 0.1, "format": "speedscope"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "all threads"
+    assert "MainThread" in [profile["name"] for profile in data["profiles"]]
+
+    response = client_admin.get("/admin/debug/cpu", params={"requests": 1})
+    assert response.status_code == 400
+
+    response = client.get("/admin/debug/cpu", params={"seconds": 0.1})
+    assert response.status_code == 403
+
+
+def test_cpu_profile_with_route(client_admin, client_no_auth):
+    result = {}
+
+    def profile():
+        result["response"] = client_admin.get(
+            "/admin/debug/cpu",
+            params={"route": "/health", "requests": 2, "seconds": 60, "format": "speedscope"},
+        )
+
+    thread = threading.Thread(target=profile)
+    thread.start()
+    while get_current_session() is None:
+        time.sleep(0.01)
+    for _ in range(2):
+        assert client_no_auth.get("/health").status_code == 200
+    thread.join(timeout=10)
+
+    response = result["response"]
+    assert response.status_code == 200
+    assert response.json()["name"] == "/health"
+    assert get_current_session() is None
+
+
+def test_route_memory(monkeypatch, client_admin, client):
+    response = client_admin.get("/admin/debug/memory/routes")
+    assert response.status_code == 200
+    assert response.json()["enabled"] is False
+
+    monkeypatch.setattr(settings, "TRACEMALLOC_PER_ROUTE_ENABLED", True)
+    tracemalloc.start()
+    try:
+        response = client_admin.post("/admin/debug/memory/routes/reset")
+        assert response.status_code == 200
+        assert client.get("/health").status_code == 200
+
+        response = client_admin.get("/admin/debug/memory/routes")
+    finally:
+        tracemalloc.stop()
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["enabled"] is True
+    assert data["in_flight"] == 1
+    # the reset request is recorded after the reset
+    routes = {item["route"]: item for item in data["top_by_peak"]}
+    assert set(routes) == {"POST /admin/debug/memory/routes/reset", "GET /health"}
+    assert routes["GET /health"]["count"] == 1
+    assert routes["GET /health"]["peak_max_kb"] > 0
+    assert {item["route"] for item in data["top_by_retained"]} == set(routes)
+
+    response = client.get("/admin/debug/memory/routes")
+    assert response.status_code == 403
+
+
+def test_compiled_cache(monkeypatch, session_client, client_admin, client):
+    # at least one statement compiled, even when the test is executed alone
+    assert client.get("/mtype").status_code == 200
+    response = client_admin.get("/admin/debug/compiled-cache")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["enabled"] is False
+    assert data["cache_size"] == settings.DB_QUERY_CACHE_SIZE
+    assert data["cache_usage"]["sync"] > 0
+
+    engine = session_client.app.state.database_session_manager.engine
+    compiled_cache.listen(engine)
+    monkeypatch.setattr(settings, "DB_COMPILED_CACHE_STATS_ENABLED", True)
+    try:
+        response = client_admin.post("/admin/debug/compiled-cache/reset")
+        assert response.status_code == 200
+        for _ in range(2):
+            assert client.get("/mtype").status_code == 200
+        response = client_admin.get("/admin/debug/compiled-cache")
+    finally:
+        event.remove(engine, "after_cursor_execute", compiled_cache._after_cursor_execute)
+        compiled_cache.reset()
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["enabled"] is True
+    counters = data["routes"]["GET /mtype"]
+    assert counters["hits"] > 0
+    assert counters["hits"] + counters["misses"] == data["total"]["hits"] + data["total"]["misses"]
+
+    response = client.get("/admin/debug/compiled-cache")
+    assert response.status_code == 403
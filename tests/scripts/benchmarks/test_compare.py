@@ -0,0 +1,64 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from scripts.benchmarks import compare as test_module
+from scripts.benchmarks.scenarios import RESULTS_VERSION
+
+
+def _results(app_version, scenarios):
+    return {
+        "version": RESULTS_VERSION,
+        "app_version": app_version,
+        "scenarios": {
+            name: {"p50_ms": p50, "p95_ms": p95, "queries": queries}
+            for name, (p50, p95, queries) in scenarios.items()
+        },
+    }
+
+
+def test_comparison():
+    comparison = test_module.Comparison("s", "p50_ms", base=10, new=11.5)
+    assert comparison.change == pytest.approx(0.15)
+    assert comparison.is_regression(threshold=0.1) is True
+    assert comparison.is_regression(threshold=0.2) is False
+
+    comparison = test_module.Comparison("s", "queries", base=3, new=4)
+    assert comparison.is_regression(threshold=1) is True
+
+    comparison = test_module.Comparison("s", "queries", base=0, new=0)
+    assert comparison.change is None
+    assert comparison.is_regression(threshold=0) is False
+
+
+def test_compare():
+    base = _results("1", {"a": (10, 20, 3), "b": (5, 6, 1)})
+    new = _results("2", {"a": (11, 30, 3), "c": (1, 1, 1)})
+    assert test_module.compare(base, new) == [
+        ("a", "p50_ms", 10, 11),
+        ("a", "p95_ms", 20, 30),
+        ("a", "queries", 3, 3),
+    ]
+
+
+def test_main(tmp_path):
+    base_path = tmp_path / "base.json"
+    new_path = tmp_path / "new.json"
+    base_path.write_text(json.dumps(_results("1", {"a": (10, 20, 3)})), encoding="utf-8")
+    runner = CliRunner()
+
+    new_path.write_text(json.dumps(_results("2", {"a": (11, 21, 3)})), encoding="utf-8")
+    result = runner.invoke(test_module.main, [str(base_path), str(new_path)])
+    assert result.exit_code == 0, result.output
+    assert "REGRESSION" not in result.output
+
+    new_path.write_text(json.dumps(_results("2", {"a": (11, 21, 4)})), encoding="utf-8")
+    result = runner.invoke(test_module.main, [str(base_path), str(new_path)])
+    assert result.exit_code == 1
+    assert "1 metrics regressed" in result.output
+
+    new_path.write_text(json.dumps({"version": 0}), encoding="utf-8")
+    result = runner.invoke(test_module.main, [str(base_path), str(new_path)])
+    assert result.exit_code == 1
+    assert "Unsupported version" in result.output
@@ -0,0 +1,47 @@
+import sqlalchemy as sa
+
+from app.db.model import CellMorphology, Derivation, EModel, Entity
+from scripts.benchmarks import dataset as test_module
+
+
+def _generate(db, seed):
+    nested = db.begin_nested()
+    try:
+        counts = test_module.DatasetGenerator(
+            db, seed=seed, project_id=test_module.PROJECT_ID
+        ).generate(entities=200, regions=20)
+        ids = db.scalars(
+            sa.select(Entity.id)
+            .where(Entity.created_by_id == test_module.USER_ID)
+            .order_by(Entity.creation_date)
+        ).all()
+        derivations = db.execute(sa.select(Derivation.used_id, Derivation.generated_id)).all()
+        morphology_ids = set(db.scalars(sa.select(CellMorphology.id)).all())
+        emodel_ids = set(db.scalars(sa.select(EModel.id)).all())
+    finally:
+        nested.rollback()
+    return counts, ids, derivations, morphology_ids, emodel_ids
+
+
+def test_generate(db):
+    counts, ids, derivations, morphology_ids, emodel_ids = _generate(db, seed=0)
+    assert counts["cell_morphology"] == 80
+    assert counts["emodel"] == 60
+    assert counts["brain_region"] == 20
+    assert len(ids) == sum(
+        counts[t]
+        for t in [
+            "subject",
+            "cell_morphology",
+            "experimental_neuron_density",
+            "experimental_bouton_density",
+            "emodel",
+            "cell_morphology_protocol",
+        ]
+    )
+    assert all(
+        used in morphology_ids and generated in emodel_ids for used, generated in derivations
+    )
+
+    assert _generate(db, seed=0)[1] == ids
+    assert _generate(db, seed=1)[1] != ids
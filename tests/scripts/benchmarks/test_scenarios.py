@@ -0,0 +1,49 @@
+import click
+import pytest
+import sqlalchemy as sa
+
+from scripts.benchmarks import scenarios as test_module
+
+
+def test_scenarios():
+    names = [s.name for s in test_module.SCENARIOS]
+    assert len(names) == len(set(names))
+
+
+def test_count_queries(db):
+    db.execute(sa.text("SELECT 0"))  # begin the transaction before counting
+    with test_module.count_queries() as counter:
+        db.execute(sa.text("SELECT 1"))
+        db.execute(sa.text("SELECT 2"))
+    db.execute(sa.text("SELECT 3"))
+    assert counter == [2]
+
+
+def test_summarize():
+    result = test_module.summarize(
+        200, latencies=[float(i) for i in range(1, 101)], queries=[3] * 100
+    )
+    assert result == test_module.ScenarioResult(
+        status_code=200,
+        mean_ms=50.5,
+        p50_ms=50.5,
+        p95_ms=pytest.approx(95.05),
+        p99_ms=pytest.approx(99.01),
+        queries=3,
+    )
+
+
+def test_run_scenario(client_no_auth):
+    scenario = test_module.Scenario("health", "/health")
+    result = test_module.run_scenario(client_no_auth, scenario, {}, requests=5, warmup=1)
+    assert result.status_code == 200
+    assert result.queries == 0
+    assert result.p50_ms > 0
+
+    scenario = test_module.Scenario("root", "/", status_code=302)
+    result = test_module.run_scenario(client_no_auth, scenario, {}, requests=2, warmup=0)
+    assert result.status_code == 302
+
+    scenario = test_module.Scenario("version", "/version", status_code=404)
+    with pytest.raises(click.ClickException, match="version: unexpected response 200"):
+        test_module.run_scenario(client_no_auth, scenario, {}, requests=1, warmup=0)
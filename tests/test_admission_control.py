@@ -0,0 +1,59 @@
+import threading
+from unittest.mock import MagicMock
+
+import anyio
+import anyio.to_thread
+import pytest
+
+from app import admission_control as test_module
+from app.db.pool import PoolStats
+
+
+@pytest.fixture
+def manager():
+    manager = MagicMock()
+    manager.pool_stats.return_value = {
+        "sync": PoolStats(size=30, checked_out=40, overflow=10, waiting=5, max_wait=2.0)
+    }
+    return manager
+
+
+def test_configure_threadpool():
+    async def configure():
+        test_module.configure_threadpool(7)
+        return test_module.get_threadpool_stats()
+
+    assert anyio.run(configure) == test_module.ThreadpoolStats(size=7, busy=0, waiting=0)
+
+
+def test_get_overload_reason(monkeypatch, manager):
+    monkeypatch.setattr(test_module.settings, "ADMISSION_MAX_QUEUE_DEPTH", 1)
+    monkeypatch.setattr(test_module.settings, "ADMISSION_MAX_POOL_WAIT", 3.0)
+
+    async def get_reason(n_tasks):
+        event = threading.Event()
+        async with anyio.create_task_group() as tg:
+            test_module.configure_threadpool(1)
+            for _ in range(n_tasks):
+                tg.start_soon(anyio.to_thread.run_sync, event.wait)
+            await anyio.wait_all_tasks_blocked()
+            reason = test_module.get_overload_reason(manager)
+            event.set()
+        return reason
+
+    # one task is executed, and the others are waiting for the thread
+    assert anyio.run(get_reason, 2) is None
+    assert anyio.run(get_reason, 3) == "2 tasks waiting for a worker thread"
+
+    monkeypatch.setattr(test_module.settings, "ADMISSION_MAX_POOL_WAIT", 1.0)
+    assert anyio.run(get_reason, 0) == "5 checkouts waiting up to 2.0s for sync db"
+
+
+def test_request_counters_idle_time(monkeypatch):
+    monkeypatch.setattr(test_module.time, "monotonic", lambda: 100.0)
+    counters = test_module.RequestCounters(last_finished_at=90.0)
+
+    assert counters.idle_time() == pytest.approx(10.0)
+
+    counters.in_flight = 1
+    assert counters.idle_time() == 0
@@ -1,3 +1,4 @@
+from app import middleware
 from app.schemas.types import HeaderKey
 
 
@@ -12,3 +13,12 @@ def test_add_process_time_header(client_no_auth):
     assert response.status_code == 200
     assert HeaderKey.process_time in response.headers
     assert float(response.headers[HeaderKey.process_time]) >= 0
+
+
+def test_rejected_request_cors_headers(monkeypatch, client_no_auth):
+    monkeypatch.setattr(middleware.settings, "ADMISSION_CONTROL_ENABLED", True)
+    monkeypatch.setattr(middleware, "get_overload_reason", lambda _: "too many requests")
+    response = client_no_auth.get("/species", headers={"Origin": "https://example.com"})
+    assert response.status_code == 503
+    assert response.headers["Access-Control-Allow-Origin"] == "https://example.com"
+    assert HeaderKey.request_id in response.headers
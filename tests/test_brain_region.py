@@ -286,6 +286,14 @@ def test_brain_region_id(db, client, client_admin, user_id, species_id):
     data = response.json()["data"]
     assert len(data) == 4  # semantic search just reorders - it does not filter out
 
+    data = utils.assert_request(
+        client.get,
+        url=f"{ROUTE}/nearest",
+        params={"semantic_search": "Blue region", "species__id": str(species_id)},
+    ).json()["data"]
+    assert len(data) == 4
+    assert all(d["distance"] == pytest.approx(0) for d in data)
+
     # test search by species
     response = client.get(ROUTE, params={"species__id": str(species_id)})
     assert len(response.json()["data"]) == 4
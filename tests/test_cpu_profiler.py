@@ -0,0 +1,94 @@
+import sys
+import threading
+
+import anyio
+import pytest
+
+from app import cpu_profiler as test_module
+from app.errors import ApiError, ApiErrorCode
+
+
+def _busy(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_profiling_session():
+    async def profile():
+        stop = threading.Event()
+        thread = threading.Thread(target=_busy, args=(stop,), name="busy-thread")
+        thread.start()
+        try:
+            with test_module.profiling_session(interval=0.001) as session:
+                assert test_module.get_current_session() is session
+                with (
+                    pytest.raises(ApiError) as exc_info,
+                    test_module.profiling_session(interval=0.001),
+                ):
+                    pass
+                assert exc_info.value.error_code == ApiErrorCode.PROFILING_IN_PROGRESS
+                await anyio.sleep(0.1)
+        finally:
+            stop.set()
+            thread.join()
+        return session
+
+    session = anyio.run(profile)
+
+    assert test_module.get_current_session() is None
+    assert session.samples >= 5
+    threads = {stack[0] for stack in session.stacks}
+    assert "busy-thread" in threads
+    assert "cpu-profiler" not in threads
+    assert any(
+        stack[0] == "busy-thread" and "_busy" in stack[-1]
+        for stack in session.stacks
+        if len(stack) > 1
+    )
+
+
+def test_profiling_session_with_route():
+    async def profile():
+        session = test_module.ProfilingSession(
+            interval=0.01, route="/cell-morphology/{id_}", max_requests=2
+        )
+        assert not session.is_sampling()
+        assert not session.request_started("/cell-morphology")
+        assert session.request_started("/cell-morphology/123")
+        assert session.is_sampling()
+        assert session.request_started("/cell-morphology/456")
+        assert not session.request_started("/cell-morphology/789")
+        session.request_finished()
+        assert session.is_sampling()
+        assert not session.done.is_set()
+        session.request_finished()
+        assert not session.is_sampling()
+        assert session.done.is_set()
+
+    anyio.run(profile)
+
+
+def test_formats():
+    async def create_session():
+        return test_module.ProfilingSession(interval=0.01)
+
+    session = anyio.run(create_session)
+    session.sample({1: sys._getframe()}, exclude=set())
+    session.sample({1: sys._getframe(), 2: sys._getframe()}, exclude={2})
+
+    collapsed = test_module.to_collapsed(session)
+    assert collapsed.count("\n") == 1
+    stack, count = collapsed.strip().rsplit(" ", 1)
+    assert stack.startswith("1;")
+    assert stack.endswith(f"test_formats ({__file__}:{test_formats.__code__.co_firstlineno})")
+    assert count == "2"
+
+    speedscope = test_module.to_speedscope(session)
+    frames = speedscope["shared"]["frames"]
+    assert speedscope["name"] == "all threads"
+    assert len(speedscope["profiles"]) == 1
+    profile = speedscope["profiles"][0]
+    assert profile["name"] == "1"
+    assert profile["weights"] == [pytest.approx(0.02)]
+    assert profile["endValue"] == pytest.approx(0.02)
+    assert [frames[i]["name"] for i in profile["samples"][0]] == stack.split(";")[1:]
@@ -0,0 +1,92 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+import sqlalchemy as sa
+from pydantic import SecretStr
+
+from app import embedding_backfill as test_module
+from app.config import settings
+from app.db.model import IonChannel
+from app.utils.embedding import pseudo_random_embedding
+
+from tests.utils import add_db
+
+
+@pytest.fixture
+def ion_channels(db, ion_channel_json_data, user_id):
+    return [
+        add_db(
+            db,
+            IonChannel(
+                **ion_channel_json_data
+                | {
+                    "name": f"name-{i}",
+                    "label": f"label-{i}",
+                    "created_by_id": user_id,
+                    "updated_by_id": user_id,
+                }
+            ),
+        )
+        for i in range(3)
+    ]
+
+
+def test_get_embedding_text():
+    text = test_module.get_embedding_text("My  Name", "Some\ndescription " * 1000)
+    assert text.startswith("My Name Some description Some")
+    assert len(text) == test_module.MAX_TEXT_LENGTH
+
+
+def test_backfill_embeddings(db, monkeypatch, ion_channels):
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", SecretStr("random"))
+    ids = [ion_channel.id for ion_channel in ion_channels]
+    query = sa.select(sa.func.count()).where(IonChannel.id.in_(ids), IonChannel.embedding.is_(None))
+
+    assert test_module.backfill_embeddings(db, limit=1) == 1
+    assert db.execute(query).scalar_one() == 2
+
+    # other tables might have rows without embedding
+    assert test_module.backfill_embeddings(db, limit=1000) >= 2
+    assert db.execute(query).scalar_one() == 0
+    assert test_module.backfill_embeddings(db, limit=1000) == 0
+
+    ion_channel = ion_channels[0]
+    embedding = db.execute(
+        sa.select(IonChannel.embedding).where(IonChannel.id == ion_channel.id)
+    ).scalar_one()
+    text = test_module.get_embedding_text(ion_channel.name, ion_channel.description)
+    assert list(embedding) == pytest.approx(pseudo_random_embedding(text), rel=1e-6)
+
+
+def test_backfill_worker(monkeypatch):
+    stop = threading.Event()
+    call_count = 0
+
+    def wait_twice(timeout=None):  # ruff:ignore[unused-function-argument]
+        nonlocal call_count
+        call_count += 1
+        return call_count > 2
+
+    mock_backfill = MagicMock(side_effect=[RuntimeError("boom"), 10])
+    mock_log = MagicMock()
+    monkeypatch.setattr(test_module, "backfill_embeddings", mock_backfill)
+    monkeypatch.setattr(test_module, "L", mock_log)
+    database_session_manager = MagicMock()
+
+    with patch.object(stop, "wait", side_effect=wait_twice):
+        test_module._backfill_worker(stop, database_session_manager, interval=60.0, batch_size=10)
+
+    assert mock_backfill.call_count == 2
+    assert database_session_manager.session.call_count == 2
+    mock_log.exception.assert_called_once()
+    mock_log.info.assert_called_once()
+
+
+def test_start_embedding_backfill_thread(monkeypatch):
+    monkeypatch.setattr(test_module, "backfill_embeddings", MagicMock())
+
+    stop_embedding_backfill = test_module.start_embedding_backfill_thread(MagicMock())
+
+    assert callable(stop_embedding_backfill)
+    stop_embedding_backfill()
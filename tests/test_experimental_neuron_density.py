@@ -4,6 +4,7 @@ from unittest.mock import ANY
 import pytest
 
 from app.db.model import (
+    Asset,
     BrainRegion,
     Contribution,
     EmbeddingMixin,
@@ -16,8 +17,9 @@ from app.db.model import (
     Species,
     Subject,
 )
-from app.db.types import EntityType
+from app.db.types import EntityType, StorageType
 from app.filters.density import ExperimentalNeuronDensityFilter
+from app.service import experimental_neuron_density as test_module
 
 from .utils import (
     PROJECT_ID,
@@ -556,3 +558,41 @@ def test_sorting_and_filtering(client, models):
 
     data = req({"lifecycle_status": "active"})
     assert len(data) == len(models)
+
+
+def test_read_many_projection(db, client, models, user_id, monkeypatch):
+    model_id = models[2][0].id
+    add_db(
+        db,
+        Asset(
+            path="density.swc",
+            full_path="private/density.swc",
+            status="created",
+            is_directory=False,
+            content_type="application/swc",
+            size=4,
+            sha256_digest=bytes(32),
+            meta={"key": "value"},
+            entity_id=model_id,
+            created_by_id=user_id,
+            updated_by_id=user_id,
+            label="morphology",
+            storage_type=StorageType.aws_s3_internal,
+        ),
+    )
+    params = {"order_by": "name", "page_size": 10}
+    projected = assert_request(client.get, url=ROUTE, params=params).json()
+
+    # the models are loaded as usual if the projection is disabled
+    monkeypatch.setattr(test_module, "get_schema_columns", lambda *_: None)
+    loaded = assert_request(client.get, url=ROUTE, params=params).json()
+
+    assert projected == loaded
+    assert len(projected["data"]) == len(models[2])
+    item = next(item for item in projected["data"] if item["id"] == str(model_id))
+    assert item["assets"][0]["sha256_digest"] == 64 * "0"
+    assert item["subject"]["age_value"] == timedelta(days=14).total_seconds()
+    assert {item["contributions"][0]["agent"]["type"] for item in projected["data"]} == {
+        "person",
+        "organization",
+    }
@@ -0,0 +1,153 @@
+"""Tests of the async routes of the experimental neuron densities, executed with asyncpg.
+
+The async routes are executed with the asyncpg sessions of the application, instead of the
+session of the test transaction, so the data used by these tests is committed and removed later.
+"""
+
+from collections.abc import Iterator
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from app.db.model import Base
+from app.db.types import EntityType
+
+from .utils import assert_request
+
+ROUTE = "/experimental-neuron-density"
+ADMIN_ROUTE = "/admin/experimental-neuron-density"
+
+
+@pytest.fixture
+def db(session_client) -> Iterator[Session]:
+    """Yield a session committing each statement, overriding the fixture of the test transaction.
+
+    The original dependencies of the application aren't replaced, so both the sync and the async
+    routes use their own sessions, and all the tables are truncated in teardown.
+    """
+    engine = session_client.app.state.database_session_manager.engine
+    try:
+        with (
+            engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection,
+            Session(connection, expire_on_commit=False, autoflush=False) as session,
+        ):
+            yield session
+    finally:
+        tables = ", ".join(f'"{table.name}"' for table in Base.metadata.sorted_tables)
+        with engine.begin() as connection:
+            connection.execute(sa.text(f"TRUNCATE {tables} CASCADE"))
+
+
+@pytest.fixture
+def json_data(brain_region_id, subject_id, license_id):
+    return {
+        "brain_region_id": str(brain_region_id),
+        "subject_id": subject_id,
+        "license_id": license_id,
+        "legacy_id": "Test Legacy ID",
+        "measurements": [{"name": "mean", "unit": "μm", "value": 1.23}],
+    }
+
+
+@pytest.fixture
+def model_ids(client, json_data):
+    return [
+        assert_request(
+            client.post,
+            url=ROUTE,
+            json=json_data | {"name": name, "description": description},
+        ).json()["id"]
+        for name, description in [
+            ("density-b", "density of the pyramidal cells"),
+            ("density-a", "density of the interneurons"),
+            ("density-c", "density of the pyramidal and other cells"),
+        ]
+    ]
+
+
+def _assert_read_response(data, json_data):
+    assert data["brain_region"]["id"] == json_data["brain_region_id"]
+    assert data["subject"]["id"] == json_data["subject_id"]
+    assert data["license"]["name"] == "Test License"
+    assert data["type"] == EntityType.experimental_neuron_density
+    assert [m["value"] for m in data["measurements"]] == [1.23]
+
+
+def test_read_one(session_client, client, client_admin, model_ids, json_data):
+    for data in [
+        assert_request(client.get, url=f"{ROUTE}/{model_ids[0]}").json(),
+        assert_request(client_admin.get, url=f"{ADMIN_ROUTE}/{model_ids[0]}").json(),
+    ]:
+        assert data["id"] == model_ids[0]
+        assert data["name"] == "density-b"
+        _assert_read_response(data, json_data)
+
+    assert_request(client.get, url=f"{ROUTE}/{json_data['subject_id']}", expected_status_code=404)
+    # the connections of the asyncpg pool have been used and returned
+    pool_stats = session_client.app.state.database_session_manager.pool_stats()
+    assert pool_stats["async"].checked_out == 0
+
+
+@pytest.mark.parametrize("expand", [None, "generated_from_derivations"])
+def test_read_many(client, client_admin, model_ids, json_data, expand):
+    # the rows are projected, unless the derivations are expanded
+    params = {"expand": expand} if expand else {}
+    for c, route in [(client, ROUTE), (client_admin, ADMIN_ROUTE)]:
+        response = assert_request(c.get, url=route, params=params).json()
+        # the most recent first by default
+        assert [d["id"] for d in response["data"]] == model_ids[::-1]
+        for data in response["data"]:
+            _assert_read_response(data, json_data)
+        assert response["pagination"]["total_items"] == 3
+        assert response["facets"] is None
+
+
+def test_read_many_facets(client, model_ids, json_data):
+    response = assert_request(
+        client.get, url=ROUTE, params={"with_facets": True, "page_size": 1}
+    ).json()
+    assert [d["id"] for d in response["data"]] == model_ids[-1:]
+    assert response["pagination"]["total_items"] == 3
+    assert response["facets"]["brain_region"] == [
+        {
+            "id": json_data["brain_region_id"],
+            "label": "RedRegion",
+            "count": 3,
+            "type": "brain_region",
+        }
+    ]
+    assert response["facets"]["species"] == [
+        {"id": str(response["data"][0]["subject"]["species"]["id"]), "label": "Test Species"}
+        | {"count": 3, "type": "subject.species"}
+    ]
+    assert response["facets"]["contribution"] == []
+
+
+def test_read_many_search(client, model_ids):
+    response = assert_request(
+        client.get,
+        url=ROUTE,
+        params={"search": "pyramidal", "search_headline": True, "order_by": "name"},
+    ).json()
+    assert [d["id"] for d in response["data"]] == [model_ids[0], model_ids[2]]
+    assert response["pagination"]["total_items"] == 2
+    assert response["search_headlines"] == {
+        model_ids[0]: "density of the <b>pyramidal</b> cells",
+        model_ids[2]: "density of the <b>pyramidal</b> and other cells",
+    }
+
+    response = assert_request(
+        client.get, url=ROUTE, params={"search": "pyramidal", "search_ranked": True}
+    ).json()
+    assert {d["id"] for d in response["data"]} == {model_ids[0], model_ids[2]}
+
+
+def test_read_many_ordering(client, model_ids):
+    def req(order_by):
+        response = assert_request(client.get, url=ROUTE, params={"order_by": order_by}).json()
+        return [d["id"] for d in response["data"]]
+
+    assert req("name") == [model_ids[1], model_ids[0], model_ids[2]]
+    assert req("-name") == [model_ids[2], model_ids[0], model_ids[1]]
+    assert req("creation_date") == model_ids
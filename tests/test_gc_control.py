@@ -1,6 +1,9 @@
+import dataclasses
 import threading
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from app import gc_control as test_module
 from app.gc_control import _collect, _gc_worker, configure_gc, start_gc_thread
 
@@ -126,3 +129,150 @@ def test_start_gc_thread_returns_stop_function(monkeypatch):
 
     assert callable(stop_gc)
     stop_gc()
+
+
+def test_pause_histogram():
+    histogram = test_module.PauseHistogram()
+
+    histogram.observe(0.0005)
+    histogram.observe(0.001)
+    histogram.observe(0.02)
+    histogram.observe(3.0)
+
+    assert histogram.counts == [2, 0, 0, 1, 0, 0, 0, 1]
+    assert histogram.total == pytest.approx(3.0215)
+    assert histogram.max == pytest.approx(3.0)
+
+
+def test_gc_callback(monkeypatch):
+    stats = test_module.GCStats()
+    monkeypatch.setattr(test_module, "gc_stats", stats)
+    mock_time = MagicMock()
+    mock_time.perf_counter.side_effect = [10.0, 10.002]
+    monkeypatch.setattr(test_module, "time", mock_time)
+
+    test_module._gc_callback("start", {"generation": 1})
+    test_module._gc_callback("stop", {"generation": 1, "collected": 0, "uncollectable": 0})
+
+    assert stats.pauses[1].counts == [0, 1, 0, 0, 0, 0, 0, 0]
+    assert stats.pauses[1].max == pytest.approx(0.002)
+    assert sum(stats.pauses[0].counts) == sum(stats.pauses[2].counts) == 0
+
+
+POLICY = test_module.AdaptivePolicy(
+    gen1_interval=5.0,
+    gen2_interval=600.0,
+    poll_interval=0.5,
+    idle_seconds=0.2,
+    max_idle_wait=30.0,
+    max_gen0_count=1000,
+    max_rss=100 * test_module.MB,
+    rss_min_interval=60.0,
+)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        ({}, None),
+        ({"idle": True}, None),
+        ({"since_gen1": 5.0}, None),
+        ({"since_gen1": 5.0, "idle": True}, (1, "idle")),
+        ({"since_gen1": 35.0}, (1, "overdue")),
+        ({"since_gen1": 5.0, "since_gen2": 600.0, "idle": True}, (2, "idle")),
+        ({"since_gen1": 5.0, "since_gen2": 630.0}, (2, "overdue")),
+        ({"gen0_count": 1001}, (1, "count")),
+        ({"rss": 101 * test_module.MB, "since_gen2": 60.0}, (2, "rss")),
+        ({"rss": 101 * test_module.MB, "since_gen2": 59.0}, None),
+        ({"rss": 101 * test_module.MB, "since_gen2": 60.0, "rss_interval": 120.0}, None),
+        ({"rss": 100 * test_module.MB, "since_gen2": 60.0}, None),
+    ],
+)
+def test_choose_collection(kwargs, expected):
+    params = {
+        "since_gen1": 1.0,
+        "since_gen2": 1.0,
+        "idle": False,
+        "gen0_count": 0,
+        "rss": None,
+        "rss_interval": 60.0,
+    }
+
+    assert test_module._choose_collection(POLICY, **(params | kwargs)) == expected
+
+
+def test_adaptive_gc_worker(monkeypatch):
+    stop = threading.Event()
+    call_count = 0
+
+    def wait_twice(timeout=None):  # ruff:ignore[unused-function-argument]
+        nonlocal call_count
+        call_count += 1
+        return call_count > 2
+
+    stats = test_module.GCStats()
+    mock_collect = MagicMock()
+    mock_gc = MagicMock()
+    mock_gc.get_count.return_value = (0, 0, 0)
+    mock_time = MagicMock()
+    mock_time.monotonic.side_effect = [0.0, 6.0, 6.1, 6.2]
+    monkeypatch.setattr(test_module, "gc_stats", stats)
+    monkeypatch.setattr(test_module, "_collect", mock_collect)
+    monkeypatch.setattr(test_module, "gc", mock_gc)
+    monkeypatch.setattr(test_module, "time", mock_time)
+    monkeypatch.setattr(test_module, "get_rss", MagicMock(return_value=0))
+    monkeypatch.setattr(test_module.request_counters, "in_flight", 0)
+    monkeypatch.setattr(test_module.request_counters, "last_finished_at", float("-inf"))
+
+    with patch.object(stop, "wait", side_effect=wait_twice):
+        test_module._adaptive_gc_worker(stop, POLICY)
+
+    # gen1 collected at the first iteration, and not yet due at the second iteration
+    mock_collect.assert_called_once_with(1, level="debug")
+    assert stats.triggers == {"idle": 1}
+
+
+def test_adaptive_gc_worker_rss_backoff(monkeypatch):
+    stop = threading.Event()
+    clock = 0.0
+    collected_at = []
+
+    def wait(timeout=None):  # ruff:ignore[unused-function-argument]
+        nonlocal clock
+        clock += 10.0
+        return clock > 700.0
+
+    def get_rss():
+        # the memory is released only at 510s
+        return (50 if 500.0 < clock < 520.0 else 101) * test_module.MB
+
+    mock_gc = MagicMock()
+    mock_gc.get_count.return_value = (0, 0, 0)
+    mock_time = MagicMock()
+    mock_time.monotonic.side_effect = lambda: clock
+    monkeypatch.setattr(test_module, "gc_stats", test_module.GCStats())
+    monkeypatch.setattr(test_module, "_collect", lambda *_, **__: collected_at.append(clock))
+    monkeypatch.setattr(test_module, "gc", mock_gc)
+    monkeypatch.setattr(test_module, "time", mock_time)
+    monkeypatch.setattr(test_module, "get_rss", get_rss)
+    monkeypatch.setattr(test_module.request_counters, "in_flight", 1)
+    policy = dataclasses.replace(POLICY, gen1_interval=1000.0)
+
+    with patch.object(stop, "wait", side_effect=wait):
+        test_module._adaptive_gc_worker(stop, policy)
+
+    # the interval is doubled after each collection, and reset when the rss goes below max_rss
+    assert collected_at == [60.0, 180.0, 420.0, 520.0, 640.0]
+    assert test_module.gc_stats.triggers == {"rss": 5}
+
+
+def test_start_gc_thread_adaptive(monkeypatch):
+    monkeypatch.setattr(test_module.settings, "GC_ADAPTIVE_ENABLED", True)
+    mock_worker = MagicMock()
+    monkeypatch.setattr(test_module, "_adaptive_gc_worker", mock_worker)
+
+    stop_gc = start_gc_thread()
+    stop_gc()
+
+    mock_worker.assert_called_once()
+    assert mock_worker.call_args.args[1] == test_module.AdaptivePolicy.from_settings()
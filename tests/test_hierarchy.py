@@ -1,9 +1,13 @@
+import uuid
 from functools import partial
+from unittest.mock import patch
 
 import pytest
 
+from app.db.hierarchy_cache import HierarchyRow
 from app.db.model import Circuit, Derivation
 from app.db.types import CircuitBuildCategory, CircuitScale, DerivationType
+from app.service import hierarchy as test_module
 
 from tests.utils import PROJECT_ID, UNRELATED_PROJECT_ID, add_all_db, add_db, assert_request
 
@@ -209,6 +213,7 @@ def test_hierarchy(db, client_user_1, client_user_2, root_circuit, root_circuits
     ).json()
     assert response == {
         "derivation_type": "circuit_extraction",
+        "truncated_ids": [],
         "data": [
             {
                 "authorized_project_id": str(PROJECT_ID),
@@ -303,6 +308,7 @@ def test_hierarchy(db, client_user_1, client_user_2, root_circuit, root_circuits
     ).json()
     assert response == {
         "derivation_type": "circuit_rewiring",
+        "truncated_ids": [],
         "data": [
             {
                 "authorized_project_id": str(PROJECT_ID),
@@ -395,6 +401,7 @@ def test_hierarchy(db, client_user_1, client_user_2, root_circuit, root_circuits
     ).json()
     assert response == {
         "derivation_type": "circuit_extraction",
+        "truncated_ids": [],
         "data": [
             {
                 "authorized_project_id": str(UNRELATED_PROJECT_ID),
@@ -472,6 +479,7 @@ def test_hierarchy(db, client_user_1, client_user_2, root_circuit, root_circuits
     ).json()
     assert response == {
         "derivation_type": "circuit_rewiring",
+        "truncated_ids": [],
         "data": [
             {
                 "authorized_project_id": str(PROJECT_ID),
@@ -559,3 +567,151 @@ def test_hierarchy(db, client_user_1, client_user_2, root_circuit, root_circuits
         expected_status_code=500,
     ).json()
     assert response["details"] == "Inconsistent hierarchy."
+
+
+def _get_names(nodes):
+    return [(node["name"], _get_names(node["children"])) for node in nodes]
+
+
+@pytest.mark.usefixtures("hierarchy")
+def test_hierarchy_subtree(client_user_1, root_circuits, models):
+    params = {"derivation_type": DerivationType.circuit_extraction}
+
+    response = assert_request(
+        client_user_1.get, url=ROUTE, params=params | {"root_id": str(root_circuits[0].id)}
+    ).json()
+    assert response["truncated_ids"] == []
+    assert _get_names(response["data"]) == [
+        ("root-circuit-0", [("circuit-0", [("circuit-1", [])])]),
+    ]
+
+    response = assert_request(
+        client_user_1.get,
+        url=ROUTE,
+        params=params | {"root_id": str(root_circuits[0].id), "max_depth": 1},
+    ).json()
+    assert response["truncated_ids"] == [str(models[0].id)]
+    assert _get_names(response["data"]) == [("root-circuit-0", [("circuit-0", [])])]
+
+    response = assert_request(client_user_1.get, url=ROUTE, params=params | {"max_depth": 0}).json()
+    assert response["truncated_ids"] == [
+        str(models[3].id),
+        str(root_circuits[0].id),
+        str(root_circuits[1].id),
+    ]
+    assert all(node["children"] == [] for node in response["data"])
+
+    # circuit-7 is private in a different project
+    assert_request(
+        client_user_1.get,
+        url=ROUTE,
+        params=params | {"root_id": str(models[7].id)},
+        expected_status_code=404,
+    )
+    assert_request(
+        client_user_1.get, url=ROUTE, params=params | {"max_depth": -1}, expected_status_code=422
+    )
+
+
+@pytest.mark.usefixtures("hierarchy")
+def test_hierarchy_cache(db, client_user_1, client_user_2, root_circuit, models, user_id):
+    params = {"derivation_type": DerivationType.circuit_rewiring}
+    # the cache is invalidated at the end of the first request,
+    # because the hierarchy has been changed by the fixtures in the same transaction
+    assert_request(client_user_1.get, url=ROUTE, params=params)
+
+    with patch.object(test_module, "_load_rows", wraps=test_module._load_rows) as mock_load:
+        response_1 = assert_request(client_user_1.get, url=ROUTE, params=params).json()
+        # public and private rows
+        assert mock_load.call_count == 2
+
+        response_2 = assert_request(client_user_2.get, url=ROUTE, params=params).json()
+        # only the private rows, since the public rows are cached
+        assert mock_load.call_count == 3
+        assert response_1 != response_2
+        assert str(models[7].id) in str(response_2)
+        assert str(models[7].id) not in str(response_1)
+
+        add_db(
+            db,
+            Derivation(
+                used_id=root_circuit.id,
+                generated_id=models[8].id,
+                derivation_type=DerivationType.circuit_rewiring,
+                created_by_id=user_id,
+                updated_by_id=user_id,
+            ),
+        )
+        response = assert_request(client_user_1.get, url=ROUTE, params=params).json()
+        # the public rows have been loaded again
+        assert mock_load.call_count == 5
+        assert ("root-circuit", [("circuit-8", [])]) in _get_names(response["data"])
+
+
+def test_hierarchy_mixed_case_names(db, client_user_1, circuit_json_data, root_circuits, user_id):
+    # the public and private children are sorted together, regardless of the db collation
+    names_and_public = [("alpha", True), ("Bravo", False), ("Charlie", True), ("delta", False)]
+    children = add_all_db(
+        db,
+        [
+            Circuit(
+                **circuit_json_data
+                | {
+                    "name": name,
+                    "authorized_project_id": PROJECT_ID,
+                    "authorized_public": public,
+                    "root_circuit_id": root_circuits[0].id,
+                    "created_by_id": user_id,
+                    "updated_by_id": user_id,
+                }
+            )
+            for name, public in names_and_public
+        ],
+    )
+    add_all_db(
+        db,
+        [
+            Derivation(
+                used_id=root_circuits[0].id,
+                generated_id=child.id,
+                derivation_type=DerivationType.circuit_rewiring,
+                created_by_id=user_id,
+                updated_by_id=user_id,
+            )
+            for child in children
+        ],
+    )
+
+    response = assert_request(
+        client_user_1.get,
+        url=ROUTE,
+        params={
+            "derivation_type": DerivationType.circuit_rewiring,
+            "root_id": str(root_circuits[0].id),
+        },
+    ).json()
+    assert _get_names(response["data"]) == [
+        (
+            "root-circuit-0",
+            [("Bravo", []), ("Charlie", []), ("alpha", []), ("delta", [])],
+        )
+    ]
+
+
+def test_load_nodes_with_case_insensitive_collation(db):
+    # the rows are returned as ordered by a case insensitive collation, different from Python
+    def row(name, parent_id, *, public):
+        return HierarchyRow(uuid.uuid4(), name, parent_id, public, PROJECT_ID)
+
+    root = row("root", None, public=True)
+    root_id = root.id
+    public_rows = (root, row("alpha", root_id, public=True), row("Charlie", root_id, public=True))
+    private_rows = [row("Bravo", root_id, public=False), row("delta", root_id, public=False)]
+    with (
+        patch.object(test_module, "_load_public_rows", return_value=public_rows),
+        patch.object(test_module, "_load_rows", return_value=private_rows),
+    ):
+        nodes = test_module._load_nodes(
+            db, PROJECT_ID, entity_class=Circuit, derivation_type=DerivationType.circuit_rewiring
+        )
+    assert [node.name for node in nodes.values()] == ["root", "Bravo", "Charlie", "alpha", "delta"]
@@ -1,8 +1,10 @@
 from unittest.mock import ANY
 
 import pytest
+import sqlalchemy as sa
 
-from app.db.model import IonChannel
+from app.db.model import EmbeddingMixin, IonChannel
+from app.filters.ion_channel import IonChannelFilter
 
 from .utils import (
     add_db,
@@ -160,3 +162,111 @@ def test_filtering_sorting(client, models):
 
     data = req({"ilike_search": "name-1"})
     assert len(data) == 1
+
+
+def test_ranked_search(db, client, models):
+    for model, name, description in [
+        (models[0], "sodium channel", "a channel"),
+        (models[1], "other channel", "sodium current, and more sodium"),
+        (models[2], "potassium channel", "not related"),
+    ]:
+        db.execute(
+            sa.update(IonChannel)
+            .where(IonChannel.id == model.id)
+            .values(name=name, description=description)
+        )
+
+    def req(query):
+        return assert_request(client.get, url=ROUTE, params=query).json()
+
+    # the name is weighted above the description
+    data = req({"search": "sodium", "search_ranked": True})["data"]
+    assert [d["id"] for d in data] == [str(models[0].id), str(models[1].id)]
+
+    assert req({"search": "sod"})["data"] == []
+    data = req({"search": "sod", "search_syntax": "prefix", "order_by": "name"})["data"]
+    assert [d["id"] for d in data] == [str(models[1].id), str(models[0].id)]
+
+    data = req({"search": "sodium -current", "search_syntax": "websearch"})["data"]
+    assert [d["id"] for d in data] == [str(models[0].id)]
+
+    response = req({"search": "current", "search_headline": True})
+    assert [d["id"] for d in response["data"]] == [str(models[1].id)]
+    assert response["search_headlines"] == {
+        str(models[1].id): "sodium <b>current</b>, and more sodium"
+    }
+    assert req({"search": "current"})["search_headlines"] is None
+
+
+def test_semantic_search(db, client, models):
+    size = EmbeddingMixin.SIZE
+    # the mocked embedding of the searched text is [0.1] * size
+    for model, name, value in [
+        (models[0], "name-0", 0.1),
+        (models[1], "name-1", 0.2),
+        (models[2], "potassium channel", -0.1),
+    ]:
+        db.execute(sa.update(IonChannel).where(IonChannel.id == model.id).values(name=name))
+        db.execute(
+            sa.update(IonChannel).where(IonChannel.id == model.id).values(embedding=[value] * size)
+        )
+
+    data = assert_request(client.get, url=ROUTE, params={"semantic_search": "potassium"}).json()[
+        "data"
+    ]
+    # the semantic search only reorders the results
+    assert {d["id"] for d in data} == {str(m.id) for m in models}
+    # models[2] is the only full-text match, and the last one with embedding
+    assert [d["id"] for d in data[:3]] == [str(models[i].id) for i in [2, 0, 1]]
+
+    data = assert_request(
+        client.get, url=ROUTE, params={"search": "potassium", "semantic_search": "potassium"}
+    ).json()["data"]
+    assert [d["id"] for d in data] == [str(models[2].id)]
+
+
+def test_reset_embedding(db, models):
+    model = models[0]
+    db.execute(
+        sa.update(IonChannel)
+        .where(IonChannel.id == model.id)
+        .values(embedding=[0.1] * EmbeddingMixin.SIZE)
+    )
+
+    def get_embedding():
+        query = sa.select(IonChannel.embedding).where(IonChannel.id == model.id)
+        return db.execute(query).scalar_one()
+
+    db.execute(sa.update(IonChannel).where(IonChannel.id == model.id).values(label="new label"))
+    assert get_embedding() is not None
+
+    db.execute(sa.update(IonChannel).where(IonChannel.id == model.id).values(name=model.name))
+    assert get_embedding() is not None
+
+    db.execute(sa.update(IonChannel).where(IonChannel.id == model.id).values(description="changed"))
+    assert get_embedding() is None
+
+
+@pytest.mark.parametrize(
+    ("filter_kwargs", "expected_indexes"),
+    [
+        ({"name__ilike": "%sodium%"}, {"ix_ion_channel_name_trgm"}),
+        (
+            {"ilike_search": "*sod?um*"},
+            {"ix_ion_channel_name_trgm", "ix_ion_channel_description_trgm"},
+        ),
+    ],
+)
+def test_ilike_filter_uses_trigram_indexes(db, filter_kwargs, expected_indexes):
+    query = IonChannelFilter(**filter_kwargs).filter(sa.select(IonChannel.id))
+    compiled = query.compile(db.get_bind(), compile_kwargs={"literal_binds": True})
+    # the planner would prefer a sequential scan on the small tables used in tests
+    db.execute(sa.text("SET LOCAL enable_seqscan = off"))
+    plan = db.execute(sa.text(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar_one()
+
+    def index_names(node):
+        yield node.get("Index Name")
+        for child in node.get("Plans", []):
+            yield from index_names(child)
+
+    assert set(index_names(plan[0]["Plan"])) - {None} == expected_indexes
@@ -93,3 +93,19 @@ def test_timed_custom_level(capture_logged_messages):
         pass
 
     assert all(m.record["level"].name == "WARNING" for m in capture_logged_messages)
+
+
+def test_timed_timings(capture_logged_messages):
+    timings = {}
+    with test_module.timed("operation 1", timings=timings):
+        pass
+    err_msg = "boom"
+    with (
+        pytest.raises(ValueError, match=err_msg),
+        test_module.timed("operation 2", timings=timings),
+    ):
+        raise ValueError(err_msg)
+
+    assert list(timings) == ["operation 1", "operation 2"]
+    assert all(elapsed >= 0 for elapsed in timings.values())
+    assert len(capture_logged_messages) == 4
@@ -7,9 +7,10 @@ import pytest
 from fastapi import Depends, FastAPI
 from fastapi.testclient import TestClient
 
+from app import middleware as test_module
 from app.dependencies.auth import user_verified
 from app.logger import L
-from app.middleware import RequestContextMiddleware
+from app.middleware import AdmissionControlMiddleware, RequestContextMiddleware
 
 from tests.utils import ADMIN_SUB_ID, AUTH_HEADER_ADMIN
 
@@ -25,6 +26,7 @@ async def _lifespan(_: FastAPI) -> AsyncIterator[dict]:
 
 def _make_test_app() -> FastAPI:
     test_app = FastAPI(lifespan=_lifespan)
+    test_app.add_middleware(AdmissionControlMiddleware)
     test_app.add_middleware(RequestContextMiddleware)
 
     @test_app.get("/test-authenticated-endpoint", dependencies=[Depends(user_verified)])
@@ -37,6 +39,10 @@ def _make_test_app() -> FastAPI:
         L.info("test message")
         return {"ok": True}
 
+    @test_app.get("/health")
+    def health():
+        return {"status": "OK"}
+
     @test_app.get("/test-error-endpoint")
     def error_endpoint():
         L.info("test message")
@@ -107,6 +113,7 @@ def test_authenticated_request_context(logs, client_admin):
                 "status_class": 2,
                 "process_time_ms": ANY,
                 "response_size": ANY,
+                "threadpool_waiting": 0,
                 "client": "testclient",
                 "forwarded_for": "127.1.2.3",
                 "user_agent": "testclient",
@@ -143,6 +150,7 @@ def test_public_request_context(logs, client_no_auth):
                 "status_class": 2,
                 "process_time_ms": ANY,
                 "response_size": ANY,
+                "threadpool_waiting": 0,
                 "client": "testclient",
                 "forwarded_for": "127.1.2.3",
                 "user_agent": "testclient",
@@ -184,3 +192,37 @@ def test_error_request_context(logs, client_no_auth):
         },
     ]
     assert _filter_logs(logs) == expected
+
+
+def test_admission_control(monkeypatch, client_no_auth):
+    monkeypatch.setattr(test_module.settings, "ADMISSION_CONTROL_ENABLED", True)
+    monkeypatch.setattr(test_module.settings, "ADMISSION_RETRY_AFTER", 3)
+    result = client_no_auth.get("/test-public-endpoint")
+    assert result.status_code == 200
+
+    monkeypatch.setattr(test_module, "get_overload_reason", lambda _: "too many requests")
+    result = client_no_auth.get("/test-public-endpoint")
+    assert result.status_code == 503
+    assert result.headers["Retry-After"] == "3"
+    assert result.json() == {
+        "message": "Service overloaded, retry later",
+        "error_code": "SERVICE_OVERLOADED",
+        "details": "too many requests",
+    }
+
+    result = client_no_auth.get("/health")
+    assert result.status_code == 200
+
+    monkeypatch.setattr(test_module.settings, "ADMISSION_CONTROL_ENABLED", False)
+    result = client_no_auth.get("/test-public-endpoint")
+    assert result.status_code == 200
+
+
+def test_request_counters(monkeypatch, client_no_auth):
+    monkeypatch.setattr(test_module.request_counters, "last_finished_at", 0.0)
+
+    result = client_no_auth.get("/test-public-endpoint")
+
+    assert result.status_code == 200
+    assert test_module.request_counters.in_flight == 0
+    assert test_module.request_counters.last_finished_at > 0
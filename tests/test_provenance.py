@@ -0,0 +1,150 @@
+from unittest.mock import patch
+
+import cachetools
+import pytest
+
+from app.db.model import Derivation, Generation, SimulationGeneration, Usage
+from app.db.types import ActivityStatus, DerivationType
+from app.service import provenance as test_module
+
+from .utils import PROJECT_ID, add_db, assert_request, create_cell_morphology_id
+
+
+def _route(entity_id):
+    return f"/entity/{entity_id}/provenance"
+
+
+@pytest.fixture
+def ids(
+    db, client, client_user_2, user_id, subject_id, brain_region_id, cell_morphology_protocol_id
+):
+    """Create the graph m0 -> m1 -> m2 -> m0, m1 => m3, m1 -> m4 -> m5, and return the ids.
+
+    The edge m1 => m3 is an activity, and m4 is not readable by user 1.
+    """
+    ids = [
+        create_cell_morphology_id(
+            client_user_2 if i == 4 else client,
+            subject_id=subject_id,
+            brain_region_id=brain_region_id,
+            cell_morphology_protocol_id=cell_morphology_protocol_id,
+            name=f"m{i}",
+        )
+        for i in range(6)
+    ]
+    for used, generated in [(0, 1), (1, 2), (2, 0), (1, 4), (4, 5)]:
+        add_db(
+            db,
+            Derivation(
+                used_id=ids[used],
+                generated_id=ids[generated],
+                derivation_type=DerivationType.unspecified,
+                created_by_id=user_id,
+                updated_by_id=user_id,
+            ),
+        )
+    activity = add_db(
+        db,
+        SimulationGeneration(
+            authorized_project_id=PROJECT_ID,
+            status=ActivityStatus.done,
+            created_by_id=user_id,
+            updated_by_id=user_id,
+        ),
+    )
+    db.add_all(
+        [
+            Usage(usage_entity_id=ids[1], usage_activity_id=activity.id),
+            Generation(generation_entity_id=ids[3], generation_activity_id=activity.id),
+        ]
+    )
+    db.flush()
+    return [str(id_) for id_ in ids] + [str(activity.id)]
+
+
+def _get_graph(client, entity_id, **params):
+    data = assert_request(client.get, url=_route(entity_id), params=params).json()
+    nodes = [(node["id"], node["depth"]) for node in data["nodes"]]
+    edges = {(edge["used_id"], edge["generated_id"], edge["edge_type"]) for edge in data["edges"]}
+    return nodes, edges
+
+
+def test_read_provenance(client, ids):
+    m0, m1, m2, m3, _, _, activity_id = ids
+
+    nodes, edges = _get_graph(client, m0)
+    assert sorted(nodes) == sorted([(m0, 0), (m1, 1), (m2, 2), (m3, 2)])
+    assert edges == {
+        (m0, m1, "derivation"),
+        (m1, m2, "derivation"),
+        (m2, m0, "derivation"),
+        (m1, m3, "activity"),
+    }
+
+    data = assert_request(client.get, url=_route(m1), params={"max_depth": 1}).json()
+    assert data["truncated"] is False
+    assert data["direction"] == "downstream"
+    assert [edge for edge in data["edges"] if edge["edge_type"] == "activity"] == [
+        {
+            "used_id": m1,
+            "generated_id": m3,
+            "edge_type": "activity",
+            "derivation_type": None,
+            "activity_id": activity_id,
+            "activity_type": "simulation_generation",
+        }
+    ]
+
+    nodes, _ = _get_graph(client, m0, max_depth=1)
+    assert nodes == [(m0, 0), (m1, 1)]
+
+    nodes, _ = _get_graph(client, m0, edge_types=["derivation"])
+    assert sorted(nodes) == sorted([(m0, 0), (m1, 1), (m2, 2)])
+
+    nodes, _ = _get_graph(client, m0, derivation_types=["circuit_extraction"])
+    assert nodes == [(m0, 0)]
+
+    nodes, _ = _get_graph(client, m3, direction="upstream", max_depth=2)
+    assert nodes == [(m3, 0), (m1, 1), (m0, 2)]
+
+    nodes, _ = _get_graph(client, m3, direction="upstream", max_depth=10)
+    assert nodes == [(m3, 0), (m1, 1), (m0, 2), (m2, 3)]
+
+    nodes, _ = _get_graph(client, m0, entity_types=["emodel"])
+    assert nodes == [(m0, 0)]
+
+
+def test_read_provenance_unreadable(client, client_user_2, ids):
+    m0, m1, _, _, m4, m5, _ = ids
+
+    # m4 is not readable by user 1, so m5 is not reached
+    nodes, _ = _get_graph(client, m1, edge_types=["derivation"], max_depth=5)
+    assert m4 not in {id_ for id_, _ in nodes}
+    assert m5 not in {id_ for id_, _ in nodes}
+
+    assert_request(client_user_2.get, url=_route(m0), expected_status_code=404)
+
+    nodes, _ = _get_graph(client_user_2, m4)
+    assert nodes == [(m4, 0)]
+
+
+def test_read_provenance_cache(client, ids, monkeypatch):
+    m0 = ids[0]
+    monkeypatch.setattr(test_module.settings, "PROVENANCE_CACHE_ENABLED", True)
+    monkeypatch.setattr(test_module, "_cache", cachetools.TTLCache(maxsize=10, ttl=60))
+
+    with patch.object(test_module, "_traverse", wraps=test_module._traverse) as mock_traverse:
+        first = _get_graph(client, m0)
+        assert _get_graph(client, m0) == first
+        assert mock_traverse.call_count == 1
+
+        _get_graph(client, m0, max_depth=1)
+        assert mock_traverse.call_count == 2
+
+
+def test_read_provenance_invalid_params(client, ids):
+    m0 = ids[0]
+    assert_request(client.get, url=_route(m0), params={"max_depth": 0}, expected_status_code=422)
+    assert_request(
+        client.get, url=_route(m0), params={"direction": "sideways"}, expected_status_code=422
+    )
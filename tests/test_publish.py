@@ -4,8 +4,8 @@ import uuid
 import pytest
 import sqlalchemy as sa
 
-from app.config import storages
-from app.db.model import Asset, Entity
+from app.config import settings, storages
+from app.db.model import Asset, AssetBlob, Entity
 from app.db.types import EntityType, StorageType
 from app.utils.s3 import PRIVATE_ASSET_PREFIX, PUBLIC_ASSET_PREFIX, build_s3_path
 
@@ -52,6 +52,11 @@ def private_morphology_with_asset(
     return uuid.UUID(entity_id)
 
 
+@pytest.fixture
+def asset_deduplication_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "ASSET_DEDUPLICATION_ENABLED", True)
+
+
 @pytest.fixture
 def private_circuit_with_directory_asset(db, s3, circuit, user_id):
     s3_path = build_s3_path(
@@ -262,6 +267,40 @@ def test_publish_then_unpublish(db, client_admin, s3, private_morphology_with_as
     assert s3_key_exists(s3, key=asset_after.full_path)
 
 
+@pytest.mark.usefixtures("asset_deduplication_enabled")
+def test_publish_then_unpublish_deduplicated_asset(
+    db, client_admin, s3, private_morphology_with_asset
+):
+    entity_id = private_morphology_with_asset
+
+    private_blob = _get_asset(db, entity_id).blob
+    assert private_blob is not None
+    assert not private_blob.is_public
+    private_blob_id, private_blob_path = private_blob.id, private_blob.full_path
+
+    response = _publish(client_admin, PROJECT_ID, dry_run=False)
+    assert response.status_code == 200
+    assert response.json()["move_assets_result"]["file_count"] == 1
+
+    db.expire_all()
+    asset = _get_asset(db, entity_id)
+    assert asset.full_path.startswith(PUBLIC_ASSET_PREFIX)
+    assert asset.blob.is_public
+    assert asset.blob.full_path.startswith(PUBLIC_ASSET_PREFIX)
+    assert asset.blob.ref_count == 1
+    assert s3_key_exists(s3, key=asset.blob.full_path)
+    # the private blob is no longer referenced
+    assert db.get(AssetBlob, private_blob_id) is None
+    assert not s3_key_exists(s3, key=private_blob_path)
+
+    _unpublish(client_admin, PROJECT_ID, dry_run=False)
+    db.expire_all()
+    asset = _get_asset(db, entity_id)
+    assert asset.full_path.startswith(PRIVATE_ASSET_PREFIX)
+    assert not asset.blob.is_public
+    assert s3_key_exists(s3, key=asset.blob.full_path)
+
+
 def test_publish_directory_asset(db, client_admin, s3, private_circuit_with_directory_asset):
     _entity_id, asset_id, directory_files = private_circuit_with_directory_asset
 
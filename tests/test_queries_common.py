@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from http import HTTPStatus
 from unittest.mock import patch
@@ -5,11 +6,20 @@ from unittest.mock import patch
 import pytest
 from pydantic import BaseModel
 
-from app.db.model import Derivation, TaskActivity
+from app.db.model import Derivation, ExperimentalNeuronDensity, TaskActivity
+from app.db.session import configure_database_session_manager
 from app.errors import ApiError, ApiErrorCode
-from app.queries.common import router_update_activity_one, router_update_one
+from app.filters.density import ExperimentalNeuronDensityFilter
+from app.queries.common import (
+    async_router_read_many,
+    async_router_read_one,
+    router_update_activity_one,
+    router_update_one,
+)
 from app.schemas.activity import ActivityUpdate
+from app.schemas.density import ExperimentalNeuronDensityRead
 from app.schemas.derivation import DerivationRead
+from app.schemas.types import PaginationRequest
 
 
 class _DerivationLabelPatch(BaseModel):
@@ -48,3 +58,51 @@ def test_router_update_activity_raises_without_authorized_project_column(db, use
         )
     assert excinfo.value.error_code == ApiErrorCode.GENERIC_ERROR
     assert excinfo.value.http_status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+async def _run_with_async_session(func, **kwargs):
+    manager = configure_database_session_manager()
+    try:
+        async with manager.async_session() as session:
+            return await func(db=session, **kwargs)
+    finally:
+        await manager.close_async()
+        manager.close()
+
+
+def test_async_router_read_one(user_context_user_1):
+    with pytest.raises(ApiError) as excinfo:
+        asyncio.run(
+            _run_with_async_session(
+                async_router_read_one,
+                id_=uuid.uuid4(),
+                db_model_class=ExperimentalNeuronDensity,
+                user_context=user_context_user_1,
+                response_schema_class=ExperimentalNeuronDensityRead,
+                apply_operations=None,
+            )
+        )
+    assert excinfo.value.error_code == ApiErrorCode.ENTITY_NOT_FOUND
+
+
+def test_async_router_read_many(user_context_user_1):
+    result = asyncio.run(
+        _run_with_async_session(
+            async_router_read_many,
+            db_model_class=ExperimentalNeuronDensity,
+            authorized_project_id=user_context_user_1.project_id,
+            with_search=None,
+            with_in_brain_region=None,
+            facets=None,
+            aliases=None,
+            apply_filter_query_operations=None,
+            apply_data_query_operations=None,
+            pagination_request=PaginationRequest(page=1, page_size=10),
+            response_schema_class=ExperimentalNeuronDensityRead,
+            name_to_facet_query_params=None,
+            filter_model=ExperimentalNeuronDensityFilter(),
+        )
+    )
+    # the test data is not visible, since it's not committed
+    assert result.data == []
+    assert result.pagination.total_items == 0
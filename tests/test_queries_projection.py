@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import settings
+from app.db.model import Asset, EModel, Entity, ExperimentalNeuronDensity
+from app.queries import projection as test_module
+from app.schemas.asset import AssetRead
+from app.schemas.density import ExperimentalNeuronDensityRead
+from app.schemas.entity import BasicEntityRead
+
+
+def test_get_schema_columns():
+    columns = test_module.get_schema_columns(Entity, BasicEntityRead)
+    assert [column.name for column in columns] == ["id", "type"]
+    assert test_module.get_schema_columns(Entity, BasicEntityRead) is columns
+
+    columns = test_module.get_schema_columns(EModel, BasicEntityRead)
+    assert [column.name for column in columns] == ["id", "type"]
+
+
+def test_get_schema_columns_with_relationships():
+    columns = test_module.get_schema_columns(
+        ExperimentalNeuronDensity, ExperimentalNeuronDensityRead
+    )
+    names = {column.name for column in columns}
+    # the derivations are omitted, since they are loaded only on demand
+    assert names == set(ExperimentalNeuronDensityRead.model_fields) - {
+        "generated_from_derivations",
+        "used_by_derivations",
+    }
+    sql = str(sa.select(*columns).compile(dialect=postgresql.dialect()))
+    assert "json_agg(json_build_object(" in sql
+    assert "ORDER BY mtype_class_1.pref_label" in sql
+    assert "LEFT OUTER JOIN person AS person_1" in sql
+
+
+def test_get_schema_columns_with_alias_choices():
+    # full_path is selected from storage_path, as when validating the model
+    columns = test_module.get_schema_columns(Asset, AssetRead)
+    sql = str(sa.select(*columns).compile(dialect=postgresql.dialect()))
+    assert "WHERE asset_blob.id = asset.blob_id) END AS full_path" in sql
+
+    columns = test_module.get_schema_columns(
+        ExperimentalNeuronDensity, ExperimentalNeuronDensityRead
+    )
+    sql = str(sa.select(*columns).compile(dialect=postgresql.dialect()))
+    assert "WHERE asset_blob.id = asset_1.blob_id) END" in sql
+
+
+def test_get_schema_columns_raises():
+    with pytest.raises(ValueError, match="Field 'type' not mapped to columns or relationships"):
+        test_module.get_schema_columns(Asset, BasicEntityRead)
+
+
+def test_to_json_enum_with_asyncpg():
+    # asyncpg prepares the statement with typed parameters, so the enum must be compared as text
+    query = sa.select(test_module._to_json(Asset.status), test_module._to_json(Asset.label))
+
+    async def execute():
+        engine = create_async_engine(settings.DB_ASYNC_URI)
+        try:
+            async with engine.connect() as conn:
+                return (await conn.execute(query.limit(0))).all()
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(execute()) == []
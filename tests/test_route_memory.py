@@ -0,0 +1,54 @@
+import tracemalloc
+
+import pytest
+
+from app import route_memory as test_module
+
+
+@pytest.fixture
+def _tracemalloc():
+    tracemalloc.start()
+    yield
+    tracemalloc.stop()
+
+
+def test_route_memory_stats():
+    stats = test_module.RouteMemoryStats()
+
+    stats.add(peak=100, retained=-10)
+    stats.add(peak=300, retained=-20)
+
+    assert stats == test_module.RouteMemoryStats(
+        count=2, peak_total=400, peak_max=300, retained_total=-30, retained_max=-10
+    )
+
+
+@pytest.mark.usefixtures("_tracemalloc")
+def test_route_memory_tracker():
+    tracker = test_module.RouteMemoryTracker()
+    retained = []
+
+    start = tracker.request_started()
+    assert tracker.in_flight == 1
+    retained.append(bytearray(1024 * 1024))
+    tracker.request_finished("GET /retaining", start)
+
+    start = tracker.request_started()
+    temporary = bytearray(512 * 1024)
+    del temporary
+    tracker.request_finished("GET /temporary", start)
+
+    assert tracker.in_flight == 0
+    retaining, temporary = tracker.routes["GET /retaining"], tracker.routes["GET /temporary"]
+    assert retaining.count == temporary.count == 1
+    assert retaining.peak_max >= retaining.retained_max >= 1024 * 1024
+    assert temporary.peak_max >= 512 * 1024
+    assert temporary.retained_max < 512 * 1024
+    assert [route for route, _ in tracker.top("peak_max", limit=1)] == ["GET /retaining"]
+    assert [route for route, _ in tracker.top("retained_total", limit=2)] == [
+        "GET /retaining",
+        "GET /temporary",
+    ]
+
+    tracker.reset()
+    assert not tracker.routes
@@ -127,6 +127,7 @@ def test_entity_route_methods(entity_routes):
         "admin_get_entity_assets",
         "delete_entity_asset",
         "download_entity_asset",
+        "entity_asset_copy",
         "entity_asset_directory_list",
         "entity_asset_directory_upload",
         "get_entity_asset",
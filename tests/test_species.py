@@ -1,6 +1,6 @@
 import pytest
 
-from app.db.model import Species
+from app.db.model import EmbeddingMixin, Species
 
 from .utils import check_creation_fields
 from tests.utils import (
@@ -166,3 +166,62 @@ def test_filtering(client, models):
 
     data = req({"created_by__id": USER_SUB_ID_1, "updated_by__id": USER_SUB_ID_1})
     assert len(data) == len(models)
+
+
+def test_read_nearest(db, client, json_data, user_id):
+    size = EmbeddingMixin.SIZE
+    models = add_all_db(
+        db,
+        [
+            Species(
+                **json_data
+                | {
+                    "name": f"s-{i}",
+                    "taxonomy_id": f"NCBITaxon:{i}000",
+                    "created_by_id": user_id,
+                    "updated_by_id": user_id,
+                    "embedding": [value] * size,
+                }
+            )
+            for i, value in enumerate([-0.1, 0.2, 0.1])
+        ],
+    )
+    # the mocked embedding of the searched text is [0.1] * size
+    data = assert_request(
+        client.get, url=f"{ROUTE}/nearest", params={"semantic_search": "s", "k": 2}
+    ).json()["data"]
+    assert [d["item"]["id"] for d in data] == [str(models[2].id), str(models[1].id)]
+    assert [d["distance"] for d in data] == pytest.approx([0, 0.1 * size**0.5])
+
+    data = assert_request(
+        client.get,
+        url=f"{ROUTE}/nearest",
+        params={"semantic_search": "s", "semantic_search_metric": "cosine", "name": "s-0"},
+    ).json()["data"]
+    assert [d["item"]["id"] for d in data] == [str(models[0].id)]
+    assert [d["distance"] for d in data] == pytest.approx([2])
+
+    data = assert_request(
+        client.get,
+        url=ROUTE,
+        params={
+            "semantic_search": "s",
+            "semantic_search_metric": "cosine",
+            "semantic_search_ef_search": 100,
+        },
+    ).json()["data"]
+    assert [d["id"] for d in data][-1] == str(models[0].id)
+
+    assert_request(client.get, url=f"{ROUTE}/nearest", expected_status_code=422)
+    assert_request(
+        client.get,
+        url=f"{ROUTE}/nearest",
+        params={"semantic_search": "s", "k": 0},
+        expected_status_code=422,
+    )
+    assert_request(
+        client.get,
+        url=ROUTE,
+        params={"semantic_search": "s", "semantic_search_ef_search": 0},
+        expected_status_code=422,
+    )
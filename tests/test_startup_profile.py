@@ -0,0 +1,86 @@
+import textwrap
+
+import pytest
+
+from app import startup_profile as test_module
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     app.db.types
+import time:       200 |        300 |   app.db.model
+import time:      1000 |       1000 |   app.routers.cell_morphology
+import time:      2000 |       3000 | app.routers
+2025-01-01 00:00:00 | INFO     | some log line
+"""
+
+
+def test_parse_import_times():
+    result = test_module.parse_import_times(IMPORTTIME_OUTPUT.splitlines())
+
+    assert result == [
+        test_module.ImportTime("app.db.types", 0.0001, 0.0001),
+        test_module.ImportTime("app.db.model", 0.0002, 0.0003),
+        test_module.ImportTime("app.routers.cell_morphology", 0.001, 0.001),
+        test_module.ImportTime("app.routers", 0.002, 0.003),
+    ]
+
+
+def test_get_import_time():
+    import_times = test_module.parse_import_times(IMPORTTIME_OUTPUT.splitlines())
+
+    assert test_module.get_import_time(import_times, "app.routers") == pytest.approx(0.003)
+    assert test_module.get_import_time(import_times, "app.db.model") == pytest.approx(0.0003)
+    assert test_module.get_import_time(import_times, "other") == 0
+
+
+def test_group_by_package():
+    import_times = test_module.parse_import_times(IMPORTTIME_OUTPUT.splitlines())
+
+    result = test_module.group_by_package(import_times)
+    assert result == pytest.approx({"app.routers": 0.003, "app.db": 0.0003})
+    assert list(result) == ["app.routers", "app.db"]
+
+    result = test_module.group_by_package(import_times, depth=1)
+    assert result == pytest.approx({"app": 0.0033})
+
+
+def test_profile_startup(tmp_path, monkeypatch):
+    (tmp_path / "fake_application.py").write_text(
+        textwrap.dedent(
+            """
+            from contextlib import asynccontextmanager
+
+            from fastapi import FastAPI
+
+            from app.logger import timed
+
+            startup_timings = {}
+
+
+            @asynccontextmanager
+            async def lifespan(_):
+                with timed("Starting", timings=startup_timings):
+                    pass
+                yield
+
+
+            app = FastAPI(lifespan=lifespan)
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(tmp_path)
+    monkeypatch.setenv("PYTHONPATH", f"{tmp_path}:.")
+
+    result = test_module.profile_startup("fake_application")
+
+    assert "fake_application" in [item.module for item in result.import_times]
+    assert list(result.lifespan_timings) == ["Starting"]
+    # measured in the new interpreter, even if already imported in the current process
+    assert result.import_time == next(
+        item.cumulative_time for item in result.import_times if item.module == "fake_application"
+    )
+    assert result.lifespan_time >= 0
+
+    report = test_module.format_startup_profile(result, top=3)
+    assert "fake_application" in report
+    assert report.endswith("s  Starting")
@@ -112,6 +112,12 @@ def test_create_strain(client, client_admin, species_id):
     data = response.json()["data"]
     assert len(data) == 3  # semantic search just reorders - it does not filter out
 
+    data = assert_request(
+        client.get, url=f"{ROUTE}/nearest", params={"semantic_search": "straaains", "k": 2}
+    ).json()["data"]
+    assert len(data) == 2
+    assert {d["item"]["id"] for d in data} <= {item["id"] for item in items}
+
     data = assert_request(
         client.get,
         url=ROUTE,
@@ -0,0 +1,62 @@
+from .utils import assert_request, create_cell_morphology_id
+
+ROUTE = "/suggest"
+
+
+def _suggest(client, **params):
+    data = assert_request(client.get, url=ROUTE, params=params).json()["data"]
+    return [(d["type"], d["name"]) for d in data]
+
+
+def test_suggest(client, client_user_2, subject_id, brain_region_id, cell_morphology_protocol_id):
+    for test_client, name in [
+        (client, "Redwood cell"),
+        (client, "Cell in the red region"),
+        (client_user_2, "Red private cell"),
+    ]:
+        create_cell_morphology_id(
+            test_client,
+            subject_id=subject_id,
+            brain_region_id=brain_region_id,
+            cell_morphology_protocol_id=cell_morphology_protocol_id,
+            name=name,
+        )
+
+    # the names starting with the text are returned first, then the shortest ones
+    assert _suggest(client, q="red") == [
+        ("brain_region", "RedRegion"),
+        ("cell_morphology", "Redwood cell"),
+        ("cell_morphology", "Cell in the red region"),
+    ]
+    assert _suggest(client_user_2, q="RED") == [
+        ("brain_region", "RedRegion"),
+        ("cell_morphology", "Red private cell"),
+    ]
+    assert _suggest(client, q="red", limit=2) == [
+        ("brain_region", "RedRegion"),
+        ("cell_morphology", "Redwood cell"),
+    ]
+    assert _suggest(client, q="red", types=["cell_morphology", "emodel"]) == [
+        ("cell_morphology", "Redwood cell"),
+        ("cell_morphology", "Cell in the red region"),
+    ]
+    assert _suggest(client, q="red", types=["brain_region"]) == [
+        ("brain_region", "RedRegion"),
+    ]
+    assert _suggest(client, q="wood") == [("cell_morphology", "Redwood cell")]
+    # shorter texts are matched only at the beginning
+    assert _suggest(client, q="wo") == []
+    assert _suggest(client, q="re") == [
+        ("brain_region", "RedRegion"),
+        ("cell_morphology", "Redwood cell"),
+    ]
+    # the wildcards of the ilike filters are matched literally
+    assert _suggest(client, q="r%") == []
+
+
+def test_suggest_invalid_params(client):
+    assert_request(client.get, url=ROUTE, params={"q": ""}, expected_status_code=422)
+    assert_request(
+        client.get, url=ROUTE, params={"q": "red", "types": "unknown"}, expected_status_code=422
+    )
+    assert_request(client.get, url=ROUTE, params={"q": "red", "limit": 0}, expected_status_code=422)
@@ -0,0 +1,145 @@
+import threading
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import sqlalchemy as sa
+
+from app import upload_reaper as test_module
+from app.db.model import Asset
+from app.schemas.asset import ReapUploadsResult
+
+from tests.utils import (
+    assert_request,
+    route,
+    s3_key_exists,
+    s3_multipart_upload_exists,
+)
+
+FILESIZE = 3 * 5 * 1024**2
+DIGEST = "a" * 64
+
+
+def _get_upload_ids(db, asset_ids):
+    query = sa.select(Asset.upload_meta["upload_id"].astext).where(Asset.id.in_(asset_ids))
+    return db.execute(query).scalars().all()
+
+
+def test_reap_stale_uploads(db, client, s3, s3_internal_bucket, root_circuit):
+    entity_route = route(root_circuit.type)
+    file_asset = assert_request(
+        client.post,
+        url=f"{entity_route}/{root_circuit.id}/assets/multipart-upload/initiate",
+        json={
+            "filename": "circuit.gz",
+            "filesize": FILESIZE,
+            "sha256_digest": DIGEST,
+            "preferred_part_count": 3,
+            "label": "compressed_sonata_circuit",
+            "content_type": "application/gzip",
+        },
+    ).json()
+    directory = assert_request(
+        client.post,
+        url=f"{entity_route}/{root_circuit.id}/assets/directory/multipart-upload/initiate",
+        json={
+            "directory_name": "my-dir",
+            "label": "sonata_circuit",
+            "meta": {},
+            "files": [
+                {
+                    "filename": name,
+                    "filesize": FILESIZE,
+                    "sha256_digest": DIGEST,
+                    "preferred_part_count": 3,
+                }
+                for name in ["nodes.h5", "edges.h5"]
+            ],
+        },
+    ).json()
+    # upload and complete one of the files in the directory
+    completed = directory["files"][0]
+    [completed_upload_id] = _get_upload_ids(db, [completed["id"]])
+    parts = []
+    for part in completed["upload_meta"]["parts"]:
+        response = s3.upload_part(
+            Bucket=s3_internal_bucket,
+            Key=completed["full_path"],
+            UploadId=completed_upload_id,
+            PartNumber=part["part_number"],
+            Body=b"x" * completed["upload_meta"]["part_size"],
+        )
+        parts.append({"ETag": response["ETag"], "PartNumber": part["part_number"]})
+    s3.complete_multipart_upload(
+        Bucket=s3_internal_bucket,
+        Key=completed["full_path"],
+        UploadId=completed_upload_id,
+        MultipartUpload={"Parts": parts},
+    )
+    db.execute(sa.update(Asset).where(Asset.id == completed["id"]).values(status="created"))
+
+    asset_ids = [file_asset["id"], directory["asset"]["id"], *(f["id"] for f in directory["files"])]
+    upload_ids = _get_upload_ids(db, [file_asset["id"], directory["files"][1]["id"]])
+
+    result = test_module.reap_stale_uploads(
+        db, max_age=timedelta(days=1), limit=None, dry_run=False
+    )
+    assert result == ReapUploadsResult(dry_run=False)
+
+    result = test_module.reap_stale_uploads(db, max_age=timedelta(0), limit=None, dry_run=True)
+    assert result == ReapUploadsResult(
+        dry_run=True, asset_count=2, upload_count=2, file_count=1, total_size=3 * FILESIZE
+    )
+    db.commit()
+    assert db.execute(sa.select(sa.func.count()).where(Asset.id.in_(asset_ids))).scalar() == 4
+
+    result = test_module.reap_stale_uploads(db, max_age=timedelta(0), limit=1, dry_run=False)
+    assert result == ReapUploadsResult(
+        dry_run=False, asset_count=1, upload_count=1, file_count=0, total_size=FILESIZE
+    )
+    result = test_module.reap_stale_uploads(db, max_age=timedelta(0), limit=None, dry_run=False)
+    assert result == ReapUploadsResult(
+        dry_run=False, asset_count=1, upload_count=1, file_count=1, total_size=2 * FILESIZE
+    )
+    db.commit()
+
+    assert db.execute(sa.select(sa.func.count()).where(Asset.id.in_(asset_ids))).scalar() == 0
+    for upload_id in upload_ids:
+        assert not s3_multipart_upload_exists(s3, upload_id=upload_id, bucket=s3_internal_bucket)
+    assert not s3_key_exists(s3, key=completed["full_path"])
+
+
+def test_reaper_worker(monkeypatch):
+    stop = threading.Event()
+    call_count = 0
+
+    def wait_twice(timeout=None):  # ruff:ignore[unused-function-argument]
+        nonlocal call_count
+        call_count += 1
+        return call_count > 2
+
+    mock_reap = MagicMock(
+        side_effect=[RuntimeError("boom"), ReapUploadsResult(dry_run=False, asset_count=1)]
+    )
+    mock_log = MagicMock()
+    monkeypatch.setattr(test_module, "reap_stale_uploads", mock_reap)
+    monkeypatch.setattr(test_module, "L", mock_log)
+    database_session_manager = MagicMock()
+
+    with patch.object(stop, "wait", side_effect=wait_twice):
+        test_module._reaper_worker(
+            stop, database_session_manager, interval=60.0, max_age=timedelta(days=1)
+        )
+
+    assert mock_reap.call_count == 2
+    assert database_session_manager.session.call_count == 2
+    mock_log.exception.assert_called_once()
+    mock_log.info.assert_called_once()
+
+
+def test_start_upload_reaper_thread(monkeypatch):
+    monkeypatch.setattr(test_module, "reap_stale_uploads", MagicMock())
+
+    stop_upload_reaper = test_module.start_upload_reaper_thread(MagicMock())
+
+    assert callable(stop_upload_reaper)
+    stop_upload_reaper()
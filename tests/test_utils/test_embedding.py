@@ -3,13 +3,32 @@
 from unittest.mock import Mock, patch
 
 import pytest
+import sqlalchemy as sa
 from openai import APIConnectionError, APIStatusError
+from pydantic import SecretStr
 
-from app.db.model import EmbeddingMixin
+from app.config import settings
+from app.db.model import EmbeddingCache, EmbeddingMixin
 from app.errors import ApiError, ApiErrorCode
 from app.utils import embedding as test_module
 
 
+@pytest.fixture(autouse=True)
+def _clear_embedding_caches():
+    test_module._cache.clear()
+    test_module._create_embedding_provider.cache_clear()
+    test_module._get_openai_client.cache_clear()
+    yield
+    test_module._cache.clear()
+    test_module._create_embedding_provider.cache_clear()
+    test_module._get_openai_client.cache_clear()
+
+
+@pytest.fixture
+def random_provider(monkeypatch):
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", SecretStr("random"))
+
+
 def test_settings():
     with patch("app.utils.embedding.settings") as mock_settings:
         mock_settings.OPENAI_API_KEY = None
@@ -33,24 +52,25 @@ def test_generate_embedding_success(monkeypatch):
     mock_settings = Mock()
     mock_settings.OPENAI_API_KEY = Mock()
     mock_settings.OPENAI_API_KEY.get_secret_value.return_value = "test-api-key"
+    mock_settings.EMBEDDING_BATCH_SIZE = 512
     monkeypatch.setattr("app.utils.embedding.settings", mock_settings)
 
     mock_client = Mock()
     mock_openai_class = Mock(return_value=mock_client)
-    monkeypatch.setattr("app.utils.embedding.openai.OpenAI", mock_openai_class)
+    monkeypatch.setattr("openai.OpenAI", mock_openai_class)
 
     expected_embedding = [0.1, 0.2, 0.3, 0.4, 0.5]
     mock_response = Mock()
     mock_response.data = [Mock(embedding=expected_embedding)]
     mock_client.embeddings.create.return_value = mock_response
 
-    test_text = "This is a test text"
-    test_model = "text-embedding-3-small"
+    test_text = "This is a  test text"
+    test_model = "text-embedding-3-large"
 
     result = test_module.generate_embedding(test_text, test_model)
 
     assert result == expected_embedding
-    mock_client.embeddings.create.assert_called_once_with(model=test_model, input=test_text)
+    mock_client.embeddings.create.assert_called_once_with(model=test_model, input=[test_text])
     mock_openai_class.assert_called_once_with(api_key="test-api-key")
 
     # Test that the default model is used when no model is specified
@@ -59,9 +79,17 @@ def test_generate_embedding_success(monkeypatch):
 
     assert result == expected_embedding
     mock_client.embeddings.create.assert_called_once_with(
-        model="text-embedding-3-small", input=test_text
+        model="text-embedding-3-small", input=[test_text]
     )
 
+    # Test that the embedding is cached, and the client is reused
+    mock_client.reset_mock()
+    result = test_module.generate_embedding("This is a test text ")
+
+    assert result == expected_embedding
+    mock_client.embeddings.create.assert_not_called()
+    mock_openai_class.assert_called_once()
+
 
 def test_generate_embedding_missing_api_key(monkeypatch):
     """Test that ApiError is raised when OpenAI API key is missing."""
@@ -84,6 +112,7 @@ def test_generate_embedding_api_connection_error(monkeypatch):
     mock_settings = Mock()
     mock_settings.OPENAI_API_KEY = Mock()
     mock_settings.OPENAI_API_KEY.get_secret_value.return_value = "test-api-key"
+    mock_settings.EMBEDDING_BATCH_SIZE = 512
     monkeypatch.setattr("app.utils.embedding.settings", mock_settings)
 
     mock_client = Mock()
@@ -91,7 +120,7 @@ def test_generate_embedding_api_connection_error(monkeypatch):
         message="Connection failed", request=Mock()
     )
     mock_openai_class = Mock(return_value=mock_client)
-    monkeypatch.setattr("app.utils.embedding.openai.OpenAI", mock_openai_class)
+    monkeypatch.setattr("openai.OpenAI", mock_openai_class)
 
     with pytest.raises(ApiError) as exc_info:
         test_module.generate_embedding("This is a test text")
@@ -107,6 +136,7 @@ def test_generate_embedding_api_status_error(monkeypatch):
     mock_settings = Mock()
     mock_settings.OPENAI_API_KEY = Mock()
     mock_settings.OPENAI_API_KEY.get_secret_value.return_value = "test-api-key"
+    mock_settings.EMBEDDING_BATCH_SIZE = 512
     monkeypatch.setattr("app.utils.embedding.settings", mock_settings)
 
     mock_client = Mock()
@@ -114,7 +144,7 @@ def test_generate_embedding_api_status_error(monkeypatch):
         message="Rate limit exceeded", response=Mock(), body={}
     )
     mock_openai_class = Mock(return_value=mock_client)
-    monkeypatch.setattr("app.utils.embedding.openai.OpenAI", mock_openai_class)
+    monkeypatch.setattr("openai.OpenAI", mock_openai_class)
 
     with pytest.raises(ApiError) as exc_info:
         test_module.generate_embedding("This is a test text")
@@ -135,3 +165,87 @@ def test__pseudo_random_embedding():
     a = test_module.pseudo_random_embedding("")
     assert all(-1.0 <= v <= 1.0 for v in a)
     assert len(a) == EmbeddingMixin.SIZE
+
+
+def test_normalize_text():
+    assert test_module.normalize_text("  Mouse\tHippocampus\n") == "Mouse Hippocampus"
+    assert not test_module.normalize_text(" ")
+
+
+def test_openai_provider_embed_batch(monkeypatch):
+    monkeypatch.setattr(settings, "EMBEDDING_BATCH_SIZE", 2)
+    mock_client = Mock()
+    mock_client.embeddings.create.side_effect = lambda **kwargs: Mock(
+        data=[Mock(embedding=[float(len(text))]) for text in kwargs["input"]]
+    )
+
+    provider = test_module.OpenAIEmbeddingProvider("model", client=mock_client)
+    result = provider.embed_batch(["a", "bb", "ccc", "dddd", "eeeee"])
+
+    assert result == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert [c.kwargs["input"] for c in mock_client.embeddings.create.call_args_list] == [
+        ["a", "bb"],
+        ["ccc", "dddd"],
+        ["eeeee"],
+    ]
+
+
+@pytest.mark.usefixtures("random_provider")
+def test_generate_embeddings_with_db_cache(db):
+    provider = test_module.get_embedding_provider()
+    assert isinstance(provider, test_module.PseudoRandomEmbeddingProvider)
+
+    with patch.object(provider, "embed_batch", wraps=provider.embed_batch) as mock_embed_batch:
+        result = test_module.generate_embeddings(["Mouse", "rat", " Mouse\n", "mouse"], db=db)
+        # the keys collapse the whitespaces but preserve the case, the texts are embedded as given
+        assert result == [
+            test_module.pseudo_random_embedding("Mouse"),
+            test_module.pseudo_random_embedding("rat"),
+            test_module.pseudo_random_embedding("Mouse"),
+            test_module.pseudo_random_embedding("mouse"),
+        ]
+        assert result[0] != result[3]
+        mock_embed_batch.assert_called_once_with(["Mouse", "rat", "mouse"])
+        rows = db.execute(sa.select(EmbeddingCache.model, EmbeddingCache.text_digest)).all()
+        assert len(rows) == 3
+        assert {row.model for row in rows} == {test_module.DEFAULT_MODEL}
+
+        # in-process cache
+        mock_embed_batch.reset_mock()
+        assert test_module.generate_embedding("Mouse  ", db=db) == result[0]
+        mock_embed_batch.assert_not_called()
+        assert test_module.generate_embedding("MOUSE", db=db) == (
+            test_module.pseudo_random_embedding("MOUSE")
+        )
+        mock_embed_batch.assert_called_once_with(["MOUSE"])
+        mock_embed_batch.reset_mock()
+
+        # database cache, storing single precision values
+        test_module._cache.clear()
+        rat, cat = test_module.generate_embeddings(["rat", "cat"], db=db)
+        assert rat == pytest.approx(result[1], rel=1e-6)
+        assert cat == test_module.pseudo_random_embedding("cat")
+        mock_embed_batch.assert_called_once_with(["cat"])
+
+
+@pytest.mark.usefixtures("random_provider")
+def test_generate_embeddings_with_expired_db_cache(db, monkeypatch):
+    monkeypatch.setattr(settings, "EMBEDDING_DB_CACHE_PURGE_BATCH_SIZE", 1)
+    provider = test_module.get_embedding_provider()
+    test_module.generate_embeddings(["mouse", "rat", "cat"], db=db)
+    db.execute(
+        sa.update(EmbeddingCache).values(
+            creation_date=sa.func.now() - sa.text("interval '31 days'")
+        )
+    )
+    test_module._cache.clear()
+
+    with patch.object(provider, "embed_batch", wraps=provider.embed_batch) as mock_embed_batch:
+        # the expired embedding is generated again and replaced, and one expired row is purged
+        assert test_module.generate_embedding("mouse", db=db) == (
+            test_module.pseudo_random_embedding("mouse")
+        )
+        mock_embed_batch.assert_called_once_with(["mouse"])
+
+    rows = db.execute(sa.select(EmbeddingCache.creation_date)).scalars().all()
+    assert len(rows) == 2
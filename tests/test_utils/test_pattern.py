@@ -0,0 +1,33 @@
+import pytest
+
+from app.utils import pattern as test_module
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("test*", "test%"),
+        ("file?.txt", "file_.txt"),
+        ("data_file", "data\\_file"),
+        ("100% complete", "100\\% complete"),
+    ],
+)
+def test_convert_to_ilike_pattern(value, expected):
+    assert test_module.convert_to_ilike_pattern(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "name", "expected"),
+    [
+        ("*.swc", "cell.swc", True),
+        ("*.swc", "morphology/cell.swc", True),
+        ("*.swc", "cell.swc.bak", False),
+        ("file?.txt", "file1.txt", True),
+        ("file?.txt", "file10.txt", False),
+        ("data_[1].txt", "data_[1].txt", True),
+        ("data_[1].txt", "data_1.txt", False),
+        ("a.b", "aXb", False),
+    ],
+)
+def test_convert_to_regex_pattern(value, name, expected):
+    assert bool(test_module.convert_to_regex_pattern(value).fullmatch(name)) is expected
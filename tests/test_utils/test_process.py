@@ -0,0 +1,48 @@
+import os
+
+from app.utils import process as test_module
+
+SMAPS_ROLLUP = """\
+55d0c0a00000-7ffd6b5f5000 ---p 00000000 00:00 0                          [rollup]
+Rss:              422400 kB
+Pss:              129024 kB
+Shared_Clean:      10240 kB
+Shared_Dirty:     380928 kB
+Private_Clean:      1024 kB
+Private_Dirty:     30208 kB
+Swap:                  0 kB
+"""
+
+
+def test_get_memory_usage(tmp_path):
+    path = tmp_path / "smaps_rollup"
+    path.write_text(SMAPS_ROLLUP)
+
+    result = test_module.get_memory_usage(path)
+
+    assert result == test_module.MemoryUsage(
+        rss=422400 * 1024, pss=129024 * 1024, private=31232 * 1024
+    )
+    assert str(result) == "rss=412.5MB pss=126.0MB private=30.5MB"
+
+
+def test_get_memory_usage_not_available(tmp_path):
+    assert test_module.get_memory_usage(tmp_path / "missing") is None
+
+
+def test_get_uptime():
+    uptime = test_module.get_uptime()
+    assert uptime > 0
+
+    # called in the forked workers
+    test_module._reset_started_at()
+    assert test_module.get_uptime() < uptime
+
+
+def test_get_rss(tmp_path):
+    path = tmp_path / "statm"
+    path.write_text("1000 200 50 10 0 300 0\n")
+
+    assert test_module.get_rss(path) == 200 * os.sysconf("SC_PAGE_SIZE")
+    assert test_module.get_rss(tmp_path / "missing") is None
+    assert test_module.get_rss() > 0
@@ -1,5 +1,8 @@
+import hashlib
 import io
 import math
+import os
+import uuid
 from unittest.mock import Mock
 
 import botocore.exceptions
@@ -7,6 +10,7 @@ import pytest
 
 from app.config import settings
 from app.db.types import EntityType
+from app.errors import ApiError, ApiErrorCode
 from app.utils import s3 as test_module
 
 from tests.utils import PROJECT_ID, VIRTUAL_LAB_ID
@@ -379,3 +383,93 @@ def test_move_directory_dry_run(s3, s3_internal_bucket):
     assert result.size == 3
     assert _exists(s3, bucket, "srcdir2/c.txt")
     assert not _exists(s3, bucket, "dstdir2/c.txt")
+
+
+@pytest.mark.parametrize("size", [0, 1024, 5 * 1024**2, 8 * 1024**2, 11 * 1024**2])
+def test_upload_to_s3(s3, s3_internal_bucket, monkeypatch, size):
+    monkeypatch.setattr(settings, "S3_MULTIPART_UPLOAD_CHUNKSIZE", 5 * 1024**2)
+    monkeypatch.setattr(settings, "S3_MULTIPART_UPLOAD_THRESHOLD", 8 * 1024**2)
+    data = os.urandom(size)
+    key = "a/b/file.bin"
+
+    result = test_module.upload_to_s3(s3, io.BytesIO(data), s3_internal_bucket, key)
+
+    assert result == {"size": size, "sha256_digest": hashlib.sha256(data).hexdigest()}
+    assert _read(s3, s3_internal_bucket, key) == data
+
+
+@pytest.mark.parametrize(
+    ("size", "multipart"),
+    [(5 * 1024**2 - 1, False), (7 * 1024**2, False), (8 * 1024**2, True), (13 * 1024**2, True)],
+)
+def test_upload_to_s3_threshold(s3, s3_internal_bucket, monkeypatch, size, multipart):
+    monkeypatch.setattr(settings, "S3_MULTIPART_UPLOAD_CHUNKSIZE", 5 * 1024**2)
+    monkeypatch.setattr(settings, "S3_MULTIPART_UPLOAD_THRESHOLD", 8 * 1024**2)
+    put_object = Mock(wraps=s3.put_object)
+    upload_part = Mock(wraps=s3.upload_part)
+    monkeypatch.setattr(s3, "put_object", put_object)
+    monkeypatch.setattr(s3, "upload_part", upload_part)
+    data = os.urandom(size)
+    key = f"a/b/{uuid.uuid4()}.bin"
+
+    result = test_module.upload_to_s3(s3, io.BytesIO(data), s3_internal_bucket, key)
+
+    assert result == {"size": size, "sha256_digest": hashlib.sha256(data).hexdigest()}
+    assert _read(s3, s3_internal_bucket, key) == data
+    # the files between the chunk size and the threshold are uploaded with a single request
+    assert put_object.call_count == (0 if multipart else 1)
+    assert upload_part.call_count == (math.ceil(size / (5 * 1024**2)) if multipart else 0)
+
+
+@pytest.mark.parametrize("size", [1024, 11 * 1024**2])
+def test_upload_to_s3_digest_mismatch(s3, s3_internal_bucket, monkeypatch, size):
+    monkeypatch.setattr(settings, "S3_MULTIPART_UPLOAD_CHUNKSIZE", 5 * 1024**2)
+    monkeypatch.setattr(settings, "S3_MULTIPART_UPLOAD_THRESHOLD", 8 * 1024**2)
+    key = f"a/b/{uuid.uuid4()}.bin"
+
+    with pytest.raises(ApiError) as exc_info:
+        test_module.upload_to_s3(
+            s3,
+            io.BytesIO(os.urandom(size)),
+            s3_internal_bucket,
+            key,
+            expected_sha256_digest=hashlib.sha256(b"other").hexdigest(),
+        )
+
+    assert exc_info.value.error_code == ApiErrorCode.ASSET_INVALID_DIGEST
+    assert not _exists(s3, s3_internal_bucket, key)
+    assert "Uploads" not in s3.list_multipart_uploads(Bucket=s3_internal_bucket, Prefix=key)
+
+
+def test_upload_to_s3_part_failure(s3, s3_internal_bucket, monkeypatch):
+    monkeypatch.setattr(settings, "S3_MULTIPART_UPLOAD_CHUNKSIZE", 5 * 1024**2)
+    monkeypatch.setattr(settings, "S3_MULTIPART_UPLOAD_THRESHOLD", 8 * 1024**2)
+    monkeypatch.setattr(s3, "upload_part", Mock(side_effect=RuntimeError("Failed")))
+    key = f"a/b/{uuid.uuid4()}.bin"
+
+    result = test_module.upload_to_s3(
+        s3, io.BytesIO(os.urandom(11 * 1024**2)), s3_internal_bucket, key
+    )
+
+    assert result is None
+    assert not _exists(s3, s3_internal_bucket, key)
+    assert "Uploads" not in s3.list_multipart_uploads(Bucket=s3_internal_bucket, Prefix=key)
+
+
+def test_upload_to_s3_part_failure_stops_reading(s3, s3_internal_bucket, monkeypatch):
+    chunk_size = 1024
+    monkeypatch.setattr(settings, "S3_MULTIPART_UPLOAD_CHUNKSIZE", chunk_size)
+    monkeypatch.setattr(settings, "S3_MULTIPART_UPLOAD_MIN_PART_SIZE", chunk_size)
+    monkeypatch.setattr(settings, "S3_MULTIPART_UPLOAD_THRESHOLD", chunk_size)
+    monkeypatch.setattr(settings, "S3_MULTIPART_UPLOAD_MAX_CONCURRENCY", 2)
+    upload_part = Mock(side_effect=RuntimeError("Failed"))
+    monkeypatch.setattr(s3, "upload_part", upload_part)
+    key = f"a/b/{uuid.uuid4()}.bin"
+    file_obj = io.BytesIO(os.urandom(100 * chunk_size))
+
+    result = test_module.upload_to_s3(s3, file_obj, s3_internal_bucket, key)
+
+    assert result is None
+    assert upload_part.call_count < 10
+    assert file_obj.tell() < 10 * chunk_size
+    assert "Uploads" not in s3.list_multipart_uploads(Bucket=s3_internal_bucket, Prefix=key)
@@ -0,0 +1,51 @@
+import signal
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.utils import uvicorn as test_module
+
+
+@pytest.fixture
+def mock_os(monkeypatch):
+    mock_os = MagicMock()
+    mock_os.fork.side_effect = [101, 102, 103]
+    monkeypatch.setattr(test_module, "os", mock_os)
+    monkeypatch.setattr(signal, "signal", MagicMock())
+    monkeypatch.setattr(test_module, "freeze_before_fork", MagicMock())
+    return mock_os
+
+
+def test_prefork_supervisor_stops_when_worker_fails_at_startup(mock_os):
+    mock_os.wait.side_effect = [(101, 256), (102, 0)]
+    config = MagicMock()
+    supervisor = test_module.PreforkSupervisor(config, workers=2, warmup=None)
+    supervisor.run()
+
+    config.load.assert_called_once()
+    test_module.freeze_before_fork.assert_called_once()
+    assert mock_os.fork.call_count == 2
+    mock_os.kill.assert_called_once_with(102, signal.SIGTERM)
+    assert supervisor.should_exit is True
+    assert supervisor.pids == {}
+
+
+def test_prefork_supervisor_replaces_failed_worker(mock_os, monkeypatch):
+    monkeypatch.setattr(test_module.PreforkSupervisor, "min_worker_lifetime", 0)
+    supervisor = test_module.PreforkSupervisor(MagicMock(), workers=2, warmup=None)
+
+    def wait():
+        if mock_os.fork.call_count == 3 and not supervisor.should_exit:
+            # the failed worker has been replaced
+            supervisor._handle_exit(signal.SIGTERM, None)
+        return next(results)
+
+    results = iter([(101, 256), (102, 15), (103, 15)])
+    mock_os.wait.side_effect = wait
+    supervisor.run()
+
+    assert mock_os.fork.call_count == 3
+    assert sorted(call.args for call in mock_os.kill.call_args_list) == [
+        (102, signal.SIGTERM),
+        (103, signal.SIGTERM),
+    ]